@@ -94,6 +94,32 @@ else:
         }
     }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/ref/settings/#caches
+
+if "CACHE" in settings:
+    CACHES = {
+        "default": {
+            "BACKEND": settings.CACHE.BACKEND,
+            "LOCATION": settings.CACHE.get("LOCATION", ""),
+            "TIMEOUT": settings.CACHE.get("TIMEOUT", 300),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Data invalidated on writes (like Budget membership) is cached only in cache shared by all server processes, as
+# process local cache entries cannot be invalidated by writes handled in other processes.
+LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+SHARED_CACHE_ENABLED = CACHES["default"]["BACKEND"] not in LOCAL_CACHE_BACKENDS
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -142,7 +168,8 @@ AUTH_USER_MODEL = "app_users.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "app_infrastructure.authentication.CachedTokenAuthentication",
+        "app_infrastructure.authentication.SignedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PAGINATION_CLASS": "app_infrastructure.paginations.DefaultPagination",
@@ -152,6 +179,13 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Signed access and refresh tokens issued next to database Tokens
+
+SIGNED_TOKENS = settings.get("SIGNED_TOKENS", {})
+SIGNED_TOKENS_ENABLED = bool(SIGNED_TOKENS.get("ENABLED", 0))
+SIGNED_ACCESS_TOKEN_LIFETIME = int(SIGNED_TOKENS.get("ACCESS_TOKEN_LIFETIME", 5 * 60))
+SIGNED_REFRESH_TOKEN_LIFETIME = int(SIGNED_TOKENS.get("REFRESH_TOKEN_LIFETIME", 7 * 24 * 60 * 60))
+
 SWAGGER_SETTINGS = {
     "USE_SESSION_AUTH": False,
     "DEFAULT_AUTO_SCHEMA_CLASS": "app_config.swagger_schemas.CustomAutoSchema",
@@ -0,0 +1,84 @@
+from django.conf import settings
+from django.db.models import Model
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication, get_authorization_header
+from rest_framework.request import Request
+
+from app_infrastructure.services.auth_token_cache_service import AuthTokenCacheService
+from app_infrastructure.services.signed_token_service import SignedTokenError, SignedTokenService
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication keeping authenticated Users in AuthTokenCacheService, so Token and User are fetched from
+    database only on first request made with given token key in TIMEOUT period.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple[Model, Model]:
+        """
+        Returns User and Token for given token key, reading them from cache or database.
+
+        Args:
+            key [str]: Token key passed in request.
+
+        Returns:
+            tuple[Model, Model]: Authenticated User and Token model instances.
+
+        Raises:
+            AuthenticationFailed: Raised when Token does not exist or User is inactive.
+        """
+        if (cached := AuthTokenCacheService.get(key)) is not None:
+            return cached
+        user, token = super().authenticate_credentials(key)
+        AuthTokenCacheService.set(key, user, token)
+        return user, token
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authentication with signed access token issued by SignedTokenService, passed in "Authorization" header
+    prepended with "Bearer " keyword. With shared cache token is validated without database access and request.user
+    is User instance with all fields except id deferred, loaded from database with single query on first access.
+    Without shared cache, User is loaded together with token revocation state with single query. Token claims are
+    set as request.auth. Authentication is skipped when SIGNED_TOKENS_ENABLED setting is not set.
+    """
+
+    keyword: str = "Bearer"
+
+    def authenticate(self, request: Request) -> tuple[Model, dict] | None:
+        """
+        Authenticates request with signed access token.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            tuple[Model, dict] | None: User model instance and token claims or None if request does not contain
+            signed access token.
+
+        Raises:
+            AuthenticationFailed: Raised on malformed, expired or revoked token or on token of inactive User.
+        """
+        auth = get_authorization_header(request).split()
+        if not settings.SIGNED_TOKENS_ENABLED or not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed("Invalid token header.")
+        try:
+            claims = SignedTokenService.decode(auth[1].decode(), SignedTokenService.ACCESS)
+            user = SignedTokenService.get_user(claims)
+        except (SignedTokenError, UnicodeError) as exc:
+            raise exceptions.AuthenticationFailed(str(exc) if isinstance(exc, SignedTokenError) else "Invalid token.")
+        return user, claims
+
+    def authenticate_header(self, request: Request) -> str:
+        """
+        Returns value of "WWW-Authenticate" header for unauthenticated responses.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            str: Authentication keyword.
+        """
+        return self.keyword
@@ -0,0 +1,36 @@
+from django.db.models import QuerySet
+from rest_framework.filters import OrderingFilter
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
+
+
+class SearchRankOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter ordering results of full text search by relevance when no ordering was requested. Ordering not
+    containing unique field is completed with "id", so objects with equal values of ordering fields are always
+    returned in the same order.
+    """
+
+    def get_ordering(self, request: Request, queryset: QuerySet, view: APIView) -> list[str] | None:
+        """
+        Extended with ordering by "search_rank" annotation of FullTextSearchService, if present and if ordering
+        query param was not passed, and with "id" tiebreaker.
+
+        Args:
+            request [Request]: User request.
+            queryset [QuerySet]: Filtered QuerySet.
+            view [APIView]: View on which request was made.
+
+        Returns:
+            list[str] | None: Ordering fields.
+        """
+        if not request.query_params.get(self.ordering_param) and (
+            FullTextSearchService.RANK_FIELD in queryset.query.annotations
+        ):
+            return [f"-{FullTextSearchService.RANK_FIELD}", "id"]
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not any(term.lstrip("-") in ("id", "pk") for term in ordering):
+            ordering = [*ordering, "id"]
+        return ordering
@@ -0,0 +1,70 @@
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations import SeparateDatabaseAndState
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.state import ProjectState
+
+
+class VendorOperations(SeparateDatabaseAndState):
+    """
+    Migration operation applying wrapped operations to database only for given database vendor, while model state
+    is changed by them for every vendor. Used for database features not supported by all backends, like PostgreSQL
+    specific indexes and constraints.
+
+    Args:
+        vendor (str): Database vendor name, as in connection.vendor.
+        operations (list[Operation]): Wrapped migration operations.
+    """
+
+    def __init__(self, vendor: str, operations: list[Operation]):
+        super().__init__(database_operations=operations, state_operations=operations)
+        self.vendor = vendor
+
+    def deconstruct(self) -> tuple[str, list, dict]:
+        """
+        Returns arguments needed to recreate operation in migration file.
+
+        Returns:
+            tuple[str, list, dict]: Operation class name, positional and keyword arguments.
+        """
+        return self.__class__.__qualname__, [], {"vendor": self.vendor, "operations": self.database_operations}
+
+    def database_forwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        """
+        Applies wrapped operations to database, if its vendor matches.
+
+        Args:
+            app_label (str): Migration app label.
+            schema_editor (BaseDatabaseSchemaEditor): Database schema editor.
+            from_state (ProjectState): Model state before operation.
+            to_state (ProjectState): Model state after operation.
+        """
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(
+        self, app_label: str, schema_editor: BaseDatabaseSchemaEditor, from_state: ProjectState, to_state: ProjectState
+    ) -> None:
+        """
+        Reverts wrapped operations in database, if its vendor matches.
+
+        Args:
+            app_label (str): Migration app label.
+            schema_editor (BaseDatabaseSchemaEditor): Database schema editor.
+            from_state (ProjectState): Model state before operation.
+            to_state (ProjectState): Model state after operation.
+        """
+        if schema_editor.connection.vendor == self.vendor:
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self) -> str:
+        """
+        Returns operation description.
+
+        Returns:
+            str: Operation description.
+        """
+        return f"{self.vendor} only operations: " + "; ".join(
+            operation.describe() for operation in self.database_operations
+        )
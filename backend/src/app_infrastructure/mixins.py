@@ -0,0 +1,277 @@
+import hashlib
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.utils.http import parse_etags
+from rest_framework import serializers, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+
+
+class BudgetDataVersionMixin:
+    """
+    Mixin for Budget nested ViewSets reading data versions of Budget passed in URL once per request.
+    """
+
+    def get_data_versions(self) -> dict[str, int] | None:
+        """
+        Returns data versions of Budget passed in URL, read on first call in request.
+
+        Returns:
+            dict[str, int] | None: Budget data versions or None if Budget does not exist.
+        """
+        if not hasattr(self, "_data_versions"):
+            self._data_versions = BudgetDataVersionService.get_versions(self.kwargs.get("budget_pk"))
+        return self._data_versions
+
+
+class BudgetETagMixin(BudgetDataVersionMixin):
+    """
+    Mixin for Budget nested ViewSets adding "ETag" header to list and detail responses and answering requests with
+    matching "If-None-Match" header with HTTP 304 Not Modified.
+
+    ETag is derived from data version of Budget passed in URL, so it changes on every write to Budget data, and from
+    requesting User, as serialized data may depend on User. Check is performed after authentication and permissions
+    checks, but before QuerySet is evaluated or data is serialized.
+    """
+
+    etag: str | None = None
+
+    def get_etag(self, request: Request) -> str | None:
+        """
+        Returns weak ETag for current request, built from Budget data version, User, full request path and accepted
+        media type.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            str | None: ETag value or None if Budget does not exist.
+        """
+        if (versions := self.get_data_versions()) is None:
+            return None
+        budget_pk, version = self.kwargs.get("budget_pk"), versions["data"]
+        digest = hashlib.sha256(
+            f"{budget_pk}:{version}:{request.user.pk}:{request.get_full_path()}:{request.accepted_media_type}".encode()
+        ).hexdigest()
+        return f'W/"{digest[:32]}"'
+
+    def is_not_modified(self, request: Request) -> bool:
+        """
+        Computes ETag for current request and checks if it matches one of "If-None-Match" header values.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            bool: True if client copy of response is up to date, False otherwise.
+        """
+        self.etag = self.get_etag(request)
+        if self.etag is None or not (header := request.headers.get("If-None-Match")):
+            return False
+        etags = parse_etags(header)
+        return "*" in etags or self.etag.removeprefix("W/") in {etag.removeprefix("W/") for etag in etags}
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Extended with returning HTTP 304 Not Modified for matching "If-None-Match" header.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Objects list or empty HTTP 304 response.
+        """
+        if self.is_not_modified(request):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Extended with returning HTTP 304 Not Modified for matching "If-None-Match" header.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Object details or empty HTTP 304 response.
+        """
+        if self.is_not_modified(request):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().retrieve(request, *args, **kwargs)
+
+    def finalize_response(self, request: Request, response: Response, *args, **kwargs) -> Response:
+        """
+        Extended with setting "ETag" header on successful list and detail responses.
+
+        Args:
+            request [Request]: User request.
+            response [Response]: View response.
+
+        Returns:
+            Response: Finalized response.
+        """
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.etag and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            response["ETag"] = self.etag
+        return response
+
+
+class BudgetListCacheMixin(BudgetDataVersionMixin):
+    """
+    Mixin for Budget nested ViewSets keeping serialized list responses in cache.
+
+    Cache key is built from versions of Budget resources listed in "list_cache_resources", User, request URL with
+    sorted query params and accepted media type, so every write to resources used by list makes cached responses
+    unreachable and no explicit invalidation is needed. Writes to other Budget resources keep cached responses valid.
+    Cached responses are returned without QuerySet evaluation and serialization.
+    """
+
+    list_cache_key_prefix: str = "budget_list"
+    list_cache_resources: tuple[str, ...] = ("data",)
+
+    def get_list_cache_key(self, request: Request) -> str | None:
+        """
+        Returns cache key of list response for current request.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            str | None: Cache key or None if Budget does not exist.
+        """
+        if (versions := self.get_data_versions()) is None:
+            return None
+        budget_pk = self.kwargs.get("budget_pk")
+        version = ".".join(str(versions[resource]) for resource in self.list_cache_resources)
+        query_params = sorted((key, sorted(values)) for key, values in request.query_params.lists())
+        digest = hashlib.sha256(
+            f"{request.build_absolute_uri(request.path)}:{query_params}:{request.accepted_media_type}".encode()
+        ).hexdigest()
+        return f"{self.list_cache_key_prefix}:{budget_pk}:{version}:{request.user.pk}:{digest}"
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Extended with returning cached response data and storing data of successful responses in cache.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Objects list.
+        """
+        cache_key = self.get_list_cache_key(request)
+        if cache_key and (data := cache.get(cache_key)) is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        if cache_key and response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data)
+        return response
+
+
+class ValuesListMixin:
+    """
+    Mixin for ViewSets serializing list responses straight from QuerySet.values() rows instead of model instances.
+
+    Output fields, their order and converters are taken once per request from serializer fields, so JSON output is
+    the same as for ModelSerializer, without model instances creation and per-field serializer calls. Lookups of
+    fields represented differently than by model field value can be overridden with "values_lookups". When serializer
+    contains field not backed by model field, regular list view is used.
+    """
+
+    values_list_enabled: bool = True
+    values_lookups: dict[str, str] = {}
+
+    def get_values_fields(self, queryset: QuerySet) -> list[tuple[str, str, Callable[[Any], Any] | None]] | None:
+        """
+        Returns output name, values() lookup and converter for every serializer field.
+
+        Args:
+            queryset [QuerySet]: Filtered QuerySet of listed objects.
+
+        Returns:
+            list[tuple[str, str, Callable[[Any], Any] | None]] | None: Fields description or None if serializer
+            contains field not supported by values() path. Converter is None for values returned as they are.
+        """
+        fields = []
+        for name, field in self.get_serializer().fields.items():
+            if field.write_only:
+                continue
+            if name in self.values_lookups:
+                fields.append((name, self.values_lookups[name], None))
+            elif field.source == "*" or isinstance(
+                field, (serializers.BaseSerializer, serializers.SerializerMethodField, serializers.ManyRelatedField)
+            ):
+                return None
+            elif isinstance(field, serializers.RelatedField):
+                if not isinstance(field, serializers.PrimaryKeyRelatedField):
+                    return None
+                converter = field.pk_field.to_representation if field.pk_field else None
+                fields.append((name, field.source.replace(".", "__"), converter))
+            else:
+                fields.append((name, field.source.replace(".", "__"), field.to_representation))
+        return fields
+
+    @staticmethod
+    def get_values_queryset(queryset: QuerySet, fields: list[tuple[str, str, Callable[[Any], Any] | None]]) -> QuerySet:
+        """
+        Returns values() QuerySet containing lookups of given fields and of QuerySet ordering fields, used by
+        pagination classes.
+
+        Args:
+            queryset [QuerySet]: Filtered QuerySet of listed objects.
+            fields [list[tuple[str, str, Callable[[Any], Any] | None]]]: Fields description.
+
+        Returns:
+            QuerySet: values() QuerySet.
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        lookups = dict.fromkeys(
+            [lookup for _, lookup, _ in fields]
+            + [term.lstrip("-") for term in ordering if isinstance(term, str) and term.lstrip("-") != "pk"]
+            + ["id"]
+        )
+        return queryset.values(*lookups)
+
+    @staticmethod
+    def serialize_values(rows: list[dict], fields: list[tuple[str, str, Callable[[Any], Any] | None]]) -> list[dict]:
+        """
+        Builds representation of listed objects from values() rows.
+
+        Args:
+            rows [list[dict]]: QuerySet.values() rows.
+            fields [list[tuple[str, str, Callable[[Any], Any] | None]]]: Fields description.
+
+        Returns:
+            list[dict]: Serialized objects.
+        """
+        data = []
+        for row in rows:
+            item = {}
+            for name, lookup, converter in fields:
+                value = row[lookup]
+                item[name] = value if converter is None or value is None else converter(value)
+            data.append(item)
+        return data
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Extended with serializing listed objects from values() rows.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Objects list.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if not self.values_list_enabled or (fields := self.get_values_fields(queryset)) is None:
+            return super().list(request, *args, **kwargs)
+        rows = self.get_values_queryset(queryset, fields)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_values(page, fields))
+        return Response(self.serialize_values(rows, fields))
@@ -1,7 +1,345 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from rest_framework.views import APIView
 
 
 class DefaultPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 1000
+
+
+class KeysetPagination(BasePagination):
+    """
+    Pagination class using position of last returned object instead of page number.
+
+    Position of object is described with values of all QuerySet ordering fields extended with "id" field as a
+    tiebreaker, so every page is fetched with index-friendly filter instead of OFFSET scan and no COUNT query
+    is executed.
+    """
+
+    page_size = DefaultPagination.page_size
+    page_size_query_param = DefaultPagination.page_size_query_param
+    max_page_size = DefaultPagination.max_page_size
+    cursor_query_param = "cursor"
+    tiebreaker_field = "id"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: APIView | None = None) -> list:
+        """
+        Returns single page of QuerySet objects following position encoded in cursor query param.
+
+        Args:
+            queryset [QuerySet]: Filtered and ordered QuerySet.
+            request [Request]: User request.
+            view [APIView | None]: View on which request was made.
+
+        Returns:
+            list: Objects for requested page.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        self.ordering_fields = [self.get_ordering_field(queryset.model, term.lstrip("-")) for term in self.ordering]
+        position, reverse = self.decode_cursor(request)
+
+        ordering = [self._invert_term(term) for term in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position, ordering))
+
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+            has_next, has_previous = True, has_following
+        else:
+            has_next, has_previous = has_following, position is not None
+
+        self.next_position = self.get_position(results[-1]) if results and has_next else None
+        self.previous_position = self.get_position(results[0]) if results and has_previous else None
+        return results
+
+    def get_paginated_response(self, data: list) -> Response:
+        """
+        Returns Response with page results and links to adjacent pages.
+
+        Args:
+            data [list]: Serialized page results.
+
+        Returns:
+            Response: Paginated response.
+        """
+        return Response({"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:  # pragma: no cover
+        """
+        Returns schema of paginated response.
+
+        Args:
+            schema [dict]: Schema of single page results.
+
+        Returns:
+            dict: Schema of paginated response.
+        """
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        """
+        Returns page size passed in query params or default one.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            int: Number of objects on single page.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def get_ordering(self, queryset: QuerySet) -> list[str]:
+        """
+        Returns QuerySet ordering fields extended with tiebreaker field if not present already.
+
+        Args:
+            queryset [QuerySet]: Ordered QuerySet.
+
+        Returns:
+            list[str]: Ordering fields like ["-date", "id"].
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        ordering = [term for term in ordering if isinstance(term, str)]
+        ordering = [self.tiebreaker_field if term.lstrip("-") == "pk" else term for term in ordering]
+        if self.tiebreaker_field not in [term.lstrip("-") for term in ordering]:
+            ordering.append(self.tiebreaker_field)
+        return ordering
+
+    @staticmethod
+    def get_ordering_field(model: type[Model], path: str) -> Field | None:
+        """
+        Returns model field pointed by ordering term. For relations target field of relation is returned.
+
+        Args:
+            model [type[Model]]: Model of paginated QuerySet.
+            path [str]: Ordering term without direction prefix like "category__name".
+
+        Returns:
+            Field | None: Model field or None if term does not point model field (e.g. annotation).
+        """
+        field = None
+        for name in path.split("__"):
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if field.is_relation:
+                model = field.related_model
+        if field.is_relation:
+            field = getattr(field, "target_field", None)
+        return field
+
+    @staticmethod
+    def get_position_filter(position: list, ordering: list[str]) -> Q:
+        """
+        Builds filter returning objects placed after given position in given ordering.
+
+        Args:
+            position [list]: Values of ordering fields for last object of previous page.
+            ordering [list[str]]: Ordering fields.
+
+        Returns:
+            Q: Lexicographical "greater than position" condition.
+        """
+        position_filter = Q()
+        for index, term in enumerate(ordering):
+            lookup = "lt" if term.startswith("-") else "gt"
+            condition = Q(**{f"{term.lstrip('-')}__{lookup}": position[index]})
+            for previous_term, previous_value in zip(ordering[:index], position[:index]):
+                condition &= Q(**{previous_term.lstrip("-"): previous_value})
+            position_filter |= condition
+        return position_filter
+
+    def get_position(self, item: Model | dict) -> list:
+        """
+        Returns values of ordering fields for given page item.
+
+        Args:
+            item [Model | dict]: Model instance or dictionary containing ordering fields values.
+
+        Returns:
+            list: Values of ordering fields.
+        """
+        position = []
+        for term in self.ordering:
+            field = term.lstrip("-")
+            if isinstance(item, dict):
+                value = item[field]
+            else:
+                value = item
+                for attribute in field.split("__"):
+                    value = getattr(value, attribute)
+                value = getattr(value, "pk", value)
+            position.append(value)
+        return position
+
+    def get_cursor_link(self, position: list, reverse: bool) -> str:
+        """
+        Returns URL of current request with cursor query param encoding given position and direction.
+
+        Args:
+            position [list]: Values of ordering fields.
+            reverse [bool]: Indicates if objects should be fetched before position.
+
+        Returns:
+            str: URL with encoded cursor.
+        """
+        payload = {"p": [self._serialize_value(value) for value in position], "r": reverse}
+        cursor = b64encode(json.dumps(payload).encode("utf-8"), altchars=b"-_").decode("ascii")
+        url = remove_query_param(self.request.build_absolute_uri(), "page")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request: Request) -> tuple[list | None, bool]:
+        """
+        Decodes position and direction of pagination from cursor query param.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            tuple[list | None, bool]: Position (None for first page) and reverse flag.
+
+        Raises:
+            NotFound: Raised on malformed cursor, cursor not matching current ordering or position values not valid
+            for ordering fields.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(b64decode(encoded.encode("ascii"), altchars=b"-_", validate=True).decode("utf-8"))
+            position, reverse = payload["p"], bool(payload["r"])
+            if not isinstance(position, list) or len(position) != len(self.ordering):
+                raise ValueError
+            position = [
+                field.to_python(value) if field is not None else value
+                for field, value in zip(self.ordering_fields, position)
+            ]
+        except (BinasciiError, KeyError, TypeError, UnicodeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def get_next_link(self) -> str | None:
+        """
+        Returns link to next page.
+
+        Returns:
+            str | None: URL of next page or None if there is no next page.
+        """
+        if self.next_position is None:
+            return None
+        return self.get_cursor_link(self.next_position, reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        """
+        Returns link to previous page.
+
+        Returns:
+            str | None: URL of previous page or None if there is no previous page.
+        """
+        if self.previous_position is None:
+            return None
+        return self.get_cursor_link(self.previous_position, reverse=True)
+
+    @staticmethod
+    def _invert_term(term: str) -> str:
+        """
+        Inverts direction of ordering term.
+
+        Args:
+            term [str]: Ordering term like "-date".
+
+        Returns:
+            str: Inverted ordering term like "date".
+        """
+        return term[1:] if term.startswith("-") else f"-{term}"
+
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        """
+        Converts ordering field value into JSON serializable one.
+
+        Args:
+            value [Any]: Ordering field value.
+
+        Returns:
+            Any: JSON serializable value.
+        """
+        if isinstance(value, (Decimal, date)):
+            return str(value)
+        return value
+
+
+class OptionalKeysetPagination(DefaultPagination):
+    """
+    DefaultPagination switching to KeysetPagination when "pagination=cursor" query param passed in request.
+    """
+
+    mode_query_param = "pagination"
+    keyset_mode = "cursor"
+    keyset_pagination_class = KeysetPagination
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: APIView | None = None) -> list | None:
+        """
+        Paginates QuerySet with KeysetPagination if requested, with page number otherwise.
+
+        Args:
+            queryset [QuerySet]: Filtered and ordered QuerySet.
+            request [Request]: User request.
+            view [APIView | None]: View on which request was made.
+
+        Returns:
+            list | None: Objects for requested page.
+        """
+        if request.query_params.get(self.mode_query_param) == self.keyset_mode:
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view)
+        self.keyset_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data: list) -> Response:
+        """
+        Returns paginated Response prepared by used pagination mode.
+
+        Args:
+            data [list]: Serialized page results.
+
+        Returns:
+            Response: Paginated response.
+        """
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
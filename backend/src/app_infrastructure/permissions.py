@@ -10,7 +10,8 @@ class UserBelongsToBudgetPermission(permissions.BasePermission):
 
     def has_permission(self, request: Request, view: APIView) -> bool:
         """
-        Checks if User is owner or member of Budget passed in URL.
+        Checks if User is owner or member of Budget passed in URL. For requests authenticated with signed access
+        token Budgets ids from token claims are checked first, so membership is verified without database access.
 
         Args:
             request [Request]: User request.
@@ -22,4 +23,6 @@ class UserBelongsToBudgetPermission(permissions.BasePermission):
         if request.method == "OPTIONS":  # pragma: no cover
             return request.user.is_authenticated
         budget_pk = getattr(view, "kwargs", {}).get("budget_pk")
+        if isinstance(request.auth, dict) and str(budget_pk) in map(str, request.auth.get("bids", ())):
+            return True
         return request.user.is_budget_member(budget_pk)
@@ -0,0 +1,167 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+
+
+class AuthTokenCacheService:
+    """
+    Service keeping authenticated Users in cache mapped by hashed token key.
+
+    Entries expire after TIMEOUT seconds and have to be invalidated on every change of Token or User. With cache
+    backend shared by all server processes (SHARED_CACHE_ENABLED setting) entries are kept in Django cache, so
+    invalidation is visible in every process immediately. Otherwise entries are kept in bounded, process local LRU
+    cache (least recently used entries are evicted when cache exceeds MAX_SIZE entries) - lookup does not perform
+    any network call, but changes made in other processes are reflected only after TIMEOUT.
+    """
+
+    KEY_PREFIX: str = "auth_token"
+    MAX_SIZE: int = 1024
+    TIMEOUT: int = 60
+
+    _entries: OrderedDict = OrderedDict()
+    _user_keys: dict[int, set[str]] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def get_cache_key(token_key: str) -> str:
+        """
+        Returns cache key for given token key, so raw tokens are not kept in memory.
+
+        Args:
+            token_key (str): Token key passed in request.
+
+        Returns:
+            str: SHA-256 digest of token key.
+        """
+        return hashlib.sha256(token_key.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get(cls, token_key: str) -> tuple[Model, Model] | None:
+        """
+        Returns copies of cached User and Token for given token key.
+
+        Args:
+            token_key (str): Token key passed in request.
+
+        Returns:
+            tuple[Model, Model] | None: User and Token model instances or None if entry is missing or expired.
+        """
+        key = cls.get_cache_key(token_key)
+        if settings.SHARED_CACHE_ENABLED:
+            if (entry := cache.get(f"{cls.KEY_PREFIX}:{key}")) is None:
+                return None
+            user, token = entry
+        else:
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is None:
+                    return None
+                user, token, expires_at = entry
+                if expires_at <= time.monotonic():
+                    cls._remove(key)
+                    return None
+                cls._entries.move_to_end(key)
+            user, token = copy.copy(user), copy.copy(token)
+        token.user = user
+        return user, token
+
+    @classmethod
+    def set(cls, token_key: str, user: Model, token: Model) -> None:
+        """
+        Stores copies of User and Token for given token key, evicting least recently used entries if needed.
+
+        Args:
+            token_key (str): Token key passed in request.
+            user (Model): Authenticated User model instance.
+            token (Model): Token model instance.
+        """
+        key = cls.get_cache_key(token_key)
+        if settings.SHARED_CACHE_ENABLED:
+            cache.set(f"{cls.KEY_PREFIX}:{key}", (user, token), cls.TIMEOUT)
+            return
+        with cls._lock:
+            cls._remove(key)
+            cls._entries[key] = (copy.copy(user), copy.copy(token), time.monotonic() + cls.TIMEOUT)
+            cls._user_keys.setdefault(user.pk, set()).add(key)
+            while len(cls._entries) > cls.MAX_SIZE:
+                cls._remove(next(iter(cls._entries)))
+
+    @classmethod
+    def invalidate_token(cls, token_key: str) -> None:
+        """
+        Removes cached entry for given token key.
+
+        Args:
+            token_key (str): Token key.
+        """
+        cls.invalidate_tokens([token_key])
+
+    @classmethod
+    def invalidate_tokens(cls, token_keys: list[str]) -> None:
+        """
+        Removes cached entries for given token keys. Shared cache entries are removed immediately and once again
+        after commit of current transaction, so entries cached by concurrent requests before commit are not kept.
+
+        Args:
+            token_keys (list[str]): Token keys.
+        """
+        keys = [cls.get_cache_key(token_key) for token_key in token_keys]
+        if settings.SHARED_CACHE_ENABLED:
+            cache_keys = [f"{cls.KEY_PREFIX}:{key}" for key in keys]
+            cache.delete_many(cache_keys)
+            transaction.on_commit(lambda: cache.delete_many(cache_keys))
+            return
+        with cls._lock:
+            for key in keys:
+                cls._remove(key)
+
+    @classmethod
+    def invalidate_user(cls, user_id: int) -> None:
+        """
+        Removes all cached entries of given User. Shared cache entries are found by keys of User Tokens stored in
+        database.
+
+        Args:
+            user_id (int): User database id.
+        """
+        from rest_framework.authtoken.models import Token
+
+        if settings.SHARED_CACHE_ENABLED:
+            cls.invalidate_tokens(list(Token.objects.filter(user_id=user_id).values_list("key", flat=True)))
+            return
+        with cls._lock:
+            for key in list(cls._user_keys.get(user_id, ())):
+                cls._remove(key)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Removes all entries of process local cache.
+        """
+        with cls._lock:
+            cls._entries.clear()
+            cls._user_keys.clear()
+
+    @classmethod
+    def _remove(cls, key: str) -> None:
+        """
+        Removes cached entry with given key. Has to be called with acquired lock.
+
+        Args:
+            key (str): Cache key.
+        """
+        entry = cls._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0].pk
+        user_keys = cls._user_keys.get(user_id, set())
+        user_keys.discard(key)
+        if not user_keys:
+            cls._user_keys.pop(user_id, None)
@@ -0,0 +1,206 @@
+import weakref
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+
+class OriginBump:
+    """
+    Versions increases collected for objects deleted by single bulk operation, applied once after commit.
+    """
+
+    def __init__(self):
+        self.resources: dict[int, set[str]] = {}
+        self.budgets_by_period: dict[int, int] = {}
+        self.applied: bool = False
+
+
+class BudgetDataVersionService:
+    """
+    Service reading and bumping data versions of Budget.
+
+    Data version is increased on every write to objects owned by Budget, so it can be used to check if any Budget
+    data changed without querying the data itself. Besides it, separate version is kept for every Budget resource -
+    BudgetingPeriods, TransferCategories, Entities, Transfers and ExpensePredictions - so data depending on single
+    resources is not invalidated by writes to other ones. With shared cache, current versions are stored in cache under
+    key containing Budget id, so in steady state reading them does not query database. Process local cache is not
+    cleared by writes handled in other processes, so without shared cache versions are always read from Budget row.
+    """
+
+    KEY_PREFIX: str = "budget_data_versions"
+    TIMEOUT: int = 60 * 60
+    RESOURCES: tuple[str, ...] = ("periods", "categories", "entities", "transfers", "predictions")
+    _origin_bumps: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_cache_key(cls, budget_id: int | str) -> str:
+        """
+        Returns cache key for data versions of given Budget.
+
+        Args:
+            budget_id (int | str): Budget database id.
+
+        Returns:
+            str: Cache key.
+        """
+        return f"{cls.KEY_PREFIX}:{budget_id}"
+
+    @classmethod
+    def get_versions(cls, budget_id: int | str) -> dict[str, int] | None:
+        """
+        Returns data versions of Budget, reading them from shared cache or database.
+
+        Args:
+            budget_id (int | str): Budget database id.
+
+        Returns:
+            dict[str, int] | None: Budget data version under "data" key and versions of Budget resources under
+            resources names or None if Budget does not exist.
+        """
+        if not settings.SHARED_CACHE_ENABLED:
+            return cls.load_versions(budget_id)
+        key = cls.get_cache_key(budget_id)
+        versions = cache.get(key)
+        if versions is None:
+            versions = cls.load_versions(budget_id)
+            if versions is not None:
+                cache.set(key, versions, cls.TIMEOUT)
+        return versions
+
+    @classmethod
+    def get_version(cls, budget_id: int | str) -> int | None:
+        """
+        Returns data version of Budget, reading it from shared cache or database.
+
+        Args:
+            budget_id (int | str): Budget database id.
+
+        Returns:
+            int | None: Budget data version or None if Budget does not exist.
+        """
+        versions = cls.get_versions(budget_id)
+        return None if versions is None else versions["data"]
+
+    @classmethod
+    def load_versions(cls, budget_id: int | str) -> dict[str, int] | None:
+        """
+        Reads data versions of Budget from database.
+
+        Args:
+            budget_id (int | str): Budget database id.
+
+        Returns:
+            dict[str, int] | None: Budget data versions or None if Budget does not exist.
+        """
+        from budgets.models import Budget
+
+        row = (
+            Budget.objects.filter(pk=budget_id)
+            .values_list("data_version", *(f"{resource}_version" for resource in cls.RESOURCES))
+            .first()
+        )
+        return None if row is None else dict(zip(("data", *cls.RESOURCES), row))
+
+    @staticmethod
+    def get_budget_ids(
+        budget_ids: Iterable[int], periods_ids: Iterable[int], budgets_by_period: dict[int, int] | None = None
+    ) -> set[int]:
+        """
+        Returns given Budgets ids extended with ids of Budgets of given BudgetingPeriods.
+
+        Args:
+            budget_ids (Iterable[int]): Budgets database ids.
+            periods_ids (Iterable[int]): BudgetingPeriods database ids.
+            budgets_by_period (dict[int, int] | None): Already resolved Budgets ids mapped by BudgetingPeriods ids,
+                extended with newly resolved ones.
+
+        Returns:
+            set[int]: Budgets database ids.
+        """
+        from budgets.models import BudgetingPeriod
+
+        budgets_by_period = {} if budgets_by_period is None else budgets_by_period
+        budget_ids = {budget_id for budget_id in budget_ids if budget_id is not None}
+        periods_ids = {period_id for period_id in periods_ids if period_id is not None}
+        if unresolved_periods_ids := periods_ids - budgets_by_period.keys():
+            budgets_by_period.update(
+                BudgetingPeriod.objects.filter(pk__in=unresolved_periods_ids).values_list("id", "budget_id")
+            )
+        budget_ids.update(budgets_by_period[period_id] for period_id in periods_ids if period_id in budgets_by_period)
+        return budget_ids
+
+    @classmethod
+    def bump(cls, resource: str, budget_ids: Iterable[int] = (), periods_ids: Iterable[int] = ()) -> None:
+        """
+        Increases data version and version of given resource of given Budgets and of Budgets of given
+        BudgetingPeriods after commit of current transaction, or immediately outside of transaction. Versions are
+        updated with separate, single statement transaction, so Budget row is not locked until commit of long running
+        writes - for the price of short window, in which committed data is reported with previous versions. Cached
+        versions are removed after update.
+
+        Args:
+            resource (str): Name of written resource, one of RESOURCES.
+            budget_ids (Iterable[int]): Budgets database ids.
+            periods_ids (Iterable[int]): BudgetingPeriods database ids.
+        """
+        if budget_ids := cls.get_budget_ids(budget_ids, periods_ids):
+            resources = {budget_id: {resource} for budget_id in budget_ids}
+            transaction.on_commit(lambda: cls._update_versions(resources))
+
+    @classmethod
+    def bump_once(
+        cls, origin: object, resource: str, budget_ids: Iterable[int] = (), periods_ids: Iterable[int] = ()
+    ) -> None:
+        """
+        Increases versions of given Budgets and of Budgets of given BudgetingPeriods like bump, but once for all
+        calls with given origin of bulk operation made in current transaction. Used for deletes sending post_delete
+        signal for every deleted object, including objects of other resources deleted in cascade, so data version of
+        every Budget is increased once per operation, together with versions of all deleted resources.
+
+        Args:
+            origin (object): Object which started bulk operation, like deleted QuerySet.
+            resource (str): Name of written resource, one of RESOURCES.
+            budget_ids (Iterable[int]): Budgets database ids.
+            periods_ids (Iterable[int]): BudgetingPeriods database ids.
+        """
+        bump = cls._origin_bumps.get(origin)
+        if bump is None or bump.applied:
+            bump = cls._origin_bumps[origin] = OriginBump()
+            transaction.on_commit(lambda: cls._apply_origin_bump(bump))
+        for budget_id in cls.get_budget_ids(budget_ids, periods_ids, bump.budgets_by_period):
+            bump.resources.setdefault(budget_id, set()).add(resource)
+
+    @classmethod
+    def _apply_origin_bump(cls, bump: OriginBump) -> None:
+        """
+        Applies versions increases collected for bulk operation origin.
+
+        Args:
+            bump (OriginBump): Collected versions increases.
+        """
+        bump.applied = True
+        cls._update_versions(bump.resources)
+
+    @classmethod
+    def _update_versions(cls, resources: dict[int, set[str]]) -> None:
+        """
+        Increases data version and versions of given resources of Budgets in database and removes their cached
+        versions. Budgets with the same set of written resources are updated with single query.
+
+        Args:
+            resources (dict[int, set[str]]): Names of written resources mapped by Budget id.
+        """
+        from budgets.models import Budget
+
+        budgets_by_resources = {}
+        for budget_id, budget_resources in resources.items():
+            budgets_by_resources.setdefault(frozenset(budget_resources), []).append(budget_id)
+        for budget_resources, budget_ids in budgets_by_resources.items():
+            Budget.objects.filter(pk__in=budget_ids).update(
+                data_version=F("data_version") + 1,
+                **{f"{resource}_version": F(f"{resource}_version") + 1 for resource in budget_resources},
+            )
+        cache.delete_many([cls.get_cache_key(budget_id) for budget_id in resources])
@@ -0,0 +1,87 @@
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class BudgetMembershipCacheService:
+    """
+    Service caching ids of Budgets to which User belongs.
+
+    Set of Budgets ids is fetched from database with single query on first check and stored in cache under key
+    containing User id, so subsequent membership checks do not query database. Cached entries have to be
+    invalidated on every change of Budget members, so they are used only with cache backend shared by all server
+    processes (SHARED_CACHE_ENABLED setting). With process local cache Budgets ids are always fetched from database.
+    """
+
+    KEY_PREFIX: str = "budget_membership"
+    TIMEOUT: int = 60 * 60
+
+    @classmethod
+    def get_cache_key(cls, user_id: int) -> str:
+        """
+        Returns cache key for Budgets ids of given User.
+
+        Args:
+            user_id (int): User database id.
+
+        Returns:
+            str: Cache key.
+        """
+        return f"{cls.KEY_PREFIX}:{user_id}"
+
+    @classmethod
+    def get_budget_ids(cls, user_id: int) -> set[int]:
+        """
+        Returns ids of Budgets to which User belongs, reading them from cache or database.
+
+        Args:
+            user_id (int): User database id.
+
+        Returns:
+            set[int]: Budgets database ids.
+        """
+        from budgets.models import Budget
+
+        if not settings.SHARED_CACHE_ENABLED:
+            return set(Budget.members.through.objects.filter(user_id=user_id).values_list("budget_id", flat=True))
+        key = cls.get_cache_key(user_id)
+        budget_ids = cache.get(key)
+        if budget_ids is None:
+            budget_ids = set(Budget.members.through.objects.filter(user_id=user_id).values_list("budget_id", flat=True))
+            cache.set(key, budget_ids, cls.TIMEOUT)
+        return budget_ids
+
+    @classmethod
+    def is_member(cls, user_id: int, budget_id: int | str | None) -> bool:
+        """
+        Checks if User belongs to Budget with given id.
+
+        Args:
+            user_id (int): User database id.
+            budget_id (int | str | None): Budget database id.
+
+        Returns:
+            bool: True if User is member of Budget, False otherwise.
+        """
+        try:
+            budget_id = int(budget_id)
+        except (TypeError, ValueError):
+            return False
+        return budget_id in cls.get_budget_ids(user_id)
+
+    @classmethod
+    def invalidate(cls, user_ids: Iterable[int]) -> None:
+        """
+        Removes cached Budgets ids of given Users. Entries are removed immediately and once again after commit of
+        current transaction, so values cached by concurrent requests before commit are not kept.
+
+        Args:
+            user_ids (Iterable[int]): Users database ids.
+        """
+        keys = [cls.get_cache_key(user_id) for user_id in set(user_ids)]
+        if not keys:
+            return
+        cache.delete_many(keys)
+        transaction.on_commit(lambda: cache.delete_many(keys))
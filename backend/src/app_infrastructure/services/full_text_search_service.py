@@ -0,0 +1,82 @@
+import re
+from functools import reduce
+from operator import and_, or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import FloatField, Q, QuerySet, Value
+
+
+class FullTextSearchService:
+    """
+    Service searching QuerySets by text fields with PostgreSQL full text search.
+
+    Searched fields are combined into weighted tsvector - first field is the most important one. Every word of
+    searched phrase is matched as prefix, so partially typed words are found, and results are annotated with
+    "search_rank". Expression returned by get_vector is used in GIN indexes of searched models, so search does
+    not scan whole tables. On other database backends "icontains" lookups are used.
+    """
+
+    CONFIG: str = "simple"
+    RANK_FIELD: str = "search_rank"
+    WEIGHTS: str = "ABCD"
+
+    @classmethod
+    def get_vector(cls, *fields: str) -> SearchVector:
+        """
+        Returns weighted tsvector expression for given fields.
+
+        Args:
+            fields (str): Searched fields names, ordered from the most important one.
+
+        Returns:
+            SearchVector: Search vector expression.
+        """
+        return reduce(
+            lambda vector, field: vector + field,
+            (
+                SearchVector(field, weight=weight, config=cls.CONFIG)
+                for field, weight in zip(fields, cls.WEIGHTS, strict=False)
+            ),
+        )
+
+    @classmethod
+    def get_terms(cls, phrase: str) -> list[str]:
+        """
+        Splits searched phrase into words, skipping characters with special meaning in tsquery syntax.
+
+        Args:
+            phrase (str): Searched phrase.
+
+        Returns:
+            list[str]: Words of searched phrase.
+        """
+        return re.findall(r"\w+", phrase)
+
+    @classmethod
+    def search(cls, queryset: QuerySet, phrase: str, *fields: str) -> QuerySet:
+        """
+        Filters QuerySet with objects containing all words of phrase as prefixes of words in given fields and
+        annotates them with "search_rank".
+
+        Args:
+            queryset (QuerySet): Searched QuerySet.
+            phrase (str): Searched phrase.
+            fields (str): Searched fields names, ordered from the most important one.
+
+        Returns:
+            QuerySet: Filtered QuerySet annotated with "search_rank".
+        """
+        if not (terms := cls.get_terms(phrase)):
+            return queryset
+        if connections[queryset.db].vendor != "postgresql":
+            return queryset.filter(
+                reduce(and_, (reduce(or_, (Q(**{f"{field}__icontains": term}) for field in fields)) for term in terms))
+            ).annotate(**{cls.RANK_FIELD: Value(0.0, output_field=FloatField())})
+        vector = cls.get_vector(*fields)
+        query = SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw", config=cls.CONFIG)
+        return (
+            queryset.alias(search_vector=vector)
+            .filter(search_vector=query)
+            .annotate(**{cls.RANK_FIELD: SearchRank(vector, query)})
+        )
@@ -0,0 +1,245 @@
+import time
+import uuid
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db import router
+from django.db.models import Exists, Model
+
+from app_infrastructure.services.budget_membership_cache_service import BudgetMembershipCacheService
+
+
+class SignedTokenError(Exception):
+    """Exception raised when signed token is malformed, expired, revoked or of unexpected type."""
+
+
+class SignedTokenService:
+    """
+    Service issuing and validating signed access and refresh tokens.
+
+    Tokens are signed with SECRET_KEY, so they can be validated without database access. Access token is short-lived
+    and carries ids of User and of Budgets to which User belongs in its claims. Refresh token is long-lived and can be
+    exchanged for new tokens pair. Revoked refresh tokens are stored in RevokedToken table and mirrored in cache.
+    Access tokens issued for revoked refresh token or for inactive User are denied by cache lookup when cache is
+    shared by all server processes (SHARED_CACHE_ENABLED setting), otherwise by database lookup.
+    """
+
+    SALT: str = "app_infrastructure.signed_token"
+    ACCESS: str = "access"
+    REFRESH: str = "refresh"
+    REVOKED_KEY_PREFIX: str = "revoked_token"
+    INACTIVE_USER_KEY_PREFIX: str = "inactive_user"
+
+    @classmethod
+    def issue(cls, user: Model) -> dict[str, str]:
+        """
+        Issues new pair of access and refresh tokens for given User.
+
+        Args:
+            user (Model): User model instance.
+
+        Returns:
+            dict[str, str]: Dictionary with "access" and "refresh" tokens.
+        """
+        now = int(time.time())
+        refresh_claims = {
+            "typ": cls.REFRESH,
+            "uid": user.pk,
+            "jti": uuid.uuid4().hex,
+            "exp": now + settings.SIGNED_REFRESH_TOKEN_LIFETIME,
+        }
+        access_claims = {
+            "typ": cls.ACCESS,
+            "uid": user.pk,
+            "bids": sorted(BudgetMembershipCacheService.get_budget_ids(user.pk)),
+            "sid": refresh_claims["jti"],
+            "exp": now + settings.SIGNED_ACCESS_TOKEN_LIFETIME,
+        }
+        return {
+            cls.ACCESS: signing.dumps(access_claims, salt=cls.SALT, compress=True),
+            cls.REFRESH: signing.dumps(refresh_claims, salt=cls.SALT, compress=True),
+        }
+
+    @classmethod
+    def decode(cls, token: str, token_type: str) -> dict:
+        """
+        Validates signature, type, expiration and revocation of token and returns its claims. Refresh tokens are
+        checked against RevokedToken table. Access tokens are checked against cache and, with shared cache, User is
+        checked to be active as well. Without shared cache, revocation and User state of access token are checked
+        in database by get_user.
+
+        Args:
+            token (str): Signed token.
+            token_type (str): Expected token type - ACCESS or REFRESH.
+
+        Returns:
+            dict: Token claims.
+
+        Raises:
+            SignedTokenError: Raised when token is invalid.
+        """
+        try:
+            claims = signing.loads(token, salt=cls.SALT)
+        except signing.BadSignature:
+            raise SignedTokenError("Invalid token.")
+        if not isinstance(claims, dict) or claims.get("typ") != token_type:
+            raise SignedTokenError("Invalid token.")
+        if claims["exp"] <= time.time():
+            raise SignedTokenError("Token expired.")
+        session_id = claims["jti"] if token_type == cls.REFRESH else claims["sid"]
+        if cls.is_revoked(session_id, check_database=token_type == cls.REFRESH):
+            raise SignedTokenError("Token revoked.")
+        if token_type == cls.ACCESS and settings.SHARED_CACHE_ENABLED and not cls.is_user_active(claims["uid"]):
+            raise SignedTokenError("User inactive or deleted.")
+        return claims
+
+    @classmethod
+    def get_user(cls, claims: dict) -> Model:
+        """
+        Returns User of access token claims returned by decode method. With shared cache, token was fully validated
+        by decode, so User instance is built from claims without database query - its fields are loaded with single
+        query on first access. Without shared cache, active User is loaded together with revocation state of token
+        with single query.
+
+        Args:
+            claims (dict): Access token claims.
+
+        Returns:
+            Model: User model instance.
+
+        Raises:
+            SignedTokenError: Raised when token was revoked or User is inactive or deleted.
+        """
+        from app_users.models import RevokedToken, User
+
+        if settings.SHARED_CACHE_ENABLED:
+            return User.from_db(router.db_for_read(User), [User._meta.pk.attname], [claims["uid"]])
+        user = (
+            User.objects.filter(pk=claims["uid"], is_active=True)
+            .annotate(session_revoked=Exists(RevokedToken.objects.filter(jti=claims["sid"])))
+            .first()
+        )
+        if user is None:
+            raise SignedTokenError("User inactive or deleted.")
+        if user.session_revoked:
+            raise SignedTokenError("Token revoked.")
+        return user
+
+    @classmethod
+    def refresh(cls, claims: dict) -> dict[str, str]:
+        """
+        Revokes refresh token with given claims and issues new tokens pair for its User.
+
+        Args:
+            claims (dict): Refresh token claims returned by decode method.
+
+        Returns:
+            dict[str, str]: Dictionary with "access" and "refresh" tokens.
+
+        Raises:
+            SignedTokenError: Raised when refresh token was revoked concurrently or User is inactive or deleted.
+        """
+        from app_users.models import User
+
+        user = User.objects.filter(pk=claims["uid"], is_active=True).first()
+        if user is None:
+            raise SignedTokenError("User inactive or deleted.")
+        if not cls.revoke(claims):
+            raise SignedTokenError("Token revoked.")
+        return cls.issue(user)
+
+    @classmethod
+    def revoke(cls, claims: dict) -> bool:
+        """
+        Stores identifier of refresh token in RevokedToken table and cache. Access tokens issued for this refresh
+        token are revoked as well. Rows of expired tokens are removed from RevokedToken table.
+
+        Args:
+            claims (dict): Refresh token claims.
+
+        Returns:
+            bool: True if token was revoked by this call, False if it was revoked already.
+        """
+        from app_users.models import RevokedToken
+
+        expires_at = datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+        RevokedToken.objects.filter(expires_at__lte=datetime.now(tz=timezone.utc)).delete()
+        _, created = RevokedToken.objects.get_or_create(jti=claims["jti"], defaults={"expires_at": expires_at})
+        cache.set(cls.get_revoked_cache_key(claims["jti"]), True, max(int(claims["exp"] - time.time()), 1))
+        return created
+
+    @classmethod
+    def is_revoked(cls, jti: str, check_database: bool = False) -> bool:
+        """
+        Checks if refresh token with given identifier was revoked.
+
+        Args:
+            jti (str): Refresh token identifier.
+            check_database (bool): Indicates if RevokedToken table should be checked on cache miss.
+
+        Returns:
+            bool: True if token was revoked, False otherwise.
+        """
+        from app_users.models import RevokedToken
+
+        if cache.get(cls.get_revoked_cache_key(jti)):
+            return True
+        return check_database and RevokedToken.objects.filter(jti=jti).exists()
+
+    @classmethod
+    def is_user_active(cls, user_id: int) -> bool:
+        """
+        Checks if User with given id is active, using ids of inactive Users stored in shared cache by
+        set_user_active.
+
+        Args:
+            user_id (int): User database id.
+
+        Returns:
+            bool: True if User is active, False otherwise.
+        """
+        return not cache.get(cls.get_inactive_user_cache_key(user_id))
+
+    @classmethod
+    def set_user_active(cls, user_id: int, is_active: bool) -> None:
+        """
+        Stores in cache or removes from cache id of inactive or deleted User. Entries are kept for access token
+        lifetime, as refresh tokens of inactive Users are denied by database lookup.
+
+        Args:
+            user_id (int): User database id.
+            is_active (bool): Indicates if User is active.
+        """
+        key = cls.get_inactive_user_cache_key(user_id)
+        if is_active:
+            cache.delete(key)
+        else:
+            cache.set(key, True, settings.SIGNED_ACCESS_TOKEN_LIFETIME)
+
+    @classmethod
+    def get_inactive_user_cache_key(cls, user_id: int) -> str:
+        """
+        Returns cache key of inactive User.
+
+        Args:
+            user_id (int): User database id.
+
+        Returns:
+            str: Cache key.
+        """
+        return f"{cls.INACTIVE_USER_KEY_PREFIX}:{user_id}"
+
+    @classmethod
+    def get_revoked_cache_key(cls, jti: str) -> str:
+        """
+        Returns cache key of revoked refresh token.
+
+        Args:
+            jti (str): Refresh token identifier.
+
+        Returns:
+            str: Cache key.
+        """
+        return f"{cls.REVOKED_KEY_PREFIX}:{jti}"
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class AppUsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app_users"
+
+    def ready(self) -> None:
+        """
+        Registers signals receivers of app_users app.
+        """
+        import app_users.signals  # noqa: F401
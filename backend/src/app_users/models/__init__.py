@@ -1,3 +1,4 @@
+from .revoked_token_model import RevokedToken
 from .user_model import User
 
-__all__ = ["User"]
+__all__ = ["RevokedToken", "User"]
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """
+    RevokedToken model storing identifiers of revoked signed refresh tokens until their expiration.
+
+    Signed tokens are validated without database access, so revoked tokens have to be denied explicitly. Rows of
+    expired tokens are not needed anymore and are removed on next revocation.
+    """
+
+    jti = models.CharField(max_length=32, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        """
+        Returns string representation of RevokedToken model instance.
+
+        Returns:
+            str: Custom string representation of instance.
+        """
+        return self.jti
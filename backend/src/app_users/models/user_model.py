@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
 
+from app_infrastructure.services.budget_membership_cache_service import BudgetMembershipCacheService
 from app_users.managers.user_manager import UserManager
 
 
@@ -16,9 +17,23 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     USERNAME_FIELD = "email"
 
+    def refresh_from_db(self, using: str | None = None, fields: list[str] | None = None, **kwargs) -> None:
+        """
+        Method extended with loading all deferred fields when any of them is loaded, so User instance built from
+        signed token claims with only id loaded fetches remaining fields with single query on first access.
+
+        Args:
+            using [str | None]: Database alias.
+            fields [list[str] | None]: Loaded fields names.
+        """
+        if fields is not None and (deferred_fields := self.get_deferred_fields()).intersection(fields):
+            fields = deferred_fields.union(fields)
+        super().refresh_from_db(using, fields, **kwargs)
+
     def is_budget_member(self, budget_id: str) -> bool:
         """
-        Method to verify if User is member of Budget with given database ID.
+        Method to verify if User is member of Budget with given database ID. Ids of User Budgets are cached, so
+        in steady state check does not query database.
 
         Args:
             budget_id [str]: Budget database id.
@@ -26,4 +41,4 @@ class User(AbstractBaseUser, PermissionsMixin):
         Returns:
             bool: True if User is member of given Budget, False otherwise.
         """
-        return bool(self.joined_budgets.filter(pk=budget_id).values("pk"))  # NOQA
+        return BudgetMembershipCacheService.is_member(self.pk, budget_id)
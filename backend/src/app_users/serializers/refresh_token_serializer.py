@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from app_infrastructure.services.signed_token_service import SignedTokenError, SignedTokenService
+
+
+class RefreshTokenSerializer(serializers.Serializer):
+    """Serializer for signed refresh token."""
+
+    refresh = serializers.CharField()
+
+    def validate_refresh(self, value: str) -> dict:
+        """
+        Validates signed refresh token.
+
+        Args:
+            value [str]: Signed refresh token.
+
+        Returns:
+            dict: Refresh token claims.
+
+        Raises:
+            ValidationError: Raised when refresh token is malformed, expired or revoked.
+        """
+        try:
+            return SignedTokenService.decode(value, SignedTokenService.REFRESH)
+        except SignedTokenError as exc:
+            raise serializers.ValidationError(str(exc))
@@ -0,0 +1,59 @@
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from app_infrastructure.services.auth_token_cache_service import AuthTokenCacheService
+from app_infrastructure.services.signed_token_service import SignedTokenService
+from app_users.models import User
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token_cache(sender: type[Model], instance: Token, **kwargs) -> None:
+    """
+    Invalidates cached authentication of changed, regenerated or deleted Token.
+
+    Args:
+        sender (type[Model]): Token model class.
+        instance (Token): Saved or deleted Token instance.
+    """
+    AuthTokenCacheService.invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_token_cache(sender: type[Model], instance: User, **kwargs) -> None:
+    """
+    Invalidates cached authentications of changed or deleted User, so changes of "is_active" flag, password or
+    other User data are visible in next request.
+
+    Args:
+        sender (type[Model]): User model class.
+        instance (User): Saved or deleted User instance.
+    """
+    AuthTokenCacheService.invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def update_inactive_user_cache(sender: type[Model], instance: User, **kwargs) -> None:
+    """
+    Marks saved User in cache as active or inactive, so signed access tokens of deactivated User are denied.
+
+    Args:
+        sender (type[Model]): User model class.
+        instance (User): Saved User instance.
+    """
+    SignedTokenService.set_user_active(instance.pk, instance.is_active)
+
+
+@receiver(post_delete, sender=User)
+def mark_deleted_user_inactive(sender: type[Model], instance: User, **kwargs) -> None:
+    """
+    Marks deleted User in cache as inactive, so signed access tokens of deleted User are denied.
+
+    Args:
+        sender (type[Model]): User model class.
+        instance (User): Deleted User instance.
+    """
+    SignedTokenService.set_user_active(instance.pk, False)
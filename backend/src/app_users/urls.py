@@ -4,6 +4,8 @@ from app_users.views.authenticated_user_view import AuthenticatedUserView
 from app_users.views.create_token_view import CreateTokenView
 from app_users.views.create_user_view import CreateUserView
 from app_users.views.list_user_view import ListUserView
+from app_users.views.refresh_token_view import RefreshTokenView
+from app_users.views.revoke_token_view import RevokeTokenView
 
 app_name = "app_users"
 
@@ -11,5 +13,7 @@ urlpatterns = [
     path("", ListUserView.as_view(), name="list"),
     path("create/", CreateUserView.as_view(), name="create"),
     path("token/", CreateTokenView.as_view(), name="token"),
+    path("token/refresh/", RefreshTokenView.as_view(), name="token-refresh"),
+    path("token/revoke/", RevokeTokenView.as_view(), name="token-revoke"),
     path("me/", AuthenticatedUserView.as_view(), name="me"),
 ]
@@ -1,7 +1,8 @@
-from rest_framework import authentication, generics, permissions
+from rest_framework import generics, permissions
 from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.request import Request
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
 from app_users.models import User
 from app_users.serializers.user_serializer import UserSerializer
 
@@ -10,7 +11,7 @@ class AuthenticatedUserView(generics.RetrieveUpdateAPIView):
     """View for managing authenticated User."""
 
     serializer_class = UserSerializer
-    authentication_classes = (authentication.TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication, SignedTokenAuthentication)
     permission_classes = (permissions.IsAuthenticated,)
 
     def get_object(self) -> User | None:
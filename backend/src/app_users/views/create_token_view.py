@@ -1,6 +1,11 @@
+from django.conf import settings
+from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from app_infrastructure.services.signed_token_service import SignedTokenService
 from app_users.serializers.auth_token_serializer import AuthTokenSerializer
 
 
@@ -9,3 +14,23 @@ class CreateTokenView(ObtainAuthToken):
 
     serializer_class = AuthTokenSerializer
     renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES
+
+    def post(self, request: Request, *args: list, **kwargs: dict) -> Response:
+        """
+        Returns AuthToken of User with given credentials. When SIGNED_TOKENS_ENABLED setting is set, signed
+        access and refresh tokens are returned as well.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Response containing "token" and optionally "access" and "refresh" tokens.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data["user"]
+        token, _ = Token.objects.get_or_create(user=user)
+        data = {"token": token.key}
+        if settings.SIGNED_TOKENS_ENABLED:
+            data.update(SignedTokenService.issue(user))
+        return Response(data)
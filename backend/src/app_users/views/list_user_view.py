@@ -1,7 +1,8 @@
 from django.contrib.auth import get_user_model
 from django.db.models import QuerySet
-from rest_framework import authentication, generics, permissions
+from rest_framework import generics, permissions
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
 from app_users.serializers.user_serializer import UserSerializer
 
 
@@ -10,7 +11,7 @@ class ListUserView(generics.ListAPIView):
 
     serializer_class = UserSerializer
     queryset = get_user_model().objects.all()
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = [permissions.IsAdminUser]
 
     def get_queryset(self) -> QuerySet:
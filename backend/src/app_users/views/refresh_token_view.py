@@ -0,0 +1,40 @@
+from django.conf import settings
+from rest_framework import generics, status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app_infrastructure.services.signed_token_service import SignedTokenError, SignedTokenService
+from app_users.serializers.refresh_token_serializer import RefreshTokenSerializer
+
+
+class RefreshTokenView(generics.GenericAPIView):
+    """View to exchange signed refresh token for new pair of signed access and refresh tokens."""
+
+    serializer_class = RefreshTokenSerializer
+    authentication_classes = ()
+    permission_classes = ()
+
+    def post(self, request: Request, *args: list, **kwargs: dict) -> Response:
+        """
+        Revokes given refresh token and returns new signed access and refresh tokens.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Response containing "access" and "refresh" tokens.
+
+        Raises:
+            NotFound: Raised when SIGNED_TOKENS_ENABLED setting is not set.
+            ValidationError: Raised when refresh token is invalid or its User is inactive.
+        """
+        if not settings.SIGNED_TOKENS_ENABLED:
+            raise NotFound
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            tokens = SignedTokenService.refresh(serializer.validated_data["refresh"])
+        except SignedTokenError as exc:
+            raise ValidationError({"refresh": [str(exc)]})
+        return Response(tokens, status=status.HTTP_200_OK)
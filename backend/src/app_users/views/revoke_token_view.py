@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework import generics, status
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from app_infrastructure.services.signed_token_service import SignedTokenService
+from app_users.serializers.refresh_token_serializer import RefreshTokenSerializer
+
+
+class RevokeTokenView(generics.GenericAPIView):
+    """View to revoke signed refresh token together with access tokens issued for it."""
+
+    serializer_class = RefreshTokenSerializer
+    authentication_classes = ()
+    permission_classes = ()
+
+    def post(self, request: Request, *args: list, **kwargs: dict) -> Response:
+        """
+        Revokes given refresh token.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Empty response with HTTP 204 status.
+
+        Raises:
+            NotFound: Raised when SIGNED_TOKENS_ENABLED setting is not set.
+            ValidationError: Raised when refresh token is malformed, expired or revoked already.
+        """
+        if not settings.SIGNED_TOKENS_ENABLED:
+            raise NotFound
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        SignedTokenService.revoke(serializer.validated_data["refresh"])
+        return Response(status=status.HTTP_204_NO_CONTENT)
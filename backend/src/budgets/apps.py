@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class BudgetsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "budgets"
+
+    def ready(self) -> None:
+        """
+        Registers signals receivers of budgets app.
+        """
+        import budgets.signals  # noqa: F401
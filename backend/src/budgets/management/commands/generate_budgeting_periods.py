@@ -0,0 +1,51 @@
+"""
+Django command to generate consecutive BudgetingPeriods for Budget
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budgets.models import Budget
+from budgets.serializers.budgeting_period_generator_serializer import BudgetingPeriodGeneratorSerializer
+from budgets.services.budgeting_period_generator_service import (
+    BudgetingPeriodGeneratorError,
+    BudgetingPeriodGeneratorService,
+)
+
+
+class Command(BaseCommand):
+    """Django command to generate consecutive BudgetingPeriods"""
+
+    help = "Generates consecutive monthly, weekly or custom length BudgetingPeriods for Budget."
+
+    def add_arguments(self, parser):
+        """Adds command arguments."""
+        parser.add_argument("--budget", type=int, required=True, help="Budget database id.")
+        parser.add_argument("--date-start", required=True, help="Start date of first period in YYYY-MM-DD format.")
+        parser.add_argument("--count", type=int, required=True, help="Number of generated periods.")
+        parser.add_argument(
+            "--frequency",
+            choices=BudgetingPeriodGeneratorService.FREQUENCIES,
+            default="monthly",
+            help="Periods length.",
+        )
+        parser.add_argument("--days", type=int, help="Length of periods in days for custom frequency.")
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        if not Budget.objects.filter(pk=options["budget"]).exists():
+            raise CommandError(f"Budget with id {options['budget']} does not exist.")
+        serializer = BudgetingPeriodGeneratorSerializer(
+            data={field: options[field] for field in ("date_start", "count", "frequency", "days")}
+        )
+        if not serializer.is_valid():
+            raise CommandError(" ".join(f"{field}: {' '.join(errors)}" for field, errors in serializer.errors.items()))
+
+        service = BudgetingPeriodGeneratorService(budget_pk=options["budget"], **serializer.validated_data)
+        try:
+            periods = service.generate()
+        except BudgetingPeriodGeneratorError as exc:
+            for error in exc.errors:
+                self.stderr.write(error)
+            raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(f"Generated {len(periods)} periods."))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0002_budgetingperiod"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="budget",
+            name="data_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:48
+
+from django.db import migrations, models
+
+from app_infrastructure.migration_operations import VendorOperations
+
+SQLITE_TRIGGER_SQL = """
+CREATE TRIGGER {name} BEFORE {event} ON budgets_budgetingperiod
+BEGIN
+    SELECT CASE
+        WHEN NEW.is_active AND EXISTS (
+            SELECT 1 FROM budgets_budgetingperiod
+            WHERE budget_id = NEW.budget_id AND is_active AND {exclude_self}
+        ) THEN RAISE(ABORT, 'budgets_budgetingperiod_single_active')
+        WHEN EXISTS (
+            SELECT 1 FROM budgets_budgetingperiod
+            WHERE budget_id = NEW.budget_id AND date_start <= NEW.date_end AND date_end >= NEW.date_start
+            AND {exclude_self}
+        ) THEN RAISE(ABORT, 'budgets_budgetingperiod_no_overlap')
+    END;
+END;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0003_budget_data_version"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="budgetingperiod",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_active", True)),
+                fields=("budget",),
+                name="budgets_budgetingperiod_single_active",
+            ),
+        ),
+        VendorOperations(
+            vendor="postgresql",
+            operations=[
+                migrations.RunSQL(
+                    sql=(
+                        "ALTER TABLE budgets_budgetingperiod ADD CONSTRAINT budgets_budgetingperiod_no_overlap "
+                        "EXCLUDE USING gist ("
+                        "int8range(budget_id, budget_id, '[]') WITH &&, "
+                        "daterange(date_start, date_end, '[]') WITH &&"
+                        ")"
+                    ),
+                    reverse_sql="ALTER TABLE budgets_budgetingperiod DROP CONSTRAINT budgets_budgetingperiod_no_overlap",
+                ),
+            ],
+        ),
+        VendorOperations(
+            vendor="sqlite",
+            operations=[
+                migrations.RunSQL(
+                    sql=[
+                        SQLITE_TRIGGER_SQL.format(
+                            name="budgets_budgetingperiod_constraints_insert", event="INSERT", exclude_self="1"
+                        )
+                    ],
+                    reverse_sql=["DROP TRIGGER budgets_budgetingperiod_constraints_insert"],
+                ),
+                migrations.RunSQL(
+                    sql=[
+                        SQLITE_TRIGGER_SQL.format(
+                            name="budgets_budgetingperiod_constraints_update",
+                            event="UPDATE OF budget_id, date_start, date_end, is_active",
+                            exclude_self="id != NEW.id",
+                        )
+                    ],
+                    reverse_sql=["DROP TRIGGER budgets_budgetingperiod_constraints_update"],
+                ),
+            ],
+        ),
+    ]
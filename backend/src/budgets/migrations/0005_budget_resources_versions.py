@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0004_budgetingperiod_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="budget",
+            name="categories_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="budget",
+            name="entities_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="budget",
+            name="periods_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="budget",
+            name="predictions_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="budget",
+            name="transfers_version",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -10,6 +10,12 @@ class Budget(models.Model):
     owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="owned_budgets")
     members = models.ManyToManyField(settings.AUTH_USER_MODEL, related_name="joined_budgets", blank=True)
     currency = models.CharField(max_length=3)
+    data_version = models.PositiveBigIntegerField(default=0, editable=False)
+    periods_version = models.PositiveBigIntegerField(default=0, editable=False)
+    categories_version = models.PositiveBigIntegerField(default=0, editable=False)
+    entities_version = models.PositiveBigIntegerField(default=0, editable=False)
+    transfers_version = models.PositiveBigIntegerField(default=0, editable=False)
+    predictions_version = models.PositiveBigIntegerField(default=0, editable=False)
 
     class Meta:
         unique_together = (
@@ -28,7 +34,14 @@ class Budget(models.Model):
 
     def save(self, *args, **kwargs) -> None:
         """
-        Overrides .save() method to add Budget owner to Budget members if not added already.
+        Overrides .save() method to add Budget owner to Budget members if not added already. Data version fields are
+        excluded from updates of existing Budget, as they are changed only by BudgetDataVersionService.
         """
+        if not self._state.adding and not args and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and not field.name.endswith("_version")
+            ]
         super().save(*args, **kwargs)
         self.members.add(self.owner)  # NOQA
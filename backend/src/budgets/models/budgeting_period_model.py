@@ -1,10 +1,18 @@
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.db.models import Q
 
 
 class BudgetingPeriod(models.Model):
-    """Model for period in which Budget data will be calculated and reported."""
+    """
+    Model for period in which Budget data will be calculated and reported.
+
+    Single active BudgetingPeriod per Budget and not overlapping BudgetingPeriods date ranges are enforced by database:
+    with partial unique index and exclusion constraint on PostgreSQL and with equivalent trigger on SQLite.
+    """
+
+    ACTIVE_CONSTRAINT: str = "budgets_budgetingperiod_single_active"
+    OVERLAP_CONSTRAINT: str = "budgets_budgetingperiod_no_overlap"
 
     budget = models.ForeignKey("budgets.Budget", on_delete=models.CASCADE, related_name="periods")
     name = models.CharField(max_length=128)
@@ -17,6 +25,11 @@ class BudgetingPeriod(models.Model):
             "name",
             "budget",
         )
+        constraints = (
+            models.UniqueConstraint(
+                fields=("budget",), condition=Q(is_active=True), name="budgets_budgetingperiod_single_active"
+            ),
+        )
 
     def __str__(self) -> str:
         """
@@ -29,50 +42,41 @@ class BudgetingPeriod(models.Model):
 
     def save(self, *args: list, **kwargs: dict) -> None:
         """
-        Overrides .save() method to execute .clean() method before saving model in database.
+        Overrides .save() method to execute .clean() method before saving model in database and to convert
+        violations of BudgetingPeriod database constraints into ValidationErrors.
+
+        Raises:
+            ValidationError: Raised when is_active=True and another BudgetingPeriod with such flag already exists
+            for Budget or when date range collides with another BudgetingPeriod date range.
         """
         self.clean()
-        super().save(*args, **kwargs)
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            constraint_name = getattr(getattr(exc.__cause__, "diag", None), "constraint_name", None) or str(exc)
+            if constraint_name == self.ACTIVE_CONSTRAINT:
+                raise ValidationError("is_active: Active period already exists.", code="active-invalid")
+            if constraint_name == self.OVERLAP_CONSTRAINT:
+                raise ValidationError(
+                    "date_start: Period date range collides with other period in Budget.",
+                    code="period-range-invalid",
+                )
+            raise
 
     def clean(self) -> None:
         """
         Validates BudgetingPeriod input data before saving in database.
         """
-        self.clean_is_active()
         self.clean_dates()
 
-    def clean_is_active(self) -> None:
-        """
-        Validates is_active field. If is_active not given, passes it to default model validation.
-
-        Raises:
-            ValidationError: Raised when is_active=True and another BudgetingPeriod with such flag
-            already exists for Budget.
-        """
-        if self.is_active and self.budget.periods.filter(is_active=True).exclude(pk=self.pk).exists():
-            raise ValidationError("is_active: Active period already exists.", code="active-invalid")
-
     def clean_dates(self) -> None:
         """
         Validates date_start and date_end fields. If date_start or date_end not given, passes them to default
-        model validation.
+        model validation. Collisions with other BudgetingPeriods date ranges are checked by database on save.
 
         Raises:
-            ValidationError: Raised when date_start and date_end not in logic order or collide with another
-            BudgetingPeriod daterange.
+            ValidationError: Raised when date_start and date_end not in logic order.
         """
         if self.date_start >= self.date_end:
             raise ValidationError("start_date: Start date should be earlier than end date.", code="date-invalid")
-        if (
-            self.budget.periods.filter(
-                Q(date_start__lte=self.date_start, date_end__gte=self.date_start)
-                | Q(date_start__lte=self.date_end, date_end__gte=self.date_end)
-                | Q(date_start__gte=self.date_start, date_end__lte=self.date_end)
-            )
-            .exclude(pk=self.pk)
-            .exists()
-        ):
-            raise ValidationError(
-                "date_start: Period date range collides with other period in Budget.",
-                code="period-range-invalid",
-            )
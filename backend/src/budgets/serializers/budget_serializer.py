@@ -1,3 +1,4 @@
+from django.db.models import Model
 from rest_framework.exceptions import ValidationError
 from rest_framework.serializers import ModelSerializer
 
@@ -29,3 +30,19 @@ class BudgetSerializer(ModelSerializer):
         else:
             raise ValidationError(f'User already owns Budget with name "{value}".')
         return value
+
+    def to_representation(self, instance: Model) -> dict:
+        """
+        Returns Budget representation with members ids sorted, so output does not depend on order of members
+        returned by database, which differs between prefetched and not prefetched members.
+
+        Args:
+            instance [Model]: Budget model instance.
+
+        Returns:
+            dict: Budget representation.
+        """
+        data = super().to_representation(instance)
+        if "members" in data:
+            data["members"] = sorted(data["members"])
+        return data
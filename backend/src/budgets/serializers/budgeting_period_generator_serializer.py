@@ -0,0 +1,38 @@
+from collections import OrderedDict
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from budgets.services.budgeting_period_generator_service import BudgetingPeriodGeneratorService
+
+
+class BudgetingPeriodGeneratorSerializer(serializers.Serializer):
+    """Serializer for parameters of BudgetingPeriods generation."""
+
+    date_start = serializers.DateField()
+    count = serializers.IntegerField(min_value=1, max_value=BudgetingPeriodGeneratorService.MAX_COUNT)
+    frequency = serializers.ChoiceField(choices=BudgetingPeriodGeneratorService.FREQUENCIES, default="monthly")
+    days = serializers.IntegerField(
+        min_value=2,
+        max_value=BudgetingPeriodGeneratorService.MAX_DAYS,
+        required=False,
+        allow_null=True,
+        default=None,
+    )
+
+    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        """
+        Checks if periods length was given for "custom" frequency.
+
+        Args:
+            attrs [OrderedDict]: Dictionary containing given generation params.
+
+        Returns:
+            OrderedDict: Dictionary with validated attrs values.
+
+        Raises:
+            ValidationError: Raised when "days" not given for "custom" frequency.
+        """
+        if attrs["frequency"] == "custom" and attrs.get("days") is None:
+            raise ValidationError({"days": ["Periods length has to be given for custom frequency."]})
+        return super().validate(attrs)
@@ -1,8 +1,9 @@
 from collections import OrderedDict
 
-from django.db.models import Q
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 
 from budgets.models import BudgetingPeriod
 
@@ -36,30 +37,10 @@ class BudgetingPeriodSerializer(serializers.ModelSerializer):
             raise ValidationError(f'Period with name "{name}" already exists in Budget.')
         return name
 
-    def validate_is_active(self, is_active: bool) -> bool:
-        """
-        Checks if Budget contains active BudgetingPeriod.
-
-        Args:
-            is_active [bool]: Given is_active value to determine if BudgetingPeriod is active or not.
-
-        Returns:
-            bool: Validated is_active value.
-
-        Raises:
-            ValidationError: Raised when active BudgetingPeriod for Budget already exists in database.
-        """
-        if is_active is True:
-            active_periods = BudgetingPeriod.objects.filter(
-                budget__pk=self.context["view"].kwargs["budget_pk"], is_active=True
-            ).exclude(pk=getattr(self.instance, "pk", None))
-            if active_periods.exists():
-                raise ValidationError("Active period already exists in Budget.")
-        return is_active
-
     def validate(self, attrs: OrderedDict) -> OrderedDict:
         """
-        Checks if given BudgetingPeriod start and end dates do not collide with other Budget periods dates.
+        Checks if given BudgetingPeriod start date is earlier than end date. Collisions with other Budget periods
+        dates and other active Budget periods are checked by database on save.
 
         Args:
             attrs [OrderedDict]: Dictionary containing given BudgetingPeriod params
@@ -68,21 +49,36 @@ class BudgetingPeriodSerializer(serializers.ModelSerializer):
             OrderedDict: Dictionary with validated attrs values.
 
         Raises:
-            ValidationError: Raised when date_end earlier than date start or some Budget periods
-            dates collides with given dates.
+            ValidationError: Raised when date_end earlier than date start.
         """
         date_start = attrs.get("date_start", getattr(self.instance, "date_start", None))
         date_end = attrs.get("date_end", getattr(self.instance, "date_end", None))
         if date_start >= date_end:
             raise ValidationError("Start date should be earlier than end date.")
+        return super().validate(attrs)
 
-        budget_pk = self.context["view"].kwargs["budget_pk"]
-        colliding_periods = BudgetingPeriod.objects.filter(
-            Q(budget__pk=budget_pk, date_start__lte=date_start, date_end__gte=date_start)
-            | Q(budget__pk=budget_pk, date_start__lte=date_end, date_end__gte=date_end)
-            | Q(budget__pk=budget_pk, date_start__gte=date_start, date_end__lte=date_end)
-        ).exclude(pk=getattr(self.instance, "pk", None))
-        if colliding_periods.exists():
-            raise ValidationError("Budgeting period date range collides with other period in Budget.")
+    def save(self, **kwargs) -> BudgetingPeriod:
+        """
+        Extended with converting BudgetingPeriod database constraints violations into serializer errors.
 
-        return super().validate(attrs)
+        Returns:
+            BudgetingPeriod: Saved BudgetingPeriod model instance.
+
+        Raises:
+            ValidationError: Raised when active BudgetingPeriod for Budget already exists in database or some
+            Budget periods dates collide with given dates.
+        """
+        try:
+            return super().save(**kwargs)
+        except DjangoValidationError as exc:
+            if exc.code == "active-invalid":
+                raise ValidationError({"is_active": ["Active period already exists in Budget."]})
+            if exc.code == "period-range-invalid":
+                raise ValidationError(
+                    {
+                        api_settings.NON_FIELD_ERRORS_KEY: [
+                            "Budgeting period date range collides with other period in Budget."
+                        ]
+                    }
+                )
+            raise
@@ -0,0 +1,44 @@
+from rest_framework import serializers
+
+SUM_FIELD_KWARGS = {"max_digits": 20, "decimal_places": 2}
+
+
+class CategorySummarySerializer(serializers.Serializer):
+    """Serializer for TransferCategory totals in BudgetingPeriod summary."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    category_type = serializers.IntegerField()
+    priority = serializers.IntegerField()
+    owner = serializers.IntegerField(allow_null=True)
+    value = serializers.DecimalField(**SUM_FIELD_KWARGS)
+    count = serializers.IntegerField()
+
+
+class PrioritySummarySerializer(serializers.Serializer):
+    """Serializer for TransferCategory priority totals in BudgetingPeriod summary."""
+
+    priority = serializers.IntegerField()
+    label = serializers.CharField()
+    value = serializers.DecimalField(**SUM_FIELD_KWARGS)
+    count = serializers.IntegerField()
+
+
+class EntitySummarySerializer(serializers.Serializer):
+    """Serializer for Entity or Deposit totals in BudgetingPeriod summary."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    incomes = serializers.DecimalField(**SUM_FIELD_KWARGS)
+    expenses = serializers.DecimalField(**SUM_FIELD_KWARGS)
+
+
+class BudgetingPeriodSummarySerializer(serializers.Serializer):
+    """Serializer for BudgetingPeriod income and expense totals."""
+
+    incomes = serializers.DecimalField(**SUM_FIELD_KWARGS)
+    expenses = serializers.DecimalField(**SUM_FIELD_KWARGS)
+    categories = CategorySummarySerializer(many=True)
+    priorities = PrioritySummarySerializer(many=True)
+    entities = EntitySummarySerializer(many=True)
+    deposits = EntitySummarySerializer(many=True)
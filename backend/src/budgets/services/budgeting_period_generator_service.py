@@ -0,0 +1,195 @@
+import bisect
+import calendar
+import datetime
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from budgets.models import BudgetingPeriod
+
+
+class BudgetingPeriodGeneratorError(Exception):
+    """
+    Exception raised when generated BudgetingPeriods collide with existing ones or exceed supported dates range.
+
+    Args:
+        errors (list[str]): Collisions descriptions.
+    """
+
+    def __init__(self, errors: list[str]):
+        super().__init__(f"Generated periods contain {len(errors)} collisions.")
+        self.errors = errors
+
+
+class DateIntervals:
+    """
+    In-memory index of disjoint date intervals. Intervals are kept sorted by start date, so, as they do not overlap,
+    end dates are sorted as well and interval overlapping given date range is found with binary search.
+
+    Args:
+        intervals (Iterable[tuple[datetime.date, datetime.date, str]]): Disjoint intervals as tuples of start date,
+        end date (both inclusive) and label.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[datetime.date, datetime.date, str]]):
+        intervals = sorted(intervals)
+        self.starts = [interval[0] for interval in intervals]
+        self.ends = [interval[1] for interval in intervals]
+        self.labels = [interval[2] for interval in intervals]
+
+    def find_overlapping(self, date_start: datetime.date, date_end: datetime.date) -> str | None:
+        """
+        Returns label of first interval overlapping given date range.
+
+        Args:
+            date_start (datetime.date): Date range start (inclusive).
+            date_end (datetime.date): Date range end (inclusive).
+
+        Returns:
+            str | None: Label of overlapping interval or None if date range does not overlap any interval.
+        """
+        index = bisect.bisect_left(self.ends, date_start)
+        if index < len(self.starts) and self.starts[index] <= date_end:
+            return self.labels[index]
+        return None
+
+
+class BudgetingPeriodGeneratorService:
+    """
+    Service generating consecutive BudgetingPeriods for Budget.
+
+    Existing BudgetingPeriods of Budget are loaded with single query into DateIntervals index, against which every
+    generated period is checked in memory. Valid periods are inserted with single bulk_create - database constraints
+    still reject periods colliding with ones created concurrently.
+
+    Args:
+        budget_pk (int): Budget database id.
+        date_start (datetime.date): Start date of first generated period.
+        count (int): Number of generated periods.
+        frequency (str): Periods length - "monthly", "weekly" or "custom".
+        days (int | None): Length of periods in days for "custom" frequency.
+    """
+
+    FREQUENCIES: tuple[str] = ("monthly", "weekly", "custom")
+    MAX_COUNT: int = 1200
+    MAX_DAYS: int = 366
+
+    def __init__(
+        self,
+        budget_pk: int,
+        date_start: datetime.date,
+        count: int,
+        frequency: str = "monthly",
+        days: int | None = None,
+    ):
+        self.budget_pk = budget_pk
+        self.date_start = date_start
+        self.count = count
+        self.frequency = frequency
+        self.days = days
+
+    @staticmethod
+    def add_months(date: datetime.date, months: int) -> datetime.date:
+        """
+        Returns date shifted by given number of months. Day is clamped to length of target month.
+
+        Args:
+            date (datetime.date): Shifted date.
+            months (int): Number of months.
+
+        Returns:
+            datetime.date: Shifted date.
+        """
+        year, month = divmod(date.month - 1 + months, 12)
+        year, month = date.year + year, month + 1
+        return datetime.date(year, month, min(date.day, calendar.monthrange(year, month)[1]))
+
+    def get_date_ranges(self) -> list[tuple[datetime.date, datetime.date]]:
+        """
+        Returns start and end dates of generated periods.
+
+        Returns:
+            list[tuple[datetime.date, datetime.date]]: Consecutive date ranges with inclusive end dates.
+        """
+        if self.frequency == "monthly":
+            starts = [self.add_months(self.date_start, index) for index in range(self.count + 1)]
+        else:
+            length = datetime.timedelta(days=7 if self.frequency == "weekly" else self.days)
+            starts = [self.date_start + length * index for index in range(self.count + 1)]
+        return [(start, end - datetime.timedelta(days=1)) for start, end in zip(starts, starts[1:])]
+
+    def get_name(self, date_start: datetime.date) -> str:
+        """
+        Returns name of generated period.
+
+        Args:
+            date_start (datetime.date): Period start date.
+
+        Returns:
+            str: Period name.
+        """
+        if self.frequency == "monthly":
+            return f"{date_start.year}_{date_start.month:02d}"
+        if self.frequency == "weekly":
+            year, week, _ = date_start.isocalendar()
+            return f"{year}_W{week:02d}"
+        return date_start.strftime("%Y_%m_%d")
+
+    def build_periods(self) -> list[BudgetingPeriod]:
+        """
+        Builds generated BudgetingPeriods and validates them against existing BudgetingPeriods of Budget.
+
+        Returns:
+            list[BudgetingPeriod]: Not saved BudgetingPeriod model instances.
+
+        Raises:
+            BudgetingPeriodGeneratorError: Raised when generated periods collide with existing ones or end after
+            maximal supported date.
+        """
+        try:
+            date_ranges = self.get_date_ranges()
+        except (OverflowError, ValueError):
+            raise BudgetingPeriodGeneratorError(
+                [f"Generated periods exceed maximal supported date {datetime.date.max}."]
+            )
+        existing = list(
+            BudgetingPeriod.objects.filter(budget__pk=self.budget_pk).values_list("date_start", "date_end", "name")
+        )
+        intervals = DateIntervals(existing)
+        names = {name for _, _, name in existing}
+        periods, errors = [], []
+        for date_start, date_end in date_ranges:
+            name = self.get_name(date_start)
+            if (colliding_name := intervals.find_overlapping(date_start, date_end)) is not None:
+                errors.append(
+                    f'Period "{name}" ({date_start} - {date_end}) collides with period "{colliding_name}" in Budget.'
+                )
+            elif name in names:
+                errors.append(f'Period with name "{name}" already exists in Budget.')
+            periods.append(
+                BudgetingPeriod(budget_id=self.budget_pk, name=name, date_start=date_start, date_end=date_end)
+            )
+        if errors:
+            raise BudgetingPeriodGeneratorError(errors)
+        return periods
+
+    def generate(self) -> list[BudgetingPeriod]:
+        """
+        Creates generated BudgetingPeriods in database.
+
+        Returns:
+            list[BudgetingPeriod]: Created BudgetingPeriod model instances.
+
+        Raises:
+            BudgetingPeriodGeneratorError: Raised when generated periods collide with existing ones or end after
+            maximal supported date.
+        """
+        periods = self.build_periods()
+        try:
+            with transaction.atomic():
+                created = BudgetingPeriod.objects.bulk_create(periods)
+                BudgetDataVersionService.bump("periods", budget_ids=[self.budget_pk])
+        except IntegrityError:
+            raise BudgetingPeriodGeneratorError(["Generated periods collide with other periods in Budget."])
+        return created
@@ -0,0 +1,101 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable
+
+from categories.models.transfer_category_choices import CategoryType, ExpenseCategoryPriority, IncomeCategoryPriority
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class BudgetingPeriodSummaryService:
+    """
+    Service computing income and expense totals of BudgetingPeriod.
+
+    Sums of Transfers per category, entity and deposit are read from TransferRollup rows maintained on every
+    Transfer change. Totals per TransferCategory, priority, Entity and Deposit are rolled up in memory from these
+    rows, which number is bounded by number of distinct (category, entity, deposit) combinations, not by number
+    of Transfers.
+
+    Args:
+        period_pk (int): BudgetingPeriod database id.
+    """
+
+    TYPE_KEYS: dict[int, str] = {CategoryType.INCOME: "incomes", CategoryType.EXPENSE: "expenses"}
+
+    def __init__(self, period_pk: int):
+        self.period_pk = period_pk
+
+    def get_rows(self) -> Iterable[dict]:
+        """
+        Returns TransferRollup rows of period with related objects data.
+
+        Returns:
+            Iterable[dict]: Rows containing related objects data, "value" sum and "count" of Transfers.
+        """
+        return (
+            TransferRollup.objects.filter(period__pk=self.period_pk)
+            .values(
+                "category",
+                "category__name",
+                "category__category_type",
+                "category__priority",
+                "category__owner",
+                "entity",
+                "entity__name",
+                "deposit",
+                "deposit__name",
+                "value",
+                "count",
+            )
+            .order_by()
+        )
+
+    def get_summary(self) -> dict:
+        """
+        Rolls up aggregated rows into totals per TransferCategory, priority, Entity and Deposit.
+
+        Returns:
+            dict: Summary with "incomes" and "expenses" totals and "categories", "priorities", "entities" and
+            "deposits" lists.
+        """
+        totals = {"incomes": Decimal("0"), "expenses": Decimal("0")}
+        categories = {}
+        priorities = {
+            priority: {"priority": priority.value, "label": priority.label, "value": Decimal("0"), "count": 0}
+            for priority in (*IncomeCategoryPriority, *ExpenseCategoryPriority)
+        }
+        entities = defaultdict(lambda: {"incomes": Decimal("0"), "expenses": Decimal("0")})
+        deposits = defaultdict(lambda: {"incomes": Decimal("0"), "expenses": Decimal("0")})
+
+        for row in self.get_rows():
+            type_key = self.TYPE_KEYS[row["category__category_type"]]
+            totals[type_key] += row["value"]
+            category = categories.setdefault(
+                row["category"],
+                {
+                    "id": row["category"],
+                    "name": row["category__name"],
+                    "category_type": row["category__category_type"],
+                    "priority": row["category__priority"],
+                    "owner": row["category__owner"],
+                    "value": Decimal("0"),
+                    "count": 0,
+                },
+            )
+            category["value"] += row["value"]
+            category["count"] += row["count"]
+            priorities[row["category__priority"]]["value"] += row["value"]
+            priorities[row["category__priority"]]["count"] += row["count"]
+            for objects, field in ((entities, "entity"), (deposits, "deposit")):
+                summary = objects[row[field]]
+                summary.update(id=row[field], name=row[f"{field}__name"])
+                summary[type_key] += row["value"]
+
+        return {
+            **totals,
+            "categories": sorted(
+                categories.values(), key=lambda item: (item["category_type"], item["priority"], item["name"])
+            ),
+            "priorities": list(priorities.values()),
+            "entities": sorted(entities.values(), key=lambda item: item["name"]),
+            "deposits": sorted(deposits.values(), key=lambda item: item["name"]),
+        }
@@ -0,0 +1,120 @@
+from django.db.models import Model, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from app_infrastructure.services.budget_membership_cache_service import BudgetMembershipCacheService
+from budgets.models import Budget, BudgetingPeriod
+from categories.models import ExpenseCategory, IncomeCategory, TransferCategory
+from entities.models import Deposit, Entity
+from predictions.models import ExpensePrediction
+from transfers.models.expense_model import Expense
+from transfers.models.income_model import Income
+from transfers.models.transfer_model import Transfer
+
+VERSIONED_RESOURCES = {
+    BudgetingPeriod: "periods",
+    TransferCategory: "categories",
+    Entity: "entities",
+    Transfer: "transfers",
+    ExpensePrediction: "predictions",
+}
+
+
+@receiver(m2m_changed, sender=Budget.members.through)
+def invalidate_members_cache(
+    sender: type[Model], instance: Model, action: str, reverse: bool, pk_set: set | None, **kwargs
+) -> None:
+    """
+    Invalidates cached Budgets ids of Users added to or removed from Budget members.
+
+    Args:
+        sender (type[Model]): Budget members through model.
+        instance (Model): Budget instance or User instance for reverse relation changes.
+        action (str): Type of members change.
+        reverse (bool): Indicates if change was made from User side.
+        pk_set (set | None): Ids of added or removed objects.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if reverse:
+        BudgetMembershipCacheService.invalidate([instance.pk])
+    elif action == "pre_clear":
+        BudgetMembershipCacheService.invalidate(instance.members.values_list("pk", flat=True))
+    else:
+        BudgetMembershipCacheService.invalidate(pk_set or [])
+
+
+@receiver(pre_delete, sender=Budget)
+def invalidate_deleted_budget_members_cache(sender: type[Model], instance: Budget, **kwargs) -> None:
+    """
+    Invalidates cached Budgets ids of all members of deleted Budget.
+
+    Args:
+        sender (type[Model]): Budget model class.
+        instance (Budget): Deleted Budget instance.
+    """
+    BudgetMembershipCacheService.invalidate(instance.members.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=BudgetingPeriod)
+@receiver(post_save, sender=TransferCategory)
+@receiver(post_save, sender=IncomeCategory)
+@receiver(post_save, sender=ExpenseCategory)
+@receiver(post_save, sender=Entity)
+@receiver(post_save, sender=Deposit)
+@receiver(post_save, sender=Transfer)
+@receiver(post_save, sender=Income)
+@receiver(post_save, sender=Expense)
+@receiver(post_save, sender=ExpensePrediction)
+def bump_budget_data_version(sender: type[Model], instance: Model, **kwargs) -> None:
+    """
+    Increases data version and version of saved resource of Budget owning saved object. Receiver is connected
+    separately for proxy models, as they send signals as separate senders. Bulk Transfers operations are handled by
+    TransferQuerySet.
+
+    Args:
+        sender (type[Model]): Model class of saved instance.
+        instance (Model): Saved model instance.
+    """
+    resource = VERSIONED_RESOURCES[instance._meta.concrete_model]
+    if isinstance(instance, ExpensePrediction):
+        BudgetDataVersionService.bump(resource, periods_ids=[instance.period_id])
+    else:
+        BudgetDataVersionService.bump(resource, budget_ids=[instance.budget_id])
+
+
+@receiver(post_delete, sender=BudgetingPeriod)
+@receiver(post_delete, sender=TransferCategory)
+@receiver(post_delete, sender=IncomeCategory)
+@receiver(post_delete, sender=ExpenseCategory)
+@receiver(post_delete, sender=Entity)
+@receiver(post_delete, sender=Deposit)
+@receiver(post_delete, sender=Transfer)
+@receiver(post_delete, sender=Income)
+@receiver(post_delete, sender=Expense)
+@receiver(post_delete, sender=ExpensePrediction)
+def bump_deleted_budget_data_version(
+    sender: type[Model], instance: Model, origin: Model | QuerySet | None = None, **kwargs
+) -> None:
+    """
+    Increases data version of Budget owning deleted object once per delete operation, together with versions of
+    all resources deleted by it.
+
+    Objects deleted in cascade of Budget are skipped, as Budget is deleted itself. Objects deleted in cascade of
+    other object or with QuerySet.delete() bump every Budget once, with their delete origin.
+
+    Args:
+        sender (type[Model]): Model class of deleted instance.
+        instance (Model): Deleted model instance.
+        origin (Model | QuerySet | None): Model instance or QuerySet which delete started deletion of instance.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if issubclass(origin_model, Budget):
+        return
+    origin = instance if origin is None else origin
+    resource = VERSIONED_RESOURCES[instance._meta.concrete_model]
+    if isinstance(instance, ExpensePrediction):
+        BudgetDataVersionService.bump_once(origin, resource, periods_ids=[instance.period_id])
+    else:
+        BudgetDataVersionService.bump_once(origin, resource, budget_ids=[instance.budget_id])
@@ -1,12 +1,12 @@
 from django.db import transaction
 from django.db.models import QuerySet
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
 from budgets.models import Budget
 from budgets.serializers.budget_serializer import BudgetSerializer
 
@@ -15,8 +15,8 @@ class BudgetViewSet(ModelViewSet):
     """View for manage Budgets."""
 
     serializer_class = BudgetSerializer
-    queryset = Budget.objects.all()
-    authentication_classes = [TokenAuthentication]
+    queryset = Budget.objects.prefetch_related("members")
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self) -> QuerySet:
@@ -1,37 +1,47 @@
-from django.db.models import Q, QuerySet
-from rest_framework.authentication import TokenAuthentication
+from django.db.models import QuerySet
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.mixins import BudgetETagMixin, BudgetListCacheMixin
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
 from budgets.models import BudgetingPeriod
+from budgets.serializers.budgeting_period_generator_serializer import BudgetingPeriodGeneratorSerializer
 from budgets.serializers.budgeting_period_serializer import BudgetingPeriodSerializer
+from budgets.serializers.budgeting_period_summary_serializer import BudgetingPeriodSummarySerializer
+from budgets.services.budgeting_period_generator_service import (
+    BudgetingPeriodGeneratorError,
+    BudgetingPeriodGeneratorService,
+)
+from budgets.services.budgeting_period_summary_service import BudgetingPeriodSummaryService
 
 
-class BudgetingPeriodViewSet(ModelViewSet):
+class BudgetingPeriodViewSet(BudgetETagMixin, BudgetListCacheMixin, ModelViewSet):
     """View for manage BudgetingPeriods."""
 
     serializer_class = BudgetingPeriodSerializer
     queryset = BudgetingPeriod.objects.all()
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = [IsAuthenticated, UserBelongsToBudgetPermission]
+    list_cache_resources = ("periods",)
 
     def get_queryset(self) -> QuerySet:
         """
-        Retrieves BudgetingPeriods for Budgets to which authenticated User belongs.
+        Retrieves BudgetingPeriods for Budget passed in URL. Access to Budget is verified by
+        UserBelongsToBudgetPermission.
 
         Returns:
             QuerySet: Filtered BudgetingPeriod QuerySet.
         """
-        user = getattr(self.request, "user", None)
-        if user and user.is_authenticated:
-            budget_pk = self.kwargs.get("budget_pk")
-            if budget_pk:
-                return (
-                    self.queryset.filter(Q(budget__owner=user) | Q(budget__members=user), budget__pk=budget_pk)
-                    .order_by("-date_start")
-                    .distinct()
-                )
+        budget_pk = self.kwargs.get("budget_pk")
+        if budget_pk:
+            return self.queryset.filter(budget__pk=budget_pk).order_by("-date_start")
         return self.queryset.none()  # pragma: no cover
 
     def perform_create(self, serializer: BudgetingPeriodSerializer) -> None:
@@ -42,3 +52,38 @@ class BudgetingPeriodViewSet(ModelViewSet):
             serializer [BudgetingPeriodSerializer]: Serializer for BudgetingPeriod
         """
         serializer.save(budget_id=self.kwargs.get("budget_pk"))
+
+    @action(detail=True, methods=["GET"])
+    def summary(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns income and expense totals of BudgetingPeriod per TransferCategory, priority, Entity and Deposit.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: BudgetingPeriod summary.
+        """
+        period = self.get_object()
+        summary = BudgetingPeriodSummaryService(period.pk).get_summary()
+        return Response(BudgetingPeriodSummarySerializer(summary).data)
+
+    @action(detail=False, methods=["POST"])
+    def generate(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Creates consecutive BudgetingPeriods for Budget passed in URL at once.
+
+        Args:
+            request [Request]: User request containing start date, number and frequency of periods.
+
+        Returns:
+            Response: Created BudgetingPeriods.
+        """
+        serializer = BudgetingPeriodGeneratorSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        service = BudgetingPeriodGeneratorService(budget_pk=self.kwargs.get("budget_pk"), **serializer.validated_data)
+        try:
+            periods = service.generate()
+        except BudgetingPeriodGeneratorError as exc:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: exc.errors})
+        return Response(self.get_serializer(periods, many=True).data, status=status.HTTP_201_CREATED)
@@ -1,15 +1,33 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
+
 
 class TransferCategoryFilterSet(filters.FilterSet):
     """Base FilterSet for TransferCategory endpoints."""
 
     name = filters.CharFilter(lookup_expr="icontains", field_name="name")
+    search = filters.CharFilter(method="get_searched_categories")
     common_only = filters.BooleanFilter(method="get_common_categories")
     owner = filters.NumberFilter(field_name="owner")
     is_active = filters.BooleanFilter(field_name="is_active")
 
+    @staticmethod
+    def get_searched_categories(queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Filtering QuerySet TransferCategories with full text search by name and description.
+
+        Args:
+            queryset [QuerySet]: Input QuerySet
+            name [str]: Name of filtered param
+            value [str]: Value of filtered param
+
+        Returns:
+            QuerySet: Filtered QuerySet annotated with search rank.
+        """
+        return FullTextSearchService.search(queryset, value, "name", "description")
+
     @staticmethod
     def get_common_categories(queryset: QuerySet, name: str, value: str) -> QuerySet:
         """
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:27
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from app_infrastructure.migration_operations import VendorOperations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("categories", "0001_initial"),
+    ]
+
+    operations = [
+        VendorOperations(
+            vendor="postgresql",
+            operations=[
+                migrations.AddIndex(
+                    model_name="transfercategory",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector("name", config="simple", weight="A"),
+                            "||",
+                            django.contrib.postgres.search.SearchVector("description", config="simple", weight="B"),
+                            django.contrib.postgres.search.SearchConfig("simple"),
+                        ),
+                        name="categories_search_idx",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,7 +1,9 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import CheckConstraint, Q, UniqueConstraint
 
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
 from categories.managers.expense_category_manager import ExpenseCategoryManager
 from categories.managers.income_category_manager import IncomeCategoryManager
 from categories.models.transfer_category_choices import CategoryType, ExpenseCategoryPriority, IncomeCategoryPriority
@@ -51,6 +53,7 @@ class TransferCategory(models.Model):
                 condition=Q(owner__isnull=True),
             ),
         )
+        indexes = (GinIndex(FullTextSearchService.get_vector("name", "description"), name="categories_search_idx"),)
 
     def __str__(self) -> str:
         """
@@ -1,21 +1,23 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.filters import SearchRankOrderingFilter
+from app_infrastructure.mixins import BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
 from categories.serializers.transfer_category_serializer import TransferCategorySerializer
 
 
-class TransferCategoryViewSet(ModelViewSet):
+class TransferCategoryViewSet(BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin, ModelViewSet):
     """Base ViewSet for managing TransferCategories."""
 
     serializer_class = TransferCategorySerializer
-    authentication_classes = (TokenAuthentication,)
+    authentication_classes = (CachedTokenAuthentication, SignedTokenAuthentication)
     permission_classes = (IsAuthenticated, UserBelongsToBudgetPermission)
-    filter_backends = (filters.DjangoFilterBackend, OrderingFilter)
+    list_cache_resources = ("categories",)
+    filter_backends = (filters.DjangoFilterBackend, SearchRankOrderingFilter)
     ordering_fields = ("id", "name", "owner__name", "priority")
 
     def get_queryset(self) -> QuerySet:
@@ -25,11 +27,7 @@ class TransferCategoryViewSet(ModelViewSet):
         Returns:
             QuerySet: Filtered TransferCategory QuerySet.
         """
-        return (
-            self.serializer_class.Meta.model.objects.prefetch_related("budget", "owner")
-            .filter(budget__pk=self.kwargs.get("budget_pk"))
-            .distinct()
-        )
+        return self.serializer_class.Meta.model.objects.filter(budget__pk=self.kwargs.get("budget_pk")).distinct()
 
     def perform_create(self, serializer: TransferCategorySerializer) -> None:
         """
@@ -0,0 +1,20 @@
+from rest_framework import serializers
+
+
+class DepositPeriodBalanceSerializer(serializers.Serializer):
+    """Serializer for Deposit balance at the end of BudgetingPeriod."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    date_start = serializers.DateField()
+    date_end = serializers.DateField()
+    balance = serializers.DecimalField(max_digits=20, decimal_places=2)
+
+
+class DepositBalanceSerializer(serializers.Serializer):
+    """Serializer for Deposit current balance and balances at the end of BudgetingPeriods."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    balance = serializers.DecimalField(max_digits=20, decimal_places=2)
+    periods = DepositPeriodBalanceSerializer(many=True)
@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from django.db.models import F, Sum, Window
+
+from budgets.models import BudgetingPeriod
+from entities.models.deposit_model import Deposit
+from transfers.managers.transfer_manager import TransferQuerySet
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class DepositBalanceService:
+    """
+    Service computing balances of Budget Deposits.
+
+    Balance of Deposit is sum of its Incomes minus sum of its Expenses. Balances at the end of every BudgetingPeriod
+    are computed in database with cumulative window sum over TransferRollup rows, which are per-period checkpoints
+    of Transfers sums, so Transfers history is never scanned.
+
+    Args:
+        budget_pk (int): Budget database id.
+    """
+
+    def __init__(self, budget_pk: int):
+        self.budget_pk = budget_pk
+
+    def get_period_balances(self) -> dict[tuple[int, int], Decimal]:
+        """
+        Computes balance of every Deposit at the end of BudgetingPeriods in which Deposit was used.
+
+        Returns:
+            dict[tuple[int, int], Decimal]: Balances mapped by (deposit_id, period_id).
+        """
+        rows = (
+            TransferRollup.objects.filter(period__budget__pk=self.budget_pk)
+            .annotate(
+                balance=Window(
+                    expression=Sum(TransferQuerySet.signed_value()),
+                    partition_by=[F("deposit_id")],
+                    order_by=[F("period__date_start").asc()],
+                )
+            )
+            .values_list("deposit_id", "period_id", "balance")
+            .order_by()
+            .distinct()
+        )
+        return {(deposit_id, period_id): balance for deposit_id, period_id, balance in rows}
+
+    def get_balances(self) -> list[dict]:
+        """
+        Returns current balance and balances at the end of every BudgetingPeriod for all Budget Deposits.
+
+        Returns:
+            list[dict]: Deposits balances ordered by Deposit name.
+        """
+        period_balances = self.get_period_balances()
+        periods = list(
+            BudgetingPeriod.objects.filter(budget__pk=self.budget_pk)
+            .order_by("date_start")
+            .values("id", "name", "date_start", "date_end")
+        )
+        balances = []
+        for deposit in Deposit.objects.filter(budget__pk=self.budget_pk).order_by("name").values("id", "name"):
+            balance, deposit_periods = Decimal("0.00"), []
+            for period in periods:
+                balance = period_balances.get((deposit["id"], period["id"]), balance)
+                deposit_periods.append({**period, "balance": balance})
+            balances.append({**deposit, "balance": balance, "periods": deposit_periods})
+        return balances
@@ -1,20 +1,27 @@
 from django.db.models import QuerySet
-from rest_framework.authentication import TokenAuthentication
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.mixins import BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
 from entities.models.deposit_model import Deposit
+from entities.serializers.deposit_balance_serializer import DepositBalanceSerializer
 from entities.serializers.deposit_serializer import DepositSerializer
+from entities.services.deposit_balance_service import DepositBalanceService
 
 
-class DepositViewSet(ModelViewSet):
+class DepositViewSet(BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin, ModelViewSet):
     """View for managing Deposits."""
 
     serializer_class = DepositSerializer
     queryset = Deposit.objects.all()
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = [IsAuthenticated, UserBelongsToBudgetPermission]
+    list_cache_resources = ("entities",)
 
     def get_queryset(self) -> QuerySet:
         """
@@ -34,3 +41,17 @@ class DepositViewSet(ModelViewSet):
             serializer [DepositSerializer]: Serializer for Deposit model.
         """
         serializer.save(budget_id=self.kwargs.get("budget_pk"), is_deposit=True)
+
+    @action(detail=False, methods=["GET"])
+    def balances(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns current balance and balances at the end of every BudgetingPeriod for Deposits of Budget passed in URL.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Deposits balances.
+        """
+        balances = DepositBalanceService(self.kwargs.get("budget_pk")).get_balances()
+        return Response(DepositBalanceSerializer(balances, many=True).data)
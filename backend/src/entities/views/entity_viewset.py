@@ -1,20 +1,22 @@
 from django.db.models import QuerySet
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.mixins import BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
 from entities.models.entity_model import Entity
 from entities.serializers.entity_serializer import EntitySerializer
 
 
-class EntityViewSet(ModelViewSet):
+class EntityViewSet(BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin, ModelViewSet):
     """View for managing Entities."""
 
     serializer_class = EntitySerializer
     queryset = Entity.objects.all()
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = [IsAuthenticated, UserBelongsToBudgetPermission]
+    list_cache_resources = ("entities",)
 
     def get_queryset(self) -> QuerySet:
         """
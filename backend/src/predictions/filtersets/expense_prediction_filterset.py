@@ -1,6 +1,7 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
 from predictions.models.expense_prediction_model import ExpensePrediction
 
 
@@ -11,10 +12,11 @@ class ExpensePredictionFilterSet(filters.FilterSet):
     period_id = filters.NumberFilter(method="get_period_id")
     category_name = filters.CharFilter(method="get_category_name")
     category_id = filters.NumberFilter(method="get_category_id")
+    search = filters.CharFilter(method="get_searched_predictions")
 
     class Meta:
         model = ExpensePrediction
-        fields = ["period_id", "period_name", "category_id", "category_name"]
+        fields = ["period_id", "period_name", "category_id", "category_name", "search"]
 
     @staticmethod
     def get_period_name(queryset: QuerySet, name: str, value: str):
@@ -58,6 +60,20 @@ class ExpensePredictionFilterSet(filters.FilterSet):
         """
         return queryset.filter(category__name__icontains=value)
 
+    @staticmethod
+    def get_searched_predictions(queryset: QuerySet, name: str, value: str):
+        """
+        Filtering QuerySet with full text search by category name and description.
+
+        Args:
+            queryset [QuerySet]: Input QuerySet.
+            name [str]: Name of filtered param.
+            value [str]: Searched phrase.
+        Returns:
+            QuerySet: Filtered QuerySet annotated with search rank.
+        """
+        return FullTextSearchService.search(queryset, value, "category__name", "category__description")
+
     @staticmethod
     def get_category_id(queryset: QuerySet, name: str, value: int):
         """
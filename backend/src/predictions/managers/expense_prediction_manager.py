@@ -0,0 +1,61 @@
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Model, QuerySet
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+
+
+class ExpensePredictionQuerySet(QuerySet):
+    """Custom ExpensePredictionQuerySet keeping Budget data version in line with bulk ExpensePredictions operations."""
+
+    UNIQUE_FIELDS: tuple[str] = ("period", "category")
+    UPSERT_FIELDS: tuple[str] = ("value", "description")
+
+    def bulk_create(self, objs: Iterable[Model], *args, **kwargs) -> list[Model]:
+        """
+        Method extended with increasing data version of Budgets of created ExpensePredictions.
+
+        Args:
+            objs (Iterable[Model]): ExpensePrediction model instances to create.
+
+        Returns:
+            list[Model]: Created ExpensePrediction model instances.
+        """
+        objs = list(objs)
+        with transaction.atomic():
+            created = super().bulk_create(objs, *args, **kwargs)
+            BudgetDataVersionService.bump("predictions", periods_ids={prediction.period_id for prediction in objs})
+        return created
+
+    def upsert(
+        self,
+        objs: Iterable[Model],
+        batch_size: int | None = None,
+        overwrite: bool = True,
+        update_fields: Iterable[str] | None = None,
+    ) -> list[Model]:
+        """
+        Creates ExpensePredictions with single INSERT statement per batch. ExpensePredictions already existing
+        for the same period and category are updated with given value and description or, if "overwrite" is False,
+        left unchanged.
+
+        Args:
+            objs (Iterable[Model]): ExpensePrediction model instances to create or update.
+            batch_size (int | None): Number of ExpensePredictions inserted with single statement.
+            overwrite (bool): Indicates if existing ExpensePredictions should be updated.
+            update_fields (Iterable[str] | None): Fields updated in existing ExpensePredictions. Value and description
+            by default.
+
+        Returns:
+            list[Model]: Given ExpensePrediction model instances.
+        """
+        if overwrite:
+            return self.bulk_create(
+                objs,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=self.UNIQUE_FIELDS,
+                update_fields=self.UPSERT_FIELDS if update_fields is None else tuple(update_fields),
+            )
+        return self.bulk_create(objs, batch_size=batch_size, ignore_conflicts=True)
@@ -4,6 +4,8 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import CheckConstraint, Q
 
+from predictions.managers.expense_prediction_manager import ExpensePredictionQuerySet
+
 
 class ExpensePrediction(models.Model):
     """ExpensePrediction model for planned expenses in particular BudgetingPeriod"""
@@ -15,6 +17,8 @@ class ExpensePrediction(models.Model):
     value = models.DecimalField(max_digits=10, decimal_places=2)
     description = models.CharField(max_length=255, blank=True, null=True)
 
+    objects = ExpensePredictionQuerySet.as_manager()
+
     class Meta:
         unique_together = ("period", "category")
         constraints = (
@@ -0,0 +1,183 @@
+from collections import OrderedDict
+
+from django.db.models import Model
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from budgets.models import BudgetingPeriod
+from categories.models import ExpenseCategory
+from predictions.models.expense_prediction_model import ExpensePrediction
+from predictions.serializers.expense_prediction_serializer import ExpensePredictionSerializer
+
+
+class ExpensePredictionBulkListSerializer(serializers.ListSerializer):
+    """
+    Class for validating and upserting multiple ExpensePrediction model instances at once.
+
+    All objects referenced in payload are fetched with single query per table, validated in memory and saved with
+    single INSERT ... ON CONFLICT statement per batch - ExpensePredictions existing for the same period and category
+    are updated.
+    """
+
+    max_rows: int = 10000
+    batch_size: int = 1000
+
+    @property
+    def _budget_pk(self) -> int:
+        """
+        Property for retrieving Budget primary key passed in URL.
+
+        Returns:
+            int: Budget model instance PK.
+        """
+        return int(getattr(self.context.get("view"), "kwargs", {}).get("budget_pk", 0))
+
+    def to_internal_value(self, data: list) -> list[OrderedDict]:
+        """
+        Validates every row of payload and all objects referenced in rows.
+
+        Args:
+            data [list]: List of ExpensePredictions data.
+
+        Returns:
+            list[OrderedDict]: Validated rows.
+
+        Raises:
+            ValidationError: Raised on invalid payload. Errors of rows are returned under row index.
+        """
+        if not isinstance(data, list):
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["Expected a list of ExpensePredictions."]})
+        if not data:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["List of ExpensePredictions cannot be empty."]})
+        if len(data) > self.max_rows:
+            raise ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        f"Ensure list contains no more than {self.max_rows} ExpensePredictions."
+                    ]
+                }
+            )
+
+        rows, errors = [], {}
+        for index, item in enumerate(data):
+            try:
+                rows.append(self.child.run_validation(item))
+            except ValidationError as exc:
+                rows.append(None)
+                errors[index] = exc.detail
+
+        references = self.get_references([row for row in rows if row is not None])
+        keys = set()
+        for index, row in enumerate(rows):
+            if row is None:
+                continue
+            if row_errors := self.child.validate_references(row, references):
+                errors[index] = row_errors
+            elif (row["period"], row["category"]) in keys:
+                errors[index] = {
+                    api_settings.NON_FIELD_ERRORS_KEY: ["ExpensePrediction for period and category given twice."]
+                }
+            keys.add((row["period"], row["category"]))
+
+        if errors:
+            raise ValidationError(dict(sorted(errors.items())))
+        return rows
+
+    def get_references(self, rows: list[OrderedDict]) -> dict:
+        """
+        Fetches Budget objects referenced in validated rows with single query per table.
+
+        Args:
+            rows [list[OrderedDict]]: Validated rows.
+
+        Returns:
+            dict: Dictionary with "period" and "category" keys containing sets of existing objects primary keys.
+        """
+        budget_pk = self._budget_pk
+        ids = {field: {row[field] for row in rows} for field in self.child.RELATED_FIELDS}
+        return {
+            "period": set(
+                BudgetingPeriod.objects.filter(budget__pk=budget_pk, pk__in=ids["period"]).values_list("id", flat=True)
+            ),
+            "category": set(
+                ExpenseCategory.objects.filter(budget__pk=budget_pk, pk__in=ids["category"]).values_list(
+                    "id", flat=True
+                )
+            ),
+        }
+
+    def create(self, validated_data: list[OrderedDict]) -> list[Model]:
+        """
+        Creates or updates all ExpensePredictions with single statement per batch.
+
+        Args:
+            validated_data [list[OrderedDict]]: Validated rows.
+
+        Returns:
+            list[Model]: Saved ExpensePrediction model instances with related objects, fetched with single query.
+        """
+        objects = [self.child.get_model_instance(row) for row in validated_data]
+        ExpensePrediction.objects.upsert(objects, batch_size=self.batch_size)
+        keys = [(prediction.period_id, prediction.category_id) for prediction in objects]
+        saved = {
+            (prediction.period_id, prediction.category_id): prediction
+            for prediction in ExpensePrediction.objects.filter(
+                period__pk__in={key[0] for key in keys}, category__pk__in={key[1] for key in keys}
+            ).select_related("period", "category")
+        }
+        return [saved[key] for key in keys]
+
+
+class ExpensePredictionBulkSerializer(serializers.ModelSerializer):
+    """
+    Class for validating single row of ExpensePredictions bulk upsert payload.
+
+    Related fields are validated as plain primary keys - their existence is verified by
+    ExpensePredictionBulkListSerializer for all rows at once.
+    """
+
+    RELATED_FIELDS: tuple[str] = ("period", "category")
+
+    period = serializers.IntegerField()
+    category = serializers.IntegerField()
+
+    class Meta:
+        model: Model = ExpensePrediction
+        fields: tuple[str] = ("period", "category", "value", "description")
+        list_serializer_class = ExpensePredictionBulkListSerializer
+        validators = []
+
+    validate_value = staticmethod(ExpensePredictionSerializer.validate_value)
+
+    def validate_references(self, row: OrderedDict, references: dict) -> dict:
+        """
+        Validates objects referenced in row against objects fetched for all rows.
+
+        Args:
+            row [OrderedDict]: Validated row.
+            references [dict]: Referenced objects returned by ExpensePredictionBulkListSerializer.get_references.
+
+        Returns:
+            dict: Errors of row mapped by field name. Empty if row is valid.
+        """
+        does_not_exist = serializers.PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+        return {
+            field: [does_not_exist.format(pk_value=row[field])]
+            for field in self.RELATED_FIELDS
+            if row[field] not in references[field]
+        }
+
+    def get_model_instance(self, row: OrderedDict) -> Model:
+        """
+        Returns unsaved model instance for validated row.
+
+        Args:
+            row [OrderedDict]: Validated row.
+
+        Returns:
+            Model: ExpensePrediction model instance.
+        """
+        return self.Meta.model(
+            **{f"{field}_id" if field in self.RELATED_FIELDS else field: value for field, value in row.items()}
+        )
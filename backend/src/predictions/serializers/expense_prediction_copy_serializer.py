@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from decimal import Decimal
+
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from budgets.models import BudgetingPeriod
+
+
+class ExpensePredictionCopySerializer(serializers.Serializer):
+    """Serializer for parameters of ExpensePredictions copy between BudgetingPeriods."""
+
+    source_period = serializers.IntegerField()
+    target_period = serializers.IntegerField()
+    scale = serializers.DecimalField(max_digits=10, decimal_places=4, min_value=Decimal("0.0001"), default=Decimal("1"))
+    rounding = serializers.DecimalField(
+        max_digits=10, decimal_places=2, min_value=Decimal("0.01"), default=Decimal("0.01")
+    )
+    overwrite = serializers.BooleanField(default=True)
+
+    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        """
+        Checks if source and target BudgetingPeriods are different and belong to Budget passed in URL.
+
+        Args:
+            attrs [OrderedDict]: Dictionary containing given copy params.
+
+        Returns:
+            OrderedDict: Dictionary with validated attrs values.
+
+        Raises:
+            ValidationError: Raised when periods are the same or do not belong to Budget.
+        """
+        if attrs["source_period"] == attrs["target_period"]:
+            raise ValidationError("Source and target periods have to be different.")
+        existing = set(
+            BudgetingPeriod.objects.filter(
+                budget__pk=self.context["view"].kwargs["budget_pk"],
+                pk__in=(attrs["source_period"], attrs["target_period"]),
+            ).values_list("id", flat=True)
+        )
+        errors = {
+            field: ["BudgetingPeriod does not exist in Budget."]
+            for field in ("source_period", "target_period")
+            if attrs[field] not in existing
+        }
+        if errors:
+            raise ValidationError(errors)
+        return super().validate(attrs)
@@ -0,0 +1,44 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from budgets.models import BudgetingPeriod
+from predictions.services.expense_prediction_generator_service import ExpensePredictionGeneratorService
+
+
+class ExpensePredictionGeneratorSerializer(serializers.Serializer):
+    """Serializer for parameters of ExpensePredictions generation from history of Expenses."""
+
+    period = serializers.IntegerField()
+    method = serializers.ChoiceField(choices=ExpensePredictionGeneratorService.METHODS, default="mean")
+    periods_count = serializers.IntegerField(
+        min_value=1, max_value=ExpensePredictionGeneratorService.MAX_PERIODS_COUNT, default=6
+    )
+    trim = serializers.FloatField(min_value=0, max_value=0.49, default=0.1)
+    alpha = serializers.FloatField(min_value=0.01, max_value=1, default=0.5)
+    commit = serializers.BooleanField(default=False)
+    overwrite = serializers.BooleanField(default=True)
+
+    def validate_period(self, period: int) -> int:
+        """
+        Checks if BudgetingPeriod belongs to Budget passed in URL.
+
+        Args:
+            period [int]: BudgetingPeriod id.
+
+        Returns:
+            int: Validated BudgetingPeriod id.
+
+        Raises:
+            ValidationError: Raised when BudgetingPeriod does not exist in Budget.
+        """
+        if not BudgetingPeriod.objects.filter(budget__pk=self.context["view"].kwargs["budget_pk"], pk=period).exists():
+            raise ValidationError("BudgetingPeriod does not exist in Budget.")
+        return period
+
+
+class ExpensePredictionProposalSerializer(serializers.Serializer):
+    """Serializer for ExpensePrediction value proposed from history of Expenses."""
+
+    category_id = serializers.IntegerField()
+    category_name = serializers.CharField()
+    value = serializers.DecimalField(max_digits=20, decimal_places=2)
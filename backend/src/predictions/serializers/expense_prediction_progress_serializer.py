@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+
+class ExpensePredictionProgressSerializer(serializers.Serializer):
+    """Serializer for comparison of ExpensePrediction with real Expenses of category in BudgetingPeriod."""
+
+    prediction_id = serializers.IntegerField(allow_null=True)
+    category_id = serializers.IntegerField()
+    category_name = serializers.CharField()
+    planned = serializers.DecimalField(max_digits=20, decimal_places=2, allow_null=True)
+    spent = serializers.DecimalField(max_digits=20, decimal_places=2)
+    remaining = serializers.DecimalField(max_digits=20, decimal_places=2)
+    percent_used = serializers.DecimalField(max_digits=20, decimal_places=2, allow_null=True)
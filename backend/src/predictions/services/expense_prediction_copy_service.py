@@ -0,0 +1,109 @@
+from decimal import ROUND_CEILING, Decimal
+
+from predictions.models.expense_prediction_model import ExpensePrediction
+
+
+class ExpensePredictionCopyError(Exception):
+    """
+    Exception raised when copied ExpensePredictions values exceed allowed range.
+
+    Args:
+        errors (list[str]): Errors of copied ExpensePredictions.
+    """
+
+    def __init__(self, errors: list[str]):
+        super().__init__(f"{len(errors)} copied predictions have invalid value.")
+        self.errors = errors
+
+
+class ExpensePredictionCopyService:
+    """
+    Service copying ExpensePredictions of one BudgetingPeriod to another one.
+
+    Values of copied ExpensePredictions can be multiplied by "scale" and rounded up to multiple of "rounding". Source
+    ExpensePredictions are read with single query and saved in target period with single INSERT ... ON CONFLICT
+    statement - target ExpensePredictions existing for the same category are updated or, if "overwrite" is False,
+    left unchanged.
+
+    Args:
+        source_period_pk (int): Source BudgetingPeriod database id.
+        target_period_pk (int): Target BudgetingPeriod database id.
+        scale (Decimal): Multiplier of copied values.
+        rounding (Decimal): Step to which multiple copied values are rounded up.
+        overwrite (bool): Indicates if existing target ExpensePredictions should be updated.
+    """
+
+    MAX_VALUE: Decimal = Decimal("99999999.99")
+
+    def __init__(
+        self,
+        source_period_pk: int,
+        target_period_pk: int,
+        scale: Decimal = Decimal("1"),
+        rounding: Decimal = Decimal("0.01"),
+        overwrite: bool = True,
+    ):
+        self.source_period_pk = source_period_pk
+        self.target_period_pk = target_period_pk
+        self.scale = scale
+        self.rounding = rounding
+        self.overwrite = overwrite
+
+    def get_value(self, value: Decimal) -> Decimal:
+        """
+        Returns value of copied ExpensePrediction - source value multiplied by scale and rounded up to multiple
+        of rounding step.
+
+        Args:
+            value (Decimal): Source ExpensePrediction value.
+
+        Returns:
+            Decimal: Copied ExpensePrediction value.
+        """
+        steps = (value * self.scale / self.rounding).to_integral_value(rounding=ROUND_CEILING)
+        return (steps * self.rounding).quantize(Decimal("0.01"), rounding=ROUND_CEILING)
+
+    def build_predictions(self) -> list[ExpensePrediction]:
+        """
+        Builds copied ExpensePredictions for target period.
+
+        Returns:
+            list[ExpensePrediction]: Not saved ExpensePrediction model instances.
+
+        Raises:
+            ExpensePredictionCopyError: Raised when copied values exceed maximal allowed value.
+        """
+        predictions, errors = [], []
+        for category_id, category_name, value, description in (
+            ExpensePrediction.objects.filter(period__pk=self.source_period_pk)
+            .order_by("category__name")
+            .values_list("category_id", "category__name", "value", "description")
+        ):
+            if (copied_value := self.get_value(value)) > self.MAX_VALUE:
+                errors.append(f'Copied value of "{category_name}" prediction exceeds {self.MAX_VALUE}.')
+            predictions.append(
+                ExpensePrediction(
+                    period_id=self.target_period_pk,
+                    category_id=category_id,
+                    value=copied_value,
+                    description=description,
+                )
+            )
+        if errors:
+            raise ExpensePredictionCopyError(errors)
+        return predictions
+
+    def copy(self) -> int:
+        """
+        Saves copied ExpensePredictions in target period.
+
+        Returns:
+            int: Number of copied ExpensePredictions.
+
+        Raises:
+            ExpensePredictionCopyError: Raised when copied values exceed maximal allowed value.
+        """
+        predictions = self.build_predictions()
+        if predictions:
+            ExpensePrediction.objects.upsert(predictions, overwrite=self.overwrite)
+        return len(predictions)
@@ -0,0 +1,189 @@
+import datetime
+from decimal import Decimal
+
+import numpy as np
+from django.db.models import Sum
+
+from budgets.models import BudgetingPeriod
+from categories.models.transfer_category_choices import CategoryType
+from predictions.models.expense_prediction_model import ExpensePrediction
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class ExpensePredictionGeneratorService:
+    """
+    Service proposing ExpensePrediction values for BudgetingPeriod from Expenses of previous BudgetingPeriods.
+
+    Expenses sums of all ExpenseCategories in history periods are read from TransferRollups with single query into
+    categories x periods NumPy matrix (periods ordered from the oldest one, missing sums filled with zeros), so
+    statistics of all categories are computed at once along periods axis.
+
+    Available methods:
+        * "mean" - arithmetic mean of last "periods_count" periods.
+        * "median" - median of last "periods_count" periods.
+        * "trimmed_mean" - mean of last "periods_count" periods without "trim" fraction of the lowest and the
+          highest values.
+        * "ewm" - exponentially weighted mean of last "periods_count" periods with smoothing factor "alpha" - the
+          newest period has the highest weight.
+        * "seasonal" - mean of periods containing the same day of "periods_count" previous years.
+
+    Args:
+        budget_pk (int): Budget database id.
+        period_pk (int): Target BudgetingPeriod database id.
+        method (str): Statistic used for proposed values.
+        periods_count (int): Number of history periods (or years for "seasonal" method).
+        trim (float): Fraction of values cut from both ends for "trimmed_mean" method.
+        alpha (float): Smoothing factor for "ewm" method.
+    """
+
+    METHODS: tuple[str] = ("mean", "median", "trimmed_mean", "ewm", "seasonal")
+    MAX_PERIODS_COUNT: int = 60
+
+    def __init__(
+        self,
+        budget_pk: int,
+        period_pk: int,
+        method: str = "mean",
+        periods_count: int = 6,
+        trim: float = 0.1,
+        alpha: float = 0.5,
+    ):
+        self.budget_pk = budget_pk
+        self.period_pk = period_pk
+        self.method = method
+        self.periods_count = periods_count
+        self.trim = trim
+        self.alpha = alpha
+
+    @staticmethod
+    def shift_years(date: datetime.date, years: int) -> datetime.date:
+        """
+        Returns date shifted by given number of years. 29th of February is shifted to 28th of February.
+
+        Args:
+            date (datetime.date): Shifted date.
+            years (int): Number of years.
+
+        Returns:
+            datetime.date: Shifted date.
+        """
+        try:
+            return date.replace(year=date.year + years)
+        except ValueError:
+            return date.replace(year=date.year + years, day=28)
+
+    def get_history_periods(self) -> list[int]:
+        """
+        Returns history BudgetingPeriods used for computing proposed values.
+
+        Returns:
+            list[int]: BudgetingPeriods ids ordered from the oldest one.
+        """
+        target_start = BudgetingPeriod.objects.values_list("date_start", flat=True).get(pk=self.period_pk)
+        periods = BudgetingPeriod.objects.filter(budget__pk=self.budget_pk, date_start__lt=target_start).order_by(
+            "-date_start"
+        )
+        if self.method != "seasonal":
+            return list(periods.values_list("id", flat=True)[: self.periods_count])[::-1]
+        days = [self.shift_years(target_start, -years) for years in range(self.periods_count, 0, -1)]
+        periods = list(periods.filter(date_end__gte=days[0]).values_list("id", "date_start", "date_end"))
+        return [
+            period_id for day in days for period_id, date_start, date_end in periods if date_start <= day <= date_end
+        ]
+
+    def get_matrix(self, periods_ids: list[int]) -> tuple[list[tuple[int, str]], np.ndarray]:
+        """
+        Loads Expenses sums of ExpenseCategories in given BudgetingPeriods into matrix.
+
+        Args:
+            periods_ids (list[int]): BudgetingPeriods ids ordered from the oldest one.
+
+        Returns:
+            tuple[list[tuple[int, str]], np.ndarray]: ExpenseCategories ids and names with matrix of Expenses sums,
+            in which rows are categories and columns are periods.
+        """
+        rows = list(
+            TransferRollup.objects.filter(
+                period__pk__in=periods_ids,
+                category__budget__pk=self.budget_pk,
+                category__category_type=CategoryType.EXPENSE,
+            )
+            .values_list("category_id", "category__name", "period_id")
+            .annotate(total=Sum("value"))
+            .order_by("category__name", "category_id")
+        )
+        categories = list(dict.fromkeys((category_id, name) for category_id, name, _, _ in rows))
+        category_indexes = {category_id: index for index, (category_id, _) in enumerate(categories)}
+        period_indexes = {period_id: index for index, period_id in enumerate(periods_ids)}
+        matrix = np.zeros((len(categories), len(periods_ids)), dtype=np.float64)
+        if rows:
+            category_ids, _, period_ids, totals = zip(*rows)
+            matrix[
+                [category_indexes[category_id] for category_id in category_ids],
+                [period_indexes[period_id] for period_id in period_ids],
+            ] = np.array(totals, dtype=np.float64)
+        return categories, matrix
+
+    def compute(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Computes proposed values of all categories.
+
+        Args:
+            matrix (np.ndarray): Matrix of Expenses sums with categories rows and periods columns ordered from the
+            oldest one.
+
+        Returns:
+            np.ndarray: Proposed value for every matrix row.
+        """
+        if self.method == "median":
+            return np.median(matrix, axis=1)
+        if self.method == "trimmed_mean":
+            cut = int(matrix.shape[1] * self.trim)
+            return np.sort(matrix, axis=1)[:, slice(cut, matrix.shape[1] - cut)].mean(axis=1)
+        if self.method == "ewm":
+            weights = self.alpha * (1 - self.alpha) ** np.arange(matrix.shape[1] - 1, -1, -1, dtype=np.float64)
+            return matrix @ (weights / weights.sum())
+        return matrix.mean(axis=1)
+
+    def get_predictions(self) -> list[dict]:
+        """
+        Returns proposed ExpensePredictions values for target BudgetingPeriod.
+
+        Returns:
+            list[dict]: Category id, category name and proposed value for every ExpenseCategory with Expenses in
+            history periods.
+        """
+        periods_ids = self.get_history_periods()
+        if not periods_ids:
+            return []
+        categories, matrix = self.get_matrix(periods_ids)
+        if not categories:
+            return []
+        values = np.round(self.compute(matrix), 2)
+        return [
+            {"category_id": category_id, "category_name": category_name, "value": Decimal(f"{value:.2f}")}
+            for (category_id, category_name), value in zip(categories, values.tolist())
+            if value > 0
+        ]
+
+    def save(self, predictions: list[dict], overwrite: bool = True) -> None:
+        """
+        Saves proposed values as ExpensePredictions of target BudgetingPeriod with single INSERT ... ON CONFLICT
+        statement.
+
+        Args:
+            predictions (list[dict]): Proposed values returned by get_predictions.
+            overwrite (bool): Indicates if values of existing ExpensePredictions of target period should be updated.
+        """
+        if not predictions:
+            return
+        ExpensePrediction.objects.upsert(
+            [
+                ExpensePrediction(
+                    period_id=self.period_pk, category_id=prediction["category_id"], value=prediction["value"]
+                )
+                for prediction in predictions
+            ],
+            overwrite=overwrite,
+            update_fields=("value",),
+        )
@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from django.db.models import Case, DecimalField, ExpressionWrapper, F, OuterRef, Q, QuerySet, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from categories.models import ExpenseCategory
+from predictions.models.expense_prediction_model import ExpensePrediction
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class ExpensePredictionProgressService:
+    """
+    Service comparing ExpensePredictions of BudgetingPeriod with real Expenses.
+
+    Progress of all ExpenseCategories of Budget is computed with single query - planned value of every category is
+    read from ExpensePrediction subquery and spent value from TransferRollup subquery summing category Expenses in
+    period. Categories with Expenses but without ExpensePrediction are included too.
+
+    Args:
+        budget_pk (int): Budget database id.
+        period_pk (int): BudgetingPeriod database id.
+    """
+
+    AMOUNT_FIELD = DecimalField(max_digits=20, decimal_places=2)
+
+    def __init__(self, budget_pk: int, period_pk: int):
+        self.budget_pk = budget_pk
+        self.period_pk = period_pk
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Returns ExpenseCategories of Budget annotated with prediction and spending in BudgetingPeriod.
+
+        Returns:
+            QuerySet: ExpenseCategory QuerySet annotated with "prediction_id", "planned", "spent", "remaining" and
+            "percent_used" values.
+        """
+        predictions = ExpensePrediction.objects.filter(category=OuterRef("pk"), period__pk=self.period_pk)
+        spent = (
+            TransferRollup.objects.filter(category=OuterRef("pk"), period__pk=self.period_pk)
+            .values("category")
+            .annotate(total=Sum("value"))
+            .values("total")
+        )
+        zero = Value(Decimal("0.00"), output_field=self.AMOUNT_FIELD)
+        return (
+            ExpenseCategory.objects.filter(budget__pk=self.budget_pk)
+            .annotate(
+                prediction_id=Subquery(predictions.values("id")[:1]),
+                planned=Subquery(predictions.values("value")[:1], output_field=self.AMOUNT_FIELD),
+                spent=Coalesce(Subquery(spent[:1], output_field=self.AMOUNT_FIELD), zero),
+            )
+            .filter(Q(prediction_id__isnull=False) | Q(spent__gt=0))
+            .annotate(
+                remaining=ExpressionWrapper(Coalesce(F("planned"), zero) - F("spent"), output_field=self.AMOUNT_FIELD),
+                percent_used=Case(
+                    When(planned__gt=0, then=F("spent") * Value(Decimal("100")) / F("planned")),
+                    default=None,
+                    output_field=self.AMOUNT_FIELD,
+                ),
+            )
+            .order_by("priority", "name", "id")
+        )
+
+    def get_progress(self) -> list[dict]:
+        """
+        Returns progress of ExpensePredictions in BudgetingPeriod.
+
+        Returns:
+            list[dict]: Planned, spent and remaining values and percent of used prediction for every category.
+        """
+        return list(
+            self.get_queryset().values(
+                "prediction_id",
+                "planned",
+                "spent",
+                "remaining",
+                "percent_used",
+                category_id=F("id"),
+                category_name=F("name"),
+            )
+        )
@@ -1,29 +1,54 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.filters import OrderingFilter
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.filters import SearchRankOrderingFilter
+from app_infrastructure.mixins import BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin
+from app_infrastructure.paginations import OptionalKeysetPagination
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
+from budgets.models import BudgetingPeriod
 from predictions.filtersets.expense_prediction_filterset import ExpensePredictionFilterSet
 from predictions.models.expense_prediction_model import ExpensePrediction
+from predictions.serializers.expense_prediction_bulk_serializer import ExpensePredictionBulkSerializer
+from predictions.serializers.expense_prediction_copy_serializer import ExpensePredictionCopySerializer
+from predictions.serializers.expense_prediction_generator_serializer import (
+    ExpensePredictionGeneratorSerializer,
+    ExpensePredictionProposalSerializer,
+)
+from predictions.serializers.expense_prediction_progress_serializer import ExpensePredictionProgressSerializer
 from predictions.serializers.expense_prediction_serializer import ExpensePredictionSerializer
+from predictions.services.expense_prediction_copy_service import (
+    ExpensePredictionCopyError,
+    ExpensePredictionCopyService,
+)
+from predictions.services.expense_prediction_generator_service import ExpensePredictionGeneratorService
+from predictions.services.expense_prediction_progress_service import ExpensePredictionProgressService
 
 
-class ExpensePredictionViewSet(ModelViewSet):
+class ExpensePredictionViewSet(BudgetETagMixin, BudgetListCacheMixin, ValuesListMixin, ModelViewSet):
     """Base view for managing ExpensePredictions."""
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication, SignedTokenAuthentication]
     permission_classes = (
         IsAuthenticated,
         UserBelongsToBudgetPermission,
     )
-    filter_backends = (filters.DjangoFilterBackend, OrderingFilter)
+    filter_backends = (filters.DjangoFilterBackend, SearchRankOrderingFilter)
+    pagination_class = OptionalKeysetPagination
     serializer_class = ExpensePredictionSerializer
+    bulk_serializer_class = ExpensePredictionBulkSerializer
 
     filterset_class = ExpensePredictionFilterSet
+    ordering = ("id",)
     ordering_fields = ("id", "period__name", "category__priority", "category__name", "value")
+    values_lookups = {"period": "period__name", "category": "category__name"}
+    list_cache_resources = ("predictions", "periods", "categories")
 
     def get_queryset(self) -> QuerySet:
         """
@@ -32,6 +57,100 @@ class ExpensePredictionViewSet(ModelViewSet):
         Returns:
             QuerySet: Filtered ExpensePrediction QuerySet.
         """
-        return ExpensePrediction.objects.filter(period__budget__pk=self.kwargs.get("budget_pk")).prefetch_related(
+        return ExpensePrediction.objects.filter(period__budget__pk=self.kwargs.get("budget_pk")).select_related(
             "period", "category"
         )
+
+    @action(detail=False, methods=["GET"])
+    def progress(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns planned, spent and remaining values for ExpenseCategories in BudgetingPeriod passed in "period"
+        query param.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Progress of ExpensePredictions in BudgetingPeriod.
+        """
+        budget_pk = self.kwargs.get("budget_pk")
+        period_pk = request.query_params.get("period")
+        if not period_pk:
+            raise ValidationError({"period": ["This query param is required."]})
+        if not period_pk.isdigit() or not BudgetingPeriod.objects.filter(pk=period_pk, budget__pk=budget_pk).exists():
+            raise ValidationError({"period": ["BudgetingPeriod does not exist in Budget."]})
+        progress = ExpensePredictionProgressService(budget_pk, int(period_pk)).get_progress()
+        return Response(ExpensePredictionProgressSerializer(progress, many=True).data)
+
+    @action(detail=False, methods=["POST"])
+    def bulk(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Creates or updates multiple ExpensePredictions for Budget passed in URL at once. ExpensePredictions already
+        existing for given period and category are updated.
+
+        Args:
+            request [Request]: User request containing list of ExpensePredictions data.
+
+        Returns:
+            Response: Saved ExpensePredictions.
+        """
+        serializer = self.bulk_serializer_class(data=request.data, many=True, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        predictions = serializer.save()
+        return Response(self.get_serializer(predictions, many=True).data)
+
+    @action(detail=False, methods=["POST"])
+    def copy(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Copies ExpensePredictions of "source_period" to "target_period" of Budget passed in URL. Copied values can
+        be multiplied by "scale" and rounded up to multiple of "rounding". Existing ExpensePredictions of target
+        period are updated, unless "overwrite" is false.
+
+        Args:
+            request [Request]: User request containing copy params.
+
+        Returns:
+            Response: Number of copied ExpensePredictions.
+        """
+        serializer = ExpensePredictionCopySerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        service = ExpensePredictionCopyService(
+            source_period_pk=serializer.validated_data["source_period"],
+            target_period_pk=serializer.validated_data["target_period"],
+            scale=serializer.validated_data["scale"],
+            rounding=serializer.validated_data["rounding"],
+            overwrite=serializer.validated_data["overwrite"],
+        )
+        try:
+            copied_count = service.copy()
+        except ExpensePredictionCopyError as exc:
+            raise ValidationError({"scale": exc.errors})
+        return Response({"copied": copied_count})
+
+    @action(detail=False, methods=["POST"])
+    def generate(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Proposes ExpensePredictions values for "period" of Budget passed in URL from Expenses of previous
+        BudgetingPeriods. Proposed values are saved as ExpensePredictions if "commit" is true - existing
+        ExpensePredictions values are updated, unless "overwrite" is false.
+
+        Args:
+            request [Request]: User request containing generation params.
+
+        Returns:
+            Response: Proposed value for every ExpenseCategory with Expenses in history periods.
+        """
+        serializer = ExpensePredictionGeneratorSerializer(data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        service = ExpensePredictionGeneratorService(
+            budget_pk=int(self.kwargs["budget_pk"]),
+            period_pk=serializer.validated_data["period"],
+            method=serializer.validated_data["method"],
+            periods_count=serializer.validated_data["periods_count"],
+            trim=serializer.validated_data["trim"],
+            alpha=serializer.validated_data["alpha"],
+        )
+        predictions = service.get_predictions()
+        if serializer.validated_data["commit"]:
+            service.save(predictions, overwrite=serializer.validated_data["overwrite"])
+        return Response(ExpensePredictionProposalSerializer(predictions, many=True).data)
@@ -8,4 +8,4 @@ class TransferAdmin(admin.ModelAdmin):
     """Custom admin view for Transfer model."""
 
     list_display = ("date", "period", "entity", "name", "category", "value", "deposit")
-    list_filter = ("date", "period__budget", "period", "entity", "category", "deposit")
+    list_filter = ("date", "budget", "period", "entity", "category", "deposit")
@@ -1,6 +1,7 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
 from budgets.models import BudgetingPeriod
 from categories.models import TransferCategory
 from entities.models import Deposit, Entity
@@ -14,6 +15,7 @@ class TransferFilterSet(filters.FilterSet):
     """Base FilterSet for Transfer endpoints."""
 
     name = filters.CharFilter(lookup_expr="icontains", field_name="name")
+    search = filters.CharFilter(method="get_searched_transfers")
     period = filters.ModelChoiceFilter(
         queryset=lambda request: BudgetingPeriod.objects.filter(budget__pk=get_budget_pk(request))
     )
@@ -36,6 +38,21 @@ class TransferFilterSet(filters.FilterSet):
     def get_budget_pk(request):
         return request.parser_context.get("kwargs", {}).get("budget_pk")  # pragma: no cover
 
+    @staticmethod
+    def get_searched_transfers(queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """
+        Filtering QuerySet Transfer with full text search by name and description.
+
+        Args:
+            queryset [QuerySet]: Input QuerySet
+            name [str]: Name of filtered param
+            value [str]: Value of filtered param
+
+        Returns:
+            QuerySet: Filtered QuerySet annotated with search rank.
+        """
+        return FullTextSearchService.search(queryset, value, "name", "description")
+
     @staticmethod
     def get_owner_transfers(queryset: QuerySet, name: str, value: str) -> QuerySet:
         """
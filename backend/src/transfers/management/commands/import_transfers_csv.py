@@ -0,0 +1,60 @@
+"""
+Django command to import Transfers for Budget from CSV file
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budgets.models import Budget
+from transfers.serializers.transfer_bulk_serializer import ExpenseBulkSerializer, IncomeBulkSerializer
+from transfers.services.transfer_csv_import_service import TransferCsvImportError, TransferCsvImportService
+
+
+class Command(BaseCommand):
+    """Django command to import Transfers from CSV file"""
+
+    help = "Imports Incomes or Expenses for Budget from CSV file."
+
+    SERIALIZERS = {"income": IncomeBulkSerializer, "expense": ExpenseBulkSerializer}
+
+    def add_arguments(self, parser):
+        """Adds command arguments."""
+        parser.add_argument("path", help="Path to CSV file.")
+        parser.add_argument("--budget", type=int, required=True, help="Budget database id.")
+        parser.add_argument("--type", choices=self.SERIALIZERS.keys(), required=True, help="Type of Transfers.")
+        parser.add_argument("--delimiter", default=",", help="CSV columns delimiter.")
+        parser.add_argument("--date-format", default="%Y-%m-%d", help="Format of dates in CSV file.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Number of rows created at once.")
+        parser.add_argument(
+            "--column",
+            action="append",
+            default=[],
+            metavar="FIELD=COLUMN",
+            help="Name of CSV column for Transfer field, f.e. --column value=Amount.",
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        if not Budget.objects.filter(pk=options["budget"]).exists():
+            raise CommandError(f"Budget with id {options['budget']} does not exist.")
+        try:
+            column_mapping = dict(column.split("=", 1) for column in options["column"])
+        except ValueError:
+            raise CommandError("Columns mapping has to be passed in FIELD=COLUMN format.")
+
+        service = TransferCsvImportService(
+            budget_pk=options["budget"],
+            serializer_class=self.SERIALIZERS[options["type"]],
+            column_mapping=column_mapping,
+            delimiter=options["delimiter"],
+            date_format=options["date_format"],
+            chunk_size=options["chunk_size"],
+        )
+        with open(options["path"], newline="", encoding="utf-8-sig") as file:
+            try:
+                created_count = service.import_file(file)
+            except TransferCsvImportError as exc:
+                for line, errors in exc.errors.items():
+                    self.stderr.write(f"Line {line}: {errors}")
+                raise CommandError(str(exc))
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {created_count} Transfers."))
@@ -0,0 +1,63 @@
+"""
+Django command to verify or rebuild TransferRollup rows
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budgets.models import BudgetingPeriod
+from transfers.managers.transfer_rollup_manager import TransferRollupQuerySet
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+class Command(BaseCommand):
+    """Django command to verify or rebuild TransferRollup rows"""
+
+    help = "Recomputes TransferRollup rows from Transfers or checks if stored rows are up to date."
+
+    def add_arguments(self, parser):
+        """Adds command arguments."""
+        parser.add_argument("--budget", type=int, help="Budget database id. All Budgets when not given.")
+        parser.add_argument(
+            "--check", action="store_true", help="Only compare stored rows with Transfers, without changing them."
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        periods = BudgetingPeriod.objects.all()
+        if options["budget"] is not None:
+            periods = periods.filter(budget__pk=options["budget"])
+        periods_ids = list(periods.values_list("id", flat=True))
+
+        if options["check"]:
+            stale_periods = self.get_stale_periods(periods_ids)
+            if stale_periods:
+                for period_id in sorted(stale_periods):
+                    self.stderr.write(f"TransferRollup rows of BudgetingPeriod {period_id} are out of date.")
+                raise CommandError(f"Found {len(stale_periods)} BudgetingPeriods with out of date TransferRollups.")
+            self.stdout.write(self.style.SUCCESS(f"TransferRollups of {len(periods_ids)} periods are up to date."))
+            return
+
+        TransferRollup.objects.rebuild(periods_ids)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt TransferRollups of {len(periods_ids)} periods."))
+
+    @staticmethod
+    def get_stale_periods(periods_ids: list[int]) -> set[int]:
+        """
+        Compares stored TransferRollup rows with rows aggregated from Transfers.
+
+        Args:
+            periods_ids (list[int]): BudgetingPeriods database ids.
+
+        Returns:
+            set[int]: Ids of BudgetingPeriods with differing rows.
+        """
+        key_fields = TransferRollupQuerySet.KEY_FIELDS
+        stored = {
+            tuple(row[field] for field in key_fields): (row["value"], row["count"])
+            for row in TransferRollup.objects.filter(period_id__in=periods_ids).values(*key_fields, "value", "count")
+        }
+        expected = {
+            tuple(row[field] for field in key_fields): (row["value"], row["count"])
+            for row in TransferRollup.objects.get_expected_rows(periods_ids)
+        }
+        return {key[0] for key in stored.keys() | expected.keys() if stored.get(key) != expected.get(key)}
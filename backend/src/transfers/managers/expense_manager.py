@@ -3,9 +3,10 @@ from django.db import models
 from django.db.models import Model, QuerySet
 
 from categories.models.transfer_category_choices import CategoryType
+from transfers.managers.transfer_manager import TransferQuerySet
 
 
-class ExpenseQuerySet(QuerySet):
+class ExpenseQuerySet(TransferQuerySet):
     """Custom ExpenseQuerySet for validating input data for Expense instances create and update."""
 
     def create(self, **kwargs) -> Model:
@@ -47,4 +48,4 @@ class ExpenseManager(models.Manager):
         Returns:
             QuerySet: QuerySet containing only Transfers with ExpenseCategories as category.
         """
-        return ExpenseQuerySet(self.model, using=self._db).filter(category__category_type=CategoryType.EXPENSE)
+        return ExpenseQuerySet(self.model, using=self._db).filter(transfer_type=CategoryType.EXPENSE)
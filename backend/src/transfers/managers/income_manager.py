@@ -3,9 +3,10 @@ from django.db import models
 from django.db.models import Model, QuerySet
 
 from categories.models.transfer_category_choices import CategoryType
+from transfers.managers.transfer_manager import TransferQuerySet
 
 
-class IncomeQuerySet(QuerySet):
+class IncomeQuerySet(TransferQuerySet):
     """Custom IncomeQuerySet for validating input data for Income instances create and update."""
 
     def create(self, **kwargs) -> Model:
@@ -47,4 +48,4 @@ class IncomeManager(models.Manager):
         Returns:
             QuerySet: QuerySet containing only Transfers with IncomeCategories as category.
         """
-        return IncomeQuerySet(self.model, using=self._db).filter(category__category_type=CategoryType.INCOME)
+        return IncomeQuerySet(self.model, using=self._db).filter(transfer_type=CategoryType.INCOME)
@@ -0,0 +1,212 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    F,
+    Model,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from categories.models.transfer_category_choices import CategoryType
+from transfers.managers.transfer_rollup_manager import TransferRollupQuerySet
+
+
+class TransferQuerySet(QuerySet):
+    """Custom TransferQuerySet keeping TransferRollup rows in line with bulk Transfers operations."""
+
+    ROLLUP_FIELDS: tuple[str] = ("period", "category", "entity", "deposit", "value")
+
+    def bulk_create(self, objs: Iterable[Model], *args, **kwargs) -> list[Model]:
+        """
+        Method extended with filling denormalized "budget" and "transfer_type" fields, adding created Transfers
+        to TransferRollup rows and TransferAutocompleteService indexes and increasing data version of their Budgets.
+
+        Args:
+            objs (Iterable[Model]): Transfer model instances to create.
+
+        Returns:
+            list[Model]: Created Transfer model instances.
+        """
+        from transfers.models.transfer_rollup_model import TransferRollup
+        from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+
+        objs = list(objs)
+        self.fill_denormalized_fields(objs)
+        with transaction.atomic():
+            created = super().bulk_create(objs, *args, **kwargs)
+            deltas = defaultdict(lambda: (Decimal("0"), 0))
+            for transfer in created:
+                value, count = deltas[transfer.get_rollup_key()]
+                deltas[transfer.get_rollup_key()] = (value + transfer.value, count + 1)
+            TransferRollup.objects.apply_deltas(deltas)
+            BudgetDataVersionService.bump("transfers", budget_ids={transfer.budget_id for transfer in created})
+            TransferAutocompleteService.on_transfers_created(created)
+        return created
+
+    def update(self, **kwargs) -> int:
+        """
+        Method extended with updating denormalized "budget" and "transfer_type" fields, recomputing TransferRollup
+        rows of affected BudgetingPeriods, removing TransferAutocompleteService indexes and increasing data version
+        of affected Budgets.
+
+        Returns:
+            int: Number of affected database rows.
+        """
+        from budgets.models import BudgetingPeriod
+        from categories.models import TransferCategory
+        from transfers.models.transfer_rollup_model import TransferRollup
+        from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+
+        if (period := kwargs.get("period", kwargs.get("period_id"))) is not None:
+            kwargs["budget_id"] = (
+                period.budget_id
+                if isinstance(period, Model)
+                else BudgetingPeriod.objects.values_list("budget_id", flat=True).get(pk=period)
+            )
+        if (category := kwargs.get("category", kwargs.get("category_id"))) is not None:
+            kwargs["transfer_type"] = (
+                category.category_type
+                if isinstance(category, Model)
+                else TransferCategory.objects.values_list("category_type", flat=True).get(pk=category)
+            )
+        with transaction.atomic():
+            periods_ids, budget_ids = set(), set()
+            for period_id, budget_id in self.values_list("period_id", "budget_id").distinct().order_by():
+                periods_ids.add(period_id)
+                budget_ids.add(budget_id)
+            updated = super().update(**kwargs)
+            if period is not None:
+                periods_ids.add(getattr(period, "pk", period))
+                budget_ids.add(kwargs["budget_id"])
+            if any(field in kwargs or f"{field}_id" in kwargs for field in self.ROLLUP_FIELDS):
+                TransferRollup.objects.rebuild(periods_ids)
+            BudgetDataVersionService.bump("transfers", budget_ids=budget_ids)
+            TransferAutocompleteService.invalidate(budget_ids)
+        return updated
+
+    def delete(self) -> tuple[int, dict[str, int]]:
+        """
+        Method extended with recomputing TransferRollup rows of deleted Transfers keys and removing deleted Transfers
+        from TransferAutocompleteService indexes with set based queries, using single aggregate of deleted Transfers
+        collected before deletion. Transfers are deleted with standard Collector, so post_delete signals are sent
+        for every instance, but per instance rollup and index updates are skipped by receivers for QuerySet
+        deletes. Data version of every affected Budget is increased once by bump_deleted_budget_data_version
+        receiver.
+
+        Returns:
+            tuple[int, dict[str, int]]: Number of deleted objects and number of deleted objects per model.
+        """
+        from transfers.models.transfer_rollup_model import TransferRollup
+        from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+
+        with transaction.atomic():
+            groups = list(
+                self.order_by()
+                .values(*TransferRollupQuerySet.KEY_FIELDS, "budget_id", "transfer_type", "name", "date")
+                .annotate(transfers_count=Count("id"))
+            )
+            deleted = super().delete()
+            TransferRollup.objects.rebuild_keys(
+                {tuple(group[field] for field in TransferRollupQuerySet.KEY_FIELDS) for group in groups}
+            )
+            TransferAutocompleteService.on_transfers_deleted(groups)
+        return deleted
+
+    @staticmethod
+    def fill_denormalized_fields(transfers: list[Model]) -> None:
+        """
+        Sets "budget" and "transfer_type" fields of given Transfers from their BudgetingPeriod and TransferCategory.
+        Related objects not loaded on Transfers are fetched with single query per model.
+
+        Args:
+            transfers (list[Model]): Transfer model instances.
+        """
+        from budgets.models import BudgetingPeriod
+        from categories.models import TransferCategory
+
+        if not transfers:
+            return
+        period_field, category_field = transfers[0]._meta.get_field("period"), transfers[0]._meta.get_field("category")
+        periods_budgets = dict(
+            BudgetingPeriod.objects.filter(
+                pk__in={transfer.period_id for transfer in transfers if not period_field.is_cached(transfer)}
+            ).values_list("pk", "budget_id")
+        )
+        categories_types = dict(
+            TransferCategory.objects.filter(
+                pk__in={transfer.category_id for transfer in transfers if not category_field.is_cached(transfer)}
+            ).values_list("pk", "category_type")
+        )
+        for transfer in transfers:
+            transfer.budget_id = (
+                transfer.period.budget_id if period_field.is_cached(transfer) else periods_budgets[transfer.period_id]
+            )
+            transfer.transfer_type = (
+                transfer.category.category_type
+                if category_field.is_cached(transfer)
+                else categories_types[transfer.category_id]
+            )
+
+    @staticmethod
+    def signed_value() -> Case:
+        """
+        Returns expression evaluating "value" field as positive for Incomes and negative for Expenses. Can be used
+        for Transfer and TransferRollup QuerySets.
+
+        Returns:
+            Case: Signed value expression.
+        """
+        return Case(
+            When(category__category_type=CategoryType.INCOME, then=F("value")),
+            default=-F("value"),
+            output_field=DecimalField(max_digits=20, decimal_places=2),
+        )
+
+    def with_running_balance(self) -> QuerySet:
+        """
+        Annotates Transfers with "running_balance" - balance of Transfer Deposit after Transfer, taking into account
+        all Transfers of Deposit in chronological (date, id) order.
+
+        Balance of Deposit at the beginning of Transfer period is read from TransferRollup rows of earlier periods,
+        which act as checkpoints, so only Transfers of the same period are scanned for every Transfer.
+
+        Returns:
+            QuerySet: QuerySet annotated with "running_balance".
+        """
+        from transfers.models.transfer_model import Transfer
+        from transfers.models.transfer_rollup_model import TransferRollup
+
+        zero = Value(Decimal("0.00"), output_field=DecimalField(max_digits=20, decimal_places=2))
+        checkpoint = (
+            TransferRollup.objects.filter(
+                deposit=OuterRef("deposit"),
+                period__budget=OuterRef("period__budget"),
+                period__date_start__lt=OuterRef("period__date_start"),
+            )
+            .values("deposit")
+            .annotate(total=Sum(self.signed_value()))
+            .values("total")
+        )
+        period_balance = (
+            Transfer.objects.filter(deposit=OuterRef("deposit"), period=OuterRef("period"))
+            .filter(Q(date__lt=OuterRef("date")) | Q(date=OuterRef("date"), id__lte=OuterRef("id")))
+            .values("deposit")
+            .annotate(total=Sum(self.signed_value()))
+            .values("total")
+        )
+        return self.annotate(
+            running_balance=Coalesce(Subquery(checkpoint[:1]), zero) + Coalesce(Subquery(period_balance[:1]), zero)
+        )
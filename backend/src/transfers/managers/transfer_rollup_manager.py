@@ -0,0 +1,107 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet, Sum
+
+RollupKey = tuple[int, int, int, int]
+
+
+class TransferRollupQuerySet(QuerySet):
+    """Custom TransferRollupQuerySet for maintaining TransferRollup rows in line with Transfers."""
+
+    KEY_FIELDS: tuple[str] = ("period_id", "category_id", "entity_id", "deposit_id")
+
+    def apply_deltas(self, deltas: dict[RollupKey, tuple[Decimal, int]]) -> None:
+        """
+        Adds values and counts deltas to TransferRollup rows. Missing rows are created for positive deltas, rows
+        with no Transfers left are removed.
+
+        Args:
+            deltas (dict[RollupKey, tuple[Decimal, int]]): Value and count deltas mapped by
+            (period_id, category_id, entity_id, deposit_id) key.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+        with transaction.atomic():
+            for key, (value, count) in deltas.items():
+                lookup = dict(zip(self.KEY_FIELDS, key))
+                if self.filter(**lookup).update(value=F("value") + value, count=F("count") + count) or count <= 0:
+                    continue
+                try:
+                    with transaction.atomic():
+                        self.create(**lookup, value=value, count=count)
+                except IntegrityError:
+                    self.filter(**lookup).update(value=F("value") + value, count=F("count") + count)
+            self.filter(period_id__in={key[0] for key in deltas}, count__lte=0).delete()
+
+    def apply_transfer_change(
+        self, old_key: RollupKey | None, old_value: Decimal, new_key: RollupKey | None, new_value: Decimal
+    ) -> None:
+        """
+        Moves single Transfer between TransferRollup rows.
+
+        Args:
+            old_key (RollupKey | None): Rollup key of Transfer before change or None for created Transfer.
+            old_value (Decimal): Value of Transfer before change.
+            new_key (RollupKey | None): Rollup key of Transfer after change or None for deleted Transfer.
+            new_value (Decimal): Value of Transfer after change.
+        """
+        deltas = defaultdict(lambda: (Decimal("0"), 0))
+        if old_key is not None:
+            deltas[old_key] = (-old_value, -1)
+        if new_key is not None:
+            value, count = deltas[new_key]
+            deltas[new_key] = (value + new_value, count + 1)
+        self.apply_deltas(deltas)
+
+    def rebuild(self, periods_ids: Iterable[int]) -> None:
+        """
+        Recomputes TransferRollup rows of given BudgetingPeriods from Transfers.
+
+        Args:
+            periods_ids (Iterable[int]): BudgetingPeriods database ids.
+        """
+        periods_ids = set(periods_ids)
+        if not periods_ids:
+            return
+        with transaction.atomic():
+            self.filter(period_id__in=periods_ids).delete()
+            self.bulk_create(self.model(**row) for row in self.get_expected_rows(periods_ids))
+
+    def rebuild_keys(self, keys: Iterable[RollupKey]) -> None:
+        """
+        Recomputes TransferRollup rows of given keys from Transfers. Rows are selected with single IN lookup for
+        every key field, so all combinations of given keys fields values are recomputed with constant number of
+        queries.
+
+        Args:
+            keys (Iterable[RollupKey]): (period_id, category_id, entity_id, deposit_id) keys.
+        """
+        keys = set(keys)
+        if not keys:
+            return
+        lookup = {f"{field}__in": {key[index] for key in keys} for index, field in enumerate(self.KEY_FIELDS)}
+        with transaction.atomic():
+            self.filter(**lookup).delete()
+            self.bulk_create(self.model(**row) for row in self.get_expected_rows(**lookup))
+
+    def get_expected_rows(self, periods_ids: Iterable[int] | None = None, **lookup) -> Iterable[dict]:
+        """
+        Aggregates Transfers into TransferRollup rows data.
+
+        Args:
+            periods_ids (Iterable[int] | None): BudgetingPeriods database ids. All periods when not given.
+            **lookup: Additional Transfer filters.
+
+        Returns:
+            Iterable[dict]: TransferRollup rows data.
+        """
+        from transfers.models.transfer_model import Transfer
+
+        transfers = Transfer.objects.filter(**lookup)
+        if periods_ids is not None:
+            transfers = transfers.filter(period_id__in=periods_ids)
+        return transfers.values(*self.KEY_FIELDS).annotate(value=Sum("value"), count=Count("id")).order_by()
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:27
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_transfer_rollups(apps, schema_editor):
+    """Aggregates existing Transfers into TransferRollup rows."""
+    Transfer = apps.get_model("transfers", "Transfer")
+    TransferRollup = apps.get_model("transfers", "TransferRollup")
+    rows = (
+        Transfer.objects.values("period_id", "category_id", "entity_id", "deposit_id")
+        .annotate(value=models.Sum("value"), count=models.Count("id"))
+        .order_by()
+    )
+    TransferRollup.objects.bulk_create((TransferRollup(**row) for row in rows), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entities", "0001_initial"),
+        ("categories", "0001_initial"),
+        ("budgets", "0002_budgetingperiod"),
+        ("transfers", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TransferRollup",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("value", models.DecimalField(decimal_places=2, default=Decimal("0.00"), max_digits=20)),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transfer_rollups",
+                        to="categories.transfercategory",
+                    ),
+                ),
+                (
+                    "deposit",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deposit_transfer_rollups",
+                        to="entities.deposit",
+                    ),
+                ),
+                (
+                    "entity",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="entity_transfer_rollups",
+                        to="entities.entity",
+                    ),
+                ),
+                (
+                    "period",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transfer_rollups",
+                        to="budgets.budgetingperiod",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "transfer rollups",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="transferrollup",
+            constraint=models.UniqueConstraint(
+                fields=("period", "category", "entity", "deposit"), name="transfers_transferrollup_unique_key"
+            ),
+        ),
+        migrations.RunPython(fill_transfer_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def fill_budget_and_transfer_type(apps, schema_editor):
+    """Copies Budget of BudgetingPeriod and type of TransferCategory to existing Transfers."""
+    Transfer = apps.get_model("transfers", "Transfer")
+    BudgetingPeriod = apps.get_model("budgets", "BudgetingPeriod")
+    TransferCategory = apps.get_model("categories", "TransferCategory")
+    Transfer.objects.update(
+        budget_id=models.Subquery(
+            BudgetingPeriod.objects.filter(pk=models.OuterRef("period_id")).values("budget_id")[:1]
+        ),
+        transfer_type=models.Subquery(
+            TransferCategory.objects.filter(pk=models.OuterRef("category_id")).values("category_type")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0003_budget_data_version"),
+        ("categories", "0001_initial"),
+        ("transfers", "0002_transferrollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transfer",
+            name="budget",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transfers",
+                to="budgets.budget",
+            ),
+        ),
+        migrations.AddField(
+            model_name="transfer",
+            name="transfer_type",
+            field=models.PositiveSmallIntegerField(choices=[(1, "Expense"), (2, "Income")], editable=False, null=True),
+        ),
+        migrations.RunPython(fill_budget_and_transfer_type, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="transfer",
+            name="budget",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transfers",
+                to="budgets.budget",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transfer",
+            name="transfer_type",
+            field=models.PositiveSmallIntegerField(choices=[(1, "Expense"), (2, "Income")], editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "date"], name="transfers_budget_type_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "id"], name="transfers_budget_type_id_idx"),
+        ),
+    ]
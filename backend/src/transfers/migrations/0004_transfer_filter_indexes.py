@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("budgets", "0003_budget_data_version"),
+        ("transfers", "0003_transfer_budget_transfer_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="transfer",
+            name="budget",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transfers",
+                to="budgets.budget",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "name"], name="transfers_budget_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "value"], name="transfers_budget_value_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["deposit", "date", "id"], name="transfers_deposit_date_idx"),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transfers", "0005_transfer_search_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="transfer",
+            name="transfers_budget_type_date_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transfer",
+            name="transfers_budget_name_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="transfer",
+            name="transfers_budget_value_idx",
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "date", "id"], name="transfers_budget_type_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(
+                fields=["budget", "transfer_type", "-date", "id"], name="transfers_budget_date_desc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "name", "id"], name="transfers_budget_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="transfer",
+            index=models.Index(fields=["budget", "transfer_type", "value", "id"], name="transfers_budget_value_idx"),
+        ),
+    ]
@@ -1,10 +1,16 @@
 from decimal import Decimal
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
+from categories.models.transfer_category_choices import CategoryType
 from transfers.managers.expense_manager import ExpenseManager
 from transfers.managers.income_manager import IncomeManager
+from transfers.managers.transfer_manager import TransferQuerySet
+from transfers.managers.transfer_rollup_manager import RollupKey
+from transfers.models.transfer_rollup_model import TransferRollup
 
 
 class Transfer(models.Model):
@@ -18,13 +24,26 @@ class Transfer(models.Model):
     entity = models.ForeignKey("entities.Entity", on_delete=models.PROTECT, related_name="entity_transfers")
     deposit = models.ForeignKey("entities.Deposit", on_delete=models.PROTECT, related_name="deposit_transfers")
     category = models.ForeignKey("categories.TransferCategory", on_delete=models.PROTECT, related_name="transfers")
+    budget = models.ForeignKey(
+        "budgets.Budget", on_delete=models.CASCADE, related_name="transfers", editable=False, db_index=False
+    )
+    transfer_type = models.PositiveSmallIntegerField(choices=CategoryType.choices, editable=False)
 
-    objects = models.Manager()
+    objects = TransferQuerySet.as_manager()
     incomes = IncomeManager()
     expenses = ExpenseManager()
 
     class Meta:
         verbose_name_plural = "transfers"
+        indexes = (
+            models.Index(fields=("budget", "transfer_type", "date", "id"), name="transfers_budget_type_date_idx"),
+            models.Index(fields=("budget", "transfer_type", "-date", "id"), name="transfers_budget_date_desc_idx"),
+            models.Index(fields=("budget", "transfer_type", "id"), name="transfers_budget_type_id_idx"),
+            models.Index(fields=("budget", "transfer_type", "name", "id"), name="transfers_budget_name_idx"),
+            models.Index(fields=("budget", "transfer_type", "value", "id"), name="transfers_budget_value_idx"),
+            models.Index(fields=("deposit", "date", "id"), name="transfers_deposit_date_idx"),
+            GinIndex(FullTextSearchService.get_vector("name", "description"), name="transfers_search_idx"),
+        )
         constraints = (
             models.CheckConstraint(
                 name="%(app_label)s_%(class)s_value_gt_0",
@@ -38,12 +57,36 @@ class Transfer(models.Model):
 
     def save(self, *args, **kwargs) -> None:
         """
-        Override save method to execute validation before saving model in database.
+        Override save method to execute validation before saving model in database, to fill denormalized "budget"
+        and "transfer_type" fields and to move Transfer value between TransferRollup rows.
         """
         self.validate_budget()
         self.validate_period()
         self.validate_deposit()
-        super().save(*args, **kwargs)
+        self.budget_id = self.period.budget_id
+        self.transfer_type = self.category.category_type
+        with transaction.atomic():
+            old_key, old_value = None, Decimal("0")
+            if self.pk is not None:
+                old_state = (
+                    Transfer.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values_list("period_id", "category_id", "entity_id", "deposit_id", "value")
+                    .first()
+                )
+                if old_state is not None:
+                    old_key, old_value = old_state[:4], old_state[4]
+            super().save(*args, **kwargs)
+            TransferRollup.objects.apply_transfer_change(old_key, old_value, self.get_rollup_key(), Decimal(self.value))
+
+    def get_rollup_key(self) -> RollupKey:
+        """
+        Returns key of TransferRollup row aggregating Transfer.
+
+        Returns:
+            RollupKey: Tuple of period, category, entity and deposit ids.
+        """
+        return self.period_id, self.category_id, self.entity_id, self.deposit_id
 
     def validate_budget(self) -> None:
         """
@@ -0,0 +1,42 @@
+from decimal import Decimal
+
+from django.db import models
+
+from transfers.managers.transfer_rollup_manager import TransferRollupQuerySet
+
+
+class TransferRollup(models.Model):
+    """
+    TransferRollup model storing sum and count of Transfers with the same period, category, entity and deposit.
+
+    Rows are maintained on every Transfer change, so reports read number of rows proportional to number of
+    categories instead of number of Transfers.
+    """
+
+    period = models.ForeignKey("budgets.BudgetingPeriod", on_delete=models.CASCADE, related_name="transfer_rollups")
+    category = models.ForeignKey(
+        "categories.TransferCategory", on_delete=models.CASCADE, related_name="transfer_rollups"
+    )
+    entity = models.ForeignKey("entities.Entity", on_delete=models.CASCADE, related_name="entity_transfer_rollups")
+    deposit = models.ForeignKey("entities.Deposit", on_delete=models.CASCADE, related_name="deposit_transfer_rollups")
+    value = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal("0.00"))
+    count = models.PositiveIntegerField(default=0)
+
+    objects = TransferRollupQuerySet.as_manager()
+
+    class Meta:
+        verbose_name_plural = "transfer rollups"
+        constraints = (
+            models.UniqueConstraint(
+                name="%(app_label)s_%(class)s_unique_key", fields=("period", "category", "entity", "deposit")
+            ),
+        )
+
+    def __str__(self) -> str:
+        """
+        Returns string representation of TransferRollup model instance.
+
+        Returns:
+            str: Custom string representation of instance.
+        """
+        return f"{self.period_id} | {self.category_id} | {self.entity_id} | {self.deposit_id} | {self.value}"
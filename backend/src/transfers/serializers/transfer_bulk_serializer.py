@@ -0,0 +1,225 @@
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models import Model
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from budgets.models import BudgetingPeriod
+from categories.models import TransferCategory
+from categories.models.transfer_category_choices import CategoryType
+from entities.models import Deposit, Entity
+from transfers.models.expense_model import Expense
+from transfers.models.income_model import Income
+from transfers.models.transfer_model import Transfer
+from transfers.serializers.transfer_serializer import TransferSerializer
+
+
+class TransferBulkListSerializer(serializers.ListSerializer):
+    """
+    Class for validating and creating multiple Transfer model instances at once.
+
+    All objects referenced in payload are fetched with single query per table, validated in memory and created
+    with single bulk_create inside transaction.
+    """
+
+    max_rows: int = 10000
+    batch_size: int = 1000
+
+    @property
+    def _budget_pk(self) -> int:
+        """
+        Property for retrieving Budget primary key passed in URL.
+
+        Returns:
+            int: Budget model instance PK.
+        """
+        return int(getattr(self.context.get("view"), "kwargs", {}).get("budget_pk", 0))
+
+    def to_internal_value(self, data: list) -> list[OrderedDict]:
+        """
+        Validates every row of payload and all objects referenced in rows.
+
+        Args:
+            data [list]: List of Transfers data.
+
+        Returns:
+            list[OrderedDict]: Validated rows.
+
+        Raises:
+            ValidationError: Raised on invalid payload. Errors of rows are returned under row index.
+        """
+        if not isinstance(data, list):
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["Expected a list of Transfers."]})
+        if not data:
+            raise ValidationError({api_settings.NON_FIELD_ERRORS_KEY: ["List of Transfers cannot be empty."]})
+        if len(data) > self.max_rows:
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [f"Ensure list contains no more than {self.max_rows} Transfers."]}
+            )
+
+        rows, errors = [], {}
+        for index, item in enumerate(data):
+            try:
+                rows.append(self.child.run_validation(item))
+            except ValidationError as exc:
+                rows.append(None)
+                errors[index] = exc.detail
+
+        references = self.get_references([row for row in rows if row is not None])
+        for index, row in enumerate(rows):
+            if row is None:
+                continue
+            if row_errors := self.child.validate_references(row, references):
+                errors[index] = row_errors
+
+        if errors:
+            raise ValidationError(dict(sorted(errors.items())))
+        return rows
+
+    def get_references(self, rows: list[OrderedDict]) -> dict:
+        """
+        Fetches Budget objects referenced in validated rows with single query per table. Objects can be preloaded
+        and passed in "references" key of serializer context.
+
+        Args:
+            rows [list[OrderedDict]]: Validated rows.
+
+        Returns:
+            dict: Dictionary with "period", "entity", "deposit" and "category" keys containing referenced objects
+            data mapped by their primary keys.
+        """
+        if (references := self.context.get("references")) is not None:
+            return references
+        budget_pk = self._budget_pk
+        ids = {field: {row[field] for row in rows} for field in self.child.RELATED_FIELDS}
+        return {
+            "period": {
+                period["id"]: period
+                for period in BudgetingPeriod.objects.filter(budget__pk=budget_pk, pk__in=ids["period"]).values(
+                    "id", "date_start", "date_end"
+                )
+            },
+            "entity": set(
+                Entity.objects.filter(budget__pk=budget_pk, pk__in=ids["entity"]).values_list("id", flat=True)
+            ),
+            "deposit": set(
+                Deposit.objects.filter(budget__pk=budget_pk, pk__in=ids["deposit"]).values_list("id", flat=True)
+            ),
+            "category": dict(
+                TransferCategory.objects.filter(budget__pk=budget_pk, pk__in=ids["category"]).values_list(
+                    "id", "category_type"
+                )
+            ),
+        }
+
+    def create(self, validated_data: list[OrderedDict]) -> list[Model]:
+        """
+        Creates all Transfers with single bulk_create inside transaction.
+
+        Args:
+            validated_data [list[OrderedDict]]: Validated rows.
+
+        Returns:
+            list[Model]: Created Transfer model instances.
+        """
+        objects = [self.child.get_model_instance(row) for row in validated_data]
+        with transaction.atomic():
+            return self.child.Meta.model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+
+class TransferBulkSerializer(serializers.ModelSerializer):
+    """
+    Class for validating single row of Transfers bulk create payload.
+
+    Related fields are validated as plain primary keys - their existence and consistency is verified by
+    TransferBulkListSerializer for all rows at once.
+    """
+
+    RELATED_FIELDS: tuple[str] = ("period", "entity", "deposit", "category")
+    category_type: CategoryType | None = None
+
+    period = serializers.IntegerField()
+    entity = serializers.IntegerField()
+    deposit = serializers.IntegerField()
+    category = serializers.IntegerField()
+
+    class Meta:
+        model: Model = Transfer
+        fields: tuple[str] = ("name", "description", "value", "date", "period", "entity", "deposit", "category")
+        list_serializer_class = TransferBulkListSerializer
+
+    validate_value = staticmethod(TransferSerializer.validate_value)
+
+    def validate(self, attrs: OrderedDict) -> OrderedDict:
+        """
+        Checks if "deposit" and "entity" fields do not contain the same value.
+
+        Args:
+            attrs (OrderedDict): Dictionary containing all given params.
+
+        Returns:
+            OrderedDict: Validated dictionary containing all given params.
+        """
+        if attrs["deposit"] == attrs["entity"]:
+            raise ValidationError("'deposit' and 'entity' fields cannot contain the same value.")
+        return attrs
+
+    def validate_references(self, row: OrderedDict, references: dict) -> dict:
+        """
+        Validates objects referenced in row against objects fetched for all rows.
+
+        Args:
+            row [OrderedDict]: Validated row.
+            references [dict]: Referenced objects returned by TransferBulkListSerializer.get_references.
+
+        Returns:
+            dict: Errors of row mapped by field name. Empty if row is valid.
+        """
+        errors = {}
+        does_not_exist = serializers.PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+        for field in self.RELATED_FIELDS:
+            if row[field] not in references[field]:
+                errors[field] = [does_not_exist.format(pk_value=row[field])]
+
+        period = references["period"].get(row["period"])
+        if period and not (period["date_start"] <= row["date"] <= period["date_end"]):
+            errors["date"] = ["Transfer date not in period date range."]
+
+        category_type = references["category"].get(row["category"])
+        if category_type and self.category_type is not None and category_type != self.category_type:
+            errors["category"] = [f"Invalid TransferCategory for {self.Meta.model.__name__} provided."]
+        return errors
+
+    def get_model_instance(self, row: OrderedDict) -> Model:
+        """
+        Returns unsaved model instance for validated row.
+
+        Args:
+            row [OrderedDict]: Validated row.
+
+        Returns:
+            Model: Transfer model instance.
+        """
+        return self.Meta.model(
+            **{f"{field}_id" if field in self.RELATED_FIELDS else field: value for field, value in row.items()}
+        )
+
+
+class IncomeBulkSerializer(TransferBulkSerializer):
+    """Class for validating single row of Incomes bulk create payload."""
+
+    category_type = CategoryType.INCOME
+
+    class Meta(TransferBulkSerializer.Meta):
+        model = Income
+
+
+class ExpenseBulkSerializer(TransferBulkSerializer):
+    """Class for validating single row of Expenses bulk create payload."""
+
+    category_type = CategoryType.EXPENSE
+
+    class Meta(TransferBulkSerializer.Meta):
+        model = Expense
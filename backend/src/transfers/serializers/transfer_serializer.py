@@ -127,3 +127,20 @@ class TransferSerializer(serializers.ModelSerializer):
         if any([deposit, entity]) and deposit == entity:
             raise ValidationError("'deposit' and 'entity' fields cannot contain the same value.")
         return attrs
+
+    def to_representation(self, instance: Transfer) -> OrderedDict:
+        """
+        Extended with "running_balance" value, if Transfer was annotated with it.
+
+        Args:
+            instance [Transfer]: Transfer model instance.
+
+        Returns:
+            OrderedDict: Serialized Transfer.
+        """
+        data = super().to_representation(instance)
+        if hasattr(instance, "running_balance"):
+            data["running_balance"] = serializers.DecimalField(max_digits=20, decimal_places=2).to_representation(
+                instance.running_balance
+            )
+        return data
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from transfers.services.transfer_series_service import TransferSeriesService
+
+
+class TransferSeriesSerializer(serializers.Serializer):
+    """Serializer for query params of Transfers time series."""
+
+    interval = serializers.ChoiceField(choices=tuple(TransferSeriesService.INTERVALS), default="month")
+    split_by = serializers.ChoiceField(choices=TransferSeriesService.SPLITS, required=False, default=None)
+    date_after = serializers.DateField(required=False, default=None)
+    date_before = serializers.DateField(required=False, default=None)
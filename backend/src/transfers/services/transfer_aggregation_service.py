@@ -0,0 +1,138 @@
+from typing import Any, Callable
+
+from django.db.models import Avg, Count, F, Max, Min, QuerySet, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek, TruncYear
+from rest_framework import serializers
+
+
+class TransferAggregationError(Exception):
+    """
+    Exception raised on invalid aggregation params or too large aggregation result.
+
+    Args:
+        errors (dict[str, list[str]]): Errors mapped by param name.
+    """
+
+    def __init__(self, errors: dict[str, list[str]]):
+        super().__init__("Invalid aggregation params.")
+        self.errors = errors
+
+
+class TransferAggregationService:
+    """
+    Service computing pivot aggregations of filtered Transfers.
+
+    Every dimension from allowlist is compiled into one or more Transfer fields or expressions (id and name for
+    related objects), so whole aggregation is performed with single SELECT ... GROUP BY query. Number of dimensions
+    is limited and query fetches at most MAX_GROUPS + 1 rows - aggregation returning more groups is rejected.
+
+    Args:
+        queryset (QuerySet): Filtered Transfer QuerySet.
+        group_by (list[str]): Names of dimensions.
+        measures (list[str]): Names of measures.
+    """
+
+    DIMENSIONS: dict[str, dict[str, Any]] = {
+        "period": {"period": "period", "period_name": F("period__name")},
+        "category": {"category": "category", "category_name": F("category__name")},
+        "priority": {"priority": F("category__priority")},
+        "entity": {"entity": "entity", "entity_name": F("entity__name")},
+        "deposit": {"deposit": "deposit", "deposit_name": F("deposit__name")},
+        "owner": {"owner": F("category__owner_id"), "owner_name": F("category__owner__name")},
+        "day": {"day": TruncDay("date")},
+        "week": {"week": TruncWeek("date")},
+        "month": {"month": TruncMonth("date")},
+        "year": {"year": TruncYear("date")},
+        "transfer_type": {"transfer_type": "transfer_type"},
+    }
+    MEASURES: dict[str, Callable[[], Any]] = {
+        "sum": lambda: Sum("value"),
+        "count": lambda: Count("id"),
+        "avg": lambda: Avg("value"),
+        "min": lambda: Min("value"),
+        "max": lambda: Max("value"),
+    }
+    DECIMAL_MEASURES: tuple[str] = ("sum", "avg", "min", "max")
+    DEFAULT_MEASURES: tuple[str] = ("sum", "count")
+    MAX_DIMENSIONS: int = 3
+    MAX_GROUPS: int = 5000
+
+    def __init__(self, queryset: QuerySet, group_by: list[str], measures: list[str]):
+        self.queryset = queryset
+        self.group_by = list(dict.fromkeys(group_by))
+        self.measures = list(dict.fromkeys(measures)) or list(self.DEFAULT_MEASURES)
+        self.validate()
+
+    @staticmethod
+    def parse_param(value: str | None) -> list[str]:
+        """
+        Splits comma separated query param into list of names.
+
+        Args:
+            value (str | None): Query param value.
+
+        Returns:
+            list[str]: Not empty names from param.
+        """
+        return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+    def validate(self) -> None:
+        """
+        Validates dimensions and measures against allowlists and cost limits.
+
+        Raises:
+            TransferAggregationError: Raised on unknown dimension or measure, or on too many dimensions.
+        """
+        errors = {}
+        if invalid := [name for name in self.group_by if name not in self.DIMENSIONS]:
+            errors["group_by"] = [
+                f"Invalid dimension: {', '.join(invalid)}. Allowed dimensions: {', '.join(self.DIMENSIONS)}."
+            ]
+        elif len(self.group_by) > self.MAX_DIMENSIONS:
+            errors["group_by"] = [f"Aggregation can be grouped by at most {self.MAX_DIMENSIONS} dimensions."]
+        if invalid := [name for name in self.measures if name not in self.MEASURES]:
+            errors["measures"] = [
+                f"Invalid measure: {', '.join(invalid)}. Allowed measures: {', '.join(self.MEASURES)}."
+            ]
+        if errors:
+            raise TransferAggregationError(errors)
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Returns Transfer QuerySet grouped by dimensions and annotated with measures.
+
+        Returns:
+            QuerySet: Values QuerySet with single row for every group.
+        """
+        dimensions = [item for name in self.group_by for item in self.DIMENSIONS[name].items()]
+        fields = [key for key, expression in dimensions if isinstance(expression, str)]
+        expressions = {key: expression for key, expression in dimensions if not isinstance(expression, str)}
+        measures = {name: self.MEASURES[name]() for name in self.measures}
+        ordering = [next(iter(self.DIMENSIONS[name])) for name in self.group_by]
+        return self.queryset.order_by().values(*fields, **expressions).annotate(**measures).order_by(*ordering)
+
+    def aggregate(self) -> list[dict]:
+        """
+        Computes aggregation.
+
+        Returns:
+            list[dict]: Dimensions values and measures of every group. Decimal measures are returned as strings
+            with two decimal places.
+
+        Raises:
+            TransferAggregationError: Raised when aggregation returns more than MAX_GROUPS groups.
+        """
+        if not self.group_by:
+            rows = [self.queryset.order_by().aggregate(**{name: self.MEASURES[name]() for name in self.measures})]
+        else:
+            rows = list(self.get_queryset()[: self.MAX_GROUPS + 1])
+        if len(rows) > self.MAX_GROUPS:
+            raise TransferAggregationError(
+                {"group_by": [f"Aggregation returns more than {self.MAX_GROUPS} groups. Narrow filters or dimensions."]}
+            )
+        converter = serializers.DecimalField(max_digits=20, decimal_places=2).to_representation
+        for row in rows:
+            for name in self.DECIMAL_MEASURES:
+                if row.get(name) is not None:
+                    row[name] = converter(row[name])
+        return rows
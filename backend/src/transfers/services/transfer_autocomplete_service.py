@@ -0,0 +1,447 @@
+import bisect
+import datetime
+import heapq
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Count, Model
+
+TransferRow = tuple[int, str, datetime.date, int, int, int, int]
+
+
+class TransferNameEntry:
+    """
+    Aggregated usage of single Transfer name (compared case insensitively) in Budget Transfers of one type.
+    """
+
+    __slots__ = ("names", "count", "dates", "last_date", "categories", "entities", "deposits")
+
+    def __init__(self):
+        self.names = Counter()
+        self.count = 0
+        self.dates = Counter()
+        self.last_date = None
+        self.categories = Counter()
+        self.entities = Counter()
+        self.deposits = Counter()
+
+    def add(self, name: str, date: datetime.date, category_id: int, entity_id: int, deposit_id: int, count: int = 1):
+        """
+        Adds usages of name with given related objects.
+
+        Args:
+            name (str): Transfer name.
+            date (datetime.date): Date of Transfers.
+            category_id (int): TransferCategory database id.
+            entity_id (int): Entity database id.
+            deposit_id (int): Deposit database id.
+            count (int): Number of Transfers.
+        """
+        self.names[name] += count
+        self.count += count
+        self.dates[date] += count
+        self.last_date = date if self.last_date is None else max(self.last_date, date)
+        self.categories[category_id] += count
+        self.entities[entity_id] += count
+        self.deposits[deposit_id] += count
+
+    def remove(
+        self, name: str, date: datetime.date, category_id: int, entity_id: int, deposit_id: int, count: int = 1
+    ) -> None:
+        """
+        Removes usages of name with given related objects. Date of latest Transfer is recomputed, when all Transfers
+        from latest date are removed.
+
+        Args:
+            name (str): Transfer name.
+            date (datetime.date): Date of Transfers.
+            category_id (int): TransferCategory database id.
+            entity_id (int): Entity database id.
+            deposit_id (int): Deposit database id.
+            count (int): Number of Transfers.
+        """
+        self.count -= count
+        for counter, key in (
+            (self.names, name),
+            (self.dates, date),
+            (self.categories, category_id),
+            (self.entities, entity_id),
+            (self.deposits, deposit_id),
+        ):
+            counter[key] -= count
+            if counter[key] <= 0:
+                del counter[key]
+        if self.last_date not in self.dates:
+            self.last_date = max(self.dates, default=None)
+
+    def get_score(self, today: datetime.date, half_life_days: int) -> float:
+        """
+        Returns ranking score of name - number of usages decayed by time elapsed since latest usage.
+
+        Args:
+            today (datetime.date): Reference date.
+            half_life_days (int): Number of days after which score is halved.
+
+        Returns:
+            float: Ranking score.
+        """
+        age = max((today - self.last_date).days, 0)
+        return self.count * 0.5 ** (age / half_life_days)
+
+    def to_dict(self) -> dict:
+        """
+        Returns suggestion data - most common name spelling and most common related objects.
+
+        Returns:
+            dict: Suggestion data.
+        """
+        return {
+            "name": self.names.most_common(1)[0][0],
+            "category": self.categories.most_common(1)[0][0],
+            "entity": self.entities.most_common(1)[0][0],
+            "deposit": self.deposits.most_common(1)[0][0],
+            "count": self.count,
+            "last_date": self.last_date.isoformat(),
+        }
+
+
+class TransferNameIndex:
+    """
+    Prefix index of Transfer names. Casefolded names are kept in sorted list, so names starting with given prefix
+    form continuous slice found with binary search.
+    """
+
+    def __init__(self):
+        self.keys: list[str] = []
+        self.entries: dict[str, TransferNameEntry] = {}
+
+    @staticmethod
+    def get_key(name: str) -> str:
+        """
+        Returns normalized name used as index key.
+
+        Args:
+            name (str): Transfer name.
+
+        Returns:
+            str: Index key.
+        """
+        return " ".join(name.split()).casefold()
+
+    def add(self, name: str, date: datetime.date, category_id: int, entity_id: int, deposit_id: int, count: int = 1):
+        """
+        Adds usages of name to index.
+
+        Args:
+            name (str): Transfer name.
+            date (datetime.date): Date of Transfers.
+            category_id (int): TransferCategory database id.
+            entity_id (int): Entity database id.
+            deposit_id (int): Deposit database id.
+            count (int): Number of Transfers.
+        """
+        key = self.get_key(name)
+        if (entry := self.entries.get(key)) is None:
+            entry = self.entries[key] = TransferNameEntry()
+            bisect.insort(self.keys, key)
+        entry.add(name, date, category_id, entity_id, deposit_id, count)
+
+    def remove(
+        self, name: str, date: datetime.date, category_id: int, entity_id: int, deposit_id: int, count: int = 1
+    ) -> None:
+        """
+        Removes usages of name from index.
+
+        Args:
+            name (str): Transfer name.
+            date (datetime.date): Date of Transfers.
+            category_id (int): TransferCategory database id.
+            entity_id (int): Entity database id.
+            deposit_id (int): Deposit database id.
+            count (int): Number of Transfers.
+        """
+        key = self.get_key(name)
+        if (entry := self.entries.get(key)) is None:
+            return
+        entry.remove(name, date, category_id, entity_id, deposit_id, count)
+        if entry.count <= 0:
+            del self.entries[key]
+            del self.keys[bisect.bisect_left(self.keys, key)]
+
+    def search(self, prefix: str, limit: int, today: datetime.date, half_life_days: int) -> list[dict]:
+        """
+        Returns best ranked names starting with given prefix.
+
+        Args:
+            prefix (str): Searched name prefix.
+            limit (int): Maximal number of returned names.
+            today (datetime.date): Reference date for ranking.
+            half_life_days (int): Number of days after which name score is halved.
+
+        Returns:
+            list[dict]: Suggestions data.
+        """
+        prefix = self.get_key(prefix)
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+        entries = (self.entries[key] for key in self.keys[start:end])
+        best = heapq.nlargest(
+            limit, entries, key=lambda entry: (entry.get_score(today, half_life_days), entry.last_date)
+        )
+        return [entry.to_dict() for entry in best]
+
+
+class BudgetTransferNameIndex:
+    """
+    TransferNameIndexes of single Budget for every Transfer type, together with Budget Transfers version they reflect
+    and time of build.
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.indexes: dict[int, TransferNameIndex] = {}
+
+
+class TransferAutocompleteService:
+    """
+    Service suggesting Transfer names with their most common TransferCategory, Entity and Deposit.
+
+    Suggestions are served from process local prefix indexes of Budget Transfer names, built lazily with single
+    aggregating query and kept for MAX_BUDGETS least recently used Budgets. Index is valid as long as it reflects
+    current Transfers version of Budget, so writes to other Budget resources do not affect it. Transfers created or
+    deleted in current process are applied to index incrementally after commit, advancing its version by single bump
+    made by every such write. Any other Transfers write leaves index behind Transfers version, so it is rebuilt on
+    lookup.
+
+    Indexes are process local, so in multi-process deployment every process builds its own indexes and Transfers
+    written by other processes always make them stale. To limit number of rebuilds under frequent writes, stale index
+    is rebuilt at most once per REBUILD_INTERVAL seconds and served with slightly outdated suggestions in between.
+    """
+
+    MAX_BUDGETS: int = 256
+    REBUILD_INTERVAL: float = 5.0
+    HALF_LIFE_DAYS: int = 90
+    DEFAULT_LIMIT: int = 10
+    MAX_LIMIT: int = 50
+
+    _indexes: OrderedDict = OrderedDict()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get_suggestions(
+        cls, budget_id: int, transfer_type: int, prefix: str, limit: int | None = None
+    ) -> list[dict] | None:
+        """
+        Returns best ranked Transfer names of given Budget and type starting with given prefix. Names are ranked
+        by number of Transfers, decayed by time elapsed since latest Transfer.
+
+        Args:
+            budget_id (int): Budget database id.
+            transfer_type (int): CategoryType value of Transfers.
+            prefix (str): Searched name prefix.
+            limit (int | None): Maximal number of returned names.
+
+        Returns:
+            list[dict] | None: Suggestions data or None if Budget does not exist.
+        """
+        from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+
+        if (versions := BudgetDataVersionService.get_versions(budget_id)) is None:
+            return None
+        limit = min(limit or cls.DEFAULT_LIMIT, cls.MAX_LIMIT)
+        with cls._lock:
+            budget_index = cls._indexes.get(budget_id)
+            if budget_index is not None and (
+                budget_index.version == versions["transfers"]
+                or time.monotonic() - budget_index.built_at < cls.REBUILD_INTERVAL
+            ):
+                cls._indexes.move_to_end(budget_id)
+                if (index := budget_index.indexes.get(transfer_type)) is not None:
+                    return index.search(prefix, limit, datetime.date.today(), cls.HALF_LIFE_DAYS)
+        index, version = cls.build_index(budget_id, transfer_type)
+        with cls._lock:
+            budget_index = cls._indexes.get(budget_id)
+            if budget_index is None or budget_index.version != version:
+                budget_index = cls._indexes[budget_id] = BudgetTransferNameIndex(version)
+            budget_index.indexes[transfer_type] = index
+            cls._indexes.move_to_end(budget_id)
+            while len(cls._indexes) > cls.MAX_BUDGETS:
+                cls._indexes.popitem(last=False)
+            return index.search(prefix, limit, datetime.date.today(), cls.HALF_LIFE_DAYS)
+
+    @staticmethod
+    def build_index(budget_id: int, transfer_type: int) -> tuple[TransferNameIndex, int | None]:
+        """
+        Builds TransferNameIndex of given Budget and type from database. Budget Transfers version is read after
+        Transfers, so index never contains Transfers not reflected by returned version.
+
+        Args:
+            budget_id (int): Budget database id.
+            transfer_type (int): CategoryType value of Transfers.
+
+        Returns:
+            tuple[TransferNameIndex, int | None]: Built index and Budget Transfers version.
+        """
+        from budgets.models import Budget
+        from transfers.models.transfer_model import Transfer
+
+        index = TransferNameIndex()
+        rows = (
+            Transfer.objects.filter(budget_id=budget_id, transfer_type=transfer_type)
+            .values("name", "date", "category_id", "entity_id", "deposit_id")
+            .annotate(transfers_count=Count("id"))
+            .order_by()
+        )
+        for row in rows:
+            index.add(
+                row["name"],
+                row["date"],
+                row["category_id"],
+                row["entity_id"],
+                row["deposit_id"],
+                row["transfers_count"],
+            )
+        version = Budget.objects.filter(pk=budget_id).values_list("transfers_version", flat=True).first()
+        return index, version
+
+    @staticmethod
+    def get_row(transfer: Model) -> TransferRow:
+        """
+        Returns Transfer data stored in index.
+
+        Args:
+            transfer (Model): Transfer model instance.
+
+        Returns:
+            TransferRow: Tuple of Transfer type, name, date, category, entity and deposit ids and number of
+            Transfers.
+        """
+        return (
+            transfer.transfer_type,
+            transfer.name,
+            transfer.date,
+            transfer.category_id,
+            transfer.entity_id,
+            transfer.deposit_id,
+            1,
+        )
+
+    @classmethod
+    def on_transfers_created(cls, transfers: Iterable[Model]) -> None:
+        """
+        Adds created Transfers to indexes of their Budgets after commit of current transaction. Has to be called
+        once per write increasing Transfers version of Transfers Budgets, after BudgetDataVersionService.bump, so
+        index is updated after version.
+
+        Args:
+            transfers (Iterable[Model]): Created Transfer model instances.
+        """
+        rows = {}
+        for transfer in transfers:
+            rows.setdefault(transfer.budget_id, []).append(cls.get_row(transfer))
+        if rows:
+            transaction.on_commit(lambda: cls._apply(rows, created=True))
+
+    @classmethod
+    def on_transfer_deleted(cls, transfer: Model) -> None:
+        """
+        Removes deleted Transfer from index of its Budget after commit of current transaction.
+
+        Args:
+            transfer (Model): Deleted Transfer model instance.
+        """
+        rows = {transfer.budget_id: [cls.get_row(transfer)]}
+        transaction.on_commit(lambda: cls._apply(rows, created=False))
+
+    @classmethod
+    def on_transfers_deleted(cls, groups: Iterable[dict]) -> None:
+        """
+        Removes Transfers deleted with single bulk operation from indexes of their Budgets after commit of current
+        transaction. Has to be called once per bulk delete increasing Transfers version of Transfers Budgets, after
+        BudgetDataVersionService.bump.
+
+        Args:
+            groups (Iterable[dict]): Deleted Transfers grouped by "budget_id", "transfer_type", "name", "date",
+                "category_id", "entity_id" and "deposit_id", with number of Transfers in "transfers_count".
+        """
+        rows = {}
+        for group in groups:
+            rows.setdefault(group["budget_id"], []).append(
+                (
+                    group["transfer_type"],
+                    group["name"],
+                    group["date"],
+                    group["category_id"],
+                    group["entity_id"],
+                    group["deposit_id"],
+                    group["transfers_count"],
+                )
+            )
+        if rows:
+            transaction.on_commit(lambda: cls._apply(rows, created=False))
+
+    @classmethod
+    def invalidate(cls, budget_ids: Iterable[int]) -> None:
+        """
+        Removes indexes of given Budgets after commit of current transaction.
+
+        Args:
+            budget_ids (Iterable[int]): Budgets database ids.
+        """
+        budget_ids = set(budget_ids)
+        transaction.on_commit(lambda: cls._remove(budget_ids))
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Removes all indexes.
+        """
+        with cls._lock:
+            cls._indexes.clear()
+
+    @classmethod
+    def _apply(cls, rows: dict[int, list[TransferRow]], created: bool) -> None:
+        """
+        Applies created or deleted Transfers to existing indexes of their Budgets. Index is updated only if Budget
+        Transfers version is exactly one higher than version reflected by index, meaning that write was the only one
+        made since index was built. Otherwise index is left stale and rebuilt on lookup.
+
+        Args:
+            rows (dict[int, list[TransferRow]]): Transfers data mapped by Budget id.
+            created (bool): Indicates if Transfers were created or deleted.
+        """
+        from budgets.models import Budget
+
+        if not (budget_ids := [budget_id for budget_id in rows if budget_id in cls._indexes]):
+            return
+        versions = dict(Budget.objects.filter(pk__in=budget_ids).values_list("pk", "transfers_version"))
+        with cls._lock:
+            for budget_id in budget_ids:
+                if (budget_index := cls._indexes.get(budget_id)) is None:
+                    continue
+                if versions.get(budget_id) != budget_index.version + 1:
+                    continue
+                budget_index.version += 1
+                for transfer_type, name, date, category_id, entity_id, deposit_id, count in rows[budget_id]:
+                    if (index := budget_index.indexes.get(transfer_type)) is None:
+                        continue
+                    if created:
+                        index.add(name, date, category_id, entity_id, deposit_id, count)
+                    else:
+                        index.remove(name, date, category_id, entity_id, deposit_id, count)
+
+    @classmethod
+    def _remove(cls, budget_ids: set[int]) -> None:
+        """
+        Removes indexes of given Budgets.
+
+        Args:
+            budget_ids (set[int]): Budgets database ids.
+        """
+        with cls._lock:
+            for budget_id in budget_ids:
+                cls._indexes.pop(budget_id, None)
@@ -0,0 +1,316 @@
+import csv
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import F
+from rest_framework.exceptions import ValidationError
+
+from budgets.models import BudgetingPeriod
+from categories.models import TransferCategory
+from entities.models import Entity
+from transfers.serializers.transfer_bulk_serializer import TransferBulkSerializer
+from transfers.services.transfer_export_service import TransferExportService
+
+
+class TransferCsvImportError(Exception):
+    """
+    Exception raised when CSV file contains invalid rows.
+
+    Args:
+        errors (dict): Errors of invalid rows mapped by CSV line number.
+        invalid_rows_count (int): Number of all invalid rows in file.
+    """
+
+    def __init__(self, errors: dict, invalid_rows_count: int):
+        super().__init__(f"CSV file contains {invalid_rows_count} invalid rows.")
+        self.errors = errors
+        self.invalid_rows_count = invalid_rows_count
+
+
+class NameLookup:
+    """
+    Mapping of Budget objects names to their database ids. Names are matched exactly first and case insensitively
+    only when no object has exactly matching name, so objects with names differing only in letter case are never
+    confused.
+    """
+
+    def __init__(self):
+        self.exact: dict[str, int] = {}
+        self.folded: dict[str, set[str]] = {}
+
+    def add(self, name: str, object_id: int) -> None:
+        """
+        Adds object to lookup. Object added later replaces object with the same exact name.
+
+        Args:
+            name (str): Object name.
+            object_id (int): Object database id.
+        """
+        self.exact[name] = object_id
+        self.folded.setdefault(name.casefold(), set()).add(name)
+
+    def get_matches(self, name: str) -> list[int]:
+        """
+        Returns ids of objects matching given name.
+
+        Args:
+            name (str): Searched name.
+
+        Returns:
+            list[int]: Id of exactly matching object or ids of all objects matching name case insensitively.
+        """
+        if (object_id := self.exact.get(name)) is not None:
+            return [object_id]
+        return [self.exact[exact_name] for exact_name in sorted(self.folded.get(name.casefold(), ()))]
+
+    def ids(self) -> set[int]:
+        """
+        Returns ids of all objects in lookup.
+
+        Returns:
+            set[int]: Objects database ids.
+        """
+        return set(self.exact.values())
+
+
+class TransferCsvImportService:
+    """
+    Service importing Transfers for Budget from CSV file.
+
+    File is read as a stream of lines and processed in chunks of fixed size, so memory usage does not depend on file
+    size. Periods, Entities, Deposits and TransferCategories of Budget are loaded once before processing. Period of
+    each Transfer is resolved from its date, Entity, Deposit and TransferCategory are resolved by name - exact one or,
+    if not found, unambiguous case insensitive one. Import is
+    executed in single transaction - no Transfer is saved if any row is invalid.
+
+    Args:
+        budget_pk (int): Budget database id.
+        serializer_class (type[TransferBulkSerializer]): Bulk serializer for imported Transfer type.
+        column_mapping (dict | None): Mapping of Transfer fields to CSV columns names, f.e. {"value": "Amount"}.
+        delimiter (str): CSV columns delimiter.
+        date_format (str): Format of dates in CSV file.
+        chunk_size (int): Number of rows validated and created at once.
+        max_errors (int): Maximum number of reported invalid rows.
+    """
+
+    FIELDS: tuple[str] = ("name", "description", "value", "date", "entity", "deposit", "category")
+    REQUIRED_FIELDS: tuple[str] = ("name", "value", "date", "entity", "deposit", "category")
+
+    def __init__(
+        self,
+        budget_pk: int,
+        serializer_class: type[TransferBulkSerializer],
+        column_mapping: dict | None = None,
+        delimiter: str = ",",
+        date_format: str = "%Y-%m-%d",
+        chunk_size: int = 1000,
+        max_errors: int = 100,
+    ):
+        self.budget_pk = budget_pk
+        self.serializer_class = serializer_class
+        self.column_mapping = {field: (column_mapping or {}).get(field, field) for field in self.FIELDS}
+        self.delimiter = delimiter
+        self.date_format = date_format
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+
+    def import_file(self, lines: Iterable[str]) -> int:
+        """
+        Validates and saves Transfers from CSV lines.
+
+        Args:
+            lines (Iterable[str]): CSV file lines, including header line.
+
+        Returns:
+            int: Number of created Transfers.
+
+        Raises:
+            TransferCsvImportError: Raised when CSV file contains invalid rows.
+        """
+        reader = csv.DictReader(lines, delimiter=self.delimiter)
+        self.validate_header(reader.fieldnames or [])
+        self.load_budget_objects()
+
+        self.errors, self.invalid_rows_count = {}, 0
+        created_count = 0
+        with transaction.atomic():
+            chunk = OrderedDict()
+            for row in reader:
+                try:
+                    chunk[reader.line_num] = self.parse_row(row)
+                except ValidationError as exc:
+                    self.add_error(reader.line_num, exc.detail)
+                if len(chunk) >= self.chunk_size:
+                    created_count += self.save_chunk(chunk)
+                    chunk = OrderedDict()
+            created_count += self.save_chunk(chunk)
+            if self.errors:
+                transaction.set_rollback(True)
+        if self.errors:
+            raise TransferCsvImportError(dict(sorted(self.errors.items())), self.invalid_rows_count)
+        return created_count
+
+    def validate_header(self, header: list[str]) -> None:
+        """
+        Checks if CSV file contains columns for all required Transfer fields.
+
+        Args:
+            header (list[str]): CSV file columns names.
+
+        Raises:
+            TransferCsvImportError: Raised when some of required columns is missing.
+        """
+        missing_columns = [
+            self.column_mapping[field] for field in self.REQUIRED_FIELDS if self.column_mapping[field] not in header
+        ]
+        if missing_columns:
+            raise TransferCsvImportError({1: {"header": [f"Missing columns: {', '.join(missing_columns)}."]}}, 1)
+
+    def load_budget_objects(self) -> None:
+        """
+        Loads Budget objects needed for resolving Transfers fields with single query per table.
+        """
+        periods = list(
+            BudgetingPeriod.objects.filter(budget__pk=self.budget_pk)
+            .order_by("date_start")
+            .values("id", "date_start", "date_end")
+        )
+        self.periods = periods
+        self.periods_starts = [period["date_start"] for period in periods]
+
+        self.entities, self.deposits = NameLookup(), NameLookup()
+        for entity_id, name, is_deposit in Entity.objects.filter(budget__pk=self.budget_pk).values_list(
+            "id", "name", "is_deposit"
+        ):
+            self.entities.add(name, entity_id)
+            if is_deposit:
+                self.deposits.add(name, entity_id)
+
+        categories = TransferCategory.objects.filter(budget__pk=self.budget_pk)
+        if self.serializer_class.category_type is not None:
+            categories = categories.filter(category_type=self.serializer_class.category_type)
+        self.categories, self.categories_types = NameLookup(), {}
+        for category_id, name, category_type in categories.order_by(F("owner").asc(nulls_last=True)).values_list(
+            "id", "name", "category_type"
+        ):
+            self.categories.add(name, category_id)
+            self.categories_types[category_id] = category_type
+
+        self.references = {
+            "period": {period["id"]: period for period in periods},
+            "entity": self.entities.ids(),
+            "deposit": self.deposits.ids(),
+            "category": self.categories_types,
+        }
+
+    @staticmethod
+    def unescape_value(value: str) -> str:
+        """
+        Removes apostrophe prefixed by TransferExportService to text starting with formula character.
+
+        Args:
+            value (str): CSV cell value.
+
+        Returns:
+            str: Unescaped value.
+        """
+        if value.startswith("'") and value[1:].startswith(TransferExportService.FORMULA_PREFIXES):
+            return value[1:]
+        return value
+
+    def parse_row(self, row: dict) -> dict:
+        """
+        Maps CSV row into bulk serializer payload.
+
+        Args:
+            row (dict): CSV row mapped by columns names.
+
+        Returns:
+            dict: Transfer data with resolved period, entity, deposit and category ids.
+
+        Raises:
+            ValidationError: Raised when date, period, entity, deposit or category can not be resolved.
+        """
+        values = {
+            field: self.unescape_value((row.get(column) or "").strip()) for field, column in self.column_mapping.items()
+        }
+        errors = {}
+        payload = {"name": values["name"], "description": values["description"], "value": values["value"]}
+
+        try:
+            payload["date"] = datetime.strptime(values["date"], self.date_format).date()
+        except ValueError:
+            errors["date"] = [f'Date "{values["date"]}" does not match format "{self.date_format}".']
+        else:
+            if (period_id := self.get_period_id(payload["date"])) is None:
+                errors["period"] = [f"No BudgetingPeriod for date {payload['date']} in Budget."]
+            payload["period"] = period_id
+
+        for field, objects in (("entity", self.entities), ("deposit", self.deposits), ("category", self.categories)):
+            matches = objects.get_matches(values[field])
+            if not matches:
+                errors[field] = [f'{field.capitalize()} "{values[field]}" does not exist in Budget.']
+            elif len(matches) > 1:
+                errors[field] = [
+                    f'{field.capitalize()} "{values[field]}" is ambiguous - multiple objects in Budget have '
+                    f"names differing only in letter case."
+                ]
+            payload[field] = matches[0] if len(matches) == 1 else None
+
+        if errors:
+            raise ValidationError(errors)
+        return payload
+
+    def get_period_id(self, transfer_date: date) -> int | None:
+        """
+        Finds BudgetingPeriod containing given date.
+
+        Args:
+            transfer_date (date): Transfer date.
+
+        Returns:
+            int | None: BudgetingPeriod id or None if date is not covered by any period.
+        """
+        index = bisect_right(self.periods_starts, transfer_date) - 1
+        if index >= 0 and transfer_date <= self.periods[index]["date_end"]:
+            return self.periods[index]["id"]
+        return None
+
+    def save_chunk(self, chunk: OrderedDict) -> int:
+        """
+        Validates chunk of rows with bulk serializer and creates Transfers if no errors occurred so far.
+
+        Args:
+            chunk (OrderedDict): Parsed rows mapped by CSV line number.
+
+        Returns:
+            int: Number of created Transfers.
+        """
+        if not chunk:
+            return 0
+        lines = list(chunk.keys())
+        serializer = self.serializer_class(
+            data=list(chunk.values()), many=True, context={"references": self.references}
+        )
+        if not serializer.is_valid():
+            for index, row_errors in serializer.errors.items():
+                self.add_error(lines[index], row_errors)
+            return 0
+        if self.errors:
+            return 0
+        return len(serializer.save())
+
+    def add_error(self, line: int, detail: dict) -> None:
+        """
+        Registers invalid row. Details are stored only for first max_errors invalid rows.
+
+        Args:
+            line (int): CSV line number.
+            detail (dict): Errors of row mapped by field name.
+        """
+        self.invalid_rows_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors[line] = detail
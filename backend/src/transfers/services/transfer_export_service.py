@@ -0,0 +1,125 @@
+import csv
+import json
+from typing import Iterator
+
+from django.db.models import Model, QuerySet
+
+
+class EchoBuffer:
+    """Pseudo-buffer returning written value instead of storing it, used to stream csv.writer output."""
+
+    @staticmethod
+    def write(value: str) -> str:
+        """
+        Returns given value.
+
+        Args:
+            value (str): Value written by csv.writer.
+
+        Returns:
+            str: Given value.
+        """
+        return value
+
+
+class TransferExportService:
+    """
+    Service serializing Transfers QuerySet into CSV or NDJSON stream.
+
+    Transfers are fetched with related objects in single query and read from database cursor in chunks of fixed size,
+    so memory usage does not depend on number of exported Transfers. Related objects are exported by name, so CSV
+    output can be imported back with TransferCsvImportService. CSV cells starting with characters interpreted as
+    formula by spreadsheet applications are prefixed with apostrophe.
+
+    Args:
+        queryset (QuerySet): Filtered and ordered Transfers QuerySet.
+        chunk_size (int): Number of Transfers fetched from database at once.
+    """
+
+    FORMATS: tuple[str] = ("csv", "ndjson")
+    CONTENT_TYPES: dict[str, str] = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+    FIELDS: tuple[str] = ("id", "name", "description", "value", "date", "period", "entity", "deposit", "category")
+    RELATED_FIELDS: tuple[str] = ("period", "entity", "deposit", "category")
+    FORMULA_PREFIXES: tuple[str] = ("=", "+", "-", "@", "\t", "\r")
+
+    def __init__(self, queryset: QuerySet, chunk_size: int = 2000):
+        self.queryset = queryset.prefetch_related(None).select_related(*self.RELATED_FIELDS)
+        self.chunk_size = chunk_size
+
+    def iter_rows(self) -> Iterator[dict]:
+        """
+        Yields exported Transfers data.
+
+        Yields:
+            dict: Transfer data with related objects represented by their names.
+        """
+        for transfer in self.queryset.iterator(chunk_size=self.chunk_size):
+            yield self.get_row(transfer)
+
+    def get_row(self, transfer: Model) -> dict:
+        """
+        Maps Transfer into exported row.
+
+        Args:
+            transfer (Model): Transfer model instance with selected related objects.
+
+        Returns:
+            dict: Transfer data.
+        """
+        row = {field: getattr(transfer, field) for field in self.FIELDS if field not in self.RELATED_FIELDS}
+        row["value"] = str(row["value"])
+        row["date"] = row["date"].isoformat()
+        for field in self.RELATED_FIELDS:
+            related_object = getattr(transfer, field)
+            row[field] = related_object.name if related_object is not None else None
+        return row
+
+    @classmethod
+    def escape_csv_value(cls, value: object) -> object:
+        """
+        Prefixes text starting with formula character with apostrophe, so spreadsheet applications do not execute
+        it as formula.
+
+        Args:
+            value (object): Exported value.
+
+        Returns:
+            object: Escaped value.
+        """
+        if isinstance(value, str) and value.startswith(cls.FORMULA_PREFIXES):
+            return f"'{value}"
+        return value
+
+    def iter_csv(self) -> Iterator[str]:
+        """
+        Yields exported Transfers as CSV lines, starting with header line.
+
+        Yields:
+            str: CSV line.
+        """
+        writer = csv.writer(EchoBuffer())
+        yield writer.writerow(self.FIELDS)
+        for row in self.iter_rows():
+            yield writer.writerow([self.escape_csv_value(row[field]) for field in self.FIELDS])
+
+    def iter_ndjson(self) -> Iterator[str]:
+        """
+        Yields exported Transfers as newline delimited JSON objects.
+
+        Yields:
+            str: JSON line.
+        """
+        for row in self.iter_rows():
+            yield f"{json.dumps(row)}\n"
+
+    def stream(self, export_format: str) -> Iterator[str]:
+        """
+        Returns iterator of exported Transfers in given format.
+
+        Args:
+            export_format (str): One of FORMATS.
+
+        Returns:
+            Iterator[str]: Lines of exported file.
+        """
+        return self.iter_csv() if export_format == "csv" else self.iter_ndjson()
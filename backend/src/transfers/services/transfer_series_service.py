@@ -0,0 +1,179 @@
+import datetime
+from decimal import Decimal
+
+from django.db.models import QuerySet, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+from rest_framework import serializers
+
+from categories.models.transfer_category_choices import CategoryType
+from transfers.services.transfer_aggregation_service import TransferAggregationError
+
+
+class TransferSeriesService:
+    """
+    Service computing time series of Incomes and Expenses totals for charts.
+
+    Transfers dates are truncated to buckets and summed in database with single SELECT ... GROUP BY query, missing
+    buckets are filled with zeros in memory. Series are returned in columnar format - single list of buckets start
+    dates and list of values for every series.
+
+    Args:
+        queryset (QuerySet): Filtered Transfer QuerySet.
+        interval (str): Bucket length - "day", "week" or "month".
+        split_by (str | None): Optional Transfer field splitting series of every type - "category" or "deposit".
+        date_from (datetime.date | None): Start of series range. Date of the oldest Transfer is used if not given.
+        date_to (datetime.date | None): End of series range. Date of the newest Transfer is used if not given.
+    """
+
+    INTERVALS: dict[str, type] = {"day": TruncDay, "week": TruncWeek, "month": TruncMonth}
+    SPLITS: tuple[str] = ("category", "deposit")
+    MAX_BUCKETS: int = 1000
+    MAX_SERIES: int = 100
+
+    def __init__(
+        self,
+        queryset: QuerySet,
+        interval: str = "month",
+        split_by: str | None = None,
+        date_from: datetime.date | None = None,
+        date_to: datetime.date | None = None,
+    ):
+        self.queryset = queryset
+        self.interval = interval
+        self.split_by = split_by
+        self.date_from = date_from
+        self.date_to = date_to
+
+    def truncate(self, date: datetime.date) -> datetime.date:
+        """
+        Returns start date of bucket containing given date.
+
+        Args:
+            date (datetime.date): Truncated date.
+
+        Returns:
+            datetime.date: Bucket start date.
+        """
+        if self.interval == "week":
+            return date - datetime.timedelta(days=date.weekday())
+        if self.interval == "month":
+            return date.replace(day=1)
+        return date
+
+    def next_bucket(self, date: datetime.date) -> datetime.date:
+        """
+        Returns start date of bucket following bucket starting at given date.
+
+        Args:
+            date (datetime.date): Bucket start date.
+
+        Returns:
+            datetime.date: Next bucket start date.
+        """
+        if self.interval == "week":
+            return date + datetime.timedelta(days=7)
+        if self.interval == "month":
+            return (date + datetime.timedelta(days=32)).replace(day=1)
+        return date + datetime.timedelta(days=1)
+
+    def get_buckets(self, date_from: datetime.date, date_to: datetime.date) -> list[datetime.date]:
+        """
+        Returns start dates of all buckets in given date range.
+
+        Args:
+            date_from (datetime.date): Range start.
+            date_to (datetime.date): Range end.
+
+        Returns:
+            list[datetime.date]: Buckets start dates.
+
+        Raises:
+            TransferAggregationError: Raised when range contains more than MAX_BUCKETS buckets or when next
+            bucket would exceed maximal supported date.
+        """
+        buckets, bucket = [], self.truncate(date_from)
+        while bucket <= date_to:
+            if len(buckets) == self.MAX_BUCKETS:
+                raise TransferAggregationError(
+                    {"interval": [f"Series contains more than {self.MAX_BUCKETS} buckets. Narrow dates range."]}
+                )
+            buckets.append(bucket)
+            try:
+                bucket = self.next_bucket(bucket)
+            except OverflowError:
+                raise TransferAggregationError(
+                    {"date_before": [f"Series range exceeds maximal supported date {datetime.date.max}."]}
+                )
+        return buckets
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Returns Transfer QuerySet grouped by bucket, transfer type and split field.
+
+        Returns:
+            QuerySet: Values QuerySet with sum of Transfers values for every group.
+        """
+        fields = ("bucket", "transfer_type")
+        if self.split_by:
+            fields += (f"{self.split_by}_id", f"{self.split_by}__name")
+        return (
+            self.queryset.order_by()
+            .annotate(bucket=self.INTERVALS[self.interval]("date"))
+            .values(*fields)
+            .annotate(total=Sum("value"))
+        )
+
+    def get_series(self) -> dict:
+        """
+        Computes series.
+
+        Returns:
+            dict: Dictionary with "interval", "timestamps" list of buckets start dates and "series" list containing
+            transfer type, split object id and name and values of every series. Values are returned as strings with
+            two decimal places.
+
+        Raises:
+            TransferAggregationError: Raised when series contain too many buckets or series.
+        """
+        rows = list(self.get_queryset())
+        dates = [row["bucket"] for row in rows]
+        date_from = self.date_from or min(dates, default=None)
+        date_to = self.date_to or max(dates, default=None)
+        buckets = self.get_buckets(date_from, date_to) if date_from and date_to else []
+        indexes = {bucket: index for index, bucket in enumerate(buckets)}
+
+        series = {}
+        if not self.split_by:
+            series = {(transfer_type, None, None): [Decimal("0")] * len(buckets) for transfer_type in CategoryType}
+        for row in rows:
+            if (index := indexes.get(row["bucket"])) is None:
+                continue
+            key = (
+                (row["transfer_type"], row[f"{self.split_by}_id"], row[f"{self.split_by}__name"])
+                if self.split_by
+                else (row["transfer_type"], None, None)
+            )
+            if key not in series:
+                if len(series) == self.MAX_SERIES:
+                    raise TransferAggregationError(
+                        {"split_by": [f"Series split returns more than {self.MAX_SERIES} series. Narrow filters."]}
+                    )
+                series[key] = [Decimal("0")] * len(buckets)
+            series[key][index] += row["total"]
+
+        converter = serializers.DecimalField(max_digits=20, decimal_places=2).to_representation
+        return {
+            "interval": self.interval,
+            "timestamps": [bucket.isoformat() for bucket in buckets],
+            "series": [
+                {
+                    "transfer_type": transfer_type,
+                    "id": object_id,
+                    "name": name,
+                    "values": [converter(value) for value in values],
+                }
+                for (transfer_type, object_id, name), values in sorted(
+                    series.items(), key=lambda item: (item[0][0], item[0][2] or "", item[0][1] or 0)
+                )
+            ],
+        }
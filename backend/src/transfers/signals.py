@@ -0,0 +1,83 @@
+from decimal import Decimal
+
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from budgets.models import Budget
+from transfers.managers.transfer_manager import TransferQuerySet
+from transfers.models.expense_model import Expense
+from transfers.models.income_model import Income
+from transfers.models.transfer_model import Transfer
+from transfers.models.transfer_rollup_model import TransferRollup
+from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+
+
+@receiver(post_delete, sender=Transfer)
+@receiver(post_delete, sender=Income)
+@receiver(post_delete, sender=Expense)
+def remove_transfer_from_rollup(
+    sender: type[Model], instance: Transfer, origin: Model | QuerySet | None = None, **kwargs
+) -> None:
+    """
+    Subtracts deleted Transfer from TransferRollup row. Bulk deletes are handled by TransferQuerySet.delete.
+
+    Args:
+        sender (type[Model]): Transfer, Income or Expense model class.
+        instance (Transfer): Deleted Transfer instance.
+        origin (Model | QuerySet | None): Model instance or QuerySet which delete started deletion of instance.
+    """
+    if isinstance(origin, TransferQuerySet):
+        return
+    TransferRollup.objects.apply_transfer_change(instance.get_rollup_key(), Decimal(instance.value), None, Decimal("0"))
+
+
+@receiver(post_save, sender=Transfer)
+@receiver(post_save, sender=Income)
+@receiver(post_save, sender=Expense)
+def update_transfer_names_index(sender: type[Model], instance: Transfer, created: bool, **kwargs) -> None:
+    """
+    Adds created Transfer to TransferAutocompleteService index of its Budget or removes index of Budget of updated
+    Transfer.
+
+    Args:
+        sender (type[Model]): Transfer, Income or Expense model class.
+        instance (Transfer): Saved Transfer instance.
+        created (bool): Indicates if instance was created.
+    """
+    if created:
+        TransferAutocompleteService.on_transfers_created([instance])
+    else:
+        TransferAutocompleteService.invalidate([instance.budget_id])
+
+
+@receiver(post_delete, sender=Transfer)
+@receiver(post_delete, sender=Income)
+@receiver(post_delete, sender=Expense)
+def remove_transfer_from_names_index(
+    sender: type[Model], instance: Transfer, origin: Model | QuerySet | None = None, **kwargs
+) -> None:
+    """
+    Removes deleted Transfer from TransferAutocompleteService index of its Budget. Transfers are deleted in cascade
+    only with their Budget, which index is removed once by remove_deleted_budget_names_index. Bulk deletes are
+    handled by TransferQuerySet.delete.
+
+    Args:
+        sender (type[Model]): Transfer, Income or Expense model class.
+        instance (Transfer): Deleted Transfer instance.
+        origin (Model | QuerySet | None): Model instance or QuerySet which delete started deletion of instance.
+    """
+    if origin is None or origin is instance:
+        TransferAutocompleteService.on_transfer_deleted(instance)
+
+
+@receiver(post_delete, sender=Budget)
+def remove_deleted_budget_names_index(sender: type[Model], instance: Budget, **kwargs) -> None:
+    """
+    Removes TransferAutocompleteService indexes of deleted Budget.
+
+    Args:
+        sender (type[Model]): Budget model class.
+        instance (Budget): Deleted Budget instance.
+    """
+    TransferAutocompleteService.invalidate([instance.pk])
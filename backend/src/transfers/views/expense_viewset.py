@@ -1,5 +1,7 @@
+from categories.models.transfer_category_choices import CategoryType
 from transfers.filtersets.expense_filterset import ExpenseFilterSet
 from transfers.serializers.expense_serializer import ExpenseSerializer
+from transfers.serializers.transfer_bulk_serializer import ExpenseBulkSerializer
 from transfers.views.transfer_viewset import TransferViewSet
 
 
@@ -7,4 +9,6 @@ class ExpenseViewSet(TransferViewSet):
     """ViewSet for managing Expense."""
 
     serializer_class = ExpenseSerializer
+    bulk_serializer_class = ExpenseBulkSerializer
     filterset_class = ExpenseFilterSet
+    transfer_type = CategoryType.EXPENSE
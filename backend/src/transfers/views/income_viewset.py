@@ -1,5 +1,7 @@
+from categories.models.transfer_category_choices import CategoryType
 from transfers.filtersets.income_filterset import IncomeFilterSet
 from transfers.serializers.income_serializer import IncomeSerializer
+from transfers.serializers.transfer_bulk_serializer import IncomeBulkSerializer
 from transfers.views.transfer_viewset import TransferViewSet
 
 
@@ -7,4 +9,6 @@ class IncomeViewSet(TransferViewSet):
     """ViewSet for managing Incomes."""
 
     serializer_class = IncomeSerializer
+    bulk_serializer_class = IncomeBulkSerializer
     filterset_class = IncomeFilterSet
+    transfer_type = CategoryType.INCOME
@@ -0,0 +1,94 @@
+from django.db.models import QuerySet
+from django_filters import rest_framework as filters
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
+
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.mixins import BudgetETagMixin
+from app_infrastructure.permissions import UserBelongsToBudgetPermission
+from transfers.filtersets.transfer_filterset import TransferFilterSet
+from transfers.models.transfer_model import Transfer
+from transfers.serializers.transfer_series_serializer import TransferSeriesSerializer
+from transfers.services.transfer_aggregation_service import TransferAggregationError, TransferAggregationService
+from transfers.services.transfer_series_service import TransferSeriesService
+
+
+class TransferAggregateViewSet(BudgetETagMixin, GenericViewSet):
+    """ViewSet for aggregations and time series of both Incomes and Expenses of Budget."""
+
+    authentication_classes = (CachedTokenAuthentication, SignedTokenAuthentication)
+    permission_classes = (IsAuthenticated, UserBelongsToBudgetPermission)
+    filter_backends = (filters.DjangoFilterBackend,)
+    filterset_class = TransferFilterSet
+
+    def get_queryset(self) -> QuerySet:
+        """
+        Retrieve Transfers for Budget passed in URL.
+
+        Returns:
+            QuerySet: Filtered Transfer QuerySet.
+        """
+        return Transfer.objects.filter(budget__pk=self.kwargs.get("budget_pk"))
+
+    @action(detail=False, methods=["GET"])
+    def aggregate(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns pivot aggregation of filtered Transfers of Budget passed in URL.
+
+        Dimensions are passed as comma separated "group_by" query param and measures as comma separated "measures"
+        query param ("sum,count" by default). Filters are the same as for Incomes and Expenses list views.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Dimensions values and measures of every group.
+        """
+        if self.is_not_modified(request):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        try:
+            service = TransferAggregationService(
+                self.filter_queryset(self.get_queryset()),
+                group_by=TransferAggregationService.parse_param(request.query_params.get("group_by")),
+                measures=TransferAggregationService.parse_param(request.query_params.get("measures")),
+            )
+            rows = service.aggregate()
+        except TransferAggregationError as exc:
+            raise ValidationError(exc.errors)
+        return Response(rows)
+
+    @action(detail=False, methods=["GET"])
+    def series(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns time series of filtered Incomes and Expenses totals of Budget passed in URL.
+
+        Bucket length is passed in "interval" query param ("month" by default) and optional series split in
+        "split_by" query param. Buckets cover range given by "date_after" and "date_before" filters or, if not
+        given, range of filtered Transfers dates. Empty buckets are filled with zeros.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Buckets start dates and values of every series.
+        """
+        if self.is_not_modified(request):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        serializer = TransferSeriesSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        service = TransferSeriesService(
+            self.filter_queryset(self.get_queryset()),
+            interval=serializer.validated_data["interval"],
+            split_by=serializer.validated_data["split_by"],
+            date_from=serializer.validated_data["date_after"],
+            date_to=serializer.validated_data["date_before"],
+        )
+        try:
+            return Response(service.get_series())
+        except TransferAggregationError as exc:
+            raise ValidationError(exc.errors)
@@ -1,21 +1,41 @@
+import codecs
+from typing import Any, Callable
+
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from django_filters import rest_framework as filters
-from rest_framework.authentication import TokenAuthentication
-from rest_framework.filters import OrderingFilter
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from app_infrastructure.authentication import CachedTokenAuthentication, SignedTokenAuthentication
+from app_infrastructure.filters import SearchRankOrderingFilter
+from app_infrastructure.mixins import BudgetETagMixin, ValuesListMixin
+from app_infrastructure.paginations import OptionalKeysetPagination
 from app_infrastructure.permissions import UserBelongsToBudgetPermission
+from transfers.serializers.transfer_bulk_serializer import TransferBulkSerializer
 from transfers.serializers.transfer_serializer import TransferSerializer
+from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+from transfers.services.transfer_csv_import_service import TransferCsvImportError, TransferCsvImportService
+from transfers.services.transfer_export_service import TransferExportService
 
 
-class TransferViewSet(ModelViewSet):
+class TransferViewSet(BudgetETagMixin, ValuesListMixin, ModelViewSet):
     """Base ViewSet for managing Transfers."""
 
     serializer_class = TransferSerializer
-    authentication_classes = (TokenAuthentication,)
+    bulk_serializer_class = TransferBulkSerializer
+    authentication_classes = (CachedTokenAuthentication, SignedTokenAuthentication)
     permission_classes = (IsAuthenticated, UserBelongsToBudgetPermission)
-    filter_backends = (filters.DjangoFilterBackend, OrderingFilter)
+    filter_backends = (filters.DjangoFilterBackend, SearchRankOrderingFilter)
+    pagination_class = OptionalKeysetPagination
+    transfer_type: int | None = None
+    ordering = ("id",)
     ordering_fields = (
         "id",
         "name",
@@ -30,13 +50,135 @@ class TransferViewSet(ModelViewSet):
 
     def get_queryset(self) -> QuerySet:
         """
-        Retrieve Transfer for Budget passed in URL.
+        Retrieve Transfer for Budget passed in URL. List of Transfers is annotated with Deposit balance after every
+        Transfer, when "running_balance=true" query param passed.
 
         Returns:
             QuerySet: Filtered TransferCategory QuerySet.
         """
-        return (
-            self.serializer_class.Meta.model.objects.prefetch_related("period", "category")
-            .filter(period__budget__pk=self.kwargs.get("budget_pk"))
-            .distinct()
+        queryset = self.serializer_class.Meta.model.objects.select_related("period", "category").filter(
+            budget__pk=self.kwargs.get("budget_pk")
+        )
+        if self.action == "list" and self.request.query_params.get("running_balance") in ("true", "1"):
+            queryset = queryset.with_running_balance()
+        return queryset
+
+    def get_values_fields(self, queryset: QuerySet) -> list[tuple[str, str, Callable[[Any], Any] | None]] | None:
+        """
+        Extended with "running_balance" field, if Transfers were annotated with it.
+
+        Args:
+            queryset [QuerySet]: Filtered Transfer QuerySet.
+
+        Returns:
+            list[tuple[str, str, Callable[[Any], Any] | None]] | None: Fields description.
+        """
+        fields = super().get_values_fields(queryset)
+        if fields is not None and "running_balance" in queryset.query.annotations:
+            converter = serializers.DecimalField(max_digits=20, decimal_places=2).to_representation
+            fields.append(("running_balance", "running_balance", converter))
+        return fields
+
+    @action(detail=False, methods=["POST"])
+    def bulk(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Creates multiple Transfers for Budget passed in URL at once.
+
+        Args:
+            request [Request]: User request containing list of Transfers data.
+
+        Returns:
+            Response: Created Transfers.
+        """
+        serializer = self.bulk_serializer_class(data=request.data, many=True, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        transfers = serializer.save()
+        return Response(self.get_serializer(transfers, many=True).data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["POST"], url_path="import", parser_classes=(MultiPartParser,))
+    def import_csv(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Creates Transfers for Budget passed in URL from uploaded CSV file.
+
+        Uploaded file is passed in "file" field. Optional "delimiter" and "date_format" fields describe file
+        format, other optional fields named as Transfer fields contain names of CSV columns for these fields.
+
+        Args:
+            request [Request]: User request containing CSV file.
+
+        Returns:
+            Response: Number of created Transfers.
+        """
+        if "file" not in request.FILES:
+            raise ValidationError({"file": ["No file was submitted."]})
+        if len(delimiter := request.data.get("delimiter", ",")) != 1:
+            raise ValidationError({"delimiter": ["Delimiter has to be a single character."]})
+        service = TransferCsvImportService(
+            budget_pk=self.kwargs.get("budget_pk"),
+            serializer_class=self.bulk_serializer_class,
+            column_mapping={
+                field: request.data[field] for field in TransferCsvImportService.FIELDS if request.data.get(field)
+            },
+            delimiter=delimiter,
+            date_format=request.data.get("date_format", "%Y-%m-%d"),
+        )
+        try:
+            created_count = service.import_file(codecs.iterdecode(request.FILES["file"], "utf-8-sig"))
+        except TransferCsvImportError as exc:
+            raise ValidationError(exc.errors)
+        except UnicodeDecodeError:
+            raise ValidationError({"file": ["File is not valid UTF-8 encoded CSV file."]})
+        return Response({"created": created_count}, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["GET"])
+    def export(self, request: Request, **kwargs: dict) -> StreamingHttpResponse:
+        """
+        Streams all filtered Transfers for Budget passed in URL as CSV or NDJSON file without pagination.
+
+        Output format is passed in "export_format" query param ("csv" by default). Filters and ordering are the
+        same as for list view.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            StreamingHttpResponse: Exported Transfers file.
+        """
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in TransferExportService.FORMATS:
+            raise ValidationError(
+                {"export_format": [f"Export format has to be one of: {', '.join(TransferExportService.FORMATS)}."]}
+            )
+        service = TransferExportService(self.filter_queryset(self.get_queryset()))
+        response = StreamingHttpResponse(
+            service.stream(export_format), content_type=TransferExportService.CONTENT_TYPES[export_format]
+        )
+        filename = f"{self.serializer_class.Meta.model._meta.verbose_name_plural}.{export_format}".lower()
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=False, methods=["GET"])
+    def autocomplete(self, request: Request, **kwargs: dict) -> Response:
+        """
+        Returns past Transfer names of Budget passed in URL starting with "q" query param, together with their most
+        common category, entity and deposit. Names are ranked by frequency and recency of use, at most "limit"
+        query param names are returned.
+
+        Args:
+            request [Request]: User request.
+
+        Returns:
+            Response: Suggested Transfer names.
+        """
+        try:
+            limit = int(request.query_params.get("limit", TransferAutocompleteService.DEFAULT_LIMIT))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= TransferAutocompleteService.MAX_LIMIT:
+            raise ValidationError(
+                {"limit": [f"Limit has to be an integer between 1 and {TransferAutocompleteService.MAX_LIMIT}."]}
+            )
+        suggestions = TransferAutocompleteService.get_suggestions(
+            int(self.kwargs.get("budget_pk")), self.transfer_type, request.query_params.get("q", ""), limit
         )
+        return Response(suggestions or [])
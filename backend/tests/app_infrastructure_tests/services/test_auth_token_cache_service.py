@@ -0,0 +1,152 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from factory.base import FactoryMetaClass
+from rest_framework.authtoken.models import Token
+
+from app_infrastructure.services.auth_token_cache_service import AuthTokenCacheService
+
+
+@pytest.fixture
+def shared_cache_disabled(settings: Any) -> None:
+    """Disables shared cache, so AuthTokenCacheService keeps entries in process local LRU cache."""
+    settings.SHARED_CACHE_ENABLED = False
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("shared_cache_disabled")
+class TestAuthTokenCacheService:
+    """Tests for AuthTokenCacheService with process local cache."""
+
+    def test_get_returns_copies(self, base_user: AbstractUser):
+        """
+        GIVEN: User and Token stored in cache.
+        WHEN: AuthTokenCacheService.get called and returned User modified.
+        THEN: Cached User not modified, returned Token references returned User.
+        """
+        token = Token.objects.create(user=base_user)
+        AuthTokenCacheService.set(token.key, base_user, token)
+
+        user, cached_token = AuthTokenCacheService.get(token.key)
+        user.name = "Changed"
+
+        assert cached_token.user is user
+        assert cached_token.key == token.key
+        assert AuthTokenCacheService.get(token.key)[0].name == base_user.name
+
+    def test_raw_token_key_not_stored(self, base_user: AbstractUser):
+        """
+        GIVEN: User and Token in database.
+        WHEN: AuthTokenCacheService.set called.
+        THEN: Entry stored under hashed token key.
+        """
+        token = Token.objects.create(user=base_user)
+
+        AuthTokenCacheService.set(token.key, base_user, token)
+
+        assert token.key not in AuthTokenCacheService._entries
+        assert AuthTokenCacheService.get_cache_key(token.key) in AuthTokenCacheService._entries
+
+    def test_entry_expired(self, base_user: AbstractUser, monkeypatch: pytest.MonkeyPatch):
+        """
+        GIVEN: User and Token stored in cache.
+        WHEN: AuthTokenCacheService.get called after TIMEOUT.
+        THEN: None returned.
+        """
+        token = Token.objects.create(user=base_user)
+        AuthTokenCacheService.set(token.key, base_user, token)
+        expires_at = AuthTokenCacheService._entries[AuthTokenCacheService.get_cache_key(token.key)][2]
+        monkeypatch.setattr("app_infrastructure.services.auth_token_cache_service.time.monotonic", lambda: expires_at)
+
+        assert AuthTokenCacheService.get(token.key) is None
+        assert not AuthTokenCacheService._entries
+
+    def test_least_recently_used_entry_evicted(self, user_factory: FactoryMetaClass, monkeypatch: pytest.MonkeyPatch):
+        """
+        GIVEN: AuthTokenCacheService.MAX_SIZE set to 2 and two entries stored in cache.
+        WHEN: First entry read and third entry stored.
+        THEN: Second entry, as least recently used, evicted from cache.
+        """
+        monkeypatch.setattr(AuthTokenCacheService, "MAX_SIZE", 2)
+        tokens = [Token.objects.create(user=user_factory()) for _ in range(3)]
+        for token in tokens[:2]:
+            AuthTokenCacheService.set(token.key, token.user, token)
+
+        AuthTokenCacheService.get(tokens[0].key)
+        AuthTokenCacheService.set(tokens[2].key, tokens[2].user, tokens[2])
+
+        assert AuthTokenCacheService.get(tokens[0].key) is not None
+        assert AuthTokenCacheService.get(tokens[1].key) is None
+        assert AuthTokenCacheService.get(tokens[2].key) is not None
+        assert tokens[1].user.pk not in AuthTokenCacheService._user_keys
+
+    def test_invalidate_user(self, user_factory: FactoryMetaClass):
+        """
+        GIVEN: Entries of two Users stored in cache.
+        WHEN: AuthTokenCacheService.invalidate_user called for first User.
+        THEN: Only entries of first User removed from cache.
+        """
+        user, other_user = user_factory(), user_factory()
+        token, other_token = Token.objects.create(user=user), Token.objects.create(user=other_user)
+        AuthTokenCacheService.set(token.key, user, token)
+        AuthTokenCacheService.set(other_token.key, other_user, other_token)
+
+        AuthTokenCacheService.invalidate_user(user.pk)
+
+        assert AuthTokenCacheService.get(token.key) is None
+        assert AuthTokenCacheService.get(other_token.key) is not None
+
+
+@pytest.mark.django_db
+class TestAuthTokenCacheServiceSharedCache:
+    """Tests for AuthTokenCacheService with shared cache."""
+
+    def test_entry_stored_in_shared_cache(self, base_user: AbstractUser):
+        """
+        GIVEN: User and Token in database.
+        WHEN: AuthTokenCacheService.set and AuthTokenCacheService.get called.
+        THEN: Entry stored in Django cache under hashed token key, not in process local cache. Returned Token
+        references returned User.
+        """
+        token = Token.objects.create(user=base_user)
+
+        AuthTokenCacheService.set(token.key, base_user, token)
+        user, cached_token = AuthTokenCacheService.get(token.key)
+
+        assert not AuthTokenCacheService._entries
+        assert cache.get(f"{AuthTokenCacheService.KEY_PREFIX}:{token.key}") is None
+        assert cache.get(f"{AuthTokenCacheService.KEY_PREFIX}:{AuthTokenCacheService.get_cache_key(token.key)}")
+        assert user.pk == base_user.pk
+        assert cached_token.user is user
+        assert cached_token.key == token.key
+
+    def test_invalidate_token(self, base_user: AbstractUser):
+        """
+        GIVEN: Entry of User stored in cache.
+        WHEN: AuthTokenCacheService.invalidate_token called for User Token.
+        THEN: Entry removed from cache.
+        """
+        token = Token.objects.create(user=base_user)
+        AuthTokenCacheService.set(token.key, base_user, token)
+
+        AuthTokenCacheService.invalidate_token(token.key)
+
+        assert AuthTokenCacheService.get(token.key) is None
+
+    def test_invalidate_user(self, user_factory: FactoryMetaClass):
+        """
+        GIVEN: Entries of two Users stored in cache.
+        WHEN: AuthTokenCacheService.invalidate_user called for first User.
+        THEN: Only entries of first User, found by Token stored in database, removed from cache.
+        """
+        user, other_user = user_factory(), user_factory()
+        token, other_token = Token.objects.create(user=user), Token.objects.create(user=other_user)
+        AuthTokenCacheService.set(token.key, user, token)
+        AuthTokenCacheService.set(other_token.key, other_user, other_token)
+
+        AuthTokenCacheService.invalidate_user(user.pk)
+
+        assert AuthTokenCacheService.get(token.key) is None
+        assert AuthTokenCacheService.get(other_token.key) is not None
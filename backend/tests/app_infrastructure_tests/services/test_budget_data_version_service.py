@@ -0,0 +1,299 @@
+from typing import Any, Callable
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from budgets.models import Budget, BudgetingPeriod
+from transfers.models.transfer_model import Transfer
+
+
+@pytest.mark.django_db
+class TestBudgetDataVersionService:
+    """Tests for BudgetDataVersionService."""
+
+    def test_version_cached(self, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget in database.
+        WHEN: BudgetDataVersionService.get_version called twice for Budget.
+        THEN: Version fetched from database only for first call.
+        """
+        budget = budget_factory()
+
+        with CaptureQueriesContext(connection) as first_context:
+            first_version = BudgetDataVersionService.get_version(budget.id)
+        with CaptureQueriesContext(connection) as second_context:
+            second_version = BudgetDataVersionService.get_version(budget.id)
+
+        assert first_version == second_version
+        assert len(first_context.captured_queries) == 1
+        assert len(second_context.captured_queries) == 0
+
+    def test_version_not_cached_without_shared_cache(self, settings: Any, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget in database, shared cache disabled.
+        WHEN: BudgetDataVersionService.get_version called and Budget data version increased with QuerySet.update().
+        THEN: Version read from database on every call, nothing stored in cache.
+        """
+        settings.SHARED_CACHE_ENABLED = False
+        budget = budget_factory()
+
+        version = BudgetDataVersionService.get_version(budget.id)
+        Budget.objects.filter(pk=budget.id).update(data_version=F("data_version") + 1)
+
+        assert BudgetDataVersionService.get_version(budget.id) == version + 1
+        assert cache.get(BudgetDataVersionService.get_cache_key(budget.id)) is None
+
+    def test_version_of_not_existing_budget(self):
+        """
+        GIVEN: Empty database.
+        WHEN: BudgetDataVersionService.get_version called for not existing Budget id.
+        THEN: None returned.
+        """
+        assert BudgetDataVersionService.get_version(1) is None
+
+    def test_bump_by_periods(
+        self,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Two Budgets with BudgetingPeriods and cached data versions.
+        WHEN: BudgetDataVersionService.bump called for BudgetingPeriod of first Budget.
+        THEN: Data version increased only for first Budget.
+        """
+        budget, other_budget = budget_factory(), budget_factory()
+        period = budgeting_period_factory(budget=budget)
+        budgeting_period_factory(budget=other_budget)
+        version = BudgetDataVersionService.get_version(budget.id)
+        other_version = BudgetDataVersionService.get_version(other_budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetDataVersionService.bump("periods", periods_ids=[period.id])
+
+        assert BudgetDataVersionService.get_version(budget.id) == version + 1
+        assert BudgetDataVersionService.get_version(other_budget.id) == other_version
+
+    def test_version_bumped_after_commit(
+        self, budget_factory: FactoryMetaClass, django_capture_on_commit_callbacks: Callable
+    ):
+        """
+        GIVEN: Budget with cached data version.
+        WHEN: BudgetDataVersionService.bump called for Budget inside transaction.
+        THEN: Budget row not updated until transaction commit. Data version increased after commit.
+        """
+        budget = budget_factory()
+        version = BudgetDataVersionService.get_version(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with CaptureQueriesContext(connection) as context:
+                BudgetDataVersionService.bump("periods", budget_ids=[budget.id])
+            uncommitted_version = BudgetDataVersionService.get_version(budget.id)
+
+        assert not any("data_version" in query["sql"] for query in context.captured_queries)
+        assert uncommitted_version == version
+        assert BudgetDataVersionService.get_version(budget.id) == version + 1
+
+    @pytest.mark.parametrize(
+        "factory_name", ["budgeting_period", "entity", "deposit", "income_category", "expense_prediction", "income"]
+    )
+    def test_version_bumped_on_save_and_delete(
+        self,
+        request: pytest.FixtureRequest,
+        budget_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+        factory_name: str,
+    ):
+        """
+        GIVEN: Budget in database.
+        WHEN: Object owned by Budget created, updated and deleted.
+        THEN: Budget data version increased on every write.
+        """
+        budget = budget_factory()
+        version = BudgetDataVersionService.get_version(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            instance = request.getfixturevalue(f"{factory_name}_factory")(budget=budget)
+        created_version = BudgetDataVersionService.get_version(budget.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            instance.save()
+        updated_version = BudgetDataVersionService.get_version(budget.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            instance.delete()
+
+        assert version < created_version < updated_version < BudgetDataVersionService.get_version(budget.id)
+
+    def test_version_bumped_on_bulk_operations(
+        self,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with Income in database.
+        WHEN: Transfers bulk created and updated with QuerySet methods.
+        THEN: Budget data version increased on every operation.
+        """
+        budget = budget_factory()
+        income = income_factory(budget=budget)
+        version = BudgetDataVersionService.get_version(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Transfer.objects.bulk_create(
+                [
+                    Transfer(
+                        name="Bulk",
+                        value=income.value,
+                        date=income.date,
+                        period_id=income.period_id,
+                        category_id=income.category_id,
+                        entity_id=income.entity_id,
+                        deposit_id=income.deposit_id,
+                    )
+                ]
+            )
+        created_version = BudgetDataVersionService.get_version(budget.id)
+        with django_capture_on_commit_callbacks(execute=True):
+            Transfer.objects.filter(period__budget=budget).update(description="Updated")
+
+        assert version < created_version < BudgetDataVersionService.get_version(budget.id)
+
+    def test_version_not_overwritten_on_budget_save(
+        self, budget_factory: FactoryMetaClass, django_capture_on_commit_callbacks: Callable
+    ):
+        """
+        GIVEN: Budget instance loaded before its data version was increased.
+        WHEN: Budget instance saved.
+        THEN: Increased data version kept in database.
+        """
+        budget = budget_factory()
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetDataVersionService.bump("periods", budget_ids=[budget.id])
+
+        budget.name = "Changed"
+        budget.save()
+
+        budget.refresh_from_db()
+        assert budget.name == "Changed"
+        assert budget.data_version == 1
+
+    def test_version_bumped_once_on_cascade_delete(
+        self,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod having three ExpensePredictions in database.
+        WHEN: BudgetingPeriod deleted with ExpensePredictions in cascade.
+        THEN: Budget data version increased once.
+        """
+        budget = budget_factory()
+        period = budgeting_period_factory(budget=budget)
+        for _ in range(3):
+            expense_prediction_factory(budget=budget, period=period)
+        version = BudgetDataVersionService.get_version(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            period.delete()
+
+        assert BudgetDataVersionService.get_version(budget.id) == version + 1
+
+    def test_resource_version_bumped(
+        self,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget in database.
+        WHEN: Entity created in Budget.
+        THEN: Data version and Entities version of Budget increased, versions of other resources unchanged.
+        """
+        budget = budget_factory()
+        versions = BudgetDataVersionService.get_versions(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            entity_factory(budget=budget)
+
+        assert BudgetDataVersionService.get_versions(budget.id) == versions | {
+            "data": versions["data"] + 1,
+            "entities": versions["entities"] + 1,
+        }
+
+    def test_cascade_deleted_resources_versions_bumped(
+        self,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod having two ExpensePredictions in database.
+        WHEN: BudgetingPeriod deleted with ExpensePredictions in cascade.
+        THEN: Data version, BudgetingPeriods version and ExpensePredictions version of Budget increased once.
+        """
+        budget = budget_factory()
+        period = budgeting_period_factory(budget=budget)
+        for _ in range(2):
+            expense_prediction_factory(budget=budget, period=period)
+        versions = BudgetDataVersionService.get_versions(budget.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            period.delete()
+
+        assert BudgetDataVersionService.get_versions(budget.id) == versions | {
+            "data": versions["data"] + 1,
+            "periods": versions["periods"] + 1,
+            "predictions": versions["predictions"] + 1,
+        }
+
+    def test_version_bumped_once_on_queryset_delete(
+        self,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Two Budgets with two BudgetingPeriods each in database.
+        WHEN: All BudgetingPeriods deleted with QuerySet.delete().
+        THEN: Data version of every Budget increased once.
+        """
+        budgets = [budget_factory(), budget_factory()]
+        for budget in budgets:
+            for _ in range(2):
+                budgeting_period_factory(budget=budget)
+        versions = [BudgetDataVersionService.get_version(budget.id) for budget in budgets]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetingPeriod.objects.filter(budget__in=budgets).delete()
+
+        assert [BudgetDataVersionService.get_version(budget.id) for budget in budgets] == [
+            version + 1 for version in versions
+        ]
+
+    def test_version_not_bumped_on_budget_delete(
+        self,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod and ExpensePrediction in database.
+        WHEN: Budget deleted with its objects in cascade.
+        THEN: No data version UPDATE query executed.
+        """
+        budget = budget_factory()
+        expense_prediction_factory(budget=budget, period=budgeting_period_factory(budget=budget))
+
+        with CaptureQueriesContext(connection) as context, django_capture_on_commit_callbacks(execute=True):
+            budget.delete()
+
+        assert not any("data_version" in query["sql"] for query in context.captured_queries)
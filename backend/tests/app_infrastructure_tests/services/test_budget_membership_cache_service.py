@@ -0,0 +1,140 @@
+from typing import Any, Callable
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.services.budget_membership_cache_service import BudgetMembershipCacheService
+
+
+@pytest.mark.django_db
+class TestBudgetMembershipCacheService:
+    """Tests for BudgetMembershipCacheService."""
+
+    def test_budget_ids_cached(self, base_user: AbstractUser, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Two Budgets with User as member and one other Budget in database.
+        WHEN: BudgetMembershipCacheService.is_member called twice for User.
+        THEN: Budgets ids fetched from database with single query only for first call.
+        """
+        budgets = [budget_factory(owner=base_user), budget_factory(members=[base_user])]
+        other_budget = budget_factory()
+
+        with CaptureQueriesContext(connection) as first_context:
+            first_result = BudgetMembershipCacheService.is_member(base_user.id, budgets[0].id)
+        with CaptureQueriesContext(connection) as second_context:
+            second_results = [
+                BudgetMembershipCacheService.is_member(base_user.id, str(budget.id)) for budget in budgets
+            ]
+            other_result = BudgetMembershipCacheService.is_member(base_user.id, other_budget.id)
+
+        assert first_result is True
+        assert second_results == [True, True]
+        assert other_result is False
+        assert len(first_context.captured_queries) == 1
+        assert len(second_context.captured_queries) == 0
+
+    def test_budget_ids_not_cached_without_shared_cache(
+        self, settings: Any, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget with User as member in database. Shared cache disabled.
+        WHEN: BudgetMembershipCacheService.is_member called twice for User.
+        THEN: Budgets ids fetched from database for every call.
+        """
+        settings.SHARED_CACHE_ENABLED = False
+        budget = budget_factory(owner=base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            results = [BudgetMembershipCacheService.is_member(base_user.id, budget.id) for _ in range(2)]
+
+        assert results == [True, True]
+        assert len(context.captured_queries) == 2
+
+    @pytest.mark.parametrize("budget_id", [None, "", "abc"])
+    def test_invalid_budget_id(self, base_user: AbstractUser, budget_id: str | None):
+        """
+        GIVEN: User in database.
+        WHEN: BudgetMembershipCacheService.is_member called with invalid Budget id.
+        THEN: False returned.
+        """
+        assert BudgetMembershipCacheService.is_member(base_user.id, budget_id) is False
+
+    @pytest.mark.parametrize(
+        "change_members",
+        [
+            lambda budget, user: budget.members.add(user),
+            lambda budget, user: user.joined_budgets.add(budget),
+            lambda budget, user: budget.members.set([budget.owner, user]),
+        ],
+    )
+    def test_invalidate_on_member_added(
+        self,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        change_members: Callable,
+    ):
+        """
+        GIVEN: Budget without User as member and cached User Budgets ids.
+        WHEN: User added to Budget members from Budget or User side.
+        THEN: Cache invalidated, User recognized as Budget member.
+        """
+        budget = budget_factory()
+        assert BudgetMembershipCacheService.is_member(base_user.id, budget.id) is False
+
+        change_members(budget, base_user)
+
+        assert BudgetMembershipCacheService.is_member(base_user.id, budget.id) is True
+
+    @pytest.mark.parametrize(
+        "change_members",
+        [
+            lambda budget, user: budget.members.remove(user),
+            lambda budget, user: user.joined_budgets.remove(budget),
+            lambda budget, user: budget.members.clear(),
+            lambda budget, user: user.joined_budgets.clear(),
+            lambda budget, user: budget.delete(),
+        ],
+    )
+    def test_invalidate_on_member_removed(
+        self,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        change_members: Callable,
+    ):
+        """
+        GIVEN: Budget with User as member and cached User Budgets ids.
+        WHEN: User removed from Budget members, members cleared or Budget deleted.
+        THEN: Cache invalidated, User not recognized as Budget member.
+        """
+        budget = budget_factory(members=[base_user])
+        budget_id = budget.id
+        assert BudgetMembershipCacheService.is_member(base_user.id, budget_id) is True
+
+        change_members(budget, base_user)
+
+        assert BudgetMembershipCacheService.is_member(base_user.id, budget_id) is False
+
+    def test_permission_check_without_queries(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget with User as member in database.
+        WHEN: Budget nested endpoint called twice by User.
+        THEN: Second request does not query Budget members.
+        """
+        budget = budget_factory(owner=base_user)
+        url = reverse("budgets:period-list", args=[budget.id])
+        api_client.force_authenticate(base_user)
+        api_client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any("budgets_budget_members" in query["sql"] for query in context.captured_queries)
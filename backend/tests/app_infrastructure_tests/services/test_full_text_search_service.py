@@ -0,0 +1,77 @@
+import json
+
+import pytest
+from django.db import connection
+from factory.base import FactoryMetaClass
+
+from app_infrastructure.services.full_text_search_service import FullTextSearchService
+from transfers.models.transfer_model import Transfer
+
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Full text search with ranking and index is used only on PostgreSQL."
+)
+
+
+@pytest.mark.django_db
+class TestFullTextSearchService:
+    """Tests for FullTextSearchService."""
+
+    def test_search_by_words_prefixes(self, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfers with different names and descriptions in database.
+        WHEN: FullTextSearchService.search called with partially typed words.
+        THEN: Only Transfers containing all words as prefixes in name or description returned.
+        """
+        matching = [
+            income_factory(name="Monthly salary", description=None),
+            income_factory(name="Bonus", description="Salary bonus for month"),
+        ]
+        income_factory(name="Salary", description="Yearly")
+        income_factory(name="Monthly rent", description=None)
+
+        queryset = FullTextSearchService.search(Transfer.objects.all(), "sal mont", "name", "description")
+
+        assert set(queryset) == set(matching)
+
+    @postgresql_only
+    def test_search_ranked_by_fields_weights(self, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfer with searched word in name and Transfer with searched word in description.
+        WHEN: FullTextSearchService.search called.
+        THEN: Transfer with searched word in name ranked higher.
+        """
+        in_description = income_factory(name="Other", description="Salary")
+        in_name = income_factory(name="Salary", description="Other")
+
+        queryset = FullTextSearchService.search(Transfer.objects.all(), "salary", "name", "description")
+
+        assert list(queryset.order_by(f"-{FullTextSearchService.RANK_FIELD}")) == [in_name, in_description]
+
+    @pytest.mark.parametrize("phrase", ["", "  ", "&|!:*()'"])
+    def test_phrase_without_words(self, income_factory: FactoryMetaClass, phrase: str):
+        """
+        GIVEN: Transfer in database.
+        WHEN: FullTextSearchService.search called with phrase without words.
+        THEN: Not filtered QuerySet returned.
+        """
+        income_factory()
+
+        queryset = FullTextSearchService.search(Transfer.objects.all(), phrase, "name", "description")
+
+        assert queryset.count() == 1
+
+    @postgresql_only
+    def test_search_uses_index(self, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Transfer in database. Sequential scans disabled.
+        WHEN: Query of FullTextSearchService.search explained.
+        THEN: GIN index of Transfer search vector used.
+        """
+        income_factory()
+        queryset = FullTextSearchService.search(Transfer.objects.all(), "salary", "name", "description")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain(format="json")
+
+        assert "transfers_search_idx" in json.dumps(json.loads(plan))
@@ -0,0 +1,154 @@
+import time
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.core import signing
+from django.core.cache import cache
+from factory.base import FactoryMetaClass
+
+from app_infrastructure.services.signed_token_service import SignedTokenError, SignedTokenService
+from app_users.models import RevokedToken
+
+
+@pytest.mark.django_db
+class TestSignedTokenService:
+    """Tests for SignedTokenService."""
+
+    def test_issue_tokens(self, base_user: AbstractUser, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: User being owner of one Budget and member of other one.
+        WHEN: SignedTokenService.issue called for User.
+        THEN: Access token with User id and Budgets ids and refresh token returned.
+        """
+        budgets = [budget_factory(owner=base_user), budget_factory(members=[base_user])]
+        budget_factory()
+
+        tokens = SignedTokenService.issue(base_user)
+
+        access_claims = SignedTokenService.decode(tokens["access"], SignedTokenService.ACCESS)
+        refresh_claims = SignedTokenService.decode(tokens["refresh"], SignedTokenService.REFRESH)
+        assert access_claims["uid"] == refresh_claims["uid"] == base_user.id
+        assert access_claims["bids"] == sorted(budget.id for budget in budgets)
+        assert access_claims["sid"] == refresh_claims["jti"]
+
+    @pytest.mark.parametrize(
+        "token_type, other_type",
+        [
+            (SignedTokenService.ACCESS, SignedTokenService.REFRESH),
+            (SignedTokenService.REFRESH, SignedTokenService.ACCESS),
+        ],
+    )
+    def test_error_invalid_token_type(self, base_user: AbstractUser, token_type: str, other_type: str):
+        """
+        GIVEN: Tokens issued for User.
+        WHEN: SignedTokenService.decode called for token with other expected type.
+        THEN: SignedTokenError raised.
+        """
+        tokens = SignedTokenService.issue(base_user)
+
+        with pytest.raises(SignedTokenError) as exc:
+            SignedTokenService.decode(tokens[token_type], other_type)
+        assert str(exc.value) == "Invalid token."
+
+    def test_error_tampered_token(self, base_user: AbstractUser):
+        """
+        GIVEN: Access token issued for User.
+        WHEN: SignedTokenService.decode called for token with claims modified without signing key.
+        THEN: SignedTokenError raised.
+        """
+        token = SignedTokenService.issue(base_user)["access"]
+        claims = SignedTokenService.decode(token, SignedTokenService.ACCESS)
+        forged = signing.dumps({**claims, "bids": [1, 2, 3]}, key="other", salt=SignedTokenService.SALT, compress=True)
+
+        with pytest.raises(SignedTokenError) as exc:
+            SignedTokenService.decode(forged, SignedTokenService.ACCESS)
+        assert str(exc.value) == "Invalid token."
+
+    def test_error_expired_token(self, base_user: AbstractUser, monkeypatch: pytest.MonkeyPatch):
+        """
+        GIVEN: Access token issued for User.
+        WHEN: SignedTokenService.decode called after token expiration.
+        THEN: SignedTokenError raised.
+        """
+        token = SignedTokenService.issue(base_user)["access"]
+        expires_at = SignedTokenService.decode(token, SignedTokenService.ACCESS)["exp"]
+        monkeypatch.setattr("app_infrastructure.services.signed_token_service.time.time", lambda: expires_at)
+
+        with pytest.raises(SignedTokenError) as exc:
+            SignedTokenService.decode(token, SignedTokenService.ACCESS)
+        assert str(exc.value) == "Token expired."
+
+    def test_revoke(self, base_user: AbstractUser):
+        """
+        GIVEN: Tokens issued for User.
+        WHEN: SignedTokenService.revoke called for refresh token claims.
+        THEN: RevokedToken created, both refresh and access tokens denied.
+        """
+        tokens = SignedTokenService.issue(base_user)
+        claims = SignedTokenService.decode(tokens["refresh"], SignedTokenService.REFRESH)
+
+        assert SignedTokenService.revoke(claims) is True
+
+        assert RevokedToken.objects.filter(jti=claims["jti"]).exists()
+        for token_type, token in tokens.items():
+            with pytest.raises(SignedTokenError) as exc:
+                SignedTokenService.decode(token, token_type)
+            assert str(exc.value) == "Token revoked."
+
+    def test_revoked_refresh_token_checked_in_database(self, base_user: AbstractUser):
+        """
+        GIVEN: Revoked refresh token removed from cache.
+        WHEN: SignedTokenService.decode called for refresh token.
+        THEN: SignedTokenError raised.
+        """
+        token = SignedTokenService.issue(base_user)["refresh"]
+        claims = SignedTokenService.decode(token, SignedTokenService.REFRESH)
+        SignedTokenService.revoke(claims)
+        cache.delete(SignedTokenService.get_revoked_cache_key(claims["jti"]))
+
+        with pytest.raises(SignedTokenError):
+            SignedTokenService.decode(token, SignedTokenService.REFRESH)
+
+    def test_expired_revoked_tokens_removed(self, base_user: AbstractUser):
+        """
+        GIVEN: Expired RevokedToken in database.
+        WHEN: SignedTokenService.revoke called for other refresh token.
+        THEN: Expired RevokedToken removed from database.
+        """
+        claims = SignedTokenService.decode(SignedTokenService.issue(base_user)["refresh"], SignedTokenService.REFRESH)
+        SignedTokenService.revoke({**claims, "jti": "expired", "exp": int(time.time()) - 1})
+
+        SignedTokenService.revoke(claims)
+
+        assert list(RevokedToken.objects.values_list("jti", flat=True)) == [claims["jti"]]
+
+    def test_refresh(self, base_user: AbstractUser):
+        """
+        GIVEN: Refresh token issued for User.
+        WHEN: SignedTokenService.refresh called twice for refresh token claims.
+        THEN: New tokens pair returned for first call, SignedTokenError raised for second one.
+        """
+        claims = SignedTokenService.decode(SignedTokenService.issue(base_user)["refresh"], SignedTokenService.REFRESH)
+
+        tokens = SignedTokenService.refresh(claims)
+
+        new_claims = SignedTokenService.decode(tokens["refresh"], SignedTokenService.REFRESH)
+        assert new_claims["uid"] == base_user.id
+        assert new_claims["jti"] != claims["jti"]
+        with pytest.raises(SignedTokenError) as exc:
+            SignedTokenService.refresh(claims)
+        assert str(exc.value) == "Token revoked."
+
+    def test_error_refresh_inactive_user(self, base_user: AbstractUser):
+        """
+        GIVEN: Refresh token issued for User, User deactivated.
+        WHEN: SignedTokenService.refresh called for refresh token claims.
+        THEN: SignedTokenError raised.
+        """
+        claims = SignedTokenService.decode(SignedTokenService.issue(base_user)["refresh"], SignedTokenService.REFRESH)
+        base_user.is_active = False
+        base_user.save()
+
+        with pytest.raises(SignedTokenError) as exc:
+            SignedTokenService.refresh(claims)
+        assert str(exc.value) == "User inactive or deleted."
@@ -0,0 +1,369 @@
+from typing import Any, Callable
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from app_infrastructure.services.signed_token_service import SignedTokenService
+
+ME_URL = reverse("app_users:me")
+
+
+def authenticate_with_token(api_client: APIClient, token: Token) -> None:
+    """Sets Authorization header with given Token on API client."""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    """Tests for CachedTokenAuthentication."""
+
+    def test_token_user_cached(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User with Token in database.
+        WHEN: AuthenticatedUserView called twice with Token in Authorization header.
+        THEN: Token and User fetched from database only on first request.
+        """
+        authenticate_with_token(api_client, Token.objects.create(user=base_user))
+
+        with CaptureQueriesContext(connection) as first_context:
+            first_response = api_client.get(ME_URL)
+        with CaptureQueriesContext(connection) as second_context:
+            second_response = api_client.get(ME_URL)
+
+        assert first_response.status_code == status.HTTP_200_OK
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data == {"name": base_user.name, "email": base_user.email}
+        assert len(first_context.captured_queries) == 1
+        assert len(second_context.captured_queries) == 0
+
+    def test_error_invalid_token(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User with Token in database.
+        WHEN: AuthenticatedUserView called with not existing token key.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        Token.objects.create(user=base_user)
+        api_client.credentials(HTTP_AUTHORIZATION="Token invalid")
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Invalid token."
+
+    @pytest.mark.parametrize(
+        "change_token",
+        [
+            lambda token: token.delete(),
+            lambda token: token.user.delete(),
+        ],
+    )
+    def test_cache_invalidated_on_token_delete(
+        self, api_client: APIClient, base_user: AbstractUser, change_token: Callable
+    ):
+        """
+        GIVEN: User authenticated with Token and authentication cached.
+        WHEN: Token or its User deleted.
+        THEN: Unauthorized HTTP 401 returned for next request with deleted Token.
+        """
+        token = Token.objects.create(user=base_user)
+        authenticate_with_token(api_client, token)
+        api_client.get(ME_URL)
+
+        change_token(token)
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Invalid token."
+
+    def test_cache_invalidated_on_token_regenerate(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User authenticated with Token and authentication cached.
+        WHEN: Token regenerated.
+        THEN: Unauthorized HTTP 401 returned for old Token, HTTP 200 returned for new Token.
+        """
+        old_token = Token.objects.create(user=base_user)
+        authenticate_with_token(api_client, old_token)
+        api_client.get(ME_URL)
+
+        old_token.delete()
+        new_token = Token.objects.create(user=base_user)
+        old_token_response = api_client.get(ME_URL)
+        authenticate_with_token(api_client, new_token)
+        new_token_response = api_client.get(ME_URL)
+
+        assert old_token_response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert new_token_response.status_code == status.HTTP_200_OK
+
+    def test_cache_invalidated_on_user_deactivate(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User authenticated with Token and authentication cached.
+        WHEN: User "is_active" flag set to False.
+        THEN: Unauthorized HTTP 401 returned for next request.
+        """
+        authenticate_with_token(api_client, Token.objects.create(user=base_user))
+        api_client.get(ME_URL)
+
+        base_user.is_active = False
+        base_user.save()
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "User inactive or deleted."
+
+    def test_cache_invalidated_on_password_change(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User authenticated with Token and authentication cached.
+        WHEN: User password changed.
+        THEN: Token and User fetched from database again on next request.
+        """
+        authenticate_with_token(api_client, Token.objects.create(user=base_user))
+        api_client.get(ME_URL)
+
+        base_user.set_password("new_password123!@#")
+        base_user.save()
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(context.captured_queries) == 1
+
+    def test_updated_user_data_returned(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: User authenticated with Token and authentication cached.
+        WHEN: User name updated with PATCH on AuthenticatedUserView.
+        THEN: Updated name returned on next request.
+        """
+        authenticate_with_token(api_client, Token.objects.create(user=base_user))
+        api_client.get(ME_URL)
+
+        api_client.patch(ME_URL, {"name": "New name"})
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["name"] == "New name"
+
+
+def authenticate_with_signed_token(api_client: APIClient, access_token: str) -> None:
+    """Sets Authorization header with given signed access token on API client."""
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("signed_tokens_enabled")
+class TestSignedTokenAuthentication:
+    """Tests for SignedTokenAuthentication."""
+
+    def test_budget_access_without_database_queries(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Signed access token issued for User being Budget member.
+        WHEN: BudgetingPeriodViewSet list view called with signed access token.
+        THEN: HTTP 200 returned, User authenticated and Budget access verified with token claims, without database
+        queries even with empty cache.
+        """
+        budget = budget_factory(members=[base_user])
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(reverse("budgets:period-list", args=[budget.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any(
+            table in query["sql"]
+            for query in context.captured_queries
+            for table in ('"app_users_user"', '"budgets_budget_members"', '"authtoken_token"')
+        )
+
+    def test_access_to_budget_joined_after_token_issue(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Signed access token issued for User, then User added to Budget members.
+        WHEN: BudgetingPeriodViewSet list view called with signed access token.
+        THEN: HTTP 200 returned - membership verified outside of token claims.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        budget = budget_factory(members=[base_user])
+
+        response = api_client.get(reverse("budgets:period-list", args=[budget.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_error_not_member_budget(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Signed access token issued for User and Budget without User as member.
+        WHEN: BudgetingPeriodViewSet list view called with signed access token.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory()
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+
+        response = api_client.get(reverse("budgets:period-list", args=[budget.id]))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_user_data_loaded(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed access token issued for User.
+        WHEN: AuthenticatedUserView called with signed access token.
+        THEN: HTTP 200 returned with User data.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"name": base_user.name, "email": base_user.email}
+
+    @pytest.mark.parametrize("shared_cache", [True, False])
+    def test_user_loaded_with_single_query(
+        self, api_client: APIClient, base_user: AbstractUser, settings: Any, shared_cache: bool
+    ):
+        """
+        GIVEN: Signed access token issued for User, shared cache enabled or disabled.
+        WHEN: AuthenticatedUserView called with signed access token.
+        THEN: HTTP 200 returned with User data. User fields loaded with single query.
+        """
+        settings.SHARED_CACHE_ENABLED = shared_cache
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"name": base_user.name, "email": base_user.email}
+        assert len([query for query in context.captured_queries if '"app_users_user"' in query["sql"]]) == 1
+
+    @pytest.mark.parametrize("header", ["Bearer", "Bearer invalid", "Bearer a b"])
+    def test_error_invalid_token(self, api_client: APIClient, header: str):
+        """
+        GIVEN: Malformed signed access token.
+        WHEN: AuthenticatedUserView called with malformed token.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        api_client.credentials(HTTP_AUTHORIZATION=header)
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_error_refresh_token_used(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed refresh token issued for User.
+        WHEN: AuthenticatedUserView called with refresh token instead of access token.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["refresh"])
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Invalid token."
+
+    def test_error_revoked_token(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed tokens issued for User, refresh token revoked.
+        WHEN: AuthenticatedUserView called with access token.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        tokens = SignedTokenService.issue(base_user)
+        SignedTokenService.revoke(SignedTokenService.decode(tokens["refresh"], SignedTokenService.REFRESH))
+        authenticate_with_signed_token(api_client, tokens["access"])
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Token revoked."
+
+    def test_error_revoked_token_without_shared_cache(
+        self, api_client: APIClient, base_user: AbstractUser, settings: Any
+    ):
+        """
+        GIVEN: Signed tokens issued for User, refresh token revoked and cache cleared. Shared cache disabled.
+        WHEN: AuthenticatedUserView called with access token.
+        THEN: Unauthorized HTTP 401 returned, as revocation is read from database.
+        """
+        settings.SHARED_CACHE_ENABLED = False
+        tokens = SignedTokenService.issue(base_user)
+        SignedTokenService.revoke(SignedTokenService.decode(tokens["refresh"], SignedTokenService.REFRESH))
+        cache.clear()
+        authenticate_with_signed_token(api_client, tokens["access"])
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "Token revoked."
+
+    @pytest.mark.parametrize("shared_cache", [True, False])
+    def test_error_inactive_user(
+        self, api_client: APIClient, base_user: AbstractUser, settings: Any, shared_cache: bool
+    ):
+        """
+        GIVEN: Signed access token issued for User, User deactivated afterwards.
+        WHEN: AuthenticatedUserView called with access token with shared cache enabled or disabled.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        settings.SHARED_CACHE_ENABLED = shared_cache
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        base_user.is_active = False
+        base_user.save()
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "User inactive or deleted."
+
+    def test_error_deleted_user(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed access token issued for User, User deleted afterwards.
+        WHEN: AuthenticatedUserView called with access token.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        base_user.delete()
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["detail"] == "User inactive or deleted."
+
+    def test_reactivated_user_authenticated(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed access token issued for User, User deactivated and activated again afterwards.
+        WHEN: AuthenticatedUserView called with access token.
+        THEN: OK HTTP 200 returned.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        base_user.is_active = False
+        base_user.save()
+        base_user.is_active = True
+        base_user.save()
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_skipped_when_disabled(self, api_client: APIClient, base_user: AbstractUser, settings: Any):
+        """
+        GIVEN: Signed access token issued for User. SIGNED_TOKENS_ENABLED setting not set.
+        WHEN: AuthenticatedUserView called with signed access token.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        authenticate_with_signed_token(api_client, SignedTokenService.issue(base_user)["access"])
+        settings.SIGNED_TOKENS_ENABLED = False
+
+        response = api_client.get(ME_URL)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
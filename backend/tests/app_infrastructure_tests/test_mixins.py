@@ -0,0 +1,484 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.mixins import ValuesListMixin
+from transfers.models.transfer_model import Transfer
+from transfers.serializers.transfer_serializer import TransferSerializer
+
+
+@pytest.fixture
+def serialization_functions(
+    budget_factory: FactoryMetaClass, income_factory: FactoryMetaClass
+) -> tuple[Callable[[], list], Callable[[], list]]:
+    """
+    Creates 1000 Transfers and returns functions serializing them with ValuesListMixin and with TransferSerializer.
+    """
+    budget = budget_factory()
+    income = income_factory(budget=budget)
+    Transfer.objects.bulk_create(
+        Transfer(
+            name=f"Transfer {index}",
+            value=Decimal("10.00") + index,
+            date=income.period.date_start + timedelta(days=index % 2),
+            period_id=income.period_id,
+            entity_id=income.entity_id,
+            deposit_id=income.deposit_id,
+            category_id=income.category_id,
+        )
+        for index in range(999)
+    )
+    queryset = Transfer.objects.filter(period__budget=budget).order_by("id")
+    fields = [
+        (
+            name,
+            field.source,
+            None if name in ("period", "entity", "deposit", "category") else field.to_representation,
+        )
+        for name, field in TransferSerializer().fields.items()
+    ]
+
+    instances = list(queryset)
+    rows = list(queryset.values(*(field[1] for field in fields)))
+
+    def serialize_instances() -> list:
+        return TransferSerializer(instances, many=True).data
+
+    def serialize_values() -> list:
+        return ValuesListMixin.serialize_values(rows, fields)
+
+    return serialize_values, serialize_instances
+
+
+@pytest.mark.django_db
+class TestBudgetETagMixin:
+    """Tests for BudgetETagMixin."""
+
+    @pytest.mark.parametrize("url_name", ["budgets:period-list", "budgets:entity-list", "budgets:income-list"])
+    def test_etag_returned(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass, url_name: str
+    ):
+        """
+        GIVEN: Budget with User as member.
+        WHEN: Budget nested list endpoint called.
+        THEN: HTTP 200 returned with weak ETag header.
+        """
+        budget = budget_factory(members=[base_user])
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(reverse(url_name, args=[budget.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('W/"')
+
+    def test_not_modified_without_queryset_queries(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod of Budget with User as member, ETag of list response known.
+        WHEN: BudgetingPeriodViewSet list view called with matching "If-None-Match" header.
+        THEN: Empty HTTP 304 returned with the same ETag, BudgetingPeriods not queried.
+        """
+        budget = budget_factory(members=[base_user])
+        budgeting_period_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:period-list", args=[budget.id])
+        etag = api_client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert not response.content
+        assert not any('"budgets_budgetingperiod"' in query["sql"] for query in context.captured_queries)
+
+    def test_not_modified_detail(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Entity of Budget with User as member, ETag of detail response known.
+        WHEN: EntityViewSet detail view called with matching "If-None-Match" header.
+        THEN: HTTP 304 returned.
+        """
+        budget = budget_factory(members=[base_user])
+        entity = entity_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-detail", args=[budget.id, entity.id])
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_changed_after_write(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with User as member, ETag of Entities list response known.
+        WHEN: Entity created in Budget and list called with previous ETag in "If-None-Match" header.
+        THEN: HTTP 200 returned with new Entity and new ETag.
+        """
+        budget = budget_factory(members=[base_user])
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-list", args=[budget.id])
+        etag = api_client.get(url)["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            entity_factory(budget=budget)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response["ETag"] != etag
+
+    def test_etag_depends_on_query_params(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget with User as member, ETag of Entities list response known.
+        WHEN: Entities list called with other query params and previous ETag in "If-None-Match" header.
+        THEN: HTTP 200 returned with different ETag.
+        """
+        budget = budget_factory(members=[base_user])
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-list", args=[budget.id])
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, {"name": "Entity"}, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_etag_depends_on_user(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        user_factory: FactoryMetaClass,
+        budget_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with two Users as members, ETag of Entities list response for first User known.
+        WHEN: Entities list called by second User with first User ETag in "If-None-Match" header.
+        THEN: HTTP 200 returned with different ETag.
+        """
+        other_user = user_factory()
+        budget = budget_factory(members=[base_user, other_user])
+        url = reverse("budgets:entity-list", args=[budget.id])
+        api_client.force_authenticate(base_user)
+        etag = api_client.get(url)["ETag"]
+
+        api_client.force_authenticate(other_user)
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_error_not_member_with_etag(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget without User as member.
+        WHEN: Budget nested list endpoint called with "If-None-Match: *" header.
+        THEN: Forbidden HTTP 403 returned without ETag header.
+        """
+        budget = budget_factory()
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(reverse("budgets:entity-list", args=[budget.id]), HTTP_IF_NONE_MATCH="*")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert "ETag" not in response
+
+
+@pytest.mark.django_db
+class TestBudgetListCacheMixin:
+    """Tests for BudgetListCacheMixin."""
+
+    def test_cached_response_returned_without_queryset_queries(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Entity of Budget with User as member, Entities list called once.
+        WHEN: EntityViewSet list view called again.
+        THEN: HTTP 200 returned with the same data, Entities not queried.
+        """
+        budget = budget_factory(members=[base_user])
+        entity_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-list", args=[budget.id])
+        first_response = api_client.get(url)
+
+        with CaptureQueriesContext(connection) as context:
+            second_response = api_client.get(url)
+
+        assert second_response.status_code == status.HTTP_200_OK
+        assert second_response.data == first_response.data
+        assert not any('"entities_entity"' in query["sql"] for query in context.captured_queries)
+
+    def test_cache_invalidated_on_write(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Budget with User as member, BudgetingPeriods list response cached.
+        WHEN: BudgetingPeriod created and list called again.
+        THEN: HTTP 200 returned with created BudgetingPeriod.
+        """
+        budget = budget_factory(members=[base_user])
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:period-list", args=[budget.id])
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            period = budgeting_period_factory(budget=budget)
+        response = api_client.get(url)
+
+        assert [item["id"] for item in response.data["results"]] == [period.id]
+
+    def test_cache_kept_on_write_to_other_resource(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Callable,
+    ):
+        """
+        GIVEN: Entity of Budget with User as member, Entities list response cached.
+        WHEN: Income created in Budget with existing Entity and Entities list called again.
+        THEN: HTTP 200 returned from cache, Entities not queried.
+        """
+        budget = budget_factory(members=[base_user])
+        entity = entity_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-list", args=[budget.id])
+        income = income_factory(budget=budget, entity=entity)
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            income_factory(
+                budget=budget, period=income.period, entity=entity, deposit=income.deposit, category=income.category
+            )
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any('"entities_entity"' in query["sql"] for query in context.captured_queries)
+
+    def test_data_versions_read_once_per_request(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Entity of Budget with User as member, no data versions cached.
+        WHEN: EntityViewSet list view called.
+        THEN: Budget data versions read from database with single query for ETag and list cache key.
+        """
+        budget = budget_factory(members=[base_user])
+        entity_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(reverse("budgets:entity-list", args=[budget.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len([query for query in context.captured_queries if "data_version" in query["sql"]]) == 1
+
+    def test_query_params_order_normalized(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Entities of Budget with User as member, Entities list called with two query params.
+        WHEN: Entities list called with the same query params in other order and with other page.
+        THEN: Cached response returned for reordered params, fresh response for other page.
+        """
+        budget = budget_factory(members=[base_user])
+        entity_factory(budget=budget, name="Shop")
+        entity_factory(budget=budget, name="Bank")
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:entity-list", args=[budget.id])
+        first_response = api_client.get(f"{url}?page=1&page_size=1")
+
+        with CaptureQueriesContext(connection) as context:
+            reordered_response = api_client.get(f"{url}?page_size=1&page=1")
+        other_response = api_client.get(f"{url}?page_size=1&page=2")
+
+        assert not any('"entities_entity"' in query["sql"] for query in context.captured_queries)
+        assert reordered_response.data == first_response.data
+        assert other_response.data["results"] != first_response.data["results"]
+
+    def test_cache_not_shared_between_users(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        user_factory: FactoryMetaClass,
+        budget_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with two Users as members, Entities list response cached for first User.
+        WHEN: Entities list called by second User.
+        THEN: Entities queried from database.
+        """
+        other_user = user_factory()
+        budget = budget_factory(members=[base_user, other_user])
+        url = reverse("budgets:entity-list", args=[budget.id])
+        api_client.force_authenticate(base_user)
+        api_client.get(url)
+        api_client.force_authenticate(other_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert any('"entities_entity"' in query["sql"] for query in context.captured_queries)
+
+
+@pytest.mark.django_db
+class TestValuesListMixin:
+    """Tests for ValuesListMixin."""
+
+    @pytest.mark.parametrize(
+        "url_name, query_params",
+        [
+            ("budgets:income-list", {}),
+            ("budgets:income-list", {"running_balance": "true", "ordering": "-value"}),
+            ("budgets:expense-list", {"page_size": 2}),
+            ("budgets:income_category-list", {}),
+            ("budgets:expense_category-list", {}),
+            ("budgets:expense_prediction-list", {"ordering": "period__name", "page_size": 2}),
+            ("budgets:entity-list", {}),
+            ("budgets:deposit-list", {}),
+        ],
+    )
+    def test_same_output_as_serializer(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        monkeypatch: pytest.MonkeyPatch,
+        url_name: str,
+        query_params: dict,
+    ):
+        """
+        GIVEN: Budget with User as member and Transfers, ExpensePredictions, TransferCategories and Entities.
+        WHEN: List endpoint called with values() path enabled and disabled.
+        THEN: Byte-identical response content returned for both calls.
+        """
+        budget = budget_factory(members=[base_user])
+        for _ in range(3):
+            income_factory(budget=budget)
+            expense_factory(budget=budget, description=None)
+            expense_prediction_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+        url = reverse(url_name, args=[budget.id])
+
+        values_response = api_client.get(url, query_params)
+        cache.clear()
+        monkeypatch.setattr(ValuesListMixin, "values_list_enabled", False)
+        serializer_response = api_client.get(url, query_params)
+
+        assert values_response.status_code == serializer_response.status_code == status.HTTP_200_OK
+        assert values_response.content == serializer_response.content
+
+    def test_keyset_pagination_links(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with User as member and three Incomes.
+        WHEN: Incomes list called with keyset pagination ordered by related field, following "next" links.
+        THEN: All Incomes returned once in expected order.
+        """
+        budget = budget_factory(members=[base_user])
+        incomes = [income_factory(budget=budget) for _ in range(3)]
+        api_client.force_authenticate(base_user)
+        url = reverse("budgets:income-list", args=[budget.id])
+
+        ids = []
+        response = api_client.get(url, {"pagination": "cursor", "page_size": 1, "ordering": "category__name"})
+        while True:
+            ids.extend(item["id"] for item in response.data["results"])
+            if not response.data["next"]:
+                break
+            assert "cursor=" in response.data["next"]
+            assert "page=" not in response.data["next"]
+            response = api_client.get(response.data["next"])
+
+        assert ids == [income.id for income in sorted(incomes, key=lambda income: (income.category.name, income.id))]
+
+    def test_values_serialization_same_as_serializer(self, serialization_functions: tuple[Callable, Callable]):
+        """
+        GIVEN: 1000 Transfers in database.
+        WHEN: Fetched Transfers serialized with ValuesListMixin and with TransferSerializer.
+        THEN: The same data returned.
+        """
+        serialize_values, serialize_instances = serialization_functions
+
+        assert serialize_values() == serialize_instances()
+
+    @pytest.mark.slow
+    def test_values_serialization_faster_than_serializer(self, serialization_functions: tuple[Callable, Callable]):
+        """
+        GIVEN: 1000 Transfers in database.
+        WHEN: Fetched Transfers serialized with ValuesListMixin and with TransferSerializer.
+        THEN: ValuesListMixin at least twice as fast.
+        """
+        serialize_values, serialize_instances = serialization_functions
+
+        def best_time(function: Callable) -> float:
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                function()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert best_time(serialize_values) * 2 < best_time(serialize_instances)
@@ -0,0 +1,255 @@
+import json
+from base64 import b64encode
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from transfers.models.expense_model import Expense
+from transfers.views.transfer_viewset import TransferViewSet
+
+
+def expenses_url(budget_id):
+    """Create and return an Expense list URL."""
+    return reverse("budgets:expense-list", args=[budget_id])
+
+
+def expense_predictions_url(budget_id):
+    """Create and return an ExpensePrediction list URL."""
+    return reverse("budgets:expense_prediction-list", args=[budget_id])
+
+
+def collect_pages(api_client: APIClient, url: str, params: dict) -> tuple[list[int], list[dict]]:
+    """
+    Follows "next" links of keyset paginated endpoint and collects returned ids.
+
+    Args:
+        api_client [APIClient]: Authenticated API client.
+        url [str]: URL of list endpoint.
+        params [dict]: Query params for first request.
+
+    Returns:
+        tuple[list[int], list[dict]]: Ids of all returned objects and list of responses data.
+    """
+    ids, pages = [], []
+    response = api_client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        ids.extend(item["id"] for item in response.data["results"])
+        if not response.data["next"]:
+            break
+        response = api_client.get(response.data["next"])
+    return ids, pages
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    """Tests for keyset pagination mode of list endpoints."""
+
+    @pytest.mark.parametrize("ordering", TransferViewSet.ordering_fields)
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_traverse_all_pages(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+        ordering: str,
+        descending: bool,
+    ):
+        """
+        GIVEN: Seven Expense model instances with repeated values for Budget in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor" and following "next" links.
+        THEN: All Expenses returned exactly once, ordered by given field and id.
+        """
+        budget = budget_factory(owner=base_user)
+        for value in [10, 20, 10, 30, 10, 20, 40]:
+            expense_factory(budget=budget, value=Decimal(value))
+        api_client.force_authenticate(base_user)
+        ordering_param = f"-{ordering}" if descending else ordering
+
+        ids, pages = collect_pages(
+            api_client, expenses_url(budget.id), {"pagination": "cursor", "ordering": ordering_param, "page_size": 2}
+        )
+
+        expected_ids = list(
+            Expense.objects.filter(period__budget=budget).order_by(ordering_param, "id").values_list("id", flat=True)
+        )
+        assert len(pages) == 4
+        assert ids == expected_ids
+
+    def test_ties_resolved_with_id(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Five Expense model instances with the same value for Budget in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor" ordered by value.
+        THEN: Expenses with the same value returned in ascending id order across pages.
+        """
+        budget = budget_factory(owner=base_user)
+        expense_ids = [expense_factory(budget=budget, value=Decimal("10.00")).id for _ in range(5)]
+        api_client.force_authenticate(base_user)
+
+        ids, _ = collect_pages(
+            api_client, expenses_url(budget.id), {"pagination": "cursor", "ordering": "value", "page_size": 2}
+        )
+
+        assert ids == sorted(expense_ids)
+
+    def test_previous_link(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Five Expense model instances for Budget in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor", following "next" and then "previous" link.
+        THEN: Previous link returns the same results as first page.
+        """
+        budget = budget_factory(owner=base_user)
+        for _ in range(5):
+            expense_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+
+        first_page = api_client.get(
+            expenses_url(budget.id), {"pagination": "cursor", "ordering": "-date", "page_size": 2}
+        )
+        second_page = api_client.get(first_page.data["next"])
+        previous_page = api_client.get(second_page.data["previous"])
+
+        assert first_page.data["previous"] is None
+        assert second_page.data["previous"] is not None
+        assert previous_page.data["results"] == first_page.data["results"]
+        assert previous_page.data["previous"] is None
+
+    def test_no_count_query(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense model instances for Budget in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor".
+        THEN: Response without "count" returned and no COUNT query executed.
+        """
+        budget = budget_factory(owner=base_user)
+        for _ in range(3):
+            expense_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(expenses_url(budget.id), {"pagination": "cursor", "page_size": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert not any("COUNT(" in query["sql"] for query in context.captured_queries)
+
+    @pytest.mark.parametrize("cursor", ["invalid", "eyJwIjogWzFdfQ==", "eyJwIjogWzEsIDIsIDNdLCAiciI6IGZhbHNlfQ=="])
+    def test_error_invalid_cursor(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass, cursor: str
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor" and malformed cursor.
+        THEN: Not found HTTP 404 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expenses_url(budget.id), {"pagination": "cursor", "cursor": cursor})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["detail"] == "Invalid cursor."
+
+    @pytest.mark.parametrize(
+        "ordering, position",
+        [("date", ["not-a-date", 1]), ("value", ["abc", 1]), ("id", ["abc"]), ("period", [[1], 1])],
+    )
+    def test_error_invalid_cursor_position_value(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        ordering: str,
+        position: list,
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet list view called with "pagination=cursor" and cursor containing position values not
+        valid for ordering fields.
+        THEN: Not found HTTP 404 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        cursor = b64encode(json.dumps({"p": position, "r": 0}).encode("utf-8"), altchars=b"-_").decode("ascii")
+
+        response = api_client.get(
+            expenses_url(budget.id), {"pagination": "cursor", "cursor": cursor, "ordering": ordering}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["detail"] == "Invalid cursor."
+
+    def test_page_number_pagination_by_default(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense model instances for Budget in database.
+        WHEN: ExpenseViewSet list view called without "pagination" query param.
+        THEN: Page number paginated response returned.
+        """
+        budget = budget_factory(owner=base_user)
+        for _ in range(3):
+            expense_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expenses_url(budget.id), {"page_size": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 3
+        assert len(response.data["results"]) == 2
+
+    @pytest.mark.parametrize("ordering", ["period__name", "-category__priority", "value"])
+    def test_expense_predictions_traverse_all_pages(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        ordering: str,
+    ):
+        """
+        GIVEN: Five ExpensePrediction model instances for Budget in database.
+        WHEN: ExpensePredictionViewSet list view called with "pagination=cursor" and following "next" links.
+        THEN: All ExpensePredictions returned exactly once.
+        """
+        budget = budget_factory(owner=base_user)
+        prediction_ids = [expense_prediction_factory(budget=budget).id for _ in range(5)]
+        api_client.force_authenticate(base_user)
+
+        ids, _ = collect_pages(
+            api_client,
+            expense_predictions_url(budget.id),
+            {"pagination": "cursor", "ordering": ordering, "page_size": 2},
+        )
+
+        assert sorted(ids) == sorted(prediction_ids)
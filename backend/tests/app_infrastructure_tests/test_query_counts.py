@@ -0,0 +1,257 @@
+"""
+Query count limits for list, summary and aggregation endpoints of budgets app.
+
+Every endpoint declares maximum number of database queries executed for single request. Limit is checked for
+one and for many listed or aggregated objects, so adding rows to database never adds queries (no N+1). Limits of
+Budget nested endpoints include reading Budget data version for ETag, which is executed only with empty cache.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from budgets.models import Budget, BudgetingPeriod
+from categories.models import TransferCategory
+from categories.models.transfer_category_choices import CategoryType, ExpenseCategoryPriority, IncomeCategoryPriority
+from entities.models import Entity
+from predictions.models.expense_prediction_model import ExpensePrediction
+from transfers.models.transfer_model import Transfer
+
+LIST_SIZES = (1, 500)
+
+
+def create_budgets(budget: Budget, user: AbstractUser, size: int) -> None:
+    """Creates Budgets with given User and other User as members."""
+    other_users = [get_user_model().objects.create_user("member@example.com", "member123!@#")]
+    budgets = Budget.objects.bulk_create(
+        Budget(name=f"Budget {index}", owner=user, currency="PLN") for index in range(size - 1)
+    )
+    Budget.members.through.objects.bulk_create(
+        Budget.members.through(budget_id=item.id, user_id=member.id)
+        for item in budgets
+        for member in [user, *other_users]
+    )
+    budget.members.add(*other_users)
+
+
+def create_periods(budget: Budget, user: AbstractUser, size: int) -> None:
+    """Creates BudgetingPeriods for Budget."""
+    BudgetingPeriod.objects.bulk_create(
+        BudgetingPeriod(
+            budget=budget,
+            name=f"Period {index}",
+            date_start=date(2000, 1, 1) + timedelta(days=2 * index),
+            date_end=date(2000, 1, 2) + timedelta(days=2 * index),
+        )
+        for index in range(size)
+    )
+
+
+def create_entities(is_deposit: bool) -> Callable:
+    """Returns function creating Entities or Deposits for Budget."""
+
+    def create(budget: Budget, user: AbstractUser, size: int) -> None:
+        Entity.objects.bulk_create(
+            Entity(budget=budget, name=f"Entity {index}", is_deposit=is_deposit) for index in range(size)
+        )
+
+    return create
+
+
+def create_categories(category_type: CategoryType) -> Callable:
+    """Returns function creating TransferCategories of given type for Budget."""
+    priority = (
+        IncomeCategoryPriority.REGULAR if category_type == CategoryType.INCOME else ExpenseCategoryPriority.OTHERS
+    )
+
+    def create(budget: Budget, user: AbstractUser, size: int) -> None:
+        TransferCategory.objects.bulk_create(
+            TransferCategory(
+                budget=budget,
+                name=f"Category {index}",
+                category_type=category_type,
+                priority=priority,
+                owner=user if index % 2 else None,
+            )
+            for index in range(size)
+        )
+
+    return create
+
+
+def create_predictions(budget: Budget, user: AbstractUser, size: int) -> None:
+    """Creates ExpensePredictions for Budget."""
+    create_periods(budget, user, 1)
+    create_categories(CategoryType.EXPENSE)(budget, user, size)
+    period = BudgetingPeriod.objects.get(budget=budget)
+    ExpensePrediction.objects.bulk_create(
+        ExpensePrediction(period=period, category=category, value=Decimal("10.00"))
+        for category in TransferCategory.objects.filter(budget=budget)
+    )
+
+
+def create_transfers(category_type: CategoryType, split: bool = False) -> Callable:
+    """Returns function creating Transfers of given type for Budget, optionally with separate category each."""
+
+    def create(budget: Budget, user: AbstractUser, size: int) -> None:
+        create_periods(budget, user, 1)
+        create_categories(category_type)(budget, user, size if split else 1)
+        period = BudgetingPeriod.objects.get(budget=budget)
+        entity = Entity.objects.create(budget=budget, name="Entity", is_deposit=False)
+        deposit = Entity.objects.create(budget=budget, name="Deposit", is_deposit=True)
+        categories = list(TransferCategory.objects.filter(budget=budget))
+        Transfer.objects.bulk_create(
+            Transfer(
+                name=f"Transfer {index}",
+                value=Decimal("10.00"),
+                date=period.date_start,
+                period=period,
+                entity=entity,
+                deposit=deposit,
+                category=categories[index % len(categories)],
+            )
+            for index in range(size)
+        )
+
+    return create
+
+
+def create_predictions_with_expenses(budget: Budget, user: AbstractUser, size: int) -> None:
+    """Creates ExpensePredictions for Budget with Expense for every predicted category."""
+    create_predictions(budget, user, size)
+    period = BudgetingPeriod.objects.get(budget=budget)
+    entity = Entity.objects.create(budget=budget, name="Entity", is_deposit=False)
+    deposit = Entity.objects.create(budget=budget, name="Deposit", is_deposit=True)
+    Transfer.objects.bulk_create(
+        Transfer(
+            name=f"Transfer {prediction.category_id}",
+            value=Decimal("5.00"),
+            date=period.date_start,
+            period=period,
+            entity=entity,
+            deposit=deposit,
+            category_id=prediction.category_id,
+        )
+        for prediction in ExpensePrediction.objects.filter(period=period)
+    )
+
+
+def period_args(budget: Budget) -> list[int]:
+    """Returns URL args of Budget BudgetingPeriod detail endpoints."""
+    return [budget.id, BudgetingPeriod.objects.get(budget=budget).id]
+
+
+def period_params(budget: Budget) -> dict:
+    """Returns query params selecting Budget BudgetingPeriod."""
+    return {"period": BudgetingPeriod.objects.get(budget=budget).id}
+
+
+ENDPOINT_QUERY_LIMITS = {
+    "budgets:budget-list": (create_budgets, 3),
+    "budgets:budget-owned": (create_budgets, 2),
+    "budgets:budget-membered": (create_budgets, 2),
+    "budgets:period-list": (create_periods, 4),
+    "budgets:deposit-list": (create_entities(is_deposit=True), 4),
+    "budgets:entity-list": (create_entities(is_deposit=False), 4),
+    "budgets:income_category-list": (create_categories(CategoryType.INCOME), 4),
+    "budgets:expense_category-list": (create_categories(CategoryType.EXPENSE), 4),
+    "budgets:expense_prediction-list": (create_predictions, 4),
+    "budgets:income-list": (create_transfers(CategoryType.INCOME), 4),
+    "budgets:expense-list": (create_transfers(CategoryType.EXPENSE), 4),
+    "budgets:deposit-balances": (create_entities(is_deposit=True), 4),
+}
+
+
+AGGREGATE_ENDPOINT_QUERY_LIMITS = {
+    "budgets:period-summary": (create_transfers(CategoryType.EXPENSE, split=True), period_args, None, 3),
+    "budgets:expense_prediction-progress": (create_predictions_with_expenses, None, period_params, 3),
+    "budgets:income-autocomplete": (create_transfers(CategoryType.INCOME), None, lambda budget: {"q": "Tr"}, 4),
+    "budgets:expense-autocomplete": (create_transfers(CategoryType.EXPENSE), None, lambda budget: {"q": "Tr"}, 4),
+    "budgets:income-export": (create_transfers(CategoryType.INCOME), None, None, 2),
+    "budgets:expense-export": (create_transfers(CategoryType.EXPENSE), None, None, 2),
+    "budgets:transfer-aggregate": (
+        create_transfers(CategoryType.EXPENSE, split=True),
+        None,
+        lambda budget: {"group_by": "category,deposit", "measures": "sum,count,avg"},
+        3,
+    ),
+    "budgets:transfer-series": (
+        create_transfers(CategoryType.EXPENSE, split=True),
+        None,
+        lambda budget: {"interval": "day", "split_by": "deposit"},
+        3,
+    ),
+}
+
+
+@pytest.mark.django_db
+class TestEndpointsQueryCounts:
+    """Tests for number of database queries executed by list endpoints."""
+
+    @pytest.mark.parametrize("size", LIST_SIZES)
+    @pytest.mark.parametrize("url_name", ENDPOINT_QUERY_LIMITS.keys())
+    def test_queries_count_within_limit(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        django_assert_max_num_queries: Callable,
+        url_name: str,
+        size: int,
+    ):
+        """
+        GIVEN: Given number of objects listed by endpoint in database.
+        WHEN: List endpoint called by Budget member with page size covering all objects.
+        THEN: HTTP 200 returned with all objects. Number of executed queries not greater than endpoint limit.
+        """
+        budget = budget_factory(owner=base_user)
+        create_objects, max_queries = ENDPOINT_QUERY_LIMITS[url_name]
+        create_objects(budget, base_user, size)
+        url = reverse(url_name) if url_name.startswith("budgets:budget-") else reverse(url_name, args=[budget.id])
+        api_client.force_authenticate(base_user)
+
+        with django_assert_max_num_queries(max_queries):
+            response = api_client.get(url, {"page_size": max(LIST_SIZES)})
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"] if isinstance(response.data, dict) else response.data
+        assert len(results) == size
+
+    @pytest.mark.parametrize("size", LIST_SIZES)
+    @pytest.mark.parametrize("url_name", AGGREGATE_ENDPOINT_QUERY_LIMITS.keys())
+    def test_aggregate_queries_count_within_limit(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        django_assert_max_num_queries: Callable,
+        url_name: str,
+        size: int,
+    ):
+        """
+        GIVEN: Given number of objects summarized or aggregated by endpoint in database.
+        WHEN: Summary, aggregation, autocomplete or export endpoint called by Budget member.
+        THEN: HTTP 200 returned. Number of executed queries, including queries executed while streaming response
+        content, not greater than endpoint limit.
+        """
+        budget = budget_factory(owner=base_user)
+        create_objects, get_args, get_params, max_queries = AGGREGATE_ENDPOINT_QUERY_LIMITS[url_name]
+        create_objects(budget, base_user, size)
+        url = reverse(url_name, args=get_args(budget) if get_args else [budget.id])
+        params = get_params(budget) if get_params else {}
+        api_client.force_authenticate(base_user)
+
+        with django_assert_max_num_queries(max_queries):
+            response = api_client.get(url, params)
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        assert response.status_code == status.HTTP_200_OK
@@ -29,6 +29,33 @@ class TestCreateTokenView:
         assert "token" in response.data
         assert response.status_code == status.HTTP_200_OK
 
+    def test_signed_tokens_not_returned_by_default(self, api_client: APIClient):
+        """
+        GIVEN: User payload for AuthToken creation. SIGNED_TOKENS_ENABLED setting not set.
+        WHEN: CreateTokenView.post() called with given data.
+        THEN: Only AuthToken returned.
+        """
+        get_user_model().objects.create_user(**self.payload, name="TEST_USER")
+
+        response = api_client.post(TOKEN_URL, self.payload)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"token"}
+
+    @pytest.mark.usefixtures("signed_tokens_enabled")
+    def test_create_signed_tokens(self, api_client: APIClient):
+        """
+        GIVEN: User payload for AuthToken creation. SIGNED_TOKENS_ENABLED setting set.
+        WHEN: CreateTokenView.post() called with given data.
+        THEN: AuthToken and signed access and refresh tokens returned.
+        """
+        get_user_model().objects.create_user(**self.payload, name="TEST_USER")
+
+        response = api_client.post(TOKEN_URL, self.payload)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"token", "access", "refresh"}
+
     def test_create_token_bad_credentials(self, api_client: APIClient):
         """
         GIVEN: User invalid payload for AuthToken creation.
@@ -0,0 +1,73 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.services.signed_token_service import SignedTokenService
+
+REFRESH_URL: str = reverse("app_users:token-refresh")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("signed_tokens_enabled")
+class TestRefreshTokenView:
+    """Tests for RefreshTokenView"""
+
+    def test_refresh_tokens(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed refresh token issued for User.
+        WHEN: RefreshTokenView.post() called with refresh token.
+        THEN: HTTP 200 returned with new access and refresh tokens, old refresh token revoked.
+        """
+        refresh_token = SignedTokenService.issue(base_user)["refresh"]
+
+        response = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+        second_response = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"access", "refresh"}
+        assert SignedTokenService.decode(response.data["access"], SignedTokenService.ACCESS)["uid"] == base_user.id
+        assert second_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert second_response.data["detail"]["refresh"][0] == "Token revoked."
+
+    def test_error_invalid_refresh_token(self, api_client: APIClient):
+        """
+        GIVEN: Malformed refresh token.
+        WHEN: RefreshTokenView.post() called with malformed token.
+        THEN: Bad request HTTP 400 returned.
+        """
+        response = api_client.post(REFRESH_URL, {"refresh": "invalid"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["refresh"][0] == "Invalid token."
+
+    def test_error_inactive_user(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed refresh token issued for User, User deactivated.
+        WHEN: RefreshTokenView.post() called with refresh token.
+        THEN: Bad request HTTP 400 returned.
+        """
+        refresh_token = SignedTokenService.issue(base_user)["refresh"]
+        base_user.is_active = False
+        base_user.save()
+
+        response = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["refresh"][0] == "User inactive or deleted."
+
+    def test_error_disabled(self, api_client: APIClient, base_user: AbstractUser, settings: Any):
+        """
+        GIVEN: Signed refresh token issued for User. SIGNED_TOKENS_ENABLED setting not set.
+        WHEN: RefreshTokenView.post() called with refresh token.
+        THEN: Not found HTTP 404 returned.
+        """
+        refresh_token = SignedTokenService.issue(base_user)["refresh"]
+        settings.SIGNED_TOKENS_ENABLED = False
+
+        response = api_client.post(REFRESH_URL, {"refresh": refresh_token})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
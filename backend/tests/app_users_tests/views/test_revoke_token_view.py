@@ -0,0 +1,61 @@
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app_infrastructure.services.signed_token_service import SignedTokenService
+from app_users.models import RevokedToken
+
+REVOKE_URL: str = reverse("app_users:token-revoke")
+ME_URL: str = reverse("app_users:me")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("signed_tokens_enabled")
+class TestRevokeTokenView:
+    """Tests for RevokeTokenView"""
+
+    def test_revoke_token(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed tokens issued for User.
+        WHEN: RevokeTokenView.post() called with refresh token.
+        THEN: HTTP 204 returned, RevokedToken created, access token denied.
+        """
+        tokens = SignedTokenService.issue(base_user)
+
+        response = api_client.post(REVOKE_URL, {"refresh": tokens["refresh"]})
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert RevokedToken.objects.count() == 1
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        assert api_client.get(ME_URL).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_error_revoked_token(self, api_client: APIClient, base_user: AbstractUser):
+        """
+        GIVEN: Signed refresh token issued for User and revoked.
+        WHEN: RevokeTokenView.post() called with revoked refresh token.
+        THEN: Bad request HTTP 400 returned.
+        """
+        refresh_token = SignedTokenService.issue(base_user)["refresh"]
+        api_client.post(REVOKE_URL, {"refresh": refresh_token})
+
+        response = api_client.post(REVOKE_URL, {"refresh": refresh_token})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["refresh"][0] == "Token revoked."
+
+    def test_error_disabled(self, api_client: APIClient, base_user: AbstractUser, settings: Any):
+        """
+        GIVEN: Signed refresh token issued for User. SIGNED_TOKENS_ENABLED setting not set.
+        WHEN: RevokeTokenView.post() called with refresh token.
+        THEN: Not found HTTP 404 returned.
+        """
+        refresh_token = SignedTokenService.issue(base_user)["refresh"]
+        settings.SIGNED_TOKENS_ENABLED = False
+
+        response = api_client.post(REVOKE_URL, {"refresh": refresh_token})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
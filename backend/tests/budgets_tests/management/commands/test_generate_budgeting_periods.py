@@ -0,0 +1,60 @@
+from datetime import date
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from budgets.models.budget_model import Budget
+from budgets.models.budgeting_period_model import BudgetingPeriod
+
+
+@pytest.mark.django_db
+class TestGenerateBudgetingPeriodsCommand:
+    """Tests for generate_budgeting_periods admin command."""
+
+    def test_generate_periods(self, budget: Budget):
+        """
+        GIVEN: Budget without BudgetingPeriods.
+        WHEN: generate_budgeting_periods command called for 12 monthly periods.
+        THEN: 12 BudgetingPeriods created in database.
+        """
+        call_command("generate_budgeting_periods", budget=budget.pk, date_start="2024-01-01", count=12)
+
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 12
+        assert BudgetingPeriod.objects.filter(budget=budget).order_by("date_start").last().date_end == date(
+            2024, 12, 31
+        )
+
+    def test_error_not_existing_budget(self):
+        """
+        GIVEN: No Budget in database.
+        WHEN: generate_budgeting_periods command called for not existing Budget.
+        THEN: CommandError raised.
+        """
+        with pytest.raises(CommandError, match="Budget with id 1 does not exist."):
+            call_command("generate_budgeting_periods", budget=1, date_start="2024-01-01", count=12)
+
+    def test_error_invalid_arguments(self, budget: Budget):
+        """
+        GIVEN: Budget in database.
+        WHEN: generate_budgeting_periods command called with custom frequency without days.
+        THEN: CommandError raised. No period created.
+        """
+        with pytest.raises(CommandError, match="days: Periods length has to be given for custom frequency."):
+            call_command(
+                "generate_budgeting_periods", budget=budget.pk, date_start="2024-01-01", count=2, frequency="custom"
+            )
+        assert not BudgetingPeriod.objects.filter(budget=budget).exists()
+
+    def test_error_collisions(self, budget: Budget):
+        """
+        GIVEN: Budget with BudgetingPeriod for January 2024.
+        WHEN: generate_budgeting_periods command called for periods starting in January 2024.
+        THEN: CommandError raised. No period created.
+        """
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2024_01", date_start=date(2024, 1, 1), date_end=date(2024, 1, 31)
+        )
+
+        with pytest.raises(CommandError, match="Generated periods contain 1 collisions."):
+            call_command("generate_budgeting_periods", budget=budget.pk, date_start="2024-01-01", count=2)
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 1
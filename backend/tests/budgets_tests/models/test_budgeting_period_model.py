@@ -2,7 +2,8 @@ from datetime import date
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import DataError, IntegrityError
+from django.db import DataError, IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from factory.base import FactoryMetaClass
 
 from budgets.models.budget_model import Budget
@@ -276,3 +277,66 @@ class TestBudgetingPeriodModel:
         assert exc.value.code == "period-range-invalid"
         assert exc.value.message == "date_start: Period date range collides with other period in Budget."
         assert BudgetingPeriod.objects.filter(budget=budget).count() == 2
+
+    def test_error_date_invalid_on_update(self, budget: Budget):
+        """
+        GIVEN: Two BudgetingPeriods for single Budget in database created.
+        WHEN: BudgetingPeriod instance update attempt with date range colliding with other BudgetingPeriod.
+        THEN: ValidationError raised. BudgetingPeriod not changed in database.
+        """
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2023_06", date_start=date(2023, 6, 1), date_end=date(2023, 6, 30)
+        )
+        period = BudgetingPeriod.objects.create(
+            budget=budget, name="2023_07", date_start=date(2023, 7, 1), date_end=date(2023, 7, 31)
+        )
+
+        period.date_start = date(2023, 6, 30)
+        with pytest.raises(ValidationError) as exc:
+            period.save()
+
+        assert exc.value.code == "period-range-invalid"
+        period.refresh_from_db()
+        assert period.date_start == date(2023, 7, 1)
+
+    def test_create_without_validation_queries(self, budget: Budget):
+        """
+        GIVEN: Active BudgetingPeriod for Budget in database.
+        WHEN: Next BudgetingPeriod created.
+        THEN: BudgetingPeriod created without querying other BudgetingPeriods - collisions are checked by database.
+        """
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2023_06", date_start=date(2023, 6, 1), date_end=date(2023, 6, 30), is_active=True
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            BudgetingPeriod.objects.create(
+                budget=budget, name="2023_07", date_start=date(2023, 7, 1), date_end=date(2023, 7, 31)
+            )
+
+        assert not [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT") and "budgets_budgetingperiod" in query["sql"]
+        ]
+
+    @pytest.mark.parametrize(
+        "update_kwargs",
+        ({"is_active": True}, {"date_start": date(2023, 6, 15)}),
+    )
+    def test_constraints_enforced_by_database(self, budget: Budget, update_kwargs: dict):
+        """
+        GIVEN: Active BudgetingPeriod and inactive BudgetingPeriod for Budget in database.
+        WHEN: Inactive BudgetingPeriod updated with QuerySet update, bypassing model validation, to be active or to
+        collide with other BudgetingPeriod.
+        THEN: IntegrityError raised by database.
+        """
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2023_06", date_start=date(2023, 6, 1), date_end=date(2023, 6, 30), is_active=True
+        )
+        period = BudgetingPeriod.objects.create(
+            budget=budget, name="2023_07", date_start=date(2023, 7, 1), date_end=date(2023, 7, 31)
+        )
+
+        with pytest.raises(IntegrityError):
+            BudgetingPeriod.objects.filter(pk=period.pk).update(**update_kwargs)
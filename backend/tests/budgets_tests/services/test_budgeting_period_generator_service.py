@@ -0,0 +1,207 @@
+from datetime import date
+from typing import Callable
+
+import pytest
+from django.core.cache import cache
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from budgets.models.budget_model import Budget
+from budgets.models.budgeting_period_model import BudgetingPeriod
+from budgets.services.budgeting_period_generator_service import (
+    BudgetingPeriodGeneratorError,
+    BudgetingPeriodGeneratorService,
+    DateIntervals,
+)
+
+
+class TestDateIntervals:
+    """Tests for DateIntervals."""
+
+    @pytest.mark.parametrize(
+        "date_start, date_end, expected",
+        (
+            (date(2023, 5, 1), date(2023, 5, 31), None),
+            (date(2023, 5, 1), date(2023, 6, 1), "2023_06"),
+            (date(2023, 6, 10), date(2023, 6, 20), "2023_06"),
+            (date(2023, 6, 30), date(2023, 7, 1), "2023_06"),
+            (date(2023, 7, 1), date(2023, 7, 31), None),
+            (date(2023, 7, 15), date(2023, 9, 15), "2023_08"),
+            (date(2023, 5, 1), date(2023, 9, 1), "2023_06"),
+            (date(2023, 9, 1), date(2023, 9, 30), None),
+        ),
+    )
+    def test_find_overlapping(self, date_start: date, date_end: date, expected: str | None):
+        """
+        GIVEN: DateIntervals with two disjoint intervals given in not sorted order.
+        WHEN: DateIntervals.find_overlapping called for date range.
+        THEN: Label of first overlapping interval returned or None if date range overlaps none of intervals.
+        """
+        intervals = DateIntervals(
+            [(date(2023, 8, 1), date(2023, 8, 31), "2023_08"), (date(2023, 6, 1), date(2023, 6, 30), "2023_06")]
+        )
+
+        assert intervals.find_overlapping(date_start, date_end) == expected
+
+
+@pytest.mark.django_db
+class TestBudgetingPeriodGeneratorService:
+    """Tests for BudgetingPeriodGeneratorService."""
+
+    def test_generate_monthly_periods(self, budget: Budget):
+        """
+        GIVEN: Budget without BudgetingPeriods.
+        WHEN: BudgetingPeriodGeneratorService.generate called for 3 monthly periods starting at the end of month.
+        THEN: Consecutive BudgetingPeriods created with day clamped to length of month.
+        """
+        BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 31), 3).generate()
+
+        assert list(
+            BudgetingPeriod.objects.filter(budget=budget)
+            .order_by("date_start")
+            .values_list("name", "date_start", "date_end", "is_active")
+        ) == [
+            ("2024_01", date(2024, 1, 31), date(2024, 2, 28), False),
+            ("2024_02", date(2024, 2, 29), date(2024, 3, 30), False),
+            ("2024_03", date(2024, 3, 31), date(2024, 4, 29), False),
+        ]
+
+    @pytest.mark.parametrize(
+        "months, expected",
+        (
+            (0, date(2023, 1, 31)),
+            (1, date(2023, 2, 28)),
+            (2, date(2023, 3, 31)),
+            (3, date(2023, 4, 30)),
+            (13, date(2024, 2, 29)),
+            (14, date(2024, 3, 31)),
+        ),
+    )
+    def test_add_months_from_31st(self, months: int, expected: date):
+        """
+        GIVEN: Date of 31st day of month.
+        WHEN: BudgetingPeriodGeneratorService.add_months called with number of months.
+        THEN: Day clamped to length of shorter target months and restored to 31st in longer ones.
+        """
+        assert BudgetingPeriodGeneratorService.add_months(date(2023, 1, 31), months) == expected
+
+    def test_generate_monthly_periods_without_drift(self, budget: Budget):
+        """
+        GIVEN: Budget without BudgetingPeriods.
+        WHEN: BudgetingPeriodGeneratorService.generate called for 12 monthly periods starting at January 31st.
+        THEN: Every period starts on last day of month, as starts are computed from the anchor date, not from
+        previous clamped start. Period ends on the day before start of next period.
+        """
+        BudgetingPeriodGeneratorService(budget.pk, date(2023, 1, 31), 12).generate()
+
+        periods = list(
+            BudgetingPeriod.objects.filter(budget=budget)
+            .order_by("date_start")
+            .values_list("name", "date_start", "date_end")
+        )
+        assert [date_start.day for _, date_start, _ in periods] == [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+        assert [name for name, _, _ in periods] == [f"2023_{month:02d}" for month in range(1, 13)]
+        assert periods[1][1:] == (date(2023, 2, 28), date(2023, 3, 30))
+        assert periods[-1][1:] == (date(2023, 12, 31), date(2024, 1, 30))
+
+    def test_generate_weekly_and_custom_periods(self, budget: Budget):
+        """
+        GIVEN: Budget without BudgetingPeriods.
+        WHEN: BudgetingPeriodGeneratorService.generate called for 2 weekly and then 2 custom 10 days periods.
+        THEN: Consecutive BudgetingPeriods created with names based on start dates.
+        """
+        BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 2, frequency="weekly").generate()
+        BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 15), 2, frequency="custom", days=10).generate()
+
+        assert list(
+            BudgetingPeriod.objects.filter(budget=budget)
+            .order_by("date_start")
+            .values_list("name", "date_start", "date_end")
+        ) == [
+            ("2024_W01", date(2024, 1, 1), date(2024, 1, 7)),
+            ("2024_W02", date(2024, 1, 8), date(2024, 1, 14)),
+            ("2024_01_15", date(2024, 1, 15), date(2024, 1, 24)),
+            ("2024_01_25", date(2024, 1, 25), date(2024, 2, 3)),
+        ]
+
+    def test_generate_ten_years_with_constant_queries_count(
+        self, budget: Budget, django_assert_max_num_queries: Callable, django_capture_on_commit_callbacks: Callable
+    ):
+        """
+        GIVEN: Budget with 24 BudgetingPeriods.
+        WHEN: BudgetingPeriodGeneratorService.generate called for 120 monthly periods following existing ones.
+        THEN: Periods loaded with single query and created with single insert. Budget data version increased.
+        """
+        BudgetingPeriodGeneratorService(budget.pk, date(2022, 1, 1), 24).generate()
+        version = BudgetDataVersionService.get_version(budget.pk)
+        cache.clear()
+
+        with django_assert_max_num_queries(5), django_capture_on_commit_callbacks(execute=True):
+            periods = BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 120).generate()
+
+        assert len(periods) == 120
+        assert all(period.pk for period in periods)
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 144
+        assert BudgetDataVersionService.get_version(budget.pk) == version + 1
+
+    @pytest.mark.parametrize(
+        "date_start, count, frequency, days",
+        (
+            (date(9999, 6, 1), 12, "monthly", None),
+            (date(9999, 12, 1), 5, "weekly", None),
+            (date(2024, 1, 1), 1, "custom", 10000000),
+        ),
+    )
+    def test_error_dates_out_of_range(
+        self, budget: Budget, date_start: date, count: int, frequency: str, days: int | None
+    ):
+        """
+        GIVEN: Budget in database.
+        WHEN: BudgetingPeriodGeneratorService.generate called for periods ending after maximal supported date.
+        THEN: BudgetingPeriodGeneratorError raised. No period created.
+        """
+        with pytest.raises(BudgetingPeriodGeneratorError) as exc:
+            BudgetingPeriodGeneratorService(budget.pk, date_start, count, frequency, days).generate()
+
+        assert exc.value.errors == ["Generated periods exceed maximal supported date 9999-12-31."]
+        assert not BudgetingPeriod.objects.filter(budget=budget).exists()
+
+    def test_error_collisions(self, budget: Budget):
+        """
+        GIVEN: Budget with BudgetingPeriods "2024_02" and "2024_04" (for May 2024).
+        WHEN: BudgetingPeriodGeneratorService.generate called for 4 monthly periods starting in January 2024.
+        THEN: BudgetingPeriodGeneratorError raised with date range and name collisions. No period created.
+        """
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2024_02", date_start=date(2024, 2, 10), date_end=date(2024, 2, 20)
+        )
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2024_04", date_start=date(2024, 5, 1), date_end=date(2024, 5, 31)
+        )
+
+        with pytest.raises(BudgetingPeriodGeneratorError) as exc:
+            BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 4).generate()
+
+        assert exc.value.errors == [
+            'Period "2024_02" (2024-02-01 - 2024-02-29) collides with period "2024_02" in Budget.',
+            'Period with name "2024_04" already exists in Budget.',
+        ]
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 2
+
+    def test_error_collision_detected_by_database(self, budget: Budget, monkeypatch: pytest.MonkeyPatch):
+        """
+        GIVEN: Budget with BudgetingPeriod created after generated periods were validated.
+        WHEN: BudgetingPeriodGeneratorService.generate called for periods colliding with it.
+        THEN: BudgetingPeriodGeneratorError raised. No period created.
+        """
+        service = BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 2)
+        periods = service.build_periods()
+        BudgetingPeriod.objects.create(
+            budget=budget, name="other", date_start=date(2024, 2, 1), date_end=date(2024, 2, 5)
+        )
+        monkeypatch.setattr(service, "build_periods", lambda: periods)
+
+        with pytest.raises(BudgetingPeriodGeneratorError) as exc:
+            service.generate()
+
+        assert exc.value.errors == ["Generated periods collide with other periods in Budget."]
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 1
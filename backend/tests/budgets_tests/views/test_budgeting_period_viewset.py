@@ -5,13 +5,18 @@ Tests for BudgetingPeriodViewSet:
 * TestBudgetingPeriodViewSetDetail - GET on detail view.
 * TestBudgetingPeriodViewSetUpdate - PATCH on detail view.
 * TestBudgetingPeriodViewSetDelete - DELETE on detail view.
+* TestBudgetingPeriodViewSetSummary - GET on summary view.
+* TestBudgetingPeriodViewSetGenerate - POST on generate view.
 """
 
 from datetime import date
+from decimal import Decimal
 from typing import Any
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -20,6 +25,7 @@ from rest_framework.test import APIClient
 from budgets.models.budget_model import Budget
 from budgets.models.budgeting_period_model import BudgetingPeriod
 from budgets.serializers.budgeting_period_serializer import BudgetingPeriodSerializer
+from categories.models.transfer_category_choices import ExpenseCategoryPriority, IncomeCategoryPriority
 
 
 def periods_url(budget_id):
@@ -32,6 +38,11 @@ def period_detail_url(budget_id, period_id):
     return reverse("budgets:period-detail", args=[budget_id, period_id])
 
 
+def period_summary_url(budget_id, period_id):
+    """Creates and returns BudgetingPeriod summary URL."""
+    return reverse("budgets:period-summary", args=[budget_id, period_id])
+
+
 @pytest.mark.django_db
 class TestBudgetingPeriodViewSetList:
     """Tests for BudgetingPeriodViewSet list view."""
@@ -897,3 +908,251 @@ class TestBudgetingPeriodViewSetDelete:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert BudgetingPeriod.objects.filter(id=period.id).exists()
+
+
+@pytest.mark.django_db
+class TestBudgetingPeriodViewSetSummary:
+    """Tests for summary view on BudgetingPeriodViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budgeting_period_factory: FactoryMetaClass):
+        """
+        GIVEN: BudgetingPeriod model instance in database.
+        WHEN: BudgetingPeriodViewSet summary view called without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        period = budgeting_period_factory()
+
+        res = api_client.get(period_summary_url(period.budget.id, period.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self,
+        api_client: APIClient,
+        user_factory: FactoryMetaClass,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod model instance in database.
+        WHEN: BudgetingPeriodViewSet summary view called by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        period = budgeting_period_factory(budget=budget_factory(owner=user_factory()))
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(period_summary_url(period.budget.id, period.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_period_from_other_budget(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod model instance for other Budget in database.
+        WHEN: BudgetingPeriodViewSet summary view called for User Budget and other Budget period.
+        THEN: Not found HTTP 404 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory()
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(period_summary_url(budget.id, period.id))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_get_summary(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Incomes and Expenses for two BudgetingPeriods of Budget in database.
+        WHEN: BudgetingPeriodViewSet summary view called for one BudgetingPeriod by Budget member.
+        THEN: HTTP 200 returned with totals of given period per category, priority, Entity and Deposit.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget, date_start=date(2024, 9, 1), date_end=date(2024, 9, 30))
+        other_period = budgeting_period_factory(
+            budget=budget, date_start=date(2024, 10, 1), date_end=date(2024, 10, 31)
+        )
+        shop, employer = entity_factory(budget=budget, name="Shop"), entity_factory(budget=budget, name="Employer")
+        account = deposit_factory(budget=budget, name="Account")
+        salary = income_category_factory(budget=budget, name="Salary", priority=IncomeCategoryPriority.REGULAR)
+        food = expense_category_factory(budget=budget, name="Food", priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+        bills = expense_category_factory(budget=budget, name="Bills", priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+        common = {"budget": budget, "period": period, "deposit": account, "date": date(2024, 9, 10)}
+        income_factory(**common, entity=employer, category=salary, value=Decimal("1000.00"))
+        expense_factory(**common, entity=shop, category=food, value=Decimal("10.00"))
+        expense_factory(**common, entity=shop, category=food, value=Decimal("15.50"))
+        expense_factory(**common, entity=employer, category=bills, value=Decimal("100.00"))
+        expense_factory(
+            budget=budget, period=other_period, deposit=account, entity=shop, category=food, date=date(2024, 10, 1)
+        )
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(period_summary_url(budget.id, period.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["incomes"] == "1000.00"
+        assert response.data["expenses"] == "125.50"
+        assert [(item["name"], item["value"], item["count"]) for item in response.data["categories"]] == [
+            ("Bills", "100.00", 1),
+            ("Food", "25.50", 2),
+            ("Salary", "1000.00", 1),
+        ]
+        priorities = {item["priority"]: (item["value"], item["count"]) for item in response.data["priorities"]}
+        assert priorities[ExpenseCategoryPriority.MOST_IMPORTANT] == ("125.50", 3)
+        assert priorities[IncomeCategoryPriority.REGULAR] == ("1000.00", 1)
+        assert priorities[ExpenseCategoryPriority.DEBTS] == ("0.00", 0)
+        assert [(item["name"], item["incomes"], item["expenses"]) for item in response.data["entities"]] == [
+            ("Employer", "1000.00", "100.00"),
+            ("Shop", "0.00", "25.50"),
+        ]
+        assert [(item["name"], item["incomes"], item["expenses"]) for item in response.data["deposits"]] == [
+            ("Account", "1000.00", "125.50"),
+        ]
+
+    def test_summary_read_from_rollup(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Ten Expenses for BudgetingPeriod of Budget in database.
+        WHEN: BudgetingPeriodViewSet summary view called by Budget member.
+        THEN: HTTP 200 returned. TransferRollup table queried once, Transfers table not queried.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        for _ in range(10):
+            expense_factory(budget=budget, period=period)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(period_summary_url(budget.id, period.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["categories"]) == 10
+        assert len([query for query in context.captured_queries if "transfers_transferrollup" in query["sql"]]) == 1
+        assert not any('"transfers_transfer"' in query["sql"] for query in context.captured_queries)
+
+
+def periods_generate_url(budget_id):
+    """Creates and returns BudgetingPeriods generate URL."""
+    return reverse("budgets:period-generate", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestBudgetingPeriodViewSetGenerate:
+    """Tests for generate view in BudgetingPeriodViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: BudgetingPeriodViewSet generate view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(periods_generate_url(budget.id), {"date_start": "2024-01-01", "count": 12})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: BudgetingPeriodViewSet generate view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(periods_generate_url(budget.id), {"date_start": "2024-01-01", "count": 12})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_generate_periods(self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget without BudgetingPeriods in database.
+        WHEN: BudgetingPeriodViewSet generate view called with POST by Budget member for 12 monthly periods.
+        THEN: HTTP 201 returned with 12 created BudgetingPeriods.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(periods_generate_url(budget.id), {"date_start": "2024-01-01", "count": 12})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        periods = BudgetingPeriod.objects.filter(budget=budget).order_by("date_start")
+        assert response.data == BudgetingPeriodSerializer(periods, many=True).data
+        assert [period["name"] for period in response.data] == [f"2024_{month:02d}" for month in range(1, 13)]
+
+    @pytest.mark.parametrize(
+        "payload, field, message",
+        (
+            ({"date_start": "2024-01-01", "count": 0}, "count", "Ensure this value is greater than or equal to 1."),
+            (
+                {"date_start": "2024-01-01", "count": 2, "frequency": "custom"},
+                "days",
+                "Periods length has to be given for custom frequency.",
+            ),
+            (
+                {"date_start": "2024-01-01", "count": 1, "frequency": "custom", "days": 10000000},
+                "days",
+                "Ensure this value is less than or equal to 366.",
+            ),
+            (
+                {"date_start": "9999-06-01", "count": 12},
+                "non_field_errors",
+                "Generated periods exceed maximal supported date 9999-12-31.",
+            ),
+            (
+                {"date_start": "2023-01-15", "count": 2},
+                "non_field_errors",
+                'Period "2023_01" (2023-01-15 - 2023-02-14) collides with period "2023_01" in Budget.',
+            ),
+        ),
+    )
+    def test_error_invalid_payload(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        payload: dict,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod for January 2023 in database.
+        WHEN: BudgetingPeriodViewSet generate view called with POST by Budget member with invalid payload.
+        THEN: Bad request HTTP 400 returned. No BudgetingPeriod created.
+        """
+        budget = budget_factory(owner=base_user)
+        BudgetingPeriod.objects.create(
+            budget=budget, name="2023_01", date_start=date(2023, 1, 1), date_end=date(2023, 1, 31)
+        )
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(periods_generate_url(budget.id), payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field] == [message]
+        assert BudgetingPeriod.objects.filter(budget=budget).count() == 1
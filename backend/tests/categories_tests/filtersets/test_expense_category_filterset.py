@@ -57,7 +57,7 @@ class TestExpenseCategoryFilterSetOrdering:
         response = api_client.get(categories_url(budget.id), data={"ordering": sort_param})
 
         assert response.status_code == status.HTTP_200_OK
-        categories = ExpenseCategory.objects.all().order_by(sort_param)
+        categories = ExpenseCategory.objects.all().order_by(sort_param, "id")
         serializer = ExpenseCategorySerializer(categories, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(categories) == 5
@@ -91,7 +91,7 @@ class TestExpenseCategoryFilterSetOrdering:
         response = api_client.get(categories_url(budget.id), data={"ordering": "priority,name"})
 
         assert response.status_code == status.HTTP_200_OK
-        categories = ExpenseCategory.objects.all().order_by("priority", "name")
+        categories = ExpenseCategory.objects.all().order_by("priority", "name", "id")
         serializer = ExpenseCategorySerializer(categories, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(categories) == 5
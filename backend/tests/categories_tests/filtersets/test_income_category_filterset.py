@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -55,7 +56,7 @@ class TestIncomeCategoryFilterSetOrdering:
         response = api_client.get(categories_url(budget.id), data={"ordering": sort_param})
 
         assert response.status_code == status.HTTP_200_OK
-        categories = IncomeCategory.objects.all().order_by(sort_param)
+        categories = IncomeCategory.objects.all().order_by(sort_param, "id")
         serializer = IncomeCategorySerializer(categories, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(categories) == 5
@@ -87,7 +88,7 @@ class TestIncomeCategoryFilterSetOrdering:
         response = api_client.get(categories_url(budget.id), data={"ordering": "priority,name"})
 
         assert response.status_code == status.HTTP_200_OK
-        categories = IncomeCategory.objects.all().order_by("priority", "name")
+        categories = IncomeCategory.objects.all().order_by("priority", "name", "id")
         serializer = IncomeCategorySerializer(categories, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(categories) == 5
@@ -276,3 +277,49 @@ class TestIncomeCategoryFilterSetFiltering:
         assert len(response.data["results"]) == len(serializer.data) == categories.count() == 1
         assert response.data["results"] == serializer.data
         assert response.data["results"][0]["id"] == matching_category.id
+
+    def test_get_categories_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three IncomeCategory objects for single Budget with different names and descriptions.
+        WHEN: The IncomeCategoryViewSet list view is called with "search" filter.
+        THEN: Response contains only IncomeCategories matching searched phrase in name or description.
+        """
+        budget = budget_factory(owner=base_user)
+        in_description = income_category_factory(budget=budget, name="Work", description="Salary and bonuses")
+        in_name = income_category_factory(budget=budget, name="Salary", description="Work")
+        income_category_factory(budget=budget, name="Gifts", description="Birthday")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(categories_url(budget.id), data={"search": "sal"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["id"] for item in response.data["results"]} == {in_name.id, in_description.id}
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Search results are ranked only on PostgreSQL.")
+    def test_get_categories_list_searched_ordered_by_rank(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two IncomeCategory objects for single Budget with searched phrase in name or in description.
+        WHEN: The IncomeCategoryViewSet list view is called with "search" filter.
+        THEN: Response contains IncomeCategories ordered by relevance.
+        """
+        budget = budget_factory(owner=base_user)
+        in_description = income_category_factory(budget=budget, name="Work", description="Salary and bonuses")
+        in_name = income_category_factory(budget=budget, name="Salary", description="Work")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(categories_url(budget.id), data={"search": "sal"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [in_name.id, in_description.id]
@@ -5,6 +5,7 @@ from app_users_tests.factories import UserFactory
 from budgets_tests.factories import BudgetFactory, BudgetingPeriodFactory
 from categories_tests.factories import ExpenseCategoryFactory, IncomeCategoryFactory, TransferCategoryFactory
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from entities_tests.factories import DepositFactory, EntityFactory
 from predictions_tests.factories import ExpensePredictionFactory
 from pytest_django.lazy_django import skip_if_no_django
@@ -12,6 +13,9 @@ from pytest_factoryboy import register
 from rest_framework.test import APIClient
 from transfers_tests.factories import ExpenseFactory, IncomeFactory, TransferFactory
 
+from app_infrastructure.services.auth_token_cache_service import AuthTokenCacheService
+from transfers.services.transfer_autocomplete_service import TransferAutocompleteService
+
 register(UserFactory)
 register(BudgetFactory)
 register(BudgetingPeriodFactory)
@@ -26,6 +30,26 @@ register(IncomeFactory)
 register(ExpenseFactory)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    """Clears caches before every test, so cached values do not leak between tests."""
+    cache.clear()
+    AuthTokenCacheService.clear()
+    TransferAutocompleteService.clear()
+
+
+@pytest.fixture(autouse=True)
+def shared_cache_enabled(settings: Any) -> None:
+    """Treats local memory cache as shared cache, as all tests requests are handled by single process."""
+    settings.SHARED_CACHE_ENABLED = True
+
+
+@pytest.fixture
+def signed_tokens_enabled(settings: Any) -> None:
+    """Enables signed access and refresh tokens."""
+    settings.SIGNED_TOKENS_ENABLED = True
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """API Client for creating request."""
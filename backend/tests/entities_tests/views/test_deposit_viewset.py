@@ -1,7 +1,11 @@
+from datetime import date
+from decimal import Decimal
 from typing import Any
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -511,3 +515,100 @@ class TestDepositViewSetDelete:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not budget.entities.filter(is_deposit=True).exists()
+
+
+def deposits_balances_url(budget_id):
+    """Create and return Deposits balances URL."""
+    return reverse("budgets:deposit-balances", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestDepositViewSetBalances:
+    """Tests for balances view on DepositViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: DepositViewSet balances view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.get(deposits_balances_url(budget.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: DepositViewSet balances view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(deposits_balances_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_get_balances(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Incomes and Expenses of two Deposits in three BudgetingPeriods in database.
+        WHEN: DepositViewSet balances view called with GET by Budget member.
+        THEN: HTTP 200 returned with current balance and balance at the end of every period for every Deposit.
+        """
+        budget = budget_factory(owner=base_user)
+        periods = [
+            budgeting_period_factory(budget=budget, date_start=date(2024, month, 1), date_end=date(2024, month, 28))
+            for month in (9, 10, 11)
+        ]
+        main, savings = deposit_factory(budget=budget, name="Main"), deposit_factory(budget=budget, name="Savings")
+        income_factory(budget=budget, period=periods[0], deposit=main, value=Decimal("100.00"))
+        income_factory(budget=budget, period=periods[0], deposit=main, value=Decimal("50.00"))
+        expense_factory(budget=budget, period=periods[0], deposit=main, value=Decimal("30.00"))
+        expense_factory(budget=budget, period=periods[2], deposit=main, value=Decimal("20.00"))
+        income_factory(budget=budget, period=periods[1], deposit=savings, value=Decimal("10.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(deposits_balances_url(budget.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(item["name"], item["balance"]) for item in response.data] == [("Main", "100.00"), ("Savings", "10.00")]
+        assert [period["balance"] for period in response.data[0]["periods"]] == ["120.00", "120.00", "100.00"]
+        assert [period["balance"] for period in response.data[1]["periods"]] == ["0.00", "10.00", "10.00"]
+        assert [period["id"] for period in response.data[0]["periods"]] == [period.id for period in periods]
+
+    def test_balances_not_reading_transfers(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Expenses of Deposit in database.
+        WHEN: DepositViewSet balances view called with GET by Budget member.
+        THEN: HTTP 200 returned. Balances computed without querying Transfers table.
+        """
+        budget = budget_factory(owner=base_user)
+        deposit = deposit_factory(budget=budget)
+        for _ in range(5):
+            expense_factory(budget=budget, deposit=deposit)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(deposits_balances_url(budget.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not any('"transfers_transfer"' in query["sql"] for query in context.captured_queries)
@@ -76,7 +76,7 @@ class TestExpensePredictionFilterSetOrdering:
         predictions = (
             ExpensePrediction.objects.filter(period__budget__pk=budget.pk)
             .prefetch_related("period", "category")
-            .order_by(sort_param)
+            .order_by(sort_param, "id")
         )
         serializer = ExpensePredictionSerializer(predictions, many=True)
         assert response.data["results"] and serializer.data
@@ -122,7 +122,7 @@ class TestExpensePredictionFilterSetOrdering:
         predictions = (
             ExpensePrediction.objects.filter(period__budget__pk=budget.pk)
             .prefetch_related("period", "category")
-            .order_by("period__name", "-category__name")
+            .order_by("period__name", "-category__name", "id")
         )
         serializer = ExpensePredictionSerializer(predictions, many=True)
         assert response.data["results"] and serializer.data
@@ -277,3 +277,27 @@ class TestExpensePredictionFilterSetFiltering:
         assert len(response.data["results"]) == len(serializer.data) == predictions.count() == 1
         assert response.data["results"] == serializer.data
         assert response.data["results"][0]["id"] == prediction.id
+
+    def test_get_predictions_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two ExpensePrediction objects for single Budget with different categories.
+        WHEN: The ExpensePredictionViewSet list view is called with "search" filter.
+        THEN: Response contains ExpensePrediction with category matching searched phrase.
+        """
+        budget = budget_factory(owner=base_user)
+        category = expense_category_factory(budget=budget, name="Food", description="Groceries and restaurants")
+        prediction = expense_prediction_factory(budget=budget, category=category)
+        expense_prediction_factory(budget=budget, category=expense_category_factory(budget=budget, name="Other"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expense_prediction_url(budget.id), data={"search": "grocer"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [prediction.id]
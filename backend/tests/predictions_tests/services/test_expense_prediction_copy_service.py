@@ -0,0 +1,138 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from budgets.models.budget_model import Budget
+from predictions.models.expense_prediction_model import ExpensePrediction
+from predictions.services.expense_prediction_copy_service import (
+    ExpensePredictionCopyError,
+    ExpensePredictionCopyService,
+)
+
+
+class TestExpensePredictionCopyServiceGetValue:
+    """Tests for ExpensePredictionCopyService.get_value."""
+
+    @pytest.mark.parametrize(
+        "value, scale, rounding, expected",
+        (
+            (Decimal("100.00"), Decimal("1"), Decimal("0.01"), Decimal("100.00")),
+            (Decimal("100.00"), Decimal("1.05"), Decimal("0.01"), Decimal("105.00")),
+            (Decimal("33.33"), Decimal("1.1"), Decimal("0.01"), Decimal("36.67")),
+            (Decimal("33.33"), Decimal("1.1"), Decimal("10"), Decimal("40.00")),
+            (Decimal("120.00"), Decimal("0.5"), Decimal("25"), Decimal("75.00")),
+            (Decimal("0.00"), Decimal("2"), Decimal("5"), Decimal("0.00")),
+        ),
+    )
+    def test_get_value(self, value: Decimal, scale: Decimal, rounding: Decimal, expected: Decimal):
+        """
+        GIVEN: ExpensePredictionCopyService with given scale and rounding.
+        WHEN: ExpensePredictionCopyService.get_value called for source value.
+        THEN: Value multiplied by scale and rounded up to multiple of rounding returned.
+        """
+        service = ExpensePredictionCopyService(1, 2, scale=scale, rounding=rounding)
+
+        assert service.get_value(value) == expected
+
+
+@pytest.mark.django_db
+class TestExpensePredictionCopyService:
+    """Tests for ExpensePredictionCopyService.copy."""
+
+    def test_copy_predictions(
+        self,
+        budget: Budget,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePredictions in source BudgetingPeriod and empty target BudgetingPeriod.
+        WHEN: ExpensePredictionCopyService.copy called with scale.
+        THEN: ExpensePredictions created in target period with scaled values with single INSERT query.
+        """
+        source, target = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+        food, bills = expense_category_factory(budget=budget), expense_category_factory(budget=budget)
+        expense_prediction_factory(period=source, category=food, value=Decimal("100.00"), description="Food")
+        expense_prediction_factory(period=source, category=bills, value=Decimal("50.00"), description="Bills")
+
+        with CaptureQueriesContext(connection) as context:
+            copied_count = ExpensePredictionCopyService(source.pk, target.pk, scale=Decimal("1.1")).copy()
+
+        assert copied_count == 2
+        statements = [query["sql"].split()[0] for query in context.captured_queries]
+        assert statements[0] == "SELECT"
+        assert statements.count("INSERT") == 1
+        assert set(ExpensePrediction.objects.filter(period=target).values_list("category", "value", "description")) == {
+            (food.pk, Decimal("110.00"), "Food"),
+            (bills.pk, Decimal("55.00"), "Bills"),
+        }
+        assert ExpensePrediction.objects.filter(period=source).count() == 2
+
+    @pytest.mark.parametrize("overwrite, expected_value", ((True, Decimal("100.00")), (False, Decimal("20.00"))))
+    def test_copy_to_period_with_predictions(
+        self,
+        budget: Budget,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        overwrite: bool,
+        expected_value: Decimal,
+    ):
+        """
+        GIVEN: ExpensePredictions in source BudgetingPeriod and ExpensePrediction for the same category in target
+        BudgetingPeriod.
+        WHEN: ExpensePredictionCopyService.copy called with given overwrite param.
+        THEN: Existing target ExpensePrediction updated only if overwrite is True, missing ones created.
+        """
+        source, target = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+        food, bills = expense_category_factory(budget=budget), expense_category_factory(budget=budget)
+        expense_prediction_factory(period=source, category=food, value=Decimal("100.00"))
+        expense_prediction_factory(period=source, category=bills, value=Decimal("50.00"))
+        existing = expense_prediction_factory(period=target, category=food, value=Decimal("20.00"))
+
+        ExpensePredictionCopyService(source.pk, target.pk, overwrite=overwrite).copy()
+
+        existing.refresh_from_db()
+        assert existing.value == expected_value
+        assert ExpensePrediction.objects.filter(period=target).count() == 2
+        assert ExpensePrediction.objects.get(period=target, category=bills).value == Decimal("50.00")
+
+    def test_copy_empty_period(self, budget: Budget, budgeting_period_factory: FactoryMetaClass):
+        """
+        GIVEN: Source BudgetingPeriod without ExpensePredictions.
+        WHEN: ExpensePredictionCopyService.copy called.
+        THEN: Nothing copied and no INSERT query performed.
+        """
+        source, target = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+
+        with CaptureQueriesContext(connection) as context:
+            copied_count = ExpensePredictionCopyService(source.pk, target.pk).copy()
+
+        assert copied_count == 0
+        assert len(context.captured_queries) == 1
+
+    def test_error_on_value_overflow(
+        self,
+        budget: Budget,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePrediction with large value in source BudgetingPeriod.
+        WHEN: ExpensePredictionCopyService.copy called with scale exceeding maximal value.
+        THEN: ExpensePredictionCopyError raised, no ExpensePrediction created in target period.
+        """
+        source, target = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+        category = expense_category_factory(budget=budget, name="Flat")
+        expense_prediction_factory(period=source, category=category, value=Decimal("60000000.00"))
+
+        with pytest.raises(ExpensePredictionCopyError) as exc:
+            ExpensePredictionCopyService(source.pk, target.pk, scale=Decimal("2")).copy()
+
+        assert exc.value.errors == ['Copied value of "Flat" prediction exceeds 99999999.99.']
+        assert not ExpensePrediction.objects.filter(period=target).exists()
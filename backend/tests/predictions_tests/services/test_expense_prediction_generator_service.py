@@ -0,0 +1,155 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from budgets.models.budget_model import Budget
+from budgets.services.budgeting_period_generator_service import BudgetingPeriodGeneratorService
+from predictions.models.expense_prediction_model import ExpensePrediction
+from predictions.services.expense_prediction_generator_service import ExpensePredictionGeneratorService
+
+
+@pytest.fixture
+def history(
+    budget: Budget,
+    expense_category_factory: FactoryMetaClass,
+    income_category_factory: FactoryMetaClass,
+    expense_factory: FactoryMetaClass,
+    income_factory: FactoryMetaClass,
+) -> dict:
+    """
+    Creates monthly BudgetingPeriods from 2023_01 to 2024_01 with Expenses of "Food" category in six last periods
+    before 2024_01 and Expenses of "Bills" category in 2023_01 and 2023_12 periods.
+    """
+    periods = {
+        period.name: period for period in BudgetingPeriodGeneratorService(budget.pk, date(2023, 1, 1), 13).generate()
+    }
+    food = expense_category_factory(budget=budget, name="Food")
+    bills = expense_category_factory(budget=budget, name="Bills")
+    salary = income_category_factory(budget=budget, name="Salary")
+    for month, value in zip(range(7, 13), ("100", "200", "300", "400", "500", "1200")):
+        period = periods[f"2023_{month:02d}"]
+        expense_factory(budget=budget, period=period, category=food, value=Decimal(value), date=period.date_start)
+    for name, value in (("2023_01", "80"), ("2023_12", "60")):
+        period = periods[name]
+        expense_factory(budget=budget, period=period, category=bills, value=Decimal(value), date=period.date_start)
+    income_factory(budget=budget, period=periods["2023_12"], category=salary, value=Decimal("5000"))
+    return {"periods": periods, "food": food, "bills": bills}
+
+
+class TestExpensePredictionGeneratorServiceCompute:
+    """Tests for ExpensePredictionGeneratorService.compute."""
+
+    @pytest.mark.parametrize(
+        "method, params, expected",
+        (
+            ("mean", {}, [3.0, 10.0]),
+            ("median", {}, [2.5, 10.0]),
+            ("trimmed_mean", {"trim": 0.25}, [2.5, 10.0]),
+            ("ewm", {"alpha": 0.5}, [(1 + 2 * 2 + 4 * 3 + 8 * 6) / 15, 10.0]),
+        ),
+    )
+    def test_compute(self, method: str, params: dict, expected: list[float]):
+        """
+        GIVEN: Matrix of Expenses sums of two categories in four periods.
+        WHEN: ExpensePredictionGeneratorService.compute called with given method.
+        THEN: Statistic computed for every matrix row.
+        """
+        matrix = np.array([[1.0, 2.0, 3.0, 6.0], [10.0, 10.0, 10.0, 10.0]])
+        service = ExpensePredictionGeneratorService(1, 1, method=method, **params)
+
+        assert np.allclose(service.compute(matrix), expected)
+
+
+@pytest.mark.django_db
+class TestExpensePredictionGeneratorService:
+    """Tests for ExpensePredictionGeneratorService."""
+
+    @pytest.mark.parametrize(
+        "params, food_value, bills_value",
+        (
+            ({"method": "mean"}, "450.00", "10.00"),
+            ({"method": "median"}, "350.00", None),
+            ({"method": "trimmed_mean", "trim": 0.2}, "350.00", None),
+            ({"method": "ewm", "alpha": 0.5}, "814.29", "30.48"),
+            ({"method": "mean", "periods_count": 2}, "850.00", "30.00"),
+            ({"method": "mean", "periods_count": 12}, "225.00", "11.67"),
+            ({"method": "seasonal", "periods_count": 1}, None, "80.00"),
+            ({"method": "seasonal", "periods_count": 3}, None, "80.00"),
+        ),
+    )
+    def test_get_predictions(
+        self, budget: Budget, history: dict, params: dict, food_value: str | None, bills_value: str | None
+    ):
+        """
+        GIVEN: Expenses in BudgetingPeriods preceding target BudgetingPeriod.
+        WHEN: ExpensePredictionGeneratorService.get_predictions called with given method.
+        THEN: Proposed values returned for ExpenseCategories with positive statistic, ordered by category name.
+        """
+        service = ExpensePredictionGeneratorService(budget.pk, history["periods"]["2024_01"].pk, **params)
+
+        predictions = service.get_predictions()
+
+        expected = [
+            {"category_id": history[key].id, "category_name": history[key].name, "value": Decimal(value)}
+            for key, value in (("bills", bills_value), ("food", food_value))
+            if value is not None
+        ]
+        assert predictions == expected
+
+    def test_queries_count(self, budget: Budget, history: dict):
+        """
+        GIVEN: Expenses in BudgetingPeriods preceding target BudgetingPeriod.
+        WHEN: ExpensePredictionGeneratorService.get_predictions called.
+        THEN: Expenses sums of all categories read with single query.
+        """
+        service = ExpensePredictionGeneratorService(budget.pk, history["periods"]["2024_01"].pk)
+
+        with CaptureQueriesContext(connection) as context:
+            service.get_predictions()
+
+        assert len(context.captured_queries) == 3
+
+    def test_no_history(self, budget: Budget):
+        """
+        GIVEN: Single BudgetingPeriod of Budget.
+        WHEN: ExpensePredictionGeneratorService.get_predictions called for it.
+        THEN: Empty list returned.
+        """
+        period = BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 1).generate()[0]
+
+        assert ExpensePredictionGeneratorService(budget.pk, period.pk).get_predictions() == []
+
+    @pytest.mark.parametrize("overwrite, expected_value", ((True, Decimal("450.00")), (False, Decimal("1.00"))))
+    def test_save(
+        self,
+        budget: Budget,
+        history: dict,
+        expense_prediction_factory: FactoryMetaClass,
+        overwrite: bool,
+        expected_value: Decimal,
+    ):
+        """
+        GIVEN: Expenses in BudgetingPeriods preceding target BudgetingPeriod and ExpensePrediction of "Food" category
+        in target period.
+        WHEN: ExpensePredictionGeneratorService.save called with proposed values.
+        THEN: Missing ExpensePredictions created, existing one value updated only if overwrite is True, its
+        description left unchanged.
+        """
+        target = history["periods"]["2024_01"]
+        existing = expense_prediction_factory(
+            period=target, category=history["food"], value=Decimal("1.00"), description="Groceries"
+        )
+        service = ExpensePredictionGeneratorService(budget.pk, target.pk)
+
+        service.save(service.get_predictions(), overwrite=overwrite)
+
+        existing.refresh_from_db()
+        assert existing.value == expected_value
+        assert existing.description == "Groceries"
+        assert ExpensePrediction.objects.get(period=target, category=history["bills"]).value == Decimal("10.00")
+        assert ExpensePrediction.objects.filter(period=target).count() == 2
@@ -3,11 +3,15 @@ from typing import Any
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from budgets.models.budget_model import Budget
+from categories.models.transfer_category_choices import ExpenseCategoryPriority
 from predictions.models.expense_prediction_model import ExpensePrediction
 from predictions.serializers.expense_prediction_serializer import ExpensePredictionSerializer
 
@@ -75,7 +79,7 @@ class TestExpensePredictionViewSetList:
 
         response = api_client.get(expense_prediction_url(budget.id))
 
-        predictions = ExpensePrediction.objects.filter(period__budget=budget)
+        predictions = ExpensePrediction.objects.filter(period__budget=budget).order_by("id")
         serializer = ExpensePredictionSerializer(predictions, many=True)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["results"] == serializer.data
@@ -637,3 +641,540 @@ class TestExpensePredictionViewSetDelete:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not ExpensePrediction.objects.filter(period__budget=budget).exists()
+
+
+def expense_prediction_progress_url(budget_id: int):
+    """Create and return an ExpensePrediction progress URL."""
+    return reverse("budgets:expense_prediction-progress", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetProgress:
+    """Tests for progress view on ExpensePredictionViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.get(expense_prediction_progress_url(budget.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(expense_prediction_progress_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_get_progress(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePredictions and Expenses for two BudgetingPeriods of Budget in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET for one BudgetingPeriod by Budget member.
+        THEN: HTTP 200 returned with planned, spent, remaining values and percent used for every category with
+        prediction or Expenses in period.
+        """
+        budget = budget_factory(owner=base_user)
+        period, other_period = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+        food = expense_category_factory(budget=budget, name="Food", priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+        bills = expense_category_factory(budget=budget, name="Bills", priority=ExpenseCategoryPriority.DEBTS)
+        fun = expense_category_factory(budget=budget, name="Fun", priority=ExpenseCategoryPriority.OTHERS)
+        expense_category_factory(budget=budget, name="Unused", priority=ExpenseCategoryPriority.OTHERS)
+        food_prediction = expense_prediction_factory(budget=budget, period=period, category=food, value=Decimal("200"))
+        bills_prediction = expense_prediction_factory(budget=budget, period=period, category=bills, value=Decimal("80"))
+        expense_prediction_factory(budget=budget, period=other_period, category=fun, value=Decimal("10"))
+        expense_factory(budget=budget, period=period, category=food, value=Decimal("30.00"))
+        expense_factory(budget=budget, period=period, category=food, value=Decimal("20.00"))
+        expense_factory(budget=budget, period=period, category=fun, value=Decimal("15.00"))
+        expense_factory(budget=budget, period=other_period, category=bills, value=Decimal("1000.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expense_prediction_progress_url(budget.id), {"period": period.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "prediction_id": food_prediction.id,
+                "category_id": food.id,
+                "category_name": "Food",
+                "planned": "200.00",
+                "spent": "50.00",
+                "remaining": "150.00",
+                "percent_used": "25.00",
+            },
+            {
+                "prediction_id": bills_prediction.id,
+                "category_id": bills.id,
+                "category_name": "Bills",
+                "planned": "80.00",
+                "spent": "0.00",
+                "remaining": "80.00",
+                "percent_used": "0.00",
+            },
+            {
+                "prediction_id": None,
+                "category_id": fun.id,
+                "category_name": "Fun",
+                "planned": None,
+                "spent": "15.00",
+                "remaining": "-15.00",
+                "percent_used": None,
+            },
+        ]
+
+    def test_single_query(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Five ExpensePredictions for BudgetingPeriod of Budget in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET by Budget member.
+        THEN: HTTP 200 returned. Progress computed with single query on categories table.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        for _ in range(5):
+            expense_prediction_factory(budget=budget, period=period)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(expense_prediction_progress_url(budget.id), {"period": period.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 5
+        assert (
+            len([query for query in context.captured_queries if "predictions_expenseprediction" in query["sql"]]) == 1
+        )
+
+    @pytest.mark.parametrize(
+        "period, message",
+        [(None, "This query param is required."), ("abc", "BudgetingPeriod does not exist in Budget.")],
+    )
+    def test_error_invalid_period(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        period: str | None,
+        message: str,
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET without or with invalid "period" param.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expense_prediction_progress_url(budget.id), {"period": period} if period else {})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["period"][0] == message
+
+    def test_error_period_from_other_budget(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod of other Budget in database.
+        WHEN: ExpensePredictionViewSet progress view called with GET with other Budget period.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory()
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(expense_prediction_progress_url(budget.id), {"period": period.id})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["period"][0] == "BudgetingPeriod does not exist in Budget."
+
+
+def expense_prediction_bulk_url(budget_id: int):
+    """Create and return an ExpensePrediction bulk URL."""
+    return reverse("budgets:expense_prediction-bulk", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetBulk:
+    """Tests for bulk view on ExpensePredictionViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet bulk view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(expense_prediction_bulk_url(budget.id), [], format="json")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet bulk view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(expense_prediction_bulk_url(budget.id), [], format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_bulk_upsert(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePrediction for one of two ExpenseCategories in BudgetingPeriod in database.
+        WHEN: ExpensePredictionViewSet bulk view called with POST by Budget member with predictions for both
+        categories.
+        THEN: HTTP 200 returned, existing ExpensePrediction updated and missing one created with single INSERT query.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        food, bills = expense_category_factory(budget=budget), expense_category_factory(budget=budget)
+        existing = expense_prediction_factory(period=period, category=food, value=Decimal("10.00"))
+        payload = [
+            {"period": period.id, "category": food.id, "value": "150.00", "description": "Food"},
+            {"period": period.id, "category": bills.id, "value": "300.00", "description": "Bills"},
+        ]
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(expense_prediction_bulk_url(budget.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [query["sql"].split()[0] for query in context.captured_queries].count("INSERT") == 1
+        existing.refresh_from_db()
+        assert existing.value == Decimal("150.00")
+        assert existing.description == "Food"
+        predictions = [existing, ExpensePrediction.objects.get(period=period, category=bills)]
+        assert response.data == ExpensePredictionSerializer(predictions, many=True).data
+        assert ExpensePrediction.objects.filter(period=period).count() == 2
+
+    @pytest.mark.parametrize(
+        "row, field, message",
+        (
+            ({"value": "-1.00"}, "value", "Value should be higher than 0.00."),
+            ({"period": 0}, "period", 'Invalid pk "0" - object does not exist.'),
+            ({"category": 0}, "category", 'Invalid pk "0" - object does not exist.'),
+        ),
+    )
+    def test_error_on_invalid_row(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        row: dict,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: BudgetingPeriod and ExpenseCategory of Budget in database.
+        WHEN: ExpensePredictionViewSet bulk view called with POST by Budget member with one invalid row.
+        THEN: HTTP 400 returned with error under invalid row index, no ExpensePrediction created.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        categories = [expense_category_factory(budget=budget), expense_category_factory(budget=budget)]
+        payload = [{"period": period.id, "category": category.id, "value": "100.00"} for category in categories]
+        payload[1].update(row)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(expense_prediction_bulk_url(budget.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["detail"]) == [1]
+        assert str(response.data["detail"][1][field][0]) == message
+        assert not ExpensePrediction.objects.exists()
+
+    def test_error_on_duplicated_row(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod and ExpenseCategory of Budget in database.
+        WHEN: ExpensePredictionViewSet bulk view called with POST by Budget member with two rows for the same period
+        and category.
+        THEN: HTTP 400 returned with error under duplicated row index.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        category = expense_category_factory(budget=budget)
+        payload = [{"period": period.id, "category": category.id, "value": "100.00"}] * 2
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(expense_prediction_bulk_url(budget.id), payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][1]["non_field_errors"][0] == (
+            "ExpensePrediction for period and category given twice."
+        )
+        assert not ExpensePrediction.objects.exists()
+
+
+def expense_prediction_copy_url(budget_id: int):
+    """Create and return an ExpensePrediction copy URL."""
+    return reverse("budgets:expense_prediction-copy", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetCopy:
+    """Tests for copy view on ExpensePredictionViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet copy view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(expense_prediction_copy_url(budget.id), {})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet copy view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(expense_prediction_copy_url(budget.id), {})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_copy_predictions(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_prediction_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: ExpensePredictions in source BudgetingPeriod of Budget in database.
+        WHEN: ExpensePredictionViewSet copy view called with POST by Budget member with scale and rounding.
+        THEN: HTTP 200 returned with number of copied ExpensePredictions, scaled and rounded values saved in target
+        period.
+        """
+        budget = budget_factory(owner=base_user)
+        source, target = budgeting_period_factory(budget=budget), budgeting_period_factory(budget=budget)
+        category = expense_category_factory(budget=budget)
+        expense_prediction_factory(period=source, category=category, value=Decimal("98.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            expense_prediction_copy_url(budget.id),
+            {"source_period": source.id, "target_period": target.id, "scale": "1.05", "rounding": "5"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"copied": 1}
+        assert ExpensePrediction.objects.get(period=target, category=category).value == Decimal("105.00")
+
+    @pytest.mark.parametrize(
+        "source_period, target_period, field, message",
+        (
+            ("source", "source", "non_field_errors", "Source and target periods have to be different."),
+            ("source", "other", "target_period", "BudgetingPeriod does not exist in Budget."),
+            ("other", "source", "source_period", "BudgetingPeriod does not exist in Budget."),
+        ),
+    )
+    def test_error_on_invalid_periods(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        source_period: str,
+        target_period: str,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: BudgetingPeriods of Budget and of other Budget in database.
+        WHEN: ExpensePredictionViewSet copy view called with POST by Budget member with invalid periods.
+        THEN: HTTP 400 returned with error message.
+        """
+        budget = budget_factory(owner=base_user)
+        source = budgeting_period_factory(budget=budget)
+        other = budgeting_period_factory(budget=budget_factory(owner=base_user))
+        api_client.force_authenticate(base_user)
+
+        periods = {"source": source.id, "other": other.id}
+        payload = {"source_period": periods[source_period], "target_period": periods[target_period]}
+
+        response = api_client.post(expense_prediction_copy_url(budget.id), payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+
+def expense_prediction_generate_url(budget_id: int):
+    """Create and return an ExpensePrediction generate URL."""
+    return reverse("budgets:expense_prediction-generate", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpensePredictionViewSetGenerate:
+    """Tests for generate view on ExpensePredictionViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet generate view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.post(expense_prediction_generate_url(budget.id), {})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpensePredictionViewSet generate view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(expense_prediction_generate_url(budget.id), {})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    @pytest.mark.parametrize("commit", (False, True))
+    def test_generate_predictions(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+        commit: bool,
+    ):
+        """
+        GIVEN: Expenses in two BudgetingPeriods preceding target BudgetingPeriod of Budget in database.
+        WHEN: ExpensePredictionViewSet generate view called with POST by Budget member with given commit param.
+        THEN: HTTP 200 returned with proposed values, ExpensePredictions saved only if commit is True.
+        """
+        budget = budget_factory(owner=base_user)
+        periods = [budgeting_period_factory(budget=budget) for _ in range(3)]
+        category = expense_category_factory(budget=budget, name="Food")
+        expense_factory(budget=budget, period=periods[0], category=category, value=Decimal("100.00"))
+        expense_factory(budget=budget, period=periods[1], category=category, value=Decimal("300.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            expense_prediction_generate_url(budget.id),
+            {"period": periods[2].id, "method": "median", "commit": commit},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [{"category_id": category.id, "category_name": "Food", "value": "200.00"}]
+        assert ExpensePrediction.objects.filter(period=periods[2], category=category).exists() is commit
+
+    @pytest.mark.parametrize(
+        "payload, field, message",
+        (
+            ({"method": "mode"}, "method", '"mode" is not a valid choice.'),
+            ({"periods_count": 0}, "periods_count", "Ensure this value is greater than or equal to 1."),
+            ({"trim": 0.5}, "trim", "Ensure this value is less than or equal to 0.49."),
+        ),
+    )
+    def test_error_on_invalid_params(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        payload: dict,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: BudgetingPeriod of Budget in database.
+        WHEN: ExpensePredictionViewSet generate view called with POST by Budget member with invalid params.
+        THEN: HTTP 400 returned with error message.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(expense_prediction_generate_url(budget.id), {"period": period.id, **payload})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+    def test_error_on_period_from_other_budget(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: BudgetingPeriod of other Budget in database.
+        WHEN: ExpensePredictionViewSet generate view called with POST by Budget member for other Budget period.
+        THEN: HTTP 400 returned with error message.
+        """
+        budget = budget_factory(owner=base_user)
+        period = budgeting_period_factory(budget=budget_factory(owner=base_user))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(expense_prediction_generate_url(budget.id), {"period": period.id})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["period"][0] == "BudgetingPeriod does not exist in Budget."
@@ -70,7 +70,7 @@ class TestExpenseFilterSetOrdering:
         response = api_client.get(transfers_url(budget.id), data={"ordering": sort_param})
 
         assert response.status_code == status.HTTP_200_OK
-        transfers = Expense.objects.all().order_by(sort_param)
+        transfers = Expense.objects.all().order_by(sort_param, "id")
         serializer = ExpenseSerializer(transfers, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(transfers) == 5
@@ -3,6 +3,7 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.db import connection
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -70,7 +71,7 @@ class TestIncomeFilterSetOrdering:
         response = api_client.get(transfers_url(budget.id), data={"ordering": sort_param})
 
         assert response.status_code == status.HTTP_200_OK
-        transfers = Income.objects.all().order_by(sort_param)
+        transfers = Income.objects.all().order_by(sort_param, "id")
         serializer = IncomeSerializer(transfers, many=True)
         assert response.data["results"] and serializer.data
         assert len(response.data["results"]) == len(serializer.data) == len(transfers) == 5
@@ -418,3 +419,49 @@ class TestIncomeFilterSetFiltering:
         assert len(response.data["results"]) == len(serializer.data) == transfers.count() == 1
         assert response.data["results"] == serializer.data
         assert response.data["results"][0]["id"] == transfer.id
+
+    def test_get_transfers_list_searched(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Income model objects for single Budget with different names and descriptions.
+        WHEN: The IncomeViewSet list view is called with "search" filter.
+        THEN: Response contains only Incomes matching searched phrase in name or description.
+        """
+        budget = budget_factory(owner=base_user)
+        in_description = income_factory(budget=budget, name="Other", description="Salary for September")
+        in_name = income_factory(budget=budget, name="Salary", description="September")
+        income_factory(budget=budget, name="Bonus", description="For September")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_url(budget.id), data={"search": "salar sept", "ordering": "id"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [in_description.id, in_name.id]
+
+    @pytest.mark.skipif(connection.vendor != "postgresql", reason="Search results are ranked only on PostgreSQL.")
+    def test_get_transfers_list_searched_ordered_by_rank(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Income model objects for single Budget with searched phrase in name or in description.
+        WHEN: The IncomeViewSet list view is called with "search" filter without ordering.
+        THEN: Response contains Incomes ordered by relevance.
+        """
+        budget = budget_factory(owner=base_user)
+        in_description = income_factory(budget=budget, name="Other", description="Salary for September")
+        in_name = income_factory(budget=budget, name="Salary", description="September")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_url(budget.id), data={"search": "salar sept"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [in_name.id, in_description.id]
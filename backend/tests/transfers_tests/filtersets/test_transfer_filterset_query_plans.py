@@ -0,0 +1,184 @@
+"""
+Query plans regression suite for TransferFilterSet.
+
+Every filter and ordering combination of Transfer list endpoints is checked with EXPLAIN on dataset, in which
+listed Budget contains small part of all Transfers. Plan is considered degraded, when Transfers table is read
+without index condition - with sequential scan or with full index scan followed by filtering or sorting of the
+whole table - or when Transfers ordered by own indexed field are sorted instead of read in index order.
+"""
+
+import json
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import cycle, islice
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from factory.base import FactoryMetaClass
+from rest_framework.test import APIRequestFactory
+
+from budgets.models import Budget
+from categories.models.transfer_category_choices import ExpenseCategoryPriority, IncomeCategoryPriority
+from transfers.models.transfer_model import Transfer
+from transfers.views.expense_viewset import ExpenseViewSet
+from transfers.views.income_viewset import IncomeViewSet
+
+LISTED_BUDGET_SIZE = 200
+OTHER_BUDGET_SIZE = 20000
+PAGE_SIZE = 10
+
+ORDERINGS = (
+    "id",
+    "name",
+    "value",
+    "date",
+    "period__name",
+    "entity__name",
+    "deposit__name",
+    "category__name",
+    "category__priority",
+    "-date",
+)
+INDEXED_ORDERINGS = ("id", "name", "value", "date")
+
+pytestmark = [
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="Query plans are checked with PostgreSQL EXPLAIN."),
+    pytest.mark.slow,
+]
+
+
+def create_transfers(
+    budget: Budget,
+    owner: AbstractUser,
+    size: int,
+    factories: dict[str, FactoryMetaClass],
+) -> dict[str, list]:
+    """Creates Transfers of both types for Budget and returns related objects used for them."""
+    periods = [
+        factories["budgeting_period"](
+            budget=budget,
+            name=f"Period {index}",
+            date_start=date(2024, index + 1, 1),
+            date_end=date(2024, index + 1, 28),
+        )
+        for index in range(4)
+    ]
+    entities = [factories["entity"](budget=budget) for _ in range(3)]
+    deposits = [factories["deposit"](budget=budget) for _ in range(2)]
+    categories = [
+        factories["income_category"](budget=budget, owner=None, priority=IncomeCategoryPriority.REGULAR),
+        factories["income_category"](budget=budget, owner=owner, priority=IncomeCategoryPriority.IRREGULAR),
+        factories["expense_category"](budget=budget, owner=None, priority=ExpenseCategoryPriority.MOST_IMPORTANT),
+        factories["expense_category"](budget=budget, owner=owner, priority=ExpenseCategoryPriority.OTHERS),
+    ]
+    Transfer.objects.bulk_create(
+        (
+            Transfer(
+                name=f"Transfer {index}",
+                value=Decimal(index % 1000 + 1),
+                date=period.date_start + timedelta(days=index % 28),
+                period=period,
+                entity=entity,
+                deposit=deposit,
+                category=category,
+            )
+            for index, period, entity, deposit, category in zip(
+                range(size), cycle(periods), cycle(entities), cycle(deposits), islice(cycle(categories), 1, None)
+            )
+        ),
+        batch_size=5000,
+    )
+    return {"period": periods, "entity": entities, "deposit": deposits, "category": categories}
+
+
+def get_full_scans(plan: dict, table: str) -> list[str]:
+    """Returns types of plan nodes reading whole given table."""
+    scans = []
+    if plan.get("Relation Name") == table and (
+        plan["Node Type"] == "Seq Scan"
+        or (plan["Node Type"] in ("Index Scan", "Index Only Scan") and "Index Cond" not in plan)
+    ):
+        scans.append(plan["Node Type"])
+    for subplan in plan.get("Plans", []):
+        scans.extend(get_full_scans(subplan, table))
+    return scans
+
+
+def get_sorts(plan: dict) -> list[str]:
+    """Returns types of sorting plan nodes."""
+    sorts = [plan["Node Type"]] if "Sort" in plan["Node Type"] else []
+    for subplan in plan.get("Plans", []):
+        sorts.extend(get_sorts(subplan))
+    return sorts
+
+
+@pytest.mark.django_db
+class TestTransferFilterSetQueryPlans:
+    """Tests for query plans of Transfers list filtered and ordered with TransferFilterSet."""
+
+    @pytest.mark.parametrize("viewset_class, category_index", ((IncomeViewSet, 0), (ExpenseViewSet, 2)))
+    def test_no_full_table_scans(
+        self,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        viewset_class: type,
+        category_index: int,
+    ):
+        """
+        GIVEN: Budget with small part of all Transfers in database and statistics of Transfers table collected.
+        WHEN: Transfers list QuerySet built by viewset for every filter and ordering combination and explained.
+        THEN: Transfers table read with index condition for every combination. Not filtered Transfers ordered by
+        Transfer fields read in index order, without sorting.
+        """
+        factories = {
+            "budgeting_period": budgeting_period_factory,
+            "entity": entity_factory,
+            "deposit": deposit_factory,
+            "income_category": income_category_factory,
+            "expense_category": expense_category_factory,
+        }
+        budget = budget_factory(owner=base_user)
+        related = create_transfers(budget, base_user, LISTED_BUDGET_SIZE, factories)
+        create_transfers(budget_factory(), base_user, OTHER_BUDGET_SIZE, factories)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Transfer._meta.db_table}")
+        filters = {
+            "none": {},
+            "name": {"name": "Transfer 1"},
+            "period": {"period": related["period"][0].id},
+            "entity": {"entity": related["entity"][0].id},
+            "deposit": {"deposit": related["deposit"][0].id},
+            "category": {"category": related["category"][category_index].id},
+            "owner": {"owner": base_user.id},
+            "common_only": {"common_only": "true"},
+            "date": {"date_after": "2024-01-10", "date_before": "2024-02-10"},
+            "value": {"value_min": "100", "value_max": "500"},
+        }
+
+        degraded = {}
+        for filter_name, params in filters.items():
+            for ordering in ORDERINGS:
+                view = viewset_class(
+                    action="list",
+                    action_map={"get": "list"},
+                    args=(),
+                    kwargs={"budget_pk": budget.id},
+                    format_kwarg=None,
+                )
+                view.request = view.initialize_request(APIRequestFactory().get("/", {**params, "ordering": ordering}))
+                queryset = view.filter_queryset(view.get_queryset())
+                rows = view.get_values_queryset(queryset, view.get_values_fields(queryset))[:PAGE_SIZE]
+                plan = json.loads(rows.explain(format="json"))[0]["Plan"]
+                issues = get_full_scans(plan, Transfer._meta.db_table)
+                if not params and ordering.lstrip("-") in INDEXED_ORDERINGS:
+                    issues.extend(get_sorts(plan))
+                if issues:
+                    degraded[f"{filter_name}, ordering={ordering}"] = issues
+
+        assert degraded == {}
@@ -0,0 +1,73 @@
+import datetime
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from factory.base import FactoryMetaClass
+
+from categories.models.transfer_category_choices import ExpenseCategoryPriority
+from transfers.models.expense_model import Expense
+
+
+@pytest.mark.django_db
+class TestImportTransfersCsvCommand:
+    """Tests for import_transfers_csv admin command."""
+
+    def test_import_expenses(
+        self,
+        tmp_path: Path,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod, Entity, Deposit and ExpenseCategory. CSV file with two Expenses.
+        WHEN: import_transfers_csv command called for Budget with "expense" type and custom value column.
+        THEN: Two Expenses created in database.
+        """
+        budget = budget_factory()
+        budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        entity_factory(budget=budget, name="Shop")
+        deposit_factory(budget=budget, name="Bank account")
+        expense_category_factory(budget=budget, name="Food", priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+        path = tmp_path / "expenses.csv"
+        path.write_text(
+            "name,Amount,date,entity,deposit,category\n"
+            "Bread,10.50,2024-09-01,Shop,Bank account,Food\n"
+            "Milk,5.00,2024-09-02,Shop,Bank account,Food\n"
+        )
+
+        call_command("import_transfers_csv", str(path), budget=budget.pk, type="expense", column=["value=Amount"])
+
+        assert Expense.objects.filter(period__budget=budget).count() == 2
+
+    def test_error_invalid_rows(self, tmp_path: Path, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget without Entities and CSV file with Expense referencing not existing Entity.
+        WHEN: import_transfers_csv command called for Budget.
+        THEN: CommandError raised. No Expense created.
+        """
+        budget = budget_factory()
+        path = tmp_path / "expenses.csv"
+        path.write_text("name,value,date,entity,deposit,category\nBread,10.50,2024-09-01,Shop,Bank account,Food\n")
+
+        with pytest.raises(CommandError, match="CSV file contains 1 invalid rows."):
+            call_command("import_transfers_csv", str(path), budget=budget.pk, type="expense")
+
+        assert not Expense.objects.filter(period__budget=budget).exists()
+
+    def test_error_budget_does_not_exist(self, tmp_path: Path):
+        """
+        GIVEN: No Budget in database.
+        WHEN: import_transfers_csv command called for not existing Budget.
+        THEN: CommandError raised.
+        """
+        path = tmp_path / "expenses.csv"
+        path.write_text("name,value,date,entity,deposit,category\n")
+
+        with pytest.raises(CommandError, match="Budget with id 1 does not exist."):
+            call_command("import_transfers_csv", str(path), budget=1, type="expense")
@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import CommandError, call_command
+from factory.base import FactoryMetaClass
+
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+@pytest.mark.django_db
+class TestRebuildTransferRollupsCommand:
+    """Tests for rebuild_transfer_rollups admin command."""
+
+    def test_check_up_to_date(self, expense_factory: FactoryMetaClass, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Expense and Income model instances in database.
+        WHEN: rebuild_transfer_rollups command called with --check flag.
+        THEN: No error raised.
+        """
+        expense_factory()
+        income_factory()
+
+        call_command("rebuild_transfer_rollups", check=True)
+
+    def test_check_out_of_date(self, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Expense model instance in database with modified TransferRollup row.
+        WHEN: rebuild_transfer_rollups command called with --check flag.
+        THEN: CommandError raised. TransferRollup row not changed.
+        """
+        expense = expense_factory()
+        TransferRollup.objects.update(value=Decimal("0.01"))
+
+        with pytest.raises(CommandError, match="Found 1 BudgetingPeriods with out of date TransferRollups."):
+            call_command("rebuild_transfer_rollups", check=True)
+
+        assert TransferRollup.objects.get(period=expense.period).value == Decimal("0.01")
+
+    def test_rebuild(self, expense_factory: FactoryMetaClass, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Expenses for two Budgets in database with removed and modified TransferRollup rows.
+        WHEN: rebuild_transfer_rollups command called for one Budget.
+        THEN: TransferRollup rows of given Budget recomputed, rows of other Budget not changed.
+        """
+        budget, other_budget = budget_factory(), budget_factory()
+        expense = expense_factory(budget=budget, value=Decimal("10.00"))
+        other_expense = expense_factory(budget=other_budget, value=Decimal("20.00"))
+        TransferRollup.objects.filter(period=expense.period).delete()
+        TransferRollup.objects.filter(period=other_expense.period).update(value=Decimal("0.01"))
+
+        call_command("rebuild_transfer_rollups", budget=budget.pk)
+
+        assert TransferRollup.objects.get(period=expense.period).value == Decimal("10.00")
+        assert TransferRollup.objects.get(period=other_expense.period).value == Decimal("0.01")
@@ -7,7 +7,7 @@ from django.db import DataError, IntegrityError
 from factory.base import BaseFactory, FactoryMetaClass
 
 from budgets.models.budget_model import Budget
-from categories.models.transfer_category_choices import ExpenseCategoryPriority, IncomeCategoryPriority
+from categories.models.transfer_category_choices import CategoryType, ExpenseCategoryPriority, IncomeCategoryPriority
 from transfers.models.transfer_model import Transfer
 
 
@@ -307,3 +307,62 @@ class TestTransferModel:
 
         assert str(exc.value.args[0]) == "Budget for period, category, entity and deposit fields is not the same."
         assert not Transfer.objects.all().exists()
+
+    def test_budget_and_transfer_type_filled_on_save(self, budget: Budget, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: Income created with factory.
+        THEN: Denormalized "budget" and "transfer_type" fields filled from period and category.
+        """
+        income = income_factory(budget=budget)
+
+        income.refresh_from_db()
+        assert income.budget_id == budget.id
+        assert income.transfer_type == CategoryType.INCOME
+
+    def test_budget_and_transfer_type_filled_on_bulk_create(
+        self, budget: Budget, income_factory: FactoryMetaClass, expense_category_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Income and ExpenseCategory of Budget in database.
+        WHEN: Transfer bulk created with related objects passed as ids.
+        THEN: Denormalized "budget" and "transfer_type" fields filled from period and category.
+        """
+        income = income_factory(budget=budget)
+        category = expense_category_factory(budget=budget)
+
+        Transfer.objects.bulk_create(
+            [
+                Transfer(
+                    name="Bulk",
+                    value=Decimal("10.00"),
+                    date=income.date,
+                    period_id=income.period_id,
+                    entity_id=income.entity_id,
+                    deposit_id=income.deposit_id,
+                    category_id=category.id,
+                )
+            ]
+        )
+
+        transfer = Transfer.objects.get(name="Bulk")
+        assert transfer.budget_id == budget.id
+        assert transfer.transfer_type == CategoryType.EXPENSE
+        assert Transfer.expenses.filter(budget=budget).get() == transfer
+
+    def test_transfer_type_changed_on_update(
+        self, budget: Budget, income_factory: FactoryMetaClass, expense_category_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Income and ExpenseCategory of Budget in database.
+        WHEN: Transfer category changed with QuerySet.update.
+        THEN: Denormalized "transfer_type" field changed to ExpenseCategory type.
+        """
+        income = income_factory(budget=budget)
+        category = expense_category_factory(budget=budget)
+
+        Transfer.objects.filter(pk=income.pk).update(category=category.id)
+
+        income.refresh_from_db()
+        assert income.transfer_type == CategoryType.EXPENSE
+        assert not Transfer.incomes.exists()
@@ -0,0 +1,258 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.db.models.signals import post_delete
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from budgets.models.budget_model import Budget
+from categories.models.transfer_category_choices import ExpenseCategoryPriority
+from transfers.managers.transfer_manager import TransferQuerySet
+from transfers.managers.transfer_rollup_manager import TransferRollupQuerySet
+from transfers.models.expense_model import Expense
+from transfers.models.transfer_model import Transfer
+from transfers.models.transfer_rollup_model import TransferRollup
+
+
+def get_rollups() -> dict[tuple, tuple[Decimal, int]]:
+    """
+    Returns stored TransferRollup rows.
+
+    Returns:
+        dict[tuple, tuple[Decimal, int]]: Value and count mapped by rollup key.
+    """
+    key_fields = TransferRollupQuerySet.KEY_FIELDS
+    return {
+        tuple(row[field] for field in key_fields): (row["value"], row["count"])
+        for row in TransferRollup.objects.values(*key_fields, "value", "count")
+    }
+
+
+def assert_rollups_up_to_date() -> None:
+    """Checks if stored TransferRollup rows are equal to rows aggregated from Transfers."""
+    key_fields = TransferRollupQuerySet.KEY_FIELDS
+    expected = {
+        tuple(row[field] for field in key_fields): (row["value"], row["count"])
+        for row in TransferRollup.objects.get_expected_rows()
+    }
+    assert get_rollups() == expected
+
+
+@pytest.mark.django_db
+class TestTransferRollupModel:
+    """Tests for maintaining TransferRollup rows on Transfer changes."""
+
+    def test_create_transfers(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: Two Expenses with the same period, category, entity and deposit and one other Expense created.
+        THEN: Two TransferRollup rows with sums and counts of Expenses created.
+        """
+        expense = expense_factory(budget=budget, value=Decimal("10.00"))
+        expense_factory(
+            budget=budget,
+            period=expense.period,
+            category=expense.category,
+            entity=expense.entity,
+            deposit=expense.deposit,
+            value=Decimal("5.50"),
+        )
+        other_expense = expense_factory(budget=budget, value=Decimal("1.00"))
+
+        assert get_rollups() == {
+            expense.get_rollup_key(): (Decimal("15.50"), 2),
+            other_expense.get_rollup_key(): (Decimal("1.00"), 1),
+        }
+
+    def test_update_value(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Expense model instance in database.
+        WHEN: Expense value changed and saved.
+        THEN: TransferRollup row value updated, count unchanged.
+        """
+        expense = expense_factory(budget=budget, value=Decimal("10.00"))
+
+        expense.value = Decimal("25.00")
+        expense.save()
+
+        assert get_rollups() == {expense.get_rollup_key(): (Decimal("25.00"), 1)}
+
+    @pytest.mark.parametrize("field", ["category", "entity", "deposit", "period"])
+    def test_move_transfer(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        field: str,
+    ):
+        """
+        GIVEN: Two Expense model instances with the same period, category, entity and deposit in database.
+        WHEN: One of Expenses moved to other category, entity, deposit or period.
+        THEN: Expense value moved between TransferRollup rows.
+        """
+        expense = expense_factory(budget=budget, value=Decimal("10.00"))
+        moved_expense = expense_factory(
+            budget=budget,
+            period=expense.period,
+            category=expense.category,
+            entity=expense.entity,
+            deposit=expense.deposit,
+            value=Decimal("4.00"),
+        )
+        old_key = expense.get_rollup_key()
+        if field == "period":
+            new_period = budgeting_period_factory(budget=budget)
+            moved_expense.period, moved_expense.date = new_period, new_period.date_start
+        else:
+            factory = {"category": expense_category_factory, "entity": entity_factory, "deposit": deposit_factory}
+            setattr(moved_expense, field, factory[field](budget=budget))
+
+        moved_expense.save()
+
+        assert get_rollups() == {
+            old_key: (Decimal("10.00"), 1),
+            moved_expense.get_rollup_key(): (Decimal("4.00"), 1),
+        }
+
+    def test_delete_transfer(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Two Expense model instances with different keys in database.
+        WHEN: One Expense deleted.
+        THEN: TransferRollup row of deleted Expense removed.
+        """
+        expense = expense_factory(budget=budget, value=Decimal("10.00"))
+        other_expense = expense_factory(budget=budget, value=Decimal("1.00"))
+
+        expense.delete()
+
+        assert get_rollups() == {other_expense.get_rollup_key(): (Decimal("1.00"), 1)}
+
+    def test_queryset_delete(self, budget: Budget, expense_factory: FactoryMetaClass, income_factory: FactoryMetaClass):
+        """
+        GIVEN: Expense and Income model instances in database.
+        WHEN: Expenses deleted with QuerySet delete.
+        THEN: Only TransferRollup row of Income left.
+        """
+        expense_factory(budget=budget)
+        income = income_factory(budget=budget)
+
+        Expense.objects.all().delete()
+
+        assert list(get_rollups().keys()) == [income.get_rollup_key()]
+
+    def test_queryset_delete_rebuilds_affected_keys(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Five Expenses with the same rollup key and other Expense in database.
+        WHEN: Single Expense and then three Expenses with the same key deleted with QuerySet delete.
+        THEN: The same number of queries executed for both deletes. TransferRollup rows recomputed from remaining
+        Transfers.
+        """
+        expenses = [expense_factory(budget=budget)]
+        for _ in range(4):
+            expenses.append(
+                expense_factory(
+                    budget=budget,
+                    period=expenses[0].period,
+                    category=expenses[0].category,
+                    entity=expenses[0].entity,
+                    deposit=expenses[0].deposit,
+                )
+            )
+        untouched_expense = expense_factory(budget=budget)
+
+        with CaptureQueriesContext(connection) as single_context:
+            single_deleted, _ = Expense.objects.filter(pk=expenses[1].pk).delete()
+        with CaptureQueriesContext(connection) as many_context:
+            many_deleted, _ = Expense.objects.filter(pk__in=[expense.pk for expense in expenses[2:]]).delete()
+
+        assert (single_deleted, many_deleted) == (1, 3)
+        assert len(single_context.captured_queries) == len(many_context.captured_queries)
+        assert get_rollups() == {
+            expenses[0].get_rollup_key(): (expenses[0].value, 1),
+            untouched_expense.get_rollup_key(): (untouched_expense.value, 1),
+        }
+        assert_rollups_up_to_date()
+
+    def test_queryset_delete_sends_signals(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Two Expenses in database and post_delete receiver connected for Expense.
+        WHEN: Expenses deleted with QuerySet delete.
+        THEN: Receiver called for every deleted Expense with QuerySet as origin.
+        """
+        expenses = [expense_factory(budget=budget) for _ in range(2)]
+        calls = []
+
+        def receiver(sender: type, instance: Expense, origin: object, **kwargs):
+            calls.append((instance.pk, isinstance(origin, TransferQuerySet)))
+
+        post_delete.connect(receiver, sender=Expense)
+        try:
+            Expense.objects.filter(period__budget=budget).delete()
+        finally:
+            post_delete.disconnect(receiver, sender=Expense)
+
+        assert sorted(calls) == sorted((expense.pk, True) for expense in expenses)
+        assert_rollups_up_to_date()
+
+    def test_queryset_update(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense model instances in database.
+        WHEN: Category and value of Expenses updated with ExpenseQuerySet update.
+        THEN: TransferRollup rows recomputed for affected periods.
+        """
+        for _ in range(3):
+            expense_factory(budget=budget)
+        category = expense_category_factory(budget=budget, priority=ExpenseCategoryPriority.OTHERS)
+
+        Expense.objects.filter(period__budget=budget).update(category=category, value=Decimal("2.00"))
+
+        assert_rollups_up_to_date()
+        assert {key[1] for key in get_rollups()} == {category.pk}
+
+    def test_queryset_update_period(
+        self, budget: Budget, expense_factory: FactoryMetaClass, budgeting_period_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Expense model instance in database and other BudgetingPeriod with the same dates range.
+        WHEN: Period of Expense updated with Transfer QuerySet update.
+        THEN: TransferRollup rows recomputed for old and new period.
+        """
+        expense = expense_factory(budget=budget)
+        new_period = budgeting_period_factory(budget=budget)
+
+        Transfer.objects.filter(pk=expense.pk).update(period=new_period, date=new_period.date_start)
+
+        assert_rollups_up_to_date()
+        assert [key[0] for key in get_rollups()] == [new_period.pk]
+
+    def test_bulk_create(self, budget: Budget, expense_factory: FactoryMetaClass):
+        """
+        GIVEN: Expense model instance in database.
+        WHEN: Three Expenses with the same key as existing one created with bulk_create.
+        THEN: TransferRollup row of existing Expense increased with created Expenses.
+        """
+        expense = expense_factory(budget=budget, value=Decimal("1.00"))
+
+        Expense.objects.bulk_create(
+            Expense(
+                name=f"Expense {index}",
+                value=Decimal("2.00"),
+                date=expense.date,
+                period=expense.period,
+                category=expense.category,
+                entity=expense.entity,
+                deposit=expense.deposit,
+            )
+            for index in range(3)
+        )
+
+        assert get_rollups() == {expense.get_rollup_key(): (Decimal("7.00"), 4)}
@@ -0,0 +1,380 @@
+import datetime
+from typing import Any
+
+import pytest
+from factory.base import FactoryMetaClass
+
+from app_infrastructure.services.budget_data_version_service import BudgetDataVersionService
+from budgets.models.budget_model import Budget
+from categories.models.transfer_category_choices import CategoryType
+from transfers.models.expense_model import Expense
+from transfers.services.transfer_autocomplete_service import TransferAutocompleteService, TransferNameIndex
+
+
+class TestTransferNameIndex:
+    """Tests for TransferNameIndex."""
+
+    TODAY = datetime.date(2024, 9, 30)
+
+    def test_search_by_case_insensitive_prefix(self):
+        """
+        GIVEN: TransferNameIndex with names with different prefixes and letter cases.
+        WHEN: TransferNameIndex.search called with lowercase prefix.
+        THEN: Only names starting with prefix returned, most common spelling is used as name.
+        """
+        index = TransferNameIndex()
+        index.add("Coffee shop", self.TODAY, 1, 2, 3)
+        index.add("coffee  shop", self.TODAY, 1, 2, 3)
+        index.add("Coffee shop", self.TODAY, 1, 2, 3)
+        index.add("Cola", self.TODAY, 1, 2, 3)
+        index.add("Bakery", self.TODAY, 1, 2, 3)
+
+        result = index.search("coffee", 10, self.TODAY, 90)
+
+        assert [suggestion["name"] for suggestion in result] == ["Coffee shop"]
+        assert result[0]["count"] == 3
+        assert [suggestion["name"] for suggestion in index.search("CO", 10, self.TODAY, 90)] == ["Coffee shop", "Cola"]
+
+    def test_ranking_by_frequency_and_recency(self):
+        """
+        GIVEN: TransferNameIndex with frequently used old name, less frequently used recent name and rarely used
+        recent name.
+        WHEN: TransferNameIndex.search called.
+        THEN: Names ordered by usage count decayed by age of latest usage, results limited to given number.
+        """
+        index = TransferNameIndex()
+        index.add("Rent old", self.TODAY - datetime.timedelta(days=360), 1, 2, 3, count=10)
+        index.add("Rent", self.TODAY - datetime.timedelta(days=5), 1, 2, 3, count=3)
+        index.add("Refund", self.TODAY, 1, 2, 3, count=1)
+
+        result = index.search("re", 2, self.TODAY, 90)
+
+        assert [suggestion["name"] for suggestion in result] == ["Rent", "Refund"]
+
+    def test_most_common_related_objects(self):
+        """
+        GIVEN: TransferNameIndex with name used with different categories, entities and deposits.
+        WHEN: TransferNameIndex.search called.
+        THEN: Most common category, entity and deposit of name returned.
+        """
+        index = TransferNameIndex()
+        index.add("Groceries", self.TODAY, 1, 10, 100)
+        index.add("Groceries", self.TODAY - datetime.timedelta(days=1), 2, 20, 100)
+        index.add("Groceries", self.TODAY - datetime.timedelta(days=2), 2, 20, 200, count=3)
+
+        result = index.search("gro", 10, self.TODAY, 90)
+
+        assert result == [
+            {
+                "name": "Groceries",
+                "category": 2,
+                "entity": 20,
+                "deposit": 200,
+                "count": 5,
+                "last_date": self.TODAY.isoformat(),
+            }
+        ]
+
+    def test_remove(self):
+        """
+        GIVEN: TransferNameIndex with name used twice.
+        WHEN: TransferNameIndex.remove called twice for name.
+        THEN: Name usage count decreased after first call, name removed from index after second one.
+        """
+        index = TransferNameIndex()
+        index.add("Groceries", self.TODAY, 1, 10, 100)
+        index.add("Groceries", self.TODAY, 2, 20, 200)
+
+        index.remove("groceries", self.TODAY, 1, 10, 100)
+        result = index.search("gro", 10, self.TODAY, 90)
+        index.remove("Groceries", self.TODAY, 2, 20, 200)
+
+        assert result[0]["count"] == 1
+        assert result[0]["category"] == 2
+        assert index.search("gro", 10, self.TODAY, 90) == []
+        assert index.keys == []
+
+    def test_remove_latest_date(self):
+        """
+        GIVEN: TransferNameIndex with name used twice on earlier date and once on later date.
+        WHEN: TransferNameIndex.remove called for usage from later date and for one usage from earlier date.
+        THEN: Date of latest usage changed to earlier date after first call and kept after second one.
+        """
+        earlier_date = self.TODAY - datetime.timedelta(days=10)
+        index = TransferNameIndex()
+        index.add("Groceries", earlier_date, 1, 10, 100, count=2)
+        index.add("Groceries", self.TODAY, 1, 10, 100)
+
+        index.remove("Groceries", self.TODAY, 1, 10, 100)
+        result = index.search("gro", 10, self.TODAY, 90)
+        index.remove("Groceries", earlier_date, 1, 10, 100)
+
+        assert result[0]["last_date"] == earlier_date.isoformat()
+        assert index.search("gro", 10, self.TODAY, 90)[0]["last_date"] == earlier_date.isoformat()
+
+
+@pytest.mark.django_db
+class TestTransferAutocompleteService:
+    """Tests for TransferAutocompleteService."""
+
+    @staticmethod
+    def get_names(budget: Budget, prefix: str = "", transfer_type: int = CategoryType.EXPENSE) -> list[str]:
+        """
+        Returns names suggested by TransferAutocompleteService.
+
+        Args:
+            budget [Budget]: Budget of Transfers.
+            prefix [str]: Searched name prefix.
+            transfer_type [int]: Type of Transfers.
+
+        Returns:
+            list[str]: Suggested names.
+        """
+        return [
+            suggestion["name"]
+            for suggestion in TransferAutocompleteService.get_suggestions(budget.pk, transfer_type, prefix)
+        ]
+
+    def test_index_built_lazily_once(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+    ):
+        """
+        GIVEN: Expenses and Incomes of Budget in database.
+        WHEN: TransferAutocompleteService.get_suggestions called twice.
+        THEN: Index built with database queries on first call, second call served without database queries.
+        Only names of Transfers of given type returned.
+        """
+        expense_factory(budget=budget, name="Groceries")
+        expense_factory(budget=budget, name="Gas")
+        income_factory(budget=budget, name="Gift")
+
+        with django_assert_num_queries(3):
+            first_result = self.get_names(budget, "g")
+        with django_assert_num_queries(0):
+            second_result = self.get_names(budget, "g")
+
+        assert sorted(first_result) == ["Gas", "Groceries"]
+        assert sorted(second_result) == ["Gas", "Groceries"]
+        assert self.get_names(budget, "g", CategoryType.INCOME) == ["Gift"]
+
+    def test_not_existing_budget(self):
+        """
+        GIVEN: No Budget in database.
+        WHEN: TransferAutocompleteService.get_suggestions called for not existing Budget id.
+        THEN: None returned.
+        """
+        assert TransferAutocompleteService.get_suggestions(1, CategoryType.EXPENSE, "") is None
+
+    def test_created_transfers_applied_incrementally(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ):
+        """
+        GIVEN: Index of Budget built.
+        WHEN: Expenses created with save and bulk_create and transactions committed.
+        THEN: Expenses added to index without rebuilding it - only Budget data versions are read from database.
+        """
+        expense = expense_factory(budget=budget, name="Groceries")
+        self.get_names(budget)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Expense.objects.create(
+                name="Gas",
+                value=expense.value,
+                date=expense.date,
+                period=expense.period,
+                category=expense.category,
+                entity=expense.entity,
+                deposit=expense.deposit,
+            )
+        with django_capture_on_commit_callbacks(execute=True):
+            Expense.objects.bulk_create(
+                [
+                    Expense(
+                        name="Gym",
+                        value=expense.value,
+                        date=expense.date,
+                        period=expense.period,
+                        category=expense.category,
+                        entity=expense.entity,
+                        deposit=expense.deposit,
+                    )
+                ]
+            )
+        with django_assert_num_queries(1):
+            result = self.get_names(budget, "g")
+
+        assert sorted(result) == ["Gas", "Groceries", "Gym"]
+
+    def test_deleted_transfer_applied_incrementally(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ):
+        """
+        GIVEN: Index of Budget built.
+        WHEN: Expense deleted and transaction committed.
+        THEN: Expense removed from index without rebuilding it.
+        """
+        expense_factory(budget=budget, name="Groceries")
+        expense = expense_factory(budget=budget, name="Gas")
+        self.get_names(budget)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            expense.delete()
+        with django_assert_num_queries(1):
+            result = self.get_names(budget, "g")
+
+        assert result == ["Groceries"]
+
+    def test_bulk_deleted_transfers_applied_incrementally(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ):
+        """
+        GIVEN: Index of Budget built for three Expenses, two of them with the same name.
+        WHEN: Two Expenses deleted with QuerySet.delete() and transaction committed.
+        THEN: Deleted Expenses removed from index without rebuilding it, remaining usage of name kept.
+        """
+        expense = expense_factory(budget=budget, name="Groceries")
+        for name in ("Groceries", "Gas"):
+            expense_factory(budget=budget, name=name, period=expense.period, category=expense.category)
+        self.get_names(budget)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Expense.objects.filter(period__budget=budget).exclude(pk=expense.pk).delete()
+        with django_assert_num_queries(1):
+            result = TransferAutocompleteService.get_suggestions(budget.pk, CategoryType.EXPENSE, "g")
+
+        assert [(suggestion["name"], suggestion["count"]) for suggestion in result] == [("Groceries", 1)]
+
+    def test_index_kept_on_other_resource_write(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ):
+        """
+        GIVEN: Index of Budget built.
+        WHEN: Entity created in Budget and transaction committed.
+        THEN: Index not rebuilt on next lookup - only Budget data versions are read from database.
+        """
+        expense_factory(budget=budget, name="Groceries")
+        self.get_names(budget)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            entity_factory(budget=budget)
+        with django_assert_num_queries(1):
+            result = self.get_names(budget, "g")
+
+        assert result == ["Groceries"]
+
+    def test_index_rebuilt_when_other_write_applied_before(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        GIVEN: Index of Budget built, TransferAutocompleteService.REBUILD_INTERVAL set to 0.
+        WHEN: Budget Transfers version increased by other write and Expense deleted in current process.
+        THEN: Deletion not applied to stale index, index rebuilt on next lookup.
+        """
+        monkeypatch.setattr(TransferAutocompleteService, "REBUILD_INTERVAL", 0)
+        expense_factory(budget=budget, name="Groceries")
+        expense = expense_factory(budget=budget, name="Gas")
+        self.get_names(budget)
+        version = TransferAutocompleteService._indexes[budget.pk].version
+
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetDataVersionService.bump("transfers", budget_ids=[budget.pk])
+        with django_capture_on_commit_callbacks(execute=True):
+            expense.delete()
+
+        assert TransferAutocompleteService._indexes[budget.pk].version == version
+        assert self.get_names(budget, "g") == ["Groceries"]
+        assert TransferAutocompleteService._indexes[budget.pk].version == version + 2
+
+    def test_updated_transfer_invalidates_index(
+        self, budget: Budget, expense_factory: FactoryMetaClass, django_capture_on_commit_callbacks: Any
+    ):
+        """
+        GIVEN: Index of Budget built.
+        WHEN: Expense name changed with save and with QuerySet update and transactions committed.
+        THEN: Index rebuilt with current Expenses names.
+        """
+        expense = expense_factory(budget=budget, name="Groceries")
+        other_expense = expense_factory(budget=budget, name="Gas")
+        self.get_names(budget)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            expense.name = "Gym"
+            expense.save()
+        first_result = self.get_names(budget, "g")
+        with django_capture_on_commit_callbacks(execute=True):
+            Expense.objects.filter(pk=other_expense.pk).update(name="Gift")
+
+        assert sorted(first_result) == ["Gas", "Gym"]
+        assert sorted(self.get_names(budget, "g")) == ["Gift", "Gym"]
+
+    def test_index_rebuilt_on_not_applied_write(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_capture_on_commit_callbacks: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        GIVEN: Index of Budget built, TransferAutocompleteService.REBUILD_INTERVAL set to 0.
+        WHEN: Expense created without applying it to index and Budget Transfers version increased, as it would be
+        done in other process.
+        THEN: Index rebuilt on next lookup as it is behind Budget Transfers version.
+        """
+        monkeypatch.setattr(TransferAutocompleteService, "REBUILD_INTERVAL", 0)
+        expense = expense_factory(budget=budget, name="Groceries")
+        self.get_names(budget)
+
+        expense_factory(budget=budget, name="Gas", period=expense.period, category=expense.category)
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetDataVersionService.bump("transfers", budget_ids=[budget.pk])
+
+        assert sorted(self.get_names(budget, "g")) == ["Gas", "Groceries"]
+
+    def test_stale_index_served_within_rebuild_interval(
+        self,
+        budget: Budget,
+        expense_factory: FactoryMetaClass,
+        django_assert_num_queries: Any,
+        django_capture_on_commit_callbacks: Any,
+    ):
+        """
+        GIVEN: Index of Budget built less than TransferAutocompleteService.REBUILD_INTERVAL seconds ago.
+        WHEN: Expense created without applying it to index and Budget Transfers version increased, as it would be
+        done in other process.
+        THEN: Stale index served without rebuild - only Budget data versions are read from database.
+        """
+        expense = expense_factory(budget=budget, name="Groceries")
+        self.get_names(budget)
+
+        expense_factory(budget=budget, name="Gas", period=expense.period, category=expense.category)
+        with django_capture_on_commit_callbacks(execute=True):
+            BudgetDataVersionService.bump("transfers", budget_ids=[budget.pk])
+        with django_assert_num_queries(1):
+            result = self.get_names(budget, "g")
+
+        assert result == ["Groceries"]
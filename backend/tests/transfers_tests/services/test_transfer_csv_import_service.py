@@ -0,0 +1,255 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from factory.base import FactoryMetaClass
+
+from budgets.models.budget_model import Budget
+from categories.models.transfer_category_choices import ExpenseCategoryPriority, IncomeCategoryPriority
+from transfers.models.expense_model import Expense
+from transfers.models.income_model import Income
+from transfers.serializers.transfer_bulk_serializer import ExpenseBulkSerializer, IncomeBulkSerializer
+from transfers.services.transfer_csv_import_service import TransferCsvImportError, TransferCsvImportService
+
+
+@pytest.fixture
+def import_budget(
+    budget_factory: FactoryMetaClass,
+    budgeting_period_factory: FactoryMetaClass,
+    entity_factory: FactoryMetaClass,
+    deposit_factory: FactoryMetaClass,
+    expense_category_factory: FactoryMetaClass,
+    income_category_factory: FactoryMetaClass,
+) -> Budget:
+    """Budget with two BudgetingPeriods, Entity, Deposit, ExpenseCategory and IncomeCategory."""
+    budget = budget_factory()
+    budgeting_period_factory(budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30))
+    budgeting_period_factory(budget=budget, date_start=datetime.date(2024, 10, 1), date_end=datetime.date(2024, 10, 31))
+    entity_factory(budget=budget, name="Shop")
+    deposit_factory(budget=budget, name="Bank account")
+    expense_category_factory(budget=budget, name="Food", owner=None, priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+    income_category_factory(budget=budget, name="Salary", owner=None, priority=IncomeCategoryPriority.REGULAR)
+    return budget
+
+
+def csv_lines(rows: list[str], header: str = "name,description,value,date,entity,deposit,category") -> list[str]:
+    """
+    Prepares CSV file lines.
+
+    Args:
+        rows [list[str]]: CSV rows without header.
+        header [str]: CSV header.
+
+    Returns:
+        list[str]: CSV file lines.
+    """
+    return [f"{line}\n" for line in [header, *rows]]
+
+
+@pytest.mark.django_db
+class TestTransferCsvImportService:
+    """Tests for TransferCsvImportService."""
+
+    def test_import_expenses(self, import_budget: Budget):
+        """
+        GIVEN: Budget with two BudgetingPeriods and CSV file with three valid Expense rows.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: Three Expenses created with period resolved from date and objects resolved by name.
+        """
+        lines = csv_lines(
+            [
+                "Bread,,10.50,2024-09-01,Shop,Bank account,Food",
+                "Milk,Fresh,5.00,2024-09-30,shop,BANK ACCOUNT,food",
+                "Cheese,,20.00,2024-10-15,Shop,Bank account,Food",
+            ]
+        )
+
+        created_count = TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        assert created_count == 3
+        expenses = Expense.objects.filter(period__budget=import_budget).order_by("date")
+        assert [expense.name for expense in expenses] == ["Bread", "Milk", "Cheese"]
+        assert [expense.period.date_start.month for expense in expenses] == [9, 9, 10]
+        assert expenses[0].value == Decimal("10.50")
+        assert expenses[1].description == "Fresh"
+        assert {expense.entity.name for expense in expenses} == {"Shop"}
+        assert {expense.deposit.name for expense in expenses} == {"Bank account"}
+        assert {expense.category.name for expense in expenses} == {"Food"}
+
+    def test_import_in_chunks(self, import_budget: Budget):
+        """
+        GIVEN: Budget and CSV file with five valid Income rows.
+        WHEN: TransferCsvImportService.import_file called with chunk_size=2.
+        THEN: Incomes created with three INSERT queries.
+        """
+        lines = csv_lines([f"Salary {day},,100.00,2024-09-{day:02d},Shop,Bank account,Salary" for day in range(1, 6)])
+
+        with CaptureQueriesContext(connection) as context:
+            created_count = TransferCsvImportService(import_budget.pk, IncomeBulkSerializer, chunk_size=2).import_file(
+                line for line in lines
+            )
+
+        assert created_count == 5
+        assert Income.objects.filter(period__budget=import_budget).count() == 5
+        assert (
+            len(
+                [
+                    query
+                    for query in context.captured_queries
+                    if query["sql"].startswith('INSERT INTO "transfers_transfer" ')
+                ]
+            )
+            == 3
+        )
+
+    def test_import_with_column_mapping(self, import_budget: Budget):
+        """
+        GIVEN: Budget and semicolon separated CSV file with custom columns names and date format.
+        WHEN: TransferCsvImportService.import_file called with matching column_mapping, delimiter and date_format.
+        THEN: Expense created.
+        """
+        lines = csv_lines(["01.09.2024;Bread;3.99;Food;Shop;Bank account"], header="Date;Title;Amount;Cat;To;From")
+        service = TransferCsvImportService(
+            import_budget.pk,
+            ExpenseBulkSerializer,
+            column_mapping={"date": "Date", "name": "Title", "value": "Amount", "category": "Cat", "entity": "To"}
+            | {"deposit": "From"},
+            delimiter=";",
+            date_format="%d.%m.%Y",
+        )
+
+        created_count = service.import_file(lines)
+
+        assert created_count == 1
+        expense = Expense.objects.get(period__budget=import_budget)
+        assert expense.name == "Bread"
+        assert expense.date == datetime.date(2024, 9, 1)
+        assert expense.value == Decimal("3.99")
+
+    def test_error_invalid_rows(self, import_budget: Budget):
+        """
+        GIVEN: Budget and CSV file with valid rows and invalid rows placed in different chunks.
+        WHEN: TransferCsvImportService.import_file called with chunk_size=2.
+        THEN: TransferCsvImportError raised with errors mapped by line number. No Expense created.
+        """
+        lines = csv_lines(
+            [
+                "Bread,,10.50,2024-09-01,Shop,Bank account,Food",
+                "Milk,,5.00,2024-09-02,Shop,Bank account,Food",
+                "Cheese,,20.00,2024-12-15,Shop,Bank account,Food",
+                "Salary,,20.00,2024-09-15,Shop,Bank account,Salary",
+                "Butter,,-1.00,2024-09-15,Unknown,Bank account,Food",
+                "Eggs,,1.00,15/09/2024,Shop,Shop,Food",
+            ]
+        )
+
+        with pytest.raises(TransferCsvImportError) as exc:
+            TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer, chunk_size=2).import_file(lines)
+
+        assert exc.value.invalid_rows_count == 4
+        assert list(exc.value.errors.keys()) == [4, 5, 6, 7]
+        assert exc.value.errors[4]["period"][0] == "No BudgetingPeriod for date 2024-12-15 in Budget."
+        assert exc.value.errors[5]["category"][0] == 'Category "Salary" does not exist in Budget.'
+        assert exc.value.errors[6]["entity"][0] == 'Entity "Unknown" does not exist in Budget.'
+        assert exc.value.errors[7]["date"][0] == 'Date "15/09/2024" does not match format "%Y-%m-%d".'
+        assert exc.value.errors[7]["deposit"][0] == 'Deposit "Shop" does not exist in Budget.'
+        assert not Expense.objects.filter(period__budget=import_budget).exists()
+
+    def test_names_differing_in_case(self, import_budget: Budget, entity_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget with Entities "Shop" and "SHOP", CSV file with rows referencing Entity by exact name, by name
+        matching one Entity case insensitively and by name matching both Entities case insensitively.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: TransferCsvImportError raised only for ambiguous name row.
+        """
+        entity_factory(budget=import_budget, name="SHOP")
+        lines = csv_lines(
+            [
+                "Bread,,10.50,2024-09-01,SHOP,Bank account,Food",
+                "Milk,,5.00,2024-09-02,Shop,bank ACCOUNT,food",
+                "Eggs,,1.00,2024-09-03,shop,Bank account,Food",
+            ]
+        )
+
+        with pytest.raises(TransferCsvImportError) as exc:
+            TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        assert list(exc.value.errors.keys()) == [4]
+        assert exc.value.errors[4]["entity"][0] == (
+            'Entity "shop" is ambiguous - multiple objects in Budget have names differing only in letter case.'
+        )
+
+    def test_exact_name_preferred(self, import_budget: Budget, entity_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget with Entities "Shop" and "SHOP" and CSV file with rows referencing both by exact names.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: Expenses created with Entities matching names exactly.
+        """
+        other_entity = entity_factory(budget=import_budget, name="SHOP")
+        lines = csv_lines(
+            ["Bread,,10.50,2024-09-01,SHOP,Bank account,Food", "Milk,,5.00,2024-09-02,Shop,Bank account,Food"]
+        )
+
+        TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        assert dict(Expense.objects.filter(period__budget=import_budget).values_list("name", "entity__name")) == {
+            "Bread": other_entity.name,
+            "Milk": "Shop",
+        }
+
+    def test_import_escaped_formulas(self, import_budget: Budget, entity_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget with Entity "@Shop" and CSV file with values escaped by TransferExportService.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: Expense created with apostrophe removed from escaped values only.
+        """
+        entity_factory(budget=import_budget, name="@Shop")
+        lines = csv_lines(["'=Bread,'Fresh,10.50,2024-09-01,'@Shop,Bank account,Food"])
+
+        TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        expense = Expense.objects.get(period__budget=import_budget)
+        assert (expense.name, expense.description, expense.entity.name) == ("=Bread", "'Fresh", "@Shop")
+
+    def test_error_invalid_value(self, import_budget: Budget):
+        """
+        GIVEN: Budget and CSV file with Expense row with value lower than zero.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: TransferCsvImportError raised with error from bulk serializer. No Expense created.
+        """
+        lines = csv_lines(["Bread,,-10.50,2024-09-01,Shop,Bank account,Food"])
+
+        with pytest.raises(TransferCsvImportError) as exc:
+            TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        assert exc.value.errors[2]["value"][0] == "Value should be higher than 0.00."
+        assert not Expense.objects.filter(period__budget=import_budget).exists()
+
+    def test_errors_limited_with_max_errors(self, import_budget: Budget):
+        """
+        GIVEN: Budget and CSV file with five invalid rows.
+        WHEN: TransferCsvImportService.import_file called with max_errors=2.
+        THEN: TransferCsvImportError raised with details of two rows and count of all invalid rows.
+        """
+        lines = csv_lines(["Bread,,10.50,2024-09-01,Unknown,Bank account,Food"] * 5)
+
+        with pytest.raises(TransferCsvImportError) as exc:
+            TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer, max_errors=2).import_file(lines)
+
+        assert exc.value.invalid_rows_count == 5
+        assert list(exc.value.errors.keys()) == [2, 3]
+
+    def test_error_missing_columns(self, import_budget: Budget):
+        """
+        GIVEN: Budget and CSV file without "value" and "category" columns.
+        WHEN: TransferCsvImportService.import_file called.
+        THEN: TransferCsvImportError raised with header error.
+        """
+        lines = csv_lines(["Bread,2024-09-01,Shop,Bank account"], header="name,date,entity,deposit")
+
+        with pytest.raises(TransferCsvImportError) as exc:
+            TransferCsvImportService(import_budget.pk, ExpenseBulkSerializer).import_file(lines)
+
+        assert exc.value.errors == {1: {"header": ["Missing columns: value, category."]}}
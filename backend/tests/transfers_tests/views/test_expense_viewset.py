@@ -1,9 +1,14 @@
+import csv
 import datetime
+import json
 from decimal import Decimal
 from typing import Any
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -77,7 +82,7 @@ class TestExpenseViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        transfers = Expense.objects.filter(period__budget=budget)
+        transfers = Expense.objects.filter(period__budget=budget).order_by("id")
         serializer = ExpenseSerializer(transfers, many=True)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["results"] == serializer.data
@@ -101,7 +106,7 @@ class TestExpenseViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        transfers = Expense.objects.filter(period__budget=budget)
+        transfers = Expense.objects.filter(period__budget=budget).order_by("id")
         serializer = ExpenseSerializer(transfers, many=True)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == len(serializer.data) == transfers.count() == 1
@@ -128,7 +133,7 @@ class TestExpenseViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        expense_transfers = Expense.objects.filter(period__budget=budget)
+        expense_transfers = Expense.objects.filter(period__budget=budget).order_by("id")
         serializer = ExpenseSerializer(expense_transfers, many=True)
         assert Transfer.objects.all().count() == 2
         assert response.status_code == status.HTTP_200_OK
@@ -136,6 +141,55 @@ class TestExpenseViewSetList:
         assert response.data["results"] == serializer.data
         assert income_transfer.id not in [transfer["id"] for transfer in response.data["results"]]
 
+    def test_running_balance(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Incomes and Expenses of one Deposit in two BudgetingPeriods and Expense of other Deposit in database.
+        WHEN: ExpenseViewSet list view called with GET with "running_balance=true" ordered by date.
+        THEN: HTTP 200 returned. Every Expense contains Deposit balance after Expense, including Transfers from earlier
+        periods.
+        """
+        budget = budget_factory(owner=base_user)
+        september = budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        october = budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 10, 1), date_end=datetime.date(2024, 10, 31)
+        )
+        deposit = deposit_factory(budget=budget)
+        income_factory(
+            budget=budget, period=september, deposit=deposit, date=datetime.date(2024, 9, 5), value=Decimal("100.00")
+        )
+        expense_factory(
+            budget=budget, period=september, deposit=deposit, date=datetime.date(2024, 9, 10), value=Decimal("30.00")
+        )
+        expense_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 3), value=Decimal("20.00")
+        )
+        expense_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 3), value=Decimal("5.00")
+        )
+        income_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 7), value=Decimal("50.00")
+        )
+        expense_factory(budget=budget, period=october, date=datetime.date(2024, 10, 1), value=Decimal("1000.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfers_url(budget.id), {"running_balance": "true", "deposit": deposit.id, "ordering": "date,id"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["running_balance"] for item in response.data["results"]] == ["70.00", "50.00", "45.00"]
+
 
 @pytest.mark.django_db
 class TestExpenseViewSetCreate:
@@ -1279,3 +1333,342 @@ class TestExpenseViewSetDelete:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Expense.objects.all().exists()
+
+
+def transfers_import_url(budget_id):
+    """Create and return an Expense CSV import URL."""
+    return reverse("budgets:expense-import-csv", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpenseViewSetImportCsv:
+    """Tests for Expenses CSV import on ExpenseViewSet."""
+
+    @staticmethod
+    def prepare_budget_objects(
+        budget: Budget,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ) -> None:
+        """
+        Creates BudgetingPeriod, Entity, Deposit and ExpenseCategory referenced in CSV files by name.
+
+        Args:
+            budget [Budget]: Budget for objects.
+            budgeting_period_factory [FactoryMetaClass]: Factory for BudgetingPeriod.
+            entity_factory [FactoryMetaClass]: Factory for Entity.
+            deposit_factory [FactoryMetaClass]: Factory for Deposit.
+            expense_category_factory [FactoryMetaClass]: Factory for ExpenseCategory.
+        """
+        budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        entity_factory(budget=budget, name="Shop")
+        deposit_factory(budget=budget, name="Bank account")
+        expense_category_factory(budget=budget, name="Food", priority=ExpenseCategoryPriority.MOST_IMPORTANT)
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet import view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.post(transfers_import_url(budget.id), data={}, format="multipart")
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet import view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(transfers_import_url(budget.id), data={}, format="multipart")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_import_transfers_successfully(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod, Entity, Deposit and ExpenseCategory in database. CSV file with
+        semicolon separated Expenses and custom "value" column name.
+        WHEN: ExpenseViewSet import view called with POST by User belonging to Budget with CSV file.
+        THEN: HTTP 201 returned. Expenses created in database.
+        """
+        budget = budget_factory(owner=base_user)
+        self.prepare_budget_objects(
+            budget, budgeting_period_factory, entity_factory, deposit_factory, expense_category_factory
+        )
+        content = (
+            "\ufeffname;Amount;date;entity;deposit;category\n"
+            "Bread;10.50;2024-09-01;Shop;Bank account;Food\n"
+            "Milk;5.00;2024-09-02;Shop;Bank account;Food\n"
+        )
+        file = SimpleUploadedFile("expenses.csv", content.encode("utf-8"), content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            transfers_import_url(budget.id),
+            data={"file": file, "delimiter": ";", "value": "Amount"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"created": 2}
+        assert Expense.objects.filter(period__budget=budget).count() == 2
+        assert Expense.objects.get(name="Bread").value == Decimal("10.50")
+
+    def test_error_invalid_rows(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        expense_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod, Entity, Deposit and ExpenseCategory in database. CSV file with one valid
+        and one invalid Expense.
+        WHEN: ExpenseViewSet import view called with POST by User belonging to Budget with CSV file.
+        THEN: Bad request HTTP 400 returned with errors under CSV line number. No Expense created.
+        """
+        budget = budget_factory(owner=base_user)
+        self.prepare_budget_objects(
+            budget, budgeting_period_factory, entity_factory, deposit_factory, expense_category_factory
+        )
+        content = (
+            "name,value,date,entity,deposit,category\n"
+            "Bread,10.50,2024-09-01,Shop,Bank account,Food\n"
+            "Milk,5.00,2024-09-02,Unknown,Bank account,Food\n"
+        )
+        file = SimpleUploadedFile("expenses.csv", content.encode("utf-8"), content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfers_import_url(budget.id), data={"file": file}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][3]["entity"][0] == 'Entity "Unknown" does not exist in Budget.'
+        assert not Expense.objects.filter(period__budget=budget).exists()
+
+    @pytest.mark.parametrize(
+        "data, field, message",
+        [
+            ({}, "file", "No file was submitted."),
+            ({"file": b"name\n", "delimiter": ";;"}, "delimiter", "Delimiter has to be a single character."),
+            ({"file": b"\xff\xfe\xfa\n"}, "file", "File is not valid UTF-8 encoded CSV file."),
+        ],
+    )
+    def test_error_invalid_request(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        data: dict,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: Budget instance created in database.
+        WHEN: ExpenseViewSet import view called with POST without file, with invalid delimiter or invalid file.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        if "file" in data:
+            data["file"] = SimpleUploadedFile("expenses.csv", data["file"], content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfers_import_url(budget.id), data=data, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+
+def transfers_export_url(budget_id):
+    """Create and return an Expense export URL."""
+    return reverse("budgets:expense-export", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestExpenseViewSetExport:
+    """Tests for Expenses export on ExpenseViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet export view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.get(transfers_export_url(budget.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: ExpenseViewSet export view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfers_export_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_export_csv(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Expense model instances for Budget and one for other Budget in database.
+        WHEN: ExpenseViewSet export view called with GET by User belonging to Budget.
+        THEN: HTTP 200 returned with CSV file containing Budget Expenses ordered by id.
+        """
+        budget = budget_factory(owner=base_user)
+        for _ in range(2):
+            expense_factory(budget=budget, description="Line, with comma")
+        expense_factory()
+        expenses = Expense.objects.filter(period__budget=budget).order_by("id")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_export_url(budget.id), {"ordering": "id"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="expenses.csv"'
+        rows = list(csv.reader(b"".join(response.streaming_content).decode("utf-8").splitlines(keepends=True)))
+        assert rows[0] == ["id", "name", "description", "value", "date", "period", "entity", "deposit", "category"]
+        assert rows[1:] == [
+            [
+                str(expense.id),
+                expense.name,
+                "Line, with comma",
+                str(expense.value),
+                expense.date.isoformat(),
+                expense.period.name,
+                expense.entity.name,
+                expense.deposit.name,
+                expense.category.name,
+            ]
+            for expense in expenses
+        ]
+
+    def test_export_csv_formulas_escaped(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Expense with name, description and Entity name starting with formula characters in database.
+        WHEN: ExpenseViewSet export view called with GET for CSV and NDJSON formats.
+        THEN: CSV cells starting with formula characters prefixed with apostrophe, NDJSON values not changed.
+        """
+        budget = budget_factory(owner=base_user)
+        entity = entity_factory(budget=budget, name="@Shop")
+        expense_factory(budget=budget, name="=1+2", description="-cmd", entity=entity)
+        api_client.force_authenticate(base_user)
+
+        csv_response = api_client.get(transfers_export_url(budget.id))
+        ndjson_response = api_client.get(transfers_export_url(budget.id), {"export_format": "ndjson"})
+
+        rows = list(csv.DictReader(b"".join(csv_response.streaming_content).decode("utf-8").splitlines()))
+        assert (rows[0]["name"], rows[0]["description"], rows[0]["entity"]) == ("'=1+2", "'-cmd", "'@Shop")
+        row = json.loads(b"".join(ndjson_response.streaming_content).decode("utf-8"))
+        assert (row["name"], row["description"], row["entity"]) == ("=1+2", "-cmd", "@Shop")
+
+    def test_export_ndjson_with_filters(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Expense model instances with different values for Budget in database.
+        WHEN: ExpenseViewSet export view called with GET with "export_format=ndjson" and "value_min" filter.
+        THEN: HTTP 200 returned with NDJSON file containing only filtered Expenses in requested order.
+        """
+        budget = budget_factory(owner=base_user)
+        for value in ["10.00", "20.00", "30.00"]:
+            expense_factory(budget=budget, value=Decimal(value))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfers_export_url(budget.id), {"export_format": "ndjson", "value_min": "15", "ordering": "-value"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode("utf-8").splitlines()]
+        assert [row["value"] for row in rows] == ["30.00", "20.00"]
+
+    def test_queries_count_independent_of_rows_count(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: One Expense model instance for one Budget and ten for other Budget in database.
+        WHEN: ExpenseViewSet export view called with GET for both Budgets, after warming up membership cache.
+        THEN: The same number of database queries executed for both exports.
+        """
+        small_budget, large_budget = budget_factory(owner=base_user), budget_factory(owner=base_user)
+        expense_factory(budget=small_budget)
+        for _ in range(10):
+            expense_factory(budget=large_budget)
+        api_client.force_authenticate(base_user)
+        b"".join(api_client.get(transfers_export_url(small_budget.id)).streaming_content)
+
+        queries_counts = []
+        for budget in (small_budget, large_budget):
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(transfers_export_url(budget.id))
+                b"".join(response.streaming_content)
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
+
+    def test_error_invalid_export_format(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget instance created in database.
+        WHEN: ExpenseViewSet export view called with GET with not supported "export_format".
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_export_url(budget.id), {"export_format": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["export_format"][0] == "Export format has to be one of: csv, ndjson."
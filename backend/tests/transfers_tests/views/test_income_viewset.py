@@ -1,9 +1,14 @@
+import csv
 import datetime
+import json
 from decimal import Decimal
 from typing import Any
 
 import pytest
 from django.contrib.auth.models import AbstractUser
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from factory.base import FactoryMetaClass
 from rest_framework import status
@@ -77,7 +82,7 @@ class TestIncomeViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        transfers = Income.objects.filter(period__budget=budget)
+        transfers = Income.objects.filter(period__budget=budget).order_by("id")
         serializer = IncomeSerializer(transfers, many=True)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["results"] == serializer.data
@@ -101,7 +106,7 @@ class TestIncomeViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        transfers = Income.objects.filter(period__budget=budget)
+        transfers = Income.objects.filter(period__budget=budget).order_by("id")
         serializer = IncomeSerializer(transfers, many=True)
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == len(serializer.data) == transfers.count() == 1
@@ -128,7 +133,7 @@ class TestIncomeViewSetList:
 
         response = api_client.get(transfers_url(budget.id))
 
-        income_transfers = Income.objects.filter(period__budget=budget)
+        income_transfers = Income.objects.filter(period__budget=budget).order_by("id")
         serializer = IncomeSerializer(income_transfers, many=True)
         assert Transfer.objects.all().count() == 2
         assert response.status_code == status.HTTP_200_OK
@@ -136,6 +141,84 @@ class TestIncomeViewSetList:
         assert response.data["results"] == serializer.data
         assert expense_transfer.id not in [transfer["id"] for transfer in response.data["results"]]
 
+    def test_running_balance(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Incomes and Expenses of one Deposit in two BudgetingPeriods and Expense of other Deposit in database.
+        WHEN: IncomeViewSet list view called with GET with "running_balance=true" ordered by date.
+        THEN: HTTP 200 returned. Every Income contains Deposit balance after Income, including Transfers from earlier
+        periods.
+        """
+        budget = budget_factory(owner=base_user)
+        september = budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        october = budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 10, 1), date_end=datetime.date(2024, 10, 31)
+        )
+        deposit = deposit_factory(budget=budget)
+        income_factory(
+            budget=budget, period=september, deposit=deposit, date=datetime.date(2024, 9, 5), value=Decimal("100.00")
+        )
+        expense_factory(
+            budget=budget, period=september, deposit=deposit, date=datetime.date(2024, 9, 10), value=Decimal("30.00")
+        )
+        expense_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 3), value=Decimal("20.00")
+        )
+        expense_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 3), value=Decimal("5.00")
+        )
+        income_factory(
+            budget=budget, period=october, deposit=deposit, date=datetime.date(2024, 10, 7), value=Decimal("50.00")
+        )
+        expense_factory(budget=budget, period=october, date=datetime.date(2024, 10, 1), value=Decimal("1000.00"))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfers_url(budget.id), {"running_balance": "true", "deposit": deposit.id, "ordering": "date,id"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["running_balance"] for item in response.data["results"]] == ["100.00", "95.00"]
+
+    def test_list_query_without_joins(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Income and Expense of Budget with User as member in database.
+        WHEN: IncomeViewSet list view called with GET.
+        THEN: HTTP 200 returned with Income only. Incomes scoped to Budget and type without joins and DISTINCT.
+        """
+        budget = budget_factory(owner=base_user)
+        income = income_factory(budget=budget)
+        expense_factory(budget=budget)
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(transfers_url(budget.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.data["results"]] == [income.id]
+        transfer_queries = [
+            query["sql"] for query in context.captured_queries if '"transfers_transfer"' in query["sql"]
+        ]
+        assert transfer_queries
+        assert not any(" JOIN " in sql or "DISTINCT" in sql for sql in transfer_queries)
+
 
 @pytest.mark.django_db
 class TestIncomeViewSetCreate:
@@ -1275,3 +1358,414 @@ class TestIncomeViewSetDelete:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Income.objects.all().exists()
+
+
+def transfers_import_url(budget_id):
+    """Create and return an Income CSV import URL."""
+    return reverse("budgets:income-import-csv", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestIncomeViewSetImportCsv:
+    """Tests for Incomes CSV import on IncomeViewSet."""
+
+    @staticmethod
+    def prepare_budget_objects(
+        budget: Budget,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+    ) -> None:
+        """
+        Creates BudgetingPeriod, Entity, Deposit and IncomeCategory referenced in CSV files by name.
+
+        Args:
+            budget [Budget]: Budget for objects.
+            budgeting_period_factory [FactoryMetaClass]: Factory for BudgetingPeriod.
+            entity_factory [FactoryMetaClass]: Factory for Entity.
+            deposit_factory [FactoryMetaClass]: Factory for Deposit.
+            income_category_factory [FactoryMetaClass]: Factory for IncomeCategory.
+        """
+        budgeting_period_factory(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        entity_factory(budget=budget, name="Shop")
+        deposit_factory(budget=budget, name="Bank account")
+        income_category_factory(budget=budget, name="Salary", priority=IncomeCategoryPriority.REGULAR)
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet import view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.post(transfers_import_url(budget.id), data={}, format="multipart")
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet import view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(transfers_import_url(budget.id), data={}, format="multipart")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_import_transfers_successfully(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod, Entity, Deposit and IncomeCategory in database. CSV file with
+        semicolon separated Incomes and custom "value" column name.
+        WHEN: IncomeViewSet import view called with POST by User belonging to Budget with CSV file.
+        THEN: HTTP 201 returned. Incomes created in database.
+        """
+        budget = budget_factory(owner=base_user)
+        self.prepare_budget_objects(
+            budget, budgeting_period_factory, entity_factory, deposit_factory, income_category_factory
+        )
+        content = (
+            "\ufeffname;Amount;date;entity;deposit;category\n"
+            "Bonus;10.50;2024-09-01;Shop;Bank account;Salary\n"
+            "Milk;5.00;2024-09-02;Shop;Bank account;Salary\n"
+        )
+        file = SimpleUploadedFile("incomes.csv", content.encode("utf-8"), content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(
+            transfers_import_url(budget.id),
+            data={"file": file, "delimiter": ";", "value": "Amount"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"created": 2}
+        assert Income.objects.filter(period__budget=budget).count() == 2
+        assert Income.objects.get(name="Bonus").value == Decimal("10.50")
+
+    def test_error_invalid_rows(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        budgeting_period_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        deposit_factory: FactoryMetaClass,
+        income_category_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Budget with BudgetingPeriod, Entity, Deposit and IncomeCategory in database. CSV file with one valid
+        and one invalid Income.
+        WHEN: IncomeViewSet import view called with POST by User belonging to Budget with CSV file.
+        THEN: Bad request HTTP 400 returned with errors under CSV line number. No Income created.
+        """
+        budget = budget_factory(owner=base_user)
+        self.prepare_budget_objects(
+            budget, budgeting_period_factory, entity_factory, deposit_factory, income_category_factory
+        )
+        content = (
+            "name,value,date,entity,deposit,category\n"
+            "Bonus,10.50,2024-09-01,Shop,Bank account,Salary\n"
+            "Milk,5.00,2024-09-02,Unknown,Bank account,Salary\n"
+        )
+        file = SimpleUploadedFile("incomes.csv", content.encode("utf-8"), content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfers_import_url(budget.id), data={"file": file}, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][3]["entity"][0] == 'Entity "Unknown" does not exist in Budget.'
+        assert not Income.objects.filter(period__budget=budget).exists()
+
+    @pytest.mark.parametrize(
+        "data, field, message",
+        [
+            ({}, "file", "No file was submitted."),
+            ({"file": b"name\n", "delimiter": ";;"}, "delimiter", "Delimiter has to be a single character."),
+            ({"file": b"\xff\xfe\xfa\n"}, "file", "File is not valid UTF-8 encoded CSV file."),
+        ],
+    )
+    def test_error_invalid_request(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        data: dict,
+        field: str,
+        message: str,
+    ):
+        """
+        GIVEN: Budget instance created in database.
+        WHEN: IncomeViewSet import view called with POST without file, with invalid delimiter or invalid file.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        if "file" in data:
+            data["file"] = SimpleUploadedFile("incomes.csv", data["file"], content_type="text/csv")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfers_import_url(budget.id), data=data, format="multipart")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+
+def transfers_export_url(budget_id):
+    """Create and return an Income export URL."""
+    return reverse("budgets:income-export", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestIncomeViewSetExport:
+    """Tests for Incomes export on IncomeViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet export view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.get(transfers_export_url(budget.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet export view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfers_export_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_export_csv(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Two Income model instances for Budget and one for other Budget in database.
+        WHEN: IncomeViewSet export view called with GET by User belonging to Budget.
+        THEN: HTTP 200 returned with CSV file containing Budget Incomes ordered by id.
+        """
+        budget = budget_factory(owner=base_user)
+        for _ in range(2):
+            income_factory(budget=budget, description="Line, with comma")
+        income_factory()
+        incomes = Income.objects.filter(period__budget=budget).order_by("id")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_export_url(budget.id), {"ordering": "id"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"] == 'attachment; filename="incomes.csv"'
+        rows = list(csv.reader(b"".join(response.streaming_content).decode("utf-8").splitlines(keepends=True)))
+        assert rows[0] == ["id", "name", "description", "value", "date", "period", "entity", "deposit", "category"]
+        assert rows[1:] == [
+            [
+                str(income.id),
+                income.name,
+                "Line, with comma",
+                str(income.value),
+                income.date.isoformat(),
+                income.period.name,
+                income.entity.name,
+                income.deposit.name,
+                income.category.name,
+            ]
+            for income in incomes
+        ]
+
+    def test_export_ndjson_with_filters(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Three Income model instances with different values for Budget in database.
+        WHEN: IncomeViewSet export view called with GET with "export_format=ndjson" and "value_min" filter.
+        THEN: HTTP 200 returned with NDJSON file containing only filtered Incomes in requested order.
+        """
+        budget = budget_factory(owner=base_user)
+        for value in ["10.00", "20.00", "30.00"]:
+            income_factory(budget=budget, value=Decimal(value))
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfers_export_url(budget.id), {"export_format": "ndjson", "value_min": "15", "ordering": "-value"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode("utf-8").splitlines()]
+        assert [row["value"] for row in rows] == ["30.00", "20.00"]
+
+    def test_queries_count_independent_of_rows_count(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: One Income model instance for one Budget and ten for other Budget in database.
+        WHEN: IncomeViewSet export view called with GET for both Budgets, after warming up membership cache.
+        THEN: The same number of database queries executed for both exports.
+        """
+        small_budget, large_budget = budget_factory(owner=base_user), budget_factory(owner=base_user)
+        income_factory(budget=small_budget)
+        for _ in range(10):
+            income_factory(budget=large_budget)
+        api_client.force_authenticate(base_user)
+        b"".join(api_client.get(transfers_export_url(small_budget.id)).streaming_content)
+
+        queries_counts = []
+        for budget in (small_budget, large_budget):
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.get(transfers_export_url(budget.id))
+                b"".join(response.streaming_content)
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
+
+    def test_error_invalid_export_format(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget instance created in database.
+        WHEN: IncomeViewSet export view called with GET with not supported "export_format".
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_export_url(budget.id), {"export_format": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["export_format"][0] == "Export format has to be one of: csv, ndjson."
+
+
+def transfers_autocomplete_url(budget_id):
+    """Create and return an Income autocomplete URL."""
+    return reverse("budgets:income-autocomplete", args=[budget_id])
+
+
+@pytest.mark.django_db
+class TestIncomeViewSetAutocomplete:
+    """Tests for Incomes names autocomplete on IncomeViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet autocomplete view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.get(transfers_autocomplete_url(budget.id))
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet autocomplete view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfers_autocomplete_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_autocomplete_names(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        income_factory: FactoryMetaClass,
+        expense_factory: FactoryMetaClass,
+    ):
+        """
+        GIVEN: Incomes and Expense of Budget and Income of other Budget in database.
+        WHEN: IncomeViewSet autocomplete view called with GET by Budget member with "q" and "limit" query params.
+        THEN: HTTP 200 returned with most frequently used Budget Incomes names starting with "q", together with
+        their category, entity and deposit.
+        """
+        budget = budget_factory(owner=base_user)
+        salary = income_factory(budget=budget, name="Salary")
+        income_factory(
+            budget=budget,
+            name="salary",
+            date=salary.date,
+            period=salary.period,
+            category=salary.category,
+            entity=salary.entity,
+            deposit=salary.deposit,
+        )
+        income_factory(budget=budget, name="Sale")
+        income_factory(budget=budget, name="Bonus")
+        expense_factory(budget=budget, name="Salad")
+        income_factory(name="Salary")
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_autocomplete_url(budget.id), data={"q": "sal", "limit": 1})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "name": "Salary",
+                "category": salary.category.id,
+                "entity": salary.entity.id,
+                "deposit": salary.deposit.id,
+                "count": 2,
+                "last_date": salary.date.isoformat(),
+            }
+        ]
+
+    @pytest.mark.parametrize("limit", ["0", "51", "abc"])
+    def test_error_invalid_limit(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass, limit: str
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet autocomplete view called with GET by Budget member with invalid "limit" query param.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfers_autocomplete_url(budget.id), data={"limit": limit})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["limit"] == ["Limit has to be an integer between 1 and 50."]
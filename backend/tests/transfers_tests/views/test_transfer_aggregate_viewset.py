@@ -0,0 +1,435 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from budgets.models.budget_model import Budget
+from budgets.services.budgeting_period_generator_service import BudgetingPeriodGeneratorService
+from categories.models.transfer_category_choices import CategoryType
+from transfers.services.transfer_aggregation_service import TransferAggregationService
+from transfers.services.transfer_series_service import TransferSeriesService
+
+
+def transfer_aggregate_url(budget_id: int):
+    """Create and return a Transfer aggregate URL."""
+    return reverse("budgets:transfer-aggregate", args=[budget_id])
+
+
+def transfer_series_url(budget_id: int):
+    """Create and return a Transfer series URL."""
+    return reverse("budgets:transfer-series", args=[budget_id])
+
+
+@pytest.fixture
+def transfers_data(
+    base_user: AbstractUser,
+    budget_factory: FactoryMetaClass,
+    entity_factory: FactoryMetaClass,
+    deposit_factory: FactoryMetaClass,
+    expense_category_factory: FactoryMetaClass,
+    income_category_factory: FactoryMetaClass,
+    expense_factory: FactoryMetaClass,
+    income_factory: FactoryMetaClass,
+) -> dict:
+    """
+    Creates Budget with two monthly BudgetingPeriods, four Expenses of "Food" and "Bills" categories and one Income
+    of "Salary" category.
+    """
+    budget = budget_factory(owner=base_user)
+    january, february = BudgetingPeriodGeneratorService(budget.pk, date(2024, 1, 1), 2).generate()
+    entity, deposit = entity_factory(budget=budget), deposit_factory(budget=budget)
+    food = expense_category_factory(budget=budget, name="Food")
+    bills = expense_category_factory(budget=budget, name="Bills")
+    salary = income_category_factory(budget=budget, name="Salary")
+    for period, category, value, day in (
+        (january, food, "10.00", date(2024, 1, 5)),
+        (january, food, "30.00", date(2024, 1, 20)),
+        (february, food, "20.00", date(2024, 2, 3)),
+        (february, bills, "100.00", date(2024, 2, 10)),
+    ):
+        expense_factory(
+            budget=budget,
+            period=period,
+            category=category,
+            value=Decimal(value),
+            date=day,
+            entity=entity,
+            deposit=deposit,
+        )
+    income_factory(
+        budget=budget,
+        period=january,
+        category=salary,
+        value=Decimal("1000.00"),
+        date=date(2024, 1, 1),
+        entity=entity,
+        deposit=deposit,
+    )
+    return {"budget": budget, "january": january, "february": february, "food": food, "bills": bills}
+
+
+@pytest.mark.django_db
+class TestTransferAggregateViewSetAggregate:
+    """Tests for aggregate view on TransferAggregateViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.get(transfer_aggregate_url(budget.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfer_aggregate_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_aggregate_without_dimensions(self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by Budget member without "group_by" param.
+        THEN: HTTP 200 returned with default measures of all Transfers.
+        """
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_aggregate_url(transfers_data["budget"].id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [{"sum": "1160.00", "count": 5}]
+
+    def test_aggregate_by_category_and_month(
+        self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict
+    ):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by Budget member grouped by category and month
+        with all measures.
+        THEN: HTTP 200 returned with measures of every group computed with single query.
+        """
+        api_client.force_authenticate(base_user)
+        food, bills = transfers_data["food"], transfers_data["bills"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                transfer_aggregate_url(transfers_data["budget"].id),
+                {"group_by": "category,month", "measures": "sum,count,avg,min,max", "category": food.id},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "category": food.id,
+                "category_name": "Food",
+                "month": date(2024, 1, 1),
+                "sum": "40.00",
+                "count": 2,
+                "avg": "20.00",
+                "min": "10.00",
+                "max": "30.00",
+            },
+            {
+                "category": food.id,
+                "category_name": "Food",
+                "month": date(2024, 2, 1),
+                "sum": "20.00",
+                "count": 1,
+                "avg": "20.00",
+                "min": "20.00",
+                "max": "20.00",
+            },
+        ]
+        assert len([query for query in context.captured_queries if "GROUP BY" in query["sql"]]) == 1
+        assert bills.id not in {row["category"] for row in response.data}
+
+    def test_aggregate_by_transfer_type_and_period(
+        self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict
+    ):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by Budget member grouped by transfer type and
+        period.
+        THEN: HTTP 200 returned with Incomes and Expenses aggregated separately in every period.
+        """
+        api_client.force_authenticate(base_user)
+        january, february = transfers_data["january"], transfers_data["february"]
+
+        response = api_client.get(
+            transfer_aggregate_url(transfers_data["budget"].id), {"group_by": "transfer_type,period", "measures": "sum"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {"transfer_type": CategoryType.EXPENSE, "period": january.id, "period_name": "2024_01", "sum": "40.00"},
+            {"transfer_type": CategoryType.EXPENSE, "period": february.id, "period_name": "2024_02", "sum": "120.00"},
+            {"transfer_type": CategoryType.INCOME, "period": january.id, "period_name": "2024_01", "sum": "1000.00"},
+        ]
+
+    def test_not_modified(self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet aggregate view called twice with GET by Budget member, second time with
+        "If-None-Match" header containing ETag of first response.
+        THEN: HTTP 304 returned for second request.
+        """
+        api_client.force_authenticate(base_user)
+        url = transfer_aggregate_url(transfers_data["budget"].id)
+
+        response = api_client.get(url, {"group_by": "year"})
+        second_response = api_client.get(url, {"group_by": "year"}, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert second_response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    @pytest.mark.parametrize(
+        "params, field, message",
+        (
+            (
+                {"group_by": "category,name"},
+                "group_by",
+                "Invalid dimension: name. Allowed dimensions: "
+                "period, category, priority, entity, deposit, owner, day, week, month, year, transfer_type.",
+            ),
+            (
+                {"group_by": "period,category,entity,deposit"},
+                "group_by",
+                "Aggregation can be grouped by at most 3 dimensions.",
+            ),
+            (
+                {"measures": "sum,median"},
+                "measures",
+                "Invalid measure: median. Allowed measures: sum, count, avg, min, max.",
+            ),
+        ),
+    )
+    def test_error_on_invalid_params(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass, params, field, message
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by Budget member with invalid params.
+        THEN: HTTP 400 returned with error message.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_aggregate_url(budget.id), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+    def test_error_on_too_many_groups(
+        self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        GIVEN: Incomes and Expenses of Budget in database and groups limit lower than number of days with Transfers.
+        WHEN: TransferAggregateViewSet aggregate view called with GET by Budget member grouped by day.
+        THEN: HTTP 400 returned with error message.
+        """
+        monkeypatch.setattr(TransferAggregationService, "MAX_GROUPS", 4)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_aggregate_url(transfers_data["budget"].id), {"group_by": "day"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["group_by"][0] == (
+            "Aggregation returns more than 4 groups. Narrow filters or dimensions."
+        )
+
+
+@pytest.mark.django_db
+class TestTransferAggregateViewSetSeries:
+    """Tests for series view on TransferAggregateViewSet."""
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet series view called with GET without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        response = api_client.get(transfer_series_url(budget.id))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self, api_client: APIClient, user_factory: FactoryMetaClass, budget_factory: FactoryMetaClass
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet series view called with GET by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.get(transfer_series_url(budget.id))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_monthly_series(self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member without params.
+        THEN: HTTP 200 returned with monthly Expenses and Incomes series covering Transfers dates, computed with
+        single query.
+        """
+        api_client.force_authenticate(base_user)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(transfer_series_url(transfers_data["budget"].id))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "interval": "month",
+            "timestamps": ["2024-01-01", "2024-02-01"],
+            "series": [
+                {"transfer_type": CategoryType.EXPENSE, "id": None, "name": None, "values": ["40.00", "120.00"]},
+                {"transfer_type": CategoryType.INCOME, "id": None, "name": None, "values": ["1000.00", "0.00"]},
+            ],
+        }
+        assert len([query for query in context.captured_queries if "GROUP BY" in query["sql"]]) == 1
+
+    def test_empty_buckets_filled(self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member with dates range wider than
+        Transfers dates.
+        THEN: HTTP 200 returned with series covering whole dates range and empty buckets filled with zeros.
+        """
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(
+            transfer_series_url(transfers_data["budget"].id), {"date_after": "2023-12-15", "date_before": "2024-03-31"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["timestamps"] == ["2023-12-01", "2024-01-01", "2024-02-01", "2024-03-01"]
+        assert [series["values"] for series in response.data["series"]] == [
+            ["0.00", "40.00", "120.00", "0.00"],
+            ["0.00", "1000.00", "0.00", "0.00"],
+        ]
+
+    def test_weekly_series_split_by_category(
+        self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict
+    ):
+        """
+        GIVEN: Incomes and Expenses of Budget in database.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member with weekly interval and split by
+        category.
+        THEN: HTTP 200 returned with weekly series of every category, ordered by transfer type and category name.
+        """
+        api_client.force_authenticate(base_user)
+        food, bills = transfers_data["food"], transfers_data["bills"]
+
+        response = api_client.get(
+            transfer_series_url(transfers_data["budget"].id), {"interval": "week", "split_by": "category"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["timestamps"] == [
+            "2024-01-01",
+            "2024-01-08",
+            "2024-01-15",
+            "2024-01-22",
+            "2024-01-29",
+            "2024-02-05",
+        ]
+        assert [(series["id"], series["name"], series["values"]) for series in response.data["series"][:2]] == [
+            (bills.id, "Bills", ["0.00", "0.00", "0.00", "0.00", "0.00", "100.00"]),
+            (food.id, "Food", ["10.00", "0.00", "30.00", "0.00", "20.00", "0.00"]),
+        ]
+        assert response.data["series"][2]["transfer_type"] == CategoryType.INCOME
+        assert response.data["series"][2]["name"] == "Salary"
+        assert response.data["series"][2]["values"] == ["1000.00", "0.00", "0.00", "0.00", "0.00", "0.00"]
+
+    def test_empty_series(self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass):
+        """
+        GIVEN: Budget without Transfers in database.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member.
+        THEN: HTTP 200 returned with empty series of both transfer types.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_series_url(budget.id), {"interval": "day"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "interval": "day",
+            "timestamps": [],
+            "series": [
+                {"transfer_type": CategoryType.EXPENSE, "id": None, "name": None, "values": []},
+                {"transfer_type": CategoryType.INCOME, "id": None, "name": None, "values": []},
+            ],
+        }
+
+    @pytest.mark.parametrize(
+        "params, field, message",
+        (
+            ({"interval": "year"}, "interval", '"year" is not a valid choice.'),
+            ({"split_by": "entity"}, "split_by", '"entity" is not a valid choice.'),
+            (
+                {"interval": "week", "date_after": "9999-12-01", "date_before": "9999-12-31"},
+                "date_before",
+                "Series range exceeds maximal supported date 9999-12-31.",
+            ),
+            (
+                {"interval": "month", "date_after": "9999-11-01", "date_before": "9999-12-31"},
+                "date_before",
+                "Series range exceeds maximal supported date 9999-12-31.",
+            ),
+        ),
+    )
+    def test_error_on_invalid_params(
+        self, api_client: APIClient, base_user: AbstractUser, budget_factory: FactoryMetaClass, params, field, message
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member with invalid params.
+        THEN: HTTP 400 returned with error message.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_series_url(budget.id), params)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"][field][0] == message
+
+    def test_error_on_too_many_buckets(
+        self, api_client: APIClient, base_user: AbstractUser, transfers_data: dict, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        GIVEN: Incomes and Expenses of Budget in database and buckets limit lower than number of days with
+        Transfers.
+        WHEN: TransferAggregateViewSet series view called with GET by Budget member with daily interval.
+        THEN: HTTP 400 returned with error message.
+        """
+        monkeypatch.setattr(TransferSeriesService, "MAX_BUCKETS", 30)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.get(transfer_series_url(transfers_data["budget"].id), {"interval": "day"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["interval"][0] == ("Series contains more than 30 buckets. Narrow dates range.")
@@ -0,0 +1,261 @@
+import datetime
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import AbstractUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from factory.base import FactoryMetaClass
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from budgets.models.budget_model import Budget
+from categories.models.transfer_category_choices import ExpenseCategoryPriority, IncomeCategoryPriority
+from transfers.models.expense_model import Expense
+from transfers.models.income_model import Income
+from transfers.serializers.expense_serializer import ExpenseSerializer
+from transfers.serializers.income_serializer import IncomeSerializer
+
+TRANSFER_TYPES = {
+    "income": {
+        "name": "Income",
+        "model": Income,
+        "serializer": IncomeSerializer,
+        "category_factory": "income_category_factory",
+        "other_category_factory": "expense_category_factory",
+        "priority": IncomeCategoryPriority.REGULAR,
+    },
+    "expense": {
+        "name": "Expense",
+        "model": Expense,
+        "serializer": ExpenseSerializer,
+        "category_factory": "expense_category_factory",
+        "other_category_factory": "income_category_factory",
+        "priority": ExpenseCategoryPriority.MOST_IMPORTANT,
+    },
+}
+
+
+def transfers_bulk_url(transfer_type: str, budget_id: int):
+    """Create and return an Income or Expense bulk create URL."""
+    return reverse(f"budgets:{transfer_type}-bulk", args=[budget_id])
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("transfer_type", list(TRANSFER_TYPES))
+class TestTransferViewSetBulkCreate:
+    """Tests for bulk create Transfers on IncomeViewSet and ExpenseViewSet."""
+
+    @staticmethod
+    def prepare_payload(request: pytest.FixtureRequest, budget: Budget, transfer_type: str, rows_count: int) -> list:
+        """
+        Prepares valid payload for Incomes or Expenses bulk create.
+
+        Args:
+            request [pytest.FixtureRequest]: Request used for fetching factories fixtures.
+            budget [Budget]: Budget for Transfers.
+            transfer_type [str]: "income" or "expense".
+            rows_count [int]: Number of rows in payload.
+
+        Returns:
+            list[dict]: List of Transfers data.
+        """
+        config = TRANSFER_TYPES[transfer_type]
+        period = request.getfixturevalue("budgeting_period_factory")(
+            budget=budget, date_start=datetime.date(2024, 9, 1), date_end=datetime.date(2024, 9, 30)
+        )
+        entity = request.getfixturevalue("entity_factory")(budget=budget)
+        deposit = request.getfixturevalue("deposit_factory")(budget=budget)
+        category = request.getfixturevalue(config["category_factory"])(budget=budget, priority=config["priority"])
+        return [
+            {
+                "name": f"{config['name']} {index}",
+                "description": "",
+                "value": "10.00",
+                "date": datetime.date(2024, 9, index % 30 + 1),
+                "period": period.pk,
+                "entity": entity.pk,
+                "deposit": deposit.pk,
+                "category": category.pk,
+            }
+            for index in range(rows_count)
+        ]
+
+    def test_auth_required(self, api_client: APIClient, budget: Budget, transfer_type: str):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST without authentication.
+        THEN: Unauthorized HTTP 401 returned.
+        """
+        res = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=[], format="json")
+
+        assert res.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_not_budget_member(
+        self,
+        api_client: APIClient,
+        user_factory: FactoryMetaClass,
+        budget_factory: FactoryMetaClass,
+        transfer_type: str,
+    ):
+        """
+        GIVEN: Budget model instance in database.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST by User not belonging to given Budget.
+        THEN: Forbidden HTTP 403 returned.
+        """
+        budget = budget_factory(owner=user_factory())
+        api_client.force_authenticate(user_factory())
+
+        response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=[], format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["detail"] == "User does not have access to Budget."
+
+    def test_create_transfers_successfully(
+        self,
+        request: pytest.FixtureRequest,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        transfer_type: str,
+    ):
+        """
+        GIVEN: Budget instance created in database. Valid payload with three Transfers prepared.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST by User belonging to Budget with valid
+        payload.
+        THEN: Created HTTP 201 returned. All Transfers created in database with given payload.
+        """
+        config = TRANSFER_TYPES[transfer_type]
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        payload = self.prepare_payload(request, budget, transfer_type, 3)
+
+        response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        transfers = config["model"].objects.filter(period__budget=budget).order_by("id")
+        assert transfers.count() == 3
+        assert response.data == config["serializer"](transfers, many=True).data
+        for transfer, row in zip(transfers, payload):
+            assert transfer.name == row["name"]
+            assert transfer.date == row["date"]
+            assert transfer.category.pk == row["category"]
+
+    def test_queries_count_independent_of_rows_count(
+        self,
+        request: pytest.FixtureRequest,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        transfer_type: str,
+    ):
+        """
+        GIVEN: Two Budgets created in database. Payloads with 1 and 200 Transfers prepared.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST with both payloads.
+        THEN: The same number of database queries executed for both payloads.
+        """
+        queries_counts = []
+        for rows_count in (1, 200):
+            budget = budget_factory(owner=base_user)
+            api_client.force_authenticate(base_user)
+            payload = self.prepare_payload(request, budget, transfer_type, rows_count)
+
+            with CaptureQueriesContext(connection) as context:
+                response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=payload, format="json")
+
+            assert response.status_code == status.HTTP_201_CREATED
+            assert TRANSFER_TYPES[transfer_type]["model"].objects.filter(period__budget=budget).count() == rows_count
+            queries_counts.append(len(context.captured_queries))
+
+        assert queries_counts[0] == queries_counts[1]
+
+    def test_errors_indexed_by_row(
+        self,
+        request: pytest.FixtureRequest,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        entity_factory: FactoryMetaClass,
+        transfer_type: str,
+    ):
+        """
+        GIVEN: Budget instance created in database. Payload with five Transfers, four of them invalid.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST by User belonging to Budget with invalid
+        payload.
+        THEN: Bad request HTTP 400 returned with errors under invalid rows indexes. No Transfer created.
+        """
+        config = TRANSFER_TYPES[transfer_type]
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        payload = self.prepare_payload(request, budget, transfer_type, 5)
+        payload[1]["value"] = "0.00"
+        payload[2]["category"] = request.getfixturevalue(config["other_category_factory"])(budget=budget).pk
+        payload[3]["date"] = datetime.date(2024, 10, 1)
+        payload[4]["entity"] = entity_factory(budget=budget_factory()).pk
+
+        response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["detail"].keys()) == [1, 2, 3, 4]
+        assert response.data["detail"][1]["value"][0] == "Value should be higher than 0.00."
+        assert response.data["detail"][2]["category"][0] == f"Invalid TransferCategory for {config['name']} provided."
+        assert response.data["detail"][3]["date"][0] == "Transfer date not in period date range."
+        assert (
+            response.data["detail"][4]["entity"][0] == f'Invalid pk "{payload[4]["entity"]}" - object does not exist.'
+        )
+        assert not config["model"].objects.filter(period__budget=budget).exists()
+
+    def test_error_deposit_and_entity_the_same(
+        self,
+        request: pytest.FixtureRequest,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        transfer_type: str,
+    ):
+        """
+        GIVEN: Budget instance created in database. Payload with Transfer with the same "deposit" and "entity".
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST by User belonging to Budget with invalid
+        payload.
+        THEN: Bad request HTTP 400 returned. No Transfer created.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+        payload = self.prepare_payload(request, budget, transfer_type, 1)
+        payload[0]["entity"] = payload[0]["deposit"]
+
+        response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert (
+            response.data["detail"][0]["non_field_errors"][0]
+            == "'deposit' and 'entity' fields cannot contain the same value."
+        )
+        assert not TRANSFER_TYPES[transfer_type]["model"].objects.filter(period__budget=budget).exists()
+
+    @pytest.mark.parametrize(
+        "payload, message",
+        [([], "List of Transfers cannot be empty."), ({"name": "Transfer"}, "Expected a list of Transfers.")],
+    )
+    def test_error_invalid_payload_type(
+        self,
+        api_client: APIClient,
+        base_user: AbstractUser,
+        budget_factory: FactoryMetaClass,
+        transfer_type: str,
+        payload: Any,
+        message: str,
+    ):
+        """
+        GIVEN: Budget instance created in database.
+        WHEN: IncomeViewSet or ExpenseViewSet bulk view called with POST with empty list or not a list.
+        THEN: Bad request HTTP 400 returned.
+        """
+        budget = budget_factory(owner=base_user)
+        api_client.force_authenticate(base_user)
+
+        response = api_client.post(transfers_bulk_url(transfer_type, budget.id), data=payload, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["detail"]["non_field_errors"][0] == message